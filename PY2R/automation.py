@@ -269,9 +269,13 @@ toolboxes = {
 }
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
-wbt_py = os.path.join(dir_path, "whitebox_tools.py")
 root_dir = os.path.dirname(dir_path)
 WBT_dir = os.path.join(root_dir, "WhiteboxTools_linux_amd64", "WBT")
+# The R functions are generated from the per-tool methods written out in the
+# whitebox_tools.py shipped with the binary. PY2R/whitebox_tools.py creates
+# those methods at run time from whitebox_tools.json instead, so it is not
+# overwritten here.
+wbt_py = os.path.join(WBT_dir, "whitebox_tools.py")
 
 linux_tar = "WhiteboxTools_linux_amd64.zip"
 tar_path = os.path.join(root_dir, linux_tar)
@@ -289,8 +293,6 @@ print("Decompressing {} ...".format(linux_tar))
 with zipfile.ZipFile(tar_path, "r") as tar_ref:
     tar_ref.extractall(root_dir)
 
-shutil.copyfile(os.path.join( WBT_dir, "whitebox_tools.py"), wbt_py)
-
 # Generate R functions with documentation
 ff = None
 add_example = False
@@ -300,7 +302,9 @@ with open(wbt_py) as f:
     lines = f.readlines()
     tbx = ""
     for index, line in enumerate(lines):
-        if index > 700:
+        # the per-tool methods start at the first toolbox header; anything
+        # before it belongs to the WhiteboxTools class itself
+        if ff is not None or line.strip() in toolboxes:
             line = line.strip()
             
             # Create an R script for each toolbox
@@ -0,0 +1,10 @@
+''' Fixtures of the pytest-benchmark suites: the stand-in executable of the
+tests, from tests/stand_in.py.
+'''
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'tests'))
+
+from stand_in import fake_exe_dir, wbt # noqa: E402, F401
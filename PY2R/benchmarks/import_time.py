@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+''' Start-up benchmark for whitebox_tools.py.
+
+Imports whitebox_tools in fresh interpreters under `python -X importtime`,
+reports the median cumulative import time of the module and exits with a
+non-zero status if it exceeds the budget, or if any of the modules that
+whitebox_tools only imports on first use is pulled in at import time.
+
+    python benchmarks/import_time.py [--runs 15] [--budget-ms 50]
+'''
+
+# License: MIT
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Imported lazily by whitebox_tools; none of them may be loaded by a plain import.
+DEFERRED_MODULES = ['json', 'asyncio', 'hashlib', 'platform', 'shutil', 'zipfile', 'urllib.request']
+
+PY2R_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def import_time_us(python=sys.executable):
+    '''
+    Imports whitebox_tools in a fresh interpreter and returns the cumulative
+    import time of the module in microseconds, and the set of modules that
+    were imported along with it.
+    '''
+    code = "import whitebox_tools"
+    env = dict(os.environ, PYTHONPATH=PY2R_DIR)
+    proc = subprocess.run([python, "-X", "importtime", "-c", code], env=env,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=True)
+
+    cumulative = None
+    modules = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        name = fields[2].strip()
+        modules.add(name)
+        if name == "whitebox_tools":
+            cumulative = int(fields[1])
+    return cumulative, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--runs", type=int, default=15, help="number of fresh interpreters to time")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="maximum median import time in ms")
+    opts = parser.parse_args()
+
+    # the first import also writes the bytecode cache; leave it out of the timings
+    import_time_us()
+
+    times = []
+    eager = set()
+    for _ in range(opts.runs):
+        us, modules = import_time_us()
+        times.append(us)
+        eager |= modules.intersection(DEFERRED_MODULES)
+
+    median_ms = statistics.median(times) / 1000.0
+    print("whitebox_tools import time: median {:.2f} ms, min {:.2f} ms, max {:.2f} ms over {} runs (budget {:.2f} ms)".format(
+        median_ms, min(times) / 1000.0, max(times) / 1000.0, opts.runs, opts.budget_ms))
+
+    failed = False
+    if eager:
+        print("FAIL: imported eagerly: {}".format(", ".join(sorted(eager))))
+        failed = True
+    if median_ms > opts.budget_ms:
+        print("FAIL: import time exceeds the budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+''' Reproducible synthetic inputs for the tool benchmarks: fractal DEMs made
+by the diamond-square algorithm, LAS point clouds sampled from a DEM, and
+point shapefiles of training samples. The same size and seed always give
+the same files. Requires NumPy.
+
+Example:
+
+    import synthetic
+
+    dem = synthetic.fractal_dem(2000, 2000, seed=1)
+    synthetic.write_dem("dem.dep", dem, cell_size=1.0)
+    synthetic.write_las("points.las", 1000000, dem, cell_size=1.0, seed=1)
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import os
+import struct
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+import whitebox_raster as raster
+
+
+def diamond_square(n, hurst=0.8, seed=0):
+    '''
+    Returns a (2**n + 1) x (2**n + 1) float32 fractal surface with zero
+    mean made by the diamond-square algorithm. hurst (0 to 1) sets the
+    roughness; higher values give smoother surfaces.
+    '''
+    rng = np.random.default_rng(seed)
+    size = (1 << n) + 1
+    z = np.zeros((size, size), dtype=np.float32)
+    z[0::size - 1, 0::size - 1] = rng.standard_normal((2, 2))
+    step, scale = size - 1, 1.0
+    while step > 1:
+        half = step // 2
+        scale *= 2.0 ** -hurst
+
+        # diamond step: the centre of each square
+        centres = (z[0:-1:step, 0:-1:step] + z[0:-1:step, step::step] +
+                   z[step::step, 0:-1:step] + z[step::step, step::step]) / 4.0
+        z[half::step, half::step] = centres + scale * rng.standard_normal(centres.shape)
+        centres = z[half::step, half::step]
+
+        # square step: the middle of each edge, from the 3 or 4 points around it
+        total = z[0::step, 0:-1:step] + z[0::step, step::step]
+        count = np.full(total.shape, 2.0, dtype=np.float32)
+        total[1:] += centres
+        total[:-1] += centres
+        count[1:] += 1
+        count[:-1] += 1
+        z[0::step, half::step] = total / count + scale * rng.standard_normal(total.shape)
+
+        total = z[0:-1:step, 0::step] + z[step::step, 0::step]
+        count = np.full(total.shape, 2.0, dtype=np.float32)
+        total[:, 1:] += centres
+        total[:, :-1] += centres
+        count[:, 1:] += 1
+        count[:, :-1] += 1
+        z[half::step, 0::step] = total / count + scale * rng.standard_normal(total.shape)
+        step = half
+    return z - z.mean()
+
+
+def fractal_dem(rows, cols, relief=500.0, base=100.0, hurst=0.8, seed=0):
+    '''
+    Returns a rows x cols float32 DEM, cropped from a diamond-square
+    surface and scaled to elevations from base to base + relief.
+    '''
+    n = max(1, int(np.ceil(np.log2(max(rows, cols) - 1))) if max(rows, cols) > 2 else 1)
+    z = diamond_square(n, hurst, seed)[:rows, :cols]
+    lo, hi = float(z.min()), float(z.max())
+    return ((z - lo) * (relief / (hi - lo if hi > lo else 1.0)) + base).astype(np.float32)
+
+
+def dem_header(rows, cols, cell_size=1.0):
+    '''
+    Returns the header of a raster with its south-west corner at (0, 0).
+    '''
+    return raster.RasterHeader({
+        'North': repr(rows * cell_size), 'South': '0.0', 'East': repr(cols * cell_size), 'West': '0.0',
+        'Rows': str(rows), 'Cols': str(cols), 'Stacks': '1', 'Z Units': 'metres',
+        'XY Units': 'metres', 'Projection': 'not specified', 'Data Scale': 'continuous',
+        'Preferred Palette': 'spectrum.plt', 'NoData': '-32768.0'})
+
+
+def write_dem(file_name, dem, cell_size=1.0, wbt=None):
+    '''
+    Writes a DEM array as file_name. Whitebox rasters (.dep) are written
+    directly; other formats, e.g. GeoTIFF, are written as a .dep next to
+    file_name and converted with the wbt object.
+    '''
+    rows, cols = dem.shape
+    header = dem_header(rows, cols, cell_size)
+    if raster.is_whitebox_raster(file_name):
+        raster.write_raster(file_name, dem, header)
+        return file_name
+    if wbt is None:
+        raise ValueError("A WhiteboxTools object is needed to write {}".format(file_name))
+    dep = os.path.splitext(file_name)[0] + '_src.dep'
+    raster.write_raster(dep, dem, header)
+    try:
+        if wbt.convert_raster_format(dep, file_name) != 0:
+            raise OSError("Could not convert {} to {}".format(dep, file_name))
+    finally:
+        raster.remove(dep)
+    return file_name
+
+
+# LAS 1.2 point data record format 1
+_las_point = np.dtype([('x', '<i4'), ('y', '<i4'), ('z', '<i4'), ('intensity', '<u2'),
+                       ('returns', 'u1'), ('classification', 'u1'), ('scan_angle', 'i1'),
+                       ('user_data', 'u1'), ('point_source', '<u2'), ('gps_time', '<f8')])
+_las_header_size = 227
+
+
+def write_las(file_name, num_points, dem, cell_size=1.0, vegetation=0.4, seed=0, chunk=1 << 20):
+    '''
+    Writes a LAS 1.2 file of num_points points scattered uniformly over
+    the extent of dem. A vegetation fraction of the points come from
+    vegetated locations, half as first returns 2 to 25 m above the ground
+    and half as last returns on it; the others are single returns on the
+    ground. All points are left unclassified. Points are generated and
+    written chunk at a time.
+    '''
+    rng = np.random.default_rng(seed)
+    rows, cols = dem.shape
+    width, height = cols * cell_size, rows * cell_size
+    scale = 0.01
+    by_return = [0, 0, 0, 0, 0]
+    zmin, zmax = np.inf, -np.inf
+    written = 0
+    with open(file_name, 'wb') as f:
+        f.write(b'\0' * _las_header_size)
+        while written < num_points:
+            n = min(chunk, num_points - written)
+            x = rng.uniform(0.0, width, n)
+            y = rng.uniform(0.0, height, n)
+            r = np.minimum(((height - y) / cell_size).astype(np.int64), rows - 1)
+            c = np.minimum((x / cell_size).astype(np.int64), cols - 1)
+            z = dem[r, c].astype(np.float64)
+
+            # points of vegetated locations alternate between canopy and ground returns
+            veg = rng.random(n) < vegetation
+            first = veg & (np.arange(n) % 2 == 0)
+            last = veg & ~first
+            z[first] += rng.uniform(2.0, 25.0, int(first.sum()))
+            returns = np.full(n, 1 | (1 << 3), dtype=np.uint8)
+            returns[first] = 1 | (2 << 3)
+            returns[last] = 2 | (2 << 3)
+
+            points = np.zeros(n, dtype=_las_point)
+            points['x'] = np.round(x / scale)
+            points['y'] = np.round(y / scale)
+            points['z'] = np.round(z / scale)
+            points['intensity'] = rng.integers(0, 1 << 12, n)
+            points['returns'] = returns
+            points['classification'] = 1
+            points['gps_time'] = written + np.arange(n, dtype=np.float64)
+            points.tofile(f)
+
+            by_return[0] += int(n - last.sum())
+            by_return[1] += int(last.sum())
+            zmin, zmax = min(zmin, float(z.min())), max(zmax, float(z.max()))
+            written += n
+
+        f.seek(0)
+        f.write(struct.pack(
+            '<4sHHIHH8sBB32s32sHHHIIBHI5I3d3d6d',
+            b'LASF', 0, 0, 0, 0, 0, b'\0' * 8, 1, 2,
+            b'synthetic'.ljust(32, b'\0'), b'whitebox benchmarks'.ljust(32, b'\0'),
+            1, 2024, _las_header_size, _las_header_size, 0, 1, _las_point.itemsize, num_points,
+            *(by_return + [scale, scale, scale, 0.0, 0.0, 0.0,
+                           width, 0.0, height, 0.0, zmax, zmin])))
+    return file_name
+
+
+def write_points_shapefile(file_name, x, y, field, values):
+    '''
+    Writes a point shapefile (.shp, .shx and .dbf) with one integer
+    attribute named field.
+    '''
+    stem = os.path.splitext(file_name)[0]
+    n = len(x)
+    bbox = (float(np.min(x)), float(np.min(y)), float(np.max(x)), float(np.max(y)))
+
+    def header(length_words):
+        return (struct.pack('>7i', 9994, 0, 0, 0, 0, 0, length_words) +
+                struct.pack('<2i4d4d', 1000, 1, *(bbox + (0.0, 0.0, 0.0, 0.0))))
+
+    with open(stem + '.shp', 'wb') as shp, open(stem + '.shx', 'wb') as shx:
+        shp.write(header((100 + n * 28) // 2))
+        shx.write(header((100 + n * 8) // 2))
+        for i in range(n):
+            shx.write(struct.pack('>2i', (100 + i * 28) // 2, 10))
+            shp.write(struct.pack('>2i', i + 1, 10) + struct.pack('<i2d', 1, float(x[i]), float(y[i])))
+
+    width = 10
+    with open(stem + '.dbf', 'wb') as dbf:
+        dbf.write(struct.pack('<4BIHH20x', 3, 124, 1, 1, n, 32 + 32 + 1, 1 + width))
+        dbf.write(struct.pack('<11sc4xBB14x', field.encode()[:10], b'N', width, 0))
+        dbf.write(b'\r')
+        for v in values:
+            dbf.write(b' ' + str(int(v)).rjust(width).encode())
+        dbf.write(b'\x1a')
+    return file_name
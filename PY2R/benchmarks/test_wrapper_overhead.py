@@ -0,0 +1,92 @@
+''' Micro-benchmarks of the Python-side cost of the whitebox_tools wrapper,
+with pytest-benchmark.
+
+The wbt fixture runs the stand-in executable of the tests
+(tests/stand_in.py), so that only the wrapper is measured:
+
+  run_tool     a tool run printing 10 to 1M lines, in silent and verbose
+               mode, against a bare subprocess run of the same stand-in;
+               the CPU time of the calling process per run, the wrapper's
+               own cost, is recorded in the extra_info of each result
+  methods      building the argument list in a generated tool method
+  list_tools   parsing the tool list, from the metadata cache and cold
+  dispatch     splitting output into lines and dispatching them to the
+               callback, in-process, for 10 to 1M lines
+
+    python -m pytest PY2R/benchmarks [-k "not 1000000"] [--benchmark-json results.json]
+
+Skipped unless pytest-benchmark is installed.
+'''
+
+import subprocess
+import time
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from whitebox_tools import _OutputReader, _RecordingRunner, _tool_method
+
+LINE_COUNTS = [10, 1000, 100000, 1000000]
+
+
+def _rounds(lines):
+    return 3 if lines >= 1000000 else 9
+
+
+def _pedantic_with_cpu(benchmark, fn, rounds):
+    # CPU time of this process only; the stand-in runs in a child process
+    start = time.process_time()
+    benchmark.pedantic(fn, rounds=rounds, iterations=1, warmup_rounds=1)
+    benchmark.extra_info['cpu_per_run'] = (time.process_time() - start) / (rounds + 1)
+
+
+@pytest.mark.parametrize('lines', LINE_COUNTS)
+def test_bare_subprocess(benchmark, wbt, monkeypatch, lines):
+    monkeypatch.setenv('FAKE_LINES', str(lines))
+    exe = wbt.exe_file()
+    _pedantic_with_cpu(benchmark, lambda: subprocess.run([exe, "--run=Slope"], stdout=subprocess.PIPE,
+                                                         check=True), _rounds(lines))
+
+
+@pytest.mark.parametrize('verbose', [False, True])
+@pytest.mark.parametrize('lines', LINE_COUNTS)
+def test_run_tool(benchmark, wbt, monkeypatch, lines, verbose):
+    monkeypatch.setenv('FAKE_LINES', str(lines))
+    wbt.set_verbose_mode(verbose)
+    _pedantic_with_cpu(benchmark, lambda: wbt.run_tool('slope', ["--dem='dem.tif'", "--output='out.tif'"],
+                                                       callback=lambda line: None), _rounds(lines))
+
+
+@pytest.mark.parametrize('name, args, kwargs', [
+    ('slope', ("dem.tif", "slope.tif"), {'zfactor': 1.0, 'units': "degrees"}),
+    ('breach_depressions_least_cost', ("dem.tif", "breached.tif"), {'dist': 100, 'fill': True}),
+    ('lidar_tin_gridding', (), {'i': "points.las", 'output': "dem.tif", 'resolution': 1.0}),
+])
+def test_tool_method(benchmark, name, args, kwargs):
+    method = _tool_method(name)
+    runner = _RecordingRunner()
+    benchmark(method, runner, *args, **kwargs)
+
+
+@pytest.mark.parametrize('cached', [True, False])
+def test_list_tools(benchmark, wbt, monkeypatch, cached):
+    monkeypatch.setenv('FAKE_TOOLS', '550')
+    assert len(wbt.list_tools()) == 550 # fills the metadata cache
+    wbt.use_metadata_cache = cached
+    benchmark.pedantic(wbt.list_tools, rounds=9, iterations=1)
+
+
+@pytest.mark.parametrize('batch', [False, True])
+@pytest.mark.parametrize('lines', LINE_COUNTS)
+def test_dispatch(benchmark, lines, batch):
+    data = b''.join(("Reading data: {}%\n".format(i % 101) if i % 10 else
+                     "Line {} of the tool output\n".format(i)).encode() for i in range(lines))
+    chunks = [data[i:i + 65536] for i in range(0, len(data), 65536)]
+
+    def dispatch():
+        reader = _OutputReader(lambda line: None, [], 0.1, batch)
+        for chunk in chunks:
+            reader.feed(chunk)
+        reader.close()
+    benchmark.pedantic(dispatch, rounds=_rounds(lines), iterations=1)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+''' End-to-end benchmark of representative WhiteboxTools tools on synthetic
+inputs of configurable size.
+
+Generates a fractal DEM of --rows x --cols cells (as .dep or GeoTIFF) and
+a LAS point cloud of --points points over it, once per size and seed, in
+--data-dir. It then runs each tool --repeat times with the real
+executable and reports the median wall time, CPU time, peak memory and
+throughput (cells/s for raster tools, points/s for LiDAR tools).
+
+    python benchmarks/tool_benchmark.py [--rows 4000 --cols 4000] [--points 10000000]
+        [--format tif] [--tools slope,gaussian_filter] [--repeat 3] [--max-procs 8]
+        [--exe-dir /opt/WBT] [--data-dir bench_data] [--json results.json]
+
+Requires NumPy and a WhiteboxTools executable.
+'''
+
+# License: MIT
+
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+
+BENCHMARKS_DIR = os.path.dirname(os.path.realpath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARKS_DIR))
+sys.path.insert(0, BENCHMARKS_DIR)
+
+import numpy as np
+
+import synthetic
+from whitebox_tools import WhiteboxTools
+
+
+# tool: (input the throughput is counted in, output extension, run(wbt, inputs, output))
+TOOLS = {
+    'breach_depressions_least_cost': ('dem', 'raster',
+                                      lambda wbt, f, out: wbt.breach_depressions_least_cost(f['dem'], out, dist=100)),
+    'd8_flow_accumulation': ('dem', 'raster', lambda wbt, f, out: wbt.d8_flow_accumulation(f['dem'], out)),
+    'slope': ('dem', 'raster', lambda wbt, f, out: wbt.slope(f['dem'], out)),
+    'gaussian_filter': ('dem', 'raster', lambda wbt, f, out: wbt.gaussian_filter(f['dem'], out, sigma=2.0)),
+    'lidar_tin_gridding': ('las', 'raster',
+                           lambda wbt, f, out: wbt.lidar_tin_gridding(i=f['las'], output=out, resolution=f['cell_size'])),
+    'lidar_ground_point_filter': ('las', '.las',
+                                  lambda wbt, f, out: wbt.lidar_ground_point_filter(f['las'], out, radius=2.0)),
+    'random_forest_classification': ('dem', 'raster',
+                                     lambda wbt, f, out: wbt.random_forest_classification(
+                                         "{};{}".format(f['dem'], f['slope']), f['training'], 'CLASS',
+                                         output=out, n_trees=100)),
+}
+
+
+def prepare_inputs(wbt, data_dir, rows, cols, points, raster_format, cell_size, seed, tools):
+    '''
+    Generates the inputs the tools need in data_dir, unless files of the
+    same size, cell size and seed are already there, and returns their
+    paths.
+    '''
+    os.makedirs(data_dir, exist_ok=True)
+    tag = "{}x{}_c{:g}_s{}".format(rows, cols, cell_size, seed)
+    ext = '.dep' if raster_format == 'dep' else '.tif'
+    f = {'cell_size': cell_size, 'ext': ext,
+         'dem': os.path.join(data_dir, "dem_{}{}".format(tag, ext)),
+         'las': os.path.join(data_dir, "points_{}_{}.las".format(tag, points))}
+
+    dem = None
+    if not os.path.exists(f['dem']):
+        print("generating {}".format(f['dem']))
+        dem = synthetic.fractal_dem(rows, cols, seed=seed)
+        synthetic.write_dem(f['dem'], dem, cell_size, wbt)
+    if any(TOOLS[t][0] == 'las' for t in tools) and not os.path.exists(f['las']):
+        print("generating {}".format(f['las']))
+        if dem is None:
+            dem = synthetic.fractal_dem(rows, cols, seed=seed)
+        synthetic.write_las(f['las'], points, dem, cell_size, seed=seed)
+
+    if 'random_forest_classification' in tools:
+        # a second predictor and training points classed by elevation tercile
+        f['slope'] = os.path.join(data_dir, "slope_{}{}".format(tag, ext))
+        f['training'] = os.path.join(data_dir, "training_{}.shp".format(tag))
+        if not os.path.exists(f['slope']):
+            wbt.slope(f['dem'], f['slope'])
+        if not os.path.exists(f['training']):
+            if dem is None:
+                dem = synthetic.fractal_dem(rows, cols, seed=seed)
+            rng = np.random.default_rng(seed)
+            r = rng.integers(0, rows, 600)
+            c = rng.integers(0, cols, 600)
+            z = dem[r, c]
+            classes = 1 + np.searchsorted(np.quantile(z, [1 / 3.0, 2 / 3.0]), z)
+            synthetic.write_points_shapefile(f['training'], (c + 0.5) * cell_size,
+                                             (rows - r - 0.5) * cell_size, 'CLASS', classes)
+    return f
+
+
+def run_benchmark(wbt, tool, inputs, out_dir, repeat, rows, cols, points):
+    kind, out_ext, run = TOOLS[tool]
+    output = os.path.join(out_dir, tool + (inputs['ext'] if out_ext == 'raster' else out_ext))
+    size = rows * cols if kind == 'dem' else points
+    runs = []
+    for _ in range(repeat):
+        result = run(wbt, inputs, output)
+        if result != 0:
+            return {'tool': tool, 'failed': True, 'exit_code': int(result),
+                    'message': "\n".join(getattr(result, 'output', [])[-3:])}
+        runs.append(result)
+    wall = statistics.median(r.wall_time for r in runs)
+    usage = [r.usage for r in runs]
+    return {
+        'tool': tool, 'failed': False, 'size': size, 'unit': 'cells' if kind == 'dem' else 'points',
+        'wall_time': wall,
+        'cpu_time': statistics.median(u.get('user_time', 0.0) + u.get('system_time', 0.0) for u in usage),
+        'max_rss': max(u.get('max_rss', 0) for u in usage),
+        'throughput': size / wall if wall > 0 else float('inf'),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--rows", type=int, default=2000, help="DEM rows")
+    parser.add_argument("--cols", type=int, default=2000, help="DEM columns")
+    parser.add_argument("--points", type=int, default=2000000, help="LAS points")
+    parser.add_argument("--cell-size", type=float, default=1.0, help="DEM cell size in metres")
+    parser.add_argument("--format", choices=['dep', 'tif'], default='dep', help="DEM file format")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic inputs")
+    parser.add_argument("--tools", default=",".join(TOOLS), help="comma-separated tools to run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each tool")
+    parser.add_argument("--max-procs", type=int, default=-1, help="--max_procs of the runs")
+    parser.add_argument("--exe-dir", help="directory of the whitebox_tools executable")
+    parser.add_argument("--data-dir", default="bench_data", help="directory the inputs are kept in")
+    parser.add_argument("--json", help="also write the results to this JSON file")
+    opts = parser.parse_args()
+
+    tools = [t.strip() for t in opts.tools.split(",") if t.strip()]
+    unknown = [t for t in tools if t not in TOOLS]
+    if unknown:
+        parser.error("unknown tools: {}".format(", ".join(unknown)))
+
+    wbt = WhiteboxTools()
+    if opts.exe_dir:
+        wbt.set_whitebox_dir(opts.exe_dir)
+    wbt.set_verbose_mode(False)
+    wbt.set_max_procs(opts.max_procs)
+
+    data_dir = os.path.abspath(opts.data_dir)
+    inputs = prepare_inputs(wbt, data_dir, opts.rows, opts.cols, opts.points, opts.format,
+                            opts.cell_size, opts.seed, tools)
+    out_dir = tempfile.mkdtemp(prefix='wbt_bench_out_', dir=data_dir)
+    try:
+        results = [run_benchmark(wbt, t, inputs, out_dir, opts.repeat, opts.rows, opts.cols, opts.points)
+                   for t in tools]
+    finally:
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+    version = wbt.version()
+    print("{} ({}x{} cells, {} points, {}, max_procs {})".format(
+        version.splitlines()[0] if isinstance(version, str) and version.strip() else "WhiteboxTools",
+        opts.rows, opts.cols, opts.points, opts.format, opts.max_procs))
+    print("  {:<32} {:>9} {:>9} {:>9} {:>16}".format("tool", "wall s", "cpu s", "rss MB", "throughput"))
+    for r in results:
+        if r['failed']:
+            print("  {:<32} failed with exit code {}: {}".format(r['tool'], r['exit_code'], r['message']))
+            continue
+        print("  {:<32} {:>9.2f} {:>9.2f} {:>9.0f} {:>9.3g} {}/s".format(
+            r['tool'], r['wall_time'], r['cpu_time'], r['max_rss'] / 2.0 ** 20, r['throughput'], r['unit']))
+
+    if opts.json:
+        with open(opts.json, 'w') as f:
+            json.dump({'rows': opts.rows, 'cols': opts.cols, 'points': opts.points, 'format': opts.format,
+                       'seed': opts.seed, 'max_procs': opts.max_procs, 'results': results}, f, indent=2)
+    return 1 if any(r['failed'] for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,10 @@
+''' Shared fixtures of the Python tests: the PY2R modules on sys.path, and a
+WhiteboxTools object that runs a stand-in executable, a small Python
+script, instead of the real one. Both are defined in stand_in.py, which
+the benchmarks share.
+
+Set WBT_DIR to the directory of a real whitebox_tools executable to also
+run the tests that compare against it.
+'''
+
+from stand_in import fake_exe_dir, fake_runs, wbt # noqa: F401
@@ -0,0 +1,121 @@
+''' The stand-in whitebox_tools executable, a small Python script run in
+place of the real one, and the pytest fixtures that set it up. Used by the
+tests and by the wrapper-overhead benchmarks.
+
+The stand-in copies its --input (or -i, --dem, --input1) raster to its
+--output, or writes a text --output when the input is not a .dep raster,
+and logs every run to runs.log next to itself, one "Tool arg arg ..."
+line per run with the tool's own arguments. It prints FAKE_LINES lines
+of output, every tenth one an ordinary line and the others progress
+updates, as a busy tool prints them, and exits with FAKE_EXIT.
+--listtools lists two tools, or FAKE_TOOLS numbered ones if it is set.
+
+POSIX only: the stand-in is run through its #! line.
+'''
+
+import os
+import sys
+
+import pytest
+
+PY2R_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+if PY2R_DIR not in sys.path:
+    sys.path.insert(0, PY2R_DIR)
+
+import whitebox_tools
+from whitebox_tools import WhiteboxTools
+
+FAKE_EXE = '''#!{python}
+import os, shutil, sys
+args = sys.argv[1:]
+if args[:1] == ['--listtools']:
+    n = int(os.environ.get('FAKE_TOOLS', '0'))
+    if n == 0:
+        print("All 2 Tools:")
+        print("Slope: Calculates slope")
+        print("D8Pointer: Calculates a D8 pointer")
+    else:
+        out = ["All {{}} Tools:".format(n)]
+        out += ["Tool{{}}: Description of tool number {{}}".format(i, i) for i in range(n)]
+        sys.stdout.write("\\n".join(out) + "\\n")
+    sys.exit(0)
+if args[:1] == ['--version']:
+    print("WhiteboxTools v2.4.0 (c) Dr. John Lindsay 2017-2023")
+    sys.exit(0)
+kv = {{}}
+for a in args:
+    k, _, v = a.partition('=')
+    kv[k] = v.strip('\\'"')
+if kv.get('--wd'):
+    os.chdir(kv['--wd'])
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'runs.log'), 'a') as log:
+    common = ('--run', '--wd', '-v', '--compress_rasters', '--max_procs')
+    log.write(" ".join([kv.get('--run', '')] + [a for a in args if not a.startswith(common)]) + "\\n")
+src = kv.get('--input') or kv.get('-i') or kv.get('--dem') or kv.get('--input1')
+out = kv.get('--output') or kv.get('-o')
+if out:
+    if src and src.endswith('.dep') and out.endswith('.dep'):
+        shutil.copy(src, out)
+        shutil.copy(src[:-4] + '.tas', out[:-4] + '.tas')
+    else:
+        with open(out, 'w') as f:
+            f.write("output of " + " ".join(args))
+w = sys.stdout.write
+for i in range(int(os.environ.get('FAKE_LINES', '0'))):
+    w("Reading data: {{}}%\\n".format(i % 101) if i % 10 else "Line {{}} of the tool output\\n".format(i))
+w("Elapsed Time (excluding I/O): 0.1s\\n")
+sys.stdout.flush()
+sys.exit(int(os.environ.get('FAKE_EXIT', '0')))
+'''
+
+
+def make_fake_exe(dir_name):
+    '''
+    Writes the stand-in executable to dir_name and returns its path.
+    '''
+    exe = os.path.join(dir_name, 'whitebox_tools')
+    with open(exe, 'w') as f:
+        f.write(FAKE_EXE.format(python=sys.executable))
+    os.chmod(exe, 0o755)
+    return exe
+
+
+@pytest.fixture
+def fake_exe_dir(tmp_path, monkeypatch):
+    '''
+    A directory holding the stand-in executable, with the metadata cache
+    kept in it too.
+    '''
+    exe_dir = tmp_path / 'wbt'
+    exe_dir.mkdir()
+    make_fake_exe(str(exe_dir))
+    monkeypatch.setenv('WBT_CACHE_DIR', str(exe_dir / 'cache'))
+    monkeypatch.setattr(whitebox_tools, '_metadata_cache', whitebox_tools._MetadataCache())
+    return exe_dir
+
+
+@pytest.fixture
+def wbt(fake_exe_dir, tmp_path):
+    '''
+    A WhiteboxTools object running the stand-in executable, in silent
+    mode, with tmp_path/data as its working directory.
+    '''
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    w = WhiteboxTools()
+    w.set_whitebox_dir(str(fake_exe_dir))
+    w.set_working_dir(str(data_dir))
+    w.set_verbose_mode(False)
+    return w
+
+
+@pytest.fixture
+def fake_runs(fake_exe_dir):
+    '''
+    Returns a function giving the runs of the stand-in executable so far,
+    one "Tool arg arg ..." string per run.
+    '''
+    def runs():
+        log = fake_exe_dir / 'runs.log'
+        return log.read_text().splitlines() if log.exists() else []
+    return runs
@@ -0,0 +1,28 @@
+''' Tests of the fields parsed from the output of a tool in a ToolResult.
+'''
+
+from whitebox_tools import ToolResult
+
+BANNER = ["*****************************", "* Welcome to ListUniqueValuesRaster *",
+          "*****************************"]
+
+
+def test_unique_values_are_read_from_their_block_only():
+    output = BANNER + ["Reading data...", "Number of unique values: 3", "Unique values:",
+                       "1", "2.5", "7", "Elapsed Time (excluding I/O): 0.12s", "2023"]
+    result = ToolResult(0, 'list_unique_values_raster', output)
+    assert result.fields['values'] == [1, 2.5, 7]
+
+
+def test_unique_values_without_their_heading_are_empty():
+    result = ToolResult(0, 'list_unique_values_raster', BANNER + ["42", "Elapsed Time (excluding I/O): 1s"])
+    assert result.fields['values'] == []
+
+
+def test_summary_stats_get_normalised_names():
+    output = ["Number of non-nodata grid cells: 100", "Number of nodata grid cells: 4",
+              "Image average: 12.5", "Image standard deviation: 2.0", "Image minimum: 1",
+              "Image maximum: 30", "Elapsed Time (excluding I/O): 0.1s"]
+    fields = ToolResult(0, 'raster_summary_stats', output).fields
+    assert (fields['count'], fields['nodata_count']) == (100, 4)
+    assert (fields['mean'], fields['std_dev'], fields['min'], fields['max']) == (12.5, 2.0, 1, 30)
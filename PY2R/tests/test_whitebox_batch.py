@@ -0,0 +1,106 @@
+''' Tests of BatchExecutor with the stand-in executable.
+'''
+
+import threading
+import time
+
+import pytest
+
+from whitebox_batch import BatchExecutor
+
+TOOLS = ['slope', 'aspect', 'hillshade', 'fill_depressions', 'd8_pointer', 'ruggedness_index']
+
+
+@pytest.fixture
+def dem(tmp_path):
+    data = tmp_path / 'data'
+    (data / 'dem.dep').write_text("header")
+    (data / 'dem.tas').write_bytes(b"\0" * 64)
+    return data
+
+
+def _job(tool, dem='dem.dep', *procs):
+    return (tool, ["--dem='{}'".format(dem), "--output='{}.dep'".format(tool)]) + procs
+
+
+@pytest.fixture
+def cores(wbt, monkeypatch):
+    '''
+    Wraps wbt.run_tool to record the core share of every run and the most
+    cores in use at once.
+    '''
+    state = {'in_use': 0, 'peak': 0, 'running': 0, 'peak_running': 0, 'procs': []}
+    lock = threading.Lock()
+    run_tool = wbt.run_tool
+
+    def counting_run_tool(tool_name, args, callback=None, max_procs=None):
+        with lock:
+            state['in_use'] += max_procs
+            state['running'] += 1
+            state['peak'] = max(state['peak'], state['in_use'])
+            state['peak_running'] = max(state['peak_running'], state['running'])
+            state['procs'].append(max_procs)
+        try:
+            time.sleep(0.02)
+            return run_tool(tool_name, args, callback, max_procs=max_procs)
+        finally:
+            with lock:
+                state['in_use'] -= max_procs
+                state['running'] -= 1
+
+    monkeypatch.setattr(wbt, 'run_tool', counting_run_tool)
+    return state
+
+
+def test_results_are_in_job_order(wbt, dem, fake_runs):
+    results = BatchExecutor(wbt, max_procs=4).run([_job(t) for t in TOOLS])
+    assert results == [0] * len(TOOLS)
+    assert [r.tool_name for r in results] == TOOLS
+    assert sorted(r.split()[0] for r in fake_runs()) == sorted(
+        ['Slope', 'Aspect', 'Hillshade', 'FillDepressions', 'D8Pointer', 'RuggednessIndex'])
+    assert BatchExecutor(wbt).run([]) == []
+
+
+def test_a_failed_job_does_not_stop_the_others(wbt, dem, fake_runs):
+    # the stand-in fails when its .dep input does not exist
+    jobs = [_job('slope'), _job('aspect', 'missing.dep'), _job('hillshade')]
+    assert BatchExecutor(wbt, max_procs=2).run(jobs) == [0, 1, 0]
+    assert len(fake_runs()) == 3
+
+
+def test_an_exception_is_raised_from_run(wbt, dem, monkeypatch):
+    run_tool = wbt.run_tool
+
+    def failing_run_tool(tool_name, args, callback=None, max_procs=None):
+        if tool_name == 'aspect':
+            raise OSError("cannot launch")
+        return run_tool(tool_name, args, callback, max_procs=max_procs)
+
+    monkeypatch.setattr(wbt, 'run_tool', failing_run_tool)
+    executor = BatchExecutor(wbt, max_procs=2)
+    with pytest.raises(OSError, match="cannot launch"):
+        executor.run([_job(t) for t in TOOLS])
+    # the cores of the failed job were given back
+    assert executor.run([_job('slope', 'dem.dep', 2)]) == [0]
+
+
+def test_running_jobs_never_use_more_than_max_procs(wbt, dem, cores):
+    assert BatchExecutor(wbt, max_procs=4).run([_job(t) for t in TOOLS]) == [0] * len(TOOLS)
+    assert cores['procs'] == [1] * len(TOOLS)
+    assert cores['peak'] <= 4
+
+
+def test_requested_shares_are_capped_and_waited_for(wbt, dem, cores):
+    jobs = [_job('slope', 'dem.dep', 3), _job('aspect', 'dem.dep', 3), _job('hillshade', 'dem.dep', 8)]
+    assert BatchExecutor(wbt, max_procs=4).run(jobs) == [0, 0, 0]
+    assert sorted(cores['procs']) == [3, 3, 4]
+    assert cores['peak'] <= 4
+    assert cores['peak_running'] == 1
+
+
+def test_max_workers_limits_the_jobs_running_at_once(wbt, dem, cores):
+    executor = BatchExecutor(wbt, max_procs=8, max_workers=2)
+    assert executor.procs_per_job(len(TOOLS)) == 4
+    assert executor.run([_job(t) for t in TOOLS]) == [0] * len(TOOLS)
+    assert cores['procs'] == [4] * len(TOOLS)
+    assert cores['peak_running'] <= 2
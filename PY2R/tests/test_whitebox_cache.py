@@ -0,0 +1,80 @@
+''' Tests of ResultCache with the stand-in executable.
+'''
+
+import os
+
+import pytest
+
+from whitebox_cache import ResultCache
+
+ARGS = ["--dem='dem.dep'", "--output='slope.dep'"]
+
+
+@pytest.fixture
+def cache(wbt, tmp_path):
+    c = ResultCache(str(tmp_path / 'cache'))
+    wbt.set_result_cache(c)
+    data = tmp_path / 'data'
+    (data / 'dem.dep').write_text("header")
+    (data / 'dem.tas').write_bytes(b"\0" * 64)
+    return c
+
+
+def test_identical_run_is_a_hit(wbt, cache, fake_runs):
+    first = wbt.run_tool('slope', ARGS)
+    second = wbt.run_tool('slope', ARGS)
+    assert first == second == 0
+    assert len(fake_runs()) == 1
+    assert (cache.misses, cache.hits) == (1, 1)
+    # the recorded output is replayed into the result of the skipped run
+    assert second.output == first.output
+    assert second.elapsed_time == first.elapsed_time
+
+
+def test_deleted_outputs_are_restored(wbt, cache, fake_runs, tmp_path):
+    wbt.run_tool('slope', ARGS)
+    os.remove(str(tmp_path / 'data' / 'slope.dep'))
+    os.remove(str(tmp_path / 'data' / 'slope.tas'))
+    assert wbt.run_tool('slope', ARGS) == 0
+    assert len(fake_runs()) == 1
+    assert (tmp_path / 'data' / 'slope.dep').read_text() == "header"
+    assert (tmp_path / 'data' / 'slope.tas').read_bytes() == b"\0" * 64
+
+
+def test_changed_input_runs_again(wbt, cache, fake_runs, tmp_path):
+    wbt.run_tool('slope', ARGS)
+    (tmp_path / 'data' / 'dem.tas').write_bytes(b"\1" * 128)
+    assert wbt.run_tool('slope', ARGS) == 0
+    assert len(fake_runs()) == 2
+    assert (cache.misses, cache.hits) == (2, 0)
+
+
+def test_changed_arguments_run_again(wbt, cache, fake_runs):
+    wbt.run_tool('slope', ARGS)
+    wbt.run_tool('slope', ARGS + ["--zfactor=2.0"])
+    assert len(fake_runs()) == 2
+
+
+def test_modified_stored_output_invalidates_the_entry(wbt, cache, fake_runs, tmp_path):
+    wbt.run_tool('slope', ARGS)
+    # the output is hard-linked into the cache, so this changes the stored copy too
+    with open(str(tmp_path / 'data' / 'slope.tas'), 'ab') as f:
+        f.write(b"edited")
+    assert wbt.run_tool('slope', ARGS) == 0
+    assert len(fake_runs()) == 2
+    assert (tmp_path / 'data' / 'slope.tas').read_bytes() == b"\0" * 64
+
+
+def test_failed_run_is_not_cached(wbt, cache, fake_runs, monkeypatch):
+    monkeypatch.setenv('FAKE_EXIT', '1')
+    assert wbt.run_tool('slope', ARGS) == 1
+    monkeypatch.delenv('FAKE_EXIT')
+    assert wbt.run_tool('slope', ARGS) == 0
+    assert len(fake_runs()) == 2
+
+
+def test_clear_removes_every_entry(wbt, cache, fake_runs):
+    wbt.run_tool('slope', ARGS)
+    cache.clear()
+    wbt.run_tool('slope', ARGS)
+    assert len(fake_runs()) == 2
@@ -0,0 +1,104 @@
+''' Tests of raster expressions and FusedTools, with the stand-in executable.
+'''
+
+from whitebox_expr import FusedTools, fusable_tools, raster
+
+
+def _calculator_runs(runs):
+    # (statement, output) of each raster_calculator run
+    ret = []
+    for run in runs:
+        tool, _, rest = run.partition(' ')
+        if tool == 'RasterCalculator':
+            statement, _, output = rest.partition(" --output=")
+            ret.append((statement[len("--statement="):], output.strip("'")))
+    return ret
+
+
+def test_statement_text():
+    nir, red = raster("nir.tif"), raster("red.tif")
+    assert ((nir - red) / (nir + red) > 0.3).statement() == \
+        '((("nir.tif" - "red.tif") / ("nir.tif" + "red.tif")) > 0.3)'
+    assert (abs(-nir) ** 2 + -1.5).statement() == '((abs((-"nir.tif")) ^ 2.0) + (-1.5))'
+    assert ((nir >= red) & ~red).statement() == '((("nir.tif" >= "red.tif") != 0) && (("red.tif" == 0) != 0))'
+    assert (2 - nir).statement() == '(2.0 - "nir.tif")'
+    assert ((nir - red) / (nir + red)).rasters() == ["nir.tif", "red.tif"]
+    assert ((nir - red) / (nir + red)).steps() == 3
+
+
+def test_chain_is_fused_into_one_run(wbt, fake_runs):
+    with FusedTools(wbt) as fused:
+        assert fused.subtract("nir.tif", "red.tif", "diff.tif") == 0
+        fused.add("nir.tif", "red.tif", "sum.tif")
+        fused.divide("diff.tif", "sum.tif", "ndvi.tif")
+        fused.greater_than("ndvi.tif", 0.3, "veg.tif", incl_equals=True)
+        assert fake_runs() == []
+    assert _calculator_runs(fake_runs()) == [
+        ('((("nir.tif" - "red.tif") / ("nir.tif" + "red.tif")) >= 0.3)', "veg.tif")]
+    assert len(fake_runs()) == 1
+
+
+def test_unread_outputs_are_all_written(wbt, fake_runs):
+    with FusedTools(wbt) as fused:
+        fused.square_root("a.tif", "b.tif")
+        fused.ln("b.tif", "c.tif")
+        fused.negate("a.tif", "d.tif")
+    assert sorted(_calculator_runs(fake_runs())) == [
+        ('(-"a.tif")', "d.tif"), ('log(e(), ("a.tif" ^ 0.5))', "c.tif")]
+
+
+def test_pending_output_is_written_before_a_tool_reads_it(wbt, fake_runs):
+    with FusedTools(wbt) as fused:
+        fused.add("a.tif", 1.0, "b.tif")
+        fused.slope("b.tif", "slope.tif")
+        fused.multiply("b.tif", 2.0, "c.tif")
+    runs = fake_runs()
+    assert [r.split()[0] for r in runs] == ['RasterCalculator', 'Slope', 'RasterCalculator']
+    # b.tif has been written by then, so c.tif reads it
+    assert _calculator_runs(runs) == [('("a.tif" + 1.0)', "b.tif"), ('("b.tif" * 2.0)', "c.tif")]
+
+
+def test_pending_input_is_read_before_a_tool_replaces_it(wbt, fake_runs):
+    with FusedTools(wbt) as fused:
+        fused.add("a.tif", 1.0, "b.tif")
+        fused.slope("dem.tif", "a.tif")
+    runs = fake_runs()
+    assert [r.split()[0] for r in runs] == ['RasterCalculator', 'Slope']
+    assert _calculator_runs(runs) == [('("a.tif" + 1.0)', "b.tif")]
+
+
+def test_pending_output_is_written_before_a_tool_replaces_it(wbt, fake_runs):
+    with FusedTools(wbt) as fused:
+        fused.add("x.tif", 1.0, "o.tif")
+        fused.slope("dem.tif", "o.tif")
+        assert fused.pending == {}
+    assert [r.split()[0] for r in fake_runs()] == ['RasterCalculator', 'Slope']
+
+
+def test_overwritten_input_is_read_before_it_is_replaced(wbt, fake_runs):
+    with FusedTools(wbt) as fused:
+        fused.add("a.tif", 1.0, "b.tif")
+        fused.multiply("a.tif", 2.0, "a.tif")
+    assert _calculator_runs(fake_runs()) == [('("a.tif" + 1.0)', "b.tif"), ('("a.tif" * 2.0)', "a.tif")]
+
+
+def test_nothing_is_written_after_an_exception(wbt, fake_runs):
+    try:
+        with FusedTools(wbt) as fused:
+            fused.add("a.tif", 1.0, "b.tif")
+            raise KeyError("stop")
+    except KeyError:
+        pass
+    assert fake_runs() == []
+
+
+def test_every_fusable_tool_records_an_expression(wbt):
+    fused = FusedTools(wbt)
+    for name in fusable_tools:
+        if name in ('absolute_value', 'ceil', 'floor', 'round', 'negate', 'reciprocal', 'increment',
+                    'decrement', 'square', 'square_root', 'exp', 'exp2', 'ln', 'log10', 'log2') or \
+                name.startswith(('sin', 'cos', 'tan', 'arc', 'ar', 'to_')):
+            assert getattr(fused, name)("a.tif", name + ".tif") == 0
+        else:
+            assert getattr(fused, name)("a.tif", "b.tif", name + ".tif") == 0
+    assert len(fused.pending) == len(fusable_tools)
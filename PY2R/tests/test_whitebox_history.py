@@ -0,0 +1,162 @@
+''' Tests of RuntimeHistory, its cost model and the input size readers,
+with small TIFF, BigTIFF and LAS files written by the tests.
+'''
+
+import math
+import struct
+
+import pytest
+
+from whitebox_history import CostModel, RuntimeHistory, _las_points, _tiff_cells, input_sizes
+from whitebox_tools import ToolResult
+
+
+def _tiff(file_name, width, height, order='<'):
+    # ImageWidth as a SHORT and ImageLength as a LONG, between other tags
+    entries = [(254, 4, 1, struct.pack(order + 'I', 0)),
+               (256, 3, 1, struct.pack(order + 'H', width) + b"\0\0"),
+               (257, 4, 1, struct.pack(order + 'I', height)),
+               (258, 3, 1, struct.pack(order + 'H', 32) + b"\0\0")]
+    data = (b'II' if order == '<' else b'MM') + struct.pack(order + 'HI', 42, 8)
+    data += struct.pack(order + 'H', len(entries))
+    for tag, kind, count, value in entries:
+        data += struct.pack(order + 'HHI', tag, kind, count) + value
+    data += struct.pack(order + 'I', 0)
+    with open(file_name, 'wb') as f:
+        f.write(data)
+
+
+def _bigtiff(file_name, width, height, order='<'):
+    # ImageWidth as a LONG8 and ImageLength as a SHORT
+    entries = [(256, 16, 1, struct.pack(order + 'Q', width)),
+               (257, 3, 1, struct.pack(order + 'H', height) + b"\0" * 6)]
+    data = (b'II' if order == '<' else b'MM') + struct.pack(order + 'HHHQ', 43, 8, 0, 16)
+    data += struct.pack(order + 'Q', len(entries))
+    for tag, kind, count, value in entries:
+        data += struct.pack(order + 'HHQ', tag, kind, count) + value
+    data += struct.pack(order + 'Q', 0)
+    with open(file_name, 'wb') as f:
+        f.write(data)
+
+
+def _las(file_name, points, minor=2, extended_points=0):
+    header = bytearray(375 if minor >= 4 else 227)
+    header[:4] = b'LASF'
+    header[24:26] = bytes([1, minor])
+    header[107:111] = struct.pack('<I', points)
+    if minor >= 4:
+        header[247:255] = struct.pack('<Q', extended_points)
+    with open(file_name, 'wb') as f:
+        f.write(bytes(header))
+
+
+def test_tiff_cells(tmp_path):
+    _tiff(str(tmp_path / 'le.tif'), 300, 200)
+    _tiff(str(tmp_path / 'be.tif'), 7000, 70000, order='>')
+    _bigtiff(str(tmp_path / 'big_le.tif'), 100000, 50000)
+    _bigtiff(str(tmp_path / 'big_be.tif'), 100000, 50000, order='>')
+    assert _tiff_cells(str(tmp_path / 'le.tif')) == 300 * 200
+    assert _tiff_cells(str(tmp_path / 'be.tif')) == 7000 * 70000
+    assert _tiff_cells(str(tmp_path / 'big_le.tif')) == 100000 * 50000
+    assert _tiff_cells(str(tmp_path / 'big_be.tif')) == 100000 * 50000
+    (tmp_path / 'not.tif').write_bytes(b'II' + struct.pack('<H', 41) + b"\0" * 12)
+    with pytest.raises(ValueError):
+        _tiff_cells(str(tmp_path / 'not.tif'))
+
+
+def test_las_points(tmp_path):
+    _las(str(tmp_path / 'v12.las'), 12345)
+    _las(str(tmp_path / 'v14.las'), 0, minor=4, extended_points=5 * 2 ** 32)
+    _las(str(tmp_path / 'v14_small.las'), 777, minor=4, extended_points=777)
+    assert _las_points(str(tmp_path / 'v12.las')) == 12345
+    assert _las_points(str(tmp_path / 'v14.las')) == 5 * 2 ** 32
+    assert _las_points(str(tmp_path / 'v14_small.las')) == 777
+    (tmp_path / 'not.las').write_bytes(b"LASX" + b"\0" * 300)
+    with pytest.raises(ValueError):
+        _las_points(str(tmp_path / 'not.las'))
+
+
+def test_input_sizes(wbt, tmp_path):
+    _tiff(str(tmp_path / 'data' / 'dem.tif'), 30, 20)
+    _las(str(tmp_path / 'data' / 'points.las'), 4000)
+    assert input_sizes(wbt, 'slope', ["--dem='dem.tif'", "--output='slope.tif'"]) == {
+        'cells': 600, 'points': 0, 'input_bytes': (tmp_path / 'data' / 'dem.tif').stat().st_size}
+    sizes = input_sizes(wbt, 'lidar_tin_gridding', ["--input='points.las'", "--output='dem.tif'"])
+    assert (sizes['cells'], sizes['points']) == (0, 4000)
+
+
+def test_fit_of_a_power_law():
+    sizes = [10.0, 100.0, 1000.0, 10000.0]
+    model = CostModel('slope', 'cells', sizes, [2e-4 * s ** 1.5 for s in sizes], [1e6 * s ** 0.5 for s in sizes])
+    a, b, sigma = model.wall
+    assert (math.exp(a), b, sigma) == (pytest.approx(2e-4), pytest.approx(1.5), pytest.approx(0.0, abs=1e-9))
+    estimate = model.predict(1e6)
+    assert estimate['wall_time'] == pytest.approx(2e-4 * 1e9)
+    assert estimate['wall_time_p90'] == pytest.approx(estimate['wall_time'])
+    assert estimate['max_rss'] == pytest.approx(1e9)
+    assert (estimate['runs'], estimate['kind'], estimate['size']) == (4, 'cells', 1e6)
+
+
+def test_fit_with_scatter_and_a_single_size():
+    # log residuals of +-0.1 about y = size, on two degrees of freedom
+    sizes = [10.0, 10.0, 100.0, 100.0]
+    times = [10.0 * math.exp(0.1), 10.0 * math.exp(-0.1), 100.0 * math.exp(0.1), 100.0 * math.exp(-0.1)]
+    estimate = CostModel('slope', 'cells', sizes, times, [None] * 4).predict(1000.0)
+    assert estimate['wall_time'] == pytest.approx(1000.0)
+    assert estimate['wall_time_p90'] == pytest.approx(1000.0 * math.exp(1.2816 * math.sqrt(0.02)))
+    assert estimate['max_rss'] is None
+    # the geometric mean of the runs of the one size
+    assert CostModel('slope', 'cells', [50, 50], [1.0, 4.0], [0, 0]).predict(5000)['wall_time'] == pytest.approx(2.0)
+
+
+@pytest.fixture
+def history(wbt, tmp_path):
+    h = RuntimeHistory(str(tmp_path / 'runs.sqlite'), wbt)
+    yield h
+    h.close()
+
+
+def _record(history, tmp_path, points, wall_time, exit_code=0, user_time=1.0):
+    las = 'p{}.las'.format(points)
+    _las(str(tmp_path / 'data' / las), points)
+    usage = {'max_rss': 1000 * points}
+    if user_time is not None:
+        usage['user_time'] = user_time
+    history(ToolResult(exit_code, 'lidar_tin_gridding', wall_time=wall_time, usage=usage,
+                       args=["--input='{}'".format(las), "--output='dem.tif'"]))
+
+
+def test_runs_of_wbt_are_recorded(wbt, history, tmp_path):
+    _las(str(tmp_path / 'data' / 'points.las'), 4000)
+    assert wbt.run_tool('lidar_tin_gridding', ["--input='points.las'", "--output='dem.tif'"]) == 0
+    runs = history.runs()
+    assert len(runs) == 1
+    assert (runs[0]['tool'], runs[0]['version'], runs[0]['exit_code'], runs[0]['points']) == \
+        ('lidar_tin_gridding', '2.4.0', 0, 4000)
+    assert runs[0]['args'] == ["--input='points.las'", "--output='dem.tif'"]
+
+
+def test_model_and_predict(history, tmp_path):
+    for points in (1000, 10000, 100000):
+        _record(history, tmp_path, points, 2e-4 * points)
+    _record(history, tmp_path, 10000, 500.0, exit_code=1) # failed
+    _record(history, tmp_path, 10000, 1e-6, user_time=None) # served from a result cache
+    model = history.model('lidar_tin_gridding')
+    assert (model.kind, model.runs) == ('points', 3)
+    assert history.model('slope') is None
+
+    _las(str(tmp_path / 'data' / 'big.las'), 10 ** 6)
+    estimate = history.predict('lidar_tin_gridding', ["--input='big.las'", "--output='dem.tif'"])
+    assert estimate['wall_time'] == pytest.approx(200.0)
+    assert estimate['max_rss'] == pytest.approx(1e9)
+    assert history.predict('slope', ["--dem='dem.tif'", "--output='slope.tif'"]) is None
+
+
+def test_model_of_one_version(history, tmp_path):
+    _record(history, tmp_path, 1000, 1.0)
+    history.version = '2.3.0'
+    _record(history, tmp_path, 1000, 4.0)
+    _record(history, tmp_path, 2000, 8.0)
+    assert history.model('lidar_tin_gridding').runs == 3
+    assert history.model('lidar_tin_gridding', version='2.3.0').runs == 2
+    assert history.model('lidar_tin_gridding', version='2.4.0').predict(1000)['wall_time'] == pytest.approx(1.0)
@@ -0,0 +1,122 @@
+''' Tests of the metrics sinks.
+'''
+
+import asyncio
+import threading
+import types
+
+import whitebox_metrics
+from whitebox_metrics import ChromeTrace, PrometheusExporter
+from whitebox_tools import ToolResult
+
+
+def _tracks(trace):
+    return {e['name']: e['tid'] for e in trace.trace_events() if e.get('ph') == 'X'}
+
+
+def test_overlapping_async_runs_get_tracks_of_their_own(monkeypatch):
+    # spans are ended at time.time(), so the clock is set to each end
+    now = [0.0]
+    monkeypatch.setattr(whitebox_metrics, 'time', types.SimpleNamespace(time=lambda: now[0]))
+    trace = ChromeTrace()
+
+    async def runs():
+        for name, start, end in (('slope', 1.0, 3.0), ('aspect', 2.0, 4.0), ('hillshade', 2.5, 3.5),
+                                 ('d8_pointer', 1.5, 2.5), ('fill_depressions', 5.0, 6.0)):
+            now[0] = end
+            trace(ToolResult(0, name, wall_time=end - start, start_time=start))
+
+    asyncio.run(runs())
+    tracks = _tracks(trace)
+    main = threading.get_ident()
+    # aspect overlaps slope; hillshade nests in aspect; d8_pointer nests in
+    # slope and overlaps aspect; fill_depressions overlaps nothing
+    assert tracks == {'slope': main, 'aspect': 1, 'hillshade': 1, 'd8_pointer': main, 'fill_depressions': main}
+    names = {e['tid']: e['args']['name'] for e in trace.trace_events() if e.get('ph') == 'M'}
+    assert names[1] == names[main] + " (async 1)"
+
+
+def test_async_runs_are_traced(wbt):
+    args = ["--dem='dem.tif'", "--output='slope.tif'"]
+
+    async def runs():
+        await asyncio.gather(wbt.run_tool_async('slope', args), wbt.run_tool_async('aspect', args))
+        await wbt.run_tool_async('hillshade', args)
+
+    with ChromeTrace(wbt) as trace:
+        asyncio.run(runs())
+    tracks = _tracks(trace)
+    assert sorted(tracks) == ['aspect', 'hillshade', 'slope']
+    assert tracks['hillshade'] == threading.get_ident()
+
+
+def test_thread_runs_stay_on_their_thread_track(wbt):
+    args = ["--dem='dem.tif'", "--output='slope.tif'"]
+    with ChromeTrace(wbt) as trace:
+        wbt.run_tool('slope', args)
+        thread = threading.Thread(target=wbt.run_tool, args=('aspect', args))
+        thread.start()
+        thread.join()
+    tracks = _tracks(trace)
+    assert tracks['slope'] == threading.get_ident()
+    assert tracks['aspect'] == thread.ident
+
+
+EXPOSITION = """\
+# HELP whitebox_tool_runs_total WhiteboxTools tool runs by status.
+# TYPE whitebox_tool_runs_total counter
+whitebox_tool_runs_total{status="cancelled",tool="a\\"b\\\\c"} 1
+whitebox_tool_runs_total{status="failure",tool="slope"} 1
+whitebox_tool_runs_total{status="success",tool="slope"} 1
+# HELP whitebox_tool_duration_seconds Wall time of WhiteboxTools tool runs.
+# TYPE whitebox_tool_duration_seconds histogram
+whitebox_tool_duration_seconds_bucket{le="1.0",tool="slope"} 1
+whitebox_tool_duration_seconds_bucket{le="10.0",tool="slope"} 2
+whitebox_tool_duration_seconds_bucket{le="+Inf",tool="slope"} 2
+whitebox_tool_duration_seconds_sum{tool="slope"} 4.5
+whitebox_tool_duration_seconds_count{tool="slope"} 2
+# HELP whitebox_tool_cpu_seconds_total CPU time used by WhiteboxTools tool runs.
+# TYPE whitebox_tool_cpu_seconds_total counter
+whitebox_tool_cpu_seconds_total{mode="system",tool="slope"} 0.25
+whitebox_tool_cpu_seconds_total{mode="user",tool="slope"} 1.25
+# HELP whitebox_tool_peak_rss_bytes Peak resident memory of WhiteboxTools tool runs.
+# TYPE whitebox_tool_peak_rss_bytes histogram
+whitebox_tool_peak_rss_bytes_bucket{le="1000000.0",tool="slope"} 1
+whitebox_tool_peak_rss_bytes_bucket{le="+Inf",tool="slope"} 2
+whitebox_tool_peak_rss_bytes_sum{tool="slope"} 2500000.0
+whitebox_tool_peak_rss_bytes_count{tool="slope"} 2
+# HELP whitebox_tool_read_bytes_total Bytes read by WhiteboxTools tool runs.
+# TYPE whitebox_tool_read_bytes_total counter
+whitebox_tool_read_bytes_total{tool="slope"} 100
+# HELP whitebox_tool_write_bytes_total Bytes written by WhiteboxTools tool runs.
+# TYPE whitebox_tool_write_bytes_total counter
+whitebox_tool_write_bytes_total{tool="slope"} 40
+"""
+
+
+def test_prometheus_text_format(tmp_path):
+    textfile = str(tmp_path / 'whitebox.prom')
+    exporter = PrometheusExporter(textfile=textfile, duration_buckets=(1.0, 10.0), memory_buckets=(1e6,))
+    exporter(ToolResult(0, 'slope', usage={'wall_time': 0.5, 'user_time': 1.25, 'system_time': 0.25,
+                                           'max_rss': 500000, 'read_bytes': 100, 'write_bytes': 40}))
+    exporter(ToolResult(1, 'slope', usage={'wall_time': 4.0, 'max_rss': 2000000}))
+    exporter(ToolResult(2, 'a"b\\c'))
+    assert exporter.render() == EXPOSITION
+    with open(textfile) as f:
+        assert f.read() == EXPOSITION
+    assert [p.name for p in tmp_path.iterdir()] == ['whitebox.prom']
+
+
+def test_prometheus_series_are_labelled_with_the_version(wbt):
+    from urllib.request import urlopen
+    exporter = PrometheusExporter(wbt)
+    wbt.run_tool('slope', ["--dem='dem.tif'", "--output='slope.tif'"])
+    server = exporter.serve(port=0)
+    try:
+        url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+        with urlopen(url) as response:
+            body = response.read().decode('utf-8')
+            assert response.headers['Content-Type'].startswith("text/plain; version=0.0.4")
+    finally:
+        server.shutdown()
+    assert 'whitebox_tool_runs_total{status="success",tool="slope",version="2.4.0"} 1\n' in body
@@ -0,0 +1,181 @@
+''' Checks that NumpyEngine computes every tool in supported_tools as the
+WhiteboxTools executable does: against the executable's per-cell
+semantics (the f64 operations of its Rust source) always, and against the
+executable itself when WBT_DIR names its directory.
+'''
+
+import math
+import os
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import whitebox_raster as raster
+from whitebox_numpy import NumpyEngine, supported_tools
+from whitebox_tools import WhiteboxTools
+
+NODATA = -32768.0
+
+# Halves of both signs, the largest doubles below a half and values too
+# large to have a fraction, where adding 0.5 rounds; values outside the
+# domains of the inverse functions, zeros for the divisions, and a NoData
+# cell in each input.
+A = [[-2.5, -1.5, -0.5, 0.0, 0.5, 1.5, 0.49999999999999994],
+     [2.5, 0.3, -0.7, 1.0, 3.75, NODATA, -0.49999999999999994],
+     [0.0, -3.0, 2.0, 0.25, -0.5, 12.5, 4503599627370497.0]]
+B = [[1.0, -1.5, 0.0, 0.0, 2.0, NODATA, 1.0],
+     [-2.0, 0.3, 0.5, 0.0, 1.5, 4.0, 2.0],
+     [3.0, 2.0, -2.0, 0.25, 0.5, -4.0, -1.0]]
+
+
+def _round(x):
+    # f64::round rounds halves away from zero, computed without adding 0.5
+    t = float(math.trunc(x))
+    return t + math.copysign(1.0, x) if abs(x - t) >= 0.5 else t
+
+
+def _bool(value):
+    return 1.0 if value else 0.0
+
+
+# tool: the value of one cell, from the input cell values (a, b) and
+# incl_equals. Where it raises or is not finite, the executable writes NoData.
+EXECUTABLE = {
+    'absolute_value': lambda a, b, eq: abs(a),
+    'ceil': lambda a, b, eq: float(math.ceil(a)),
+    'floor': lambda a, b, eq: float(math.floor(a)),
+    'round': lambda a, b, eq: _round(a),
+    'negate': lambda a, b, eq: -a,
+    'reciprocal': lambda a, b, eq: 1.0 / a,
+    'increment': lambda a, b, eq: a + 1.0,
+    'decrement': lambda a, b, eq: a - 1.0,
+    'square': lambda a, b, eq: a * a,
+    'square_root': lambda a, b, eq: math.sqrt(a),
+    'exp': lambda a, b, eq: math.exp(a),
+    'exp2': lambda a, b, eq: 2.0 ** a,
+    'ln': lambda a, b, eq: math.log(a),
+    'log10': lambda a, b, eq: math.log10(a),
+    'log2': lambda a, b, eq: math.log2(a),
+    'sin': lambda a, b, eq: math.sin(a),
+    'cos': lambda a, b, eq: math.cos(a),
+    'tan': lambda a, b, eq: math.tan(a),
+    'arc_sin': lambda a, b, eq: math.asin(a),
+    'arc_cos': lambda a, b, eq: math.acos(a),
+    'arc_tan': lambda a, b, eq: math.atan(a),
+    'sinh': lambda a, b, eq: math.sinh(a),
+    'cosh': lambda a, b, eq: math.cosh(a),
+    'tanh': lambda a, b, eq: math.tanh(a),
+    'arsinh': lambda a, b, eq: math.asinh(a),
+    'arcosh': lambda a, b, eq: math.acosh(a),
+    'artanh': lambda a, b, eq: math.atanh(a),
+    'to_degrees': lambda a, b, eq: math.degrees(a),
+    'to_radians': lambda a, b, eq: math.radians(a),
+    'is_no_data': None, # see _expected
+    'add': lambda a, b, eq: a + b,
+    'subtract': lambda a, b, eq: a - b,
+    'multiply': lambda a, b, eq: a * b,
+    'divide': lambda a, b, eq: a / b,
+    'power': lambda a, b, eq: math.pow(a, b),
+    'modulo': lambda a, b, eq: math.fmod(a, b),
+    'min': lambda a, b, eq: min(a, b),
+    'max': lambda a, b, eq: max(a, b),
+    'atan2': lambda a, b, eq: math.atan2(a, b),
+    'equal_to': lambda a, b, eq: _bool(a == b),
+    'not_equal_to': lambda a, b, eq: _bool(a != b),
+    'greater_than': lambda a, b, eq: _bool(a >= b if eq else a > b),
+    'less_than': lambda a, b, eq: _bool(a <= b if eq else a < b),
+    'and': lambda a, b, eq: _bool(a != 0 and b != 0),
+    'or': lambda a, b, eq: _bool(a != 0 or b != 0),
+    'xor': lambda a, b, eq: _bool((a != 0) != (b != 0)),
+    'not': lambda a, b, eq: _bool(a != 0 and b == 0),
+}
+
+# (tool, incl_equals) for every supported tool, both ways for the comparisons
+CASES = [(t, eq) for t in supported_tools
+         for eq in ((False, True) if t in ('greater_than', 'less_than') else (False,))]
+
+_BINARY = ('add', 'subtract', 'multiply', 'divide', 'power', 'modulo', 'min', 'max', 'atan2',
+           'equal_to', 'not_equal_to', 'greater_than', 'less_than', 'and', 'or', 'xor', 'not')
+
+
+def _args(tool, incl_equals, output):
+    if tool in _BINARY:
+        names = ('input_y', 'input_x') if tool == 'atan2' else ('input1', 'input2')
+        args = ["--{}='a.dep'".format(names[0]), "--{}='b.dep'".format(names[1])]
+    else:
+        args = ["--input='a.dep'"]
+    args.append("--output='{}'".format(output))
+    if incl_equals:
+        args.append("--incl_equals")
+    return args
+
+
+def _expected(tool, incl_equals):
+    ret = np.full((len(A), len(A[0])), np.nan)
+    for r in range(len(A)):
+        for c in range(len(A[0])):
+            a, b = A[r][c], B[r][c]
+            if tool == 'is_no_data':
+                ret[r, c] = _bool(a == NODATA)
+                continue
+            if a == NODATA or (tool in _BINARY and b == NODATA):
+                continue
+            try:
+                value = EXECUTABLE[tool](a, b, incl_equals)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                continue
+            if math.isfinite(value):
+                ret[r, c] = value
+    return ret
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    raster.write_raster(str(tmp_path / 'a.dep'), np.array(A), nodata=NODATA)
+    raster.write_raster(str(tmp_path / 'b.dep'), np.array(B), nodata=NODATA)
+    return tmp_path
+
+
+def _read(file_name):
+    cells, header = raster.read_raster(file_name)
+    cells = np.array(cells, dtype=np.float64)
+    cells[cells == header.nodata] = np.nan
+    return cells
+
+
+def test_every_supported_tool_has_executable_semantics():
+    assert sorted(EXECUTABLE) == sorted(supported_tools)
+
+
+@pytest.mark.parametrize('tool, incl_equals', CASES)
+def test_engine_matches_executable_semantics(data_dir, tool, incl_equals):
+    wbt = WhiteboxTools()
+    wbt.set_working_dir(str(data_dir))
+    wbt.set_verbose_mode(False)
+    engine = NumpyEngine()
+    assert engine.run_tool(wbt, tool, _args(tool, incl_equals, 'out.dep')) == 0
+    np.testing.assert_allclose(_read(str(data_dir / 'out.dep')), _expected(tool, incl_equals),
+                               rtol=1e-12, atol=0.0, equal_nan=True)
+
+
+def test_round_halves_away_from_zero(data_dir):
+    wbt = WhiteboxTools()
+    wbt.set_working_dir(str(data_dir))
+    NumpyEngine().run_tool(wbt, 'round', ["--input='a.dep'", "--output='out.dep'"])
+    out = _read(str(data_dir / 'out.dep'))
+    assert list(out[0]) == [-3.0, -2.0, -1.0, 0.0, 1.0, 2.0, 0.0]
+    assert list(out[:, -1]) == [0.0, 0.0, 4503599627370497.0]
+
+
+@pytest.mark.skipif(not os.environ.get('WBT_DIR'), reason="WBT_DIR is not set")
+@pytest.mark.parametrize('tool, incl_equals', CASES)
+def test_engine_matches_executable(data_dir, tool, incl_equals):
+    wbt = WhiteboxTools()
+    wbt.set_whitebox_dir(os.environ['WBT_DIR'])
+    wbt.set_working_dir(str(data_dir))
+    wbt.set_verbose_mode(False)
+    assert wbt.run_tool(tool, _args(tool, incl_equals, 'exe.dep')) == 0
+    assert NumpyEngine().run_tool(wbt, tool, _args(tool, incl_equals, 'engine.dep')) == 0
+    np.testing.assert_allclose(_read(str(data_dir / 'engine.dep')), _read(str(data_dir / 'exe.dep')),
+                               rtol=1e-6, atol=1e-12, equal_nan=True)
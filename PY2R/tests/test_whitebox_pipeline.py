@@ -0,0 +1,90 @@
+''' Tests of Pipeline with the stand-in executable.
+'''
+
+import os
+import time
+
+import pytest
+
+from whitebox_pipeline import Pipeline
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    data = tmp_path / 'data'
+    (data / 'dem.dep').write_text("header")
+    (data / 'dem.tas').write_bytes(b"\0" * 64)
+    return data
+
+
+def _pipeline(wbt):
+    p = Pipeline(wbt, max_workers=2)
+    p.add("fill_depressions", dem="dem.dep", output="filled.dep")
+    p.add("d8_pointer", dem="filled.dep", output="pointer.dep")
+    p.add("slope", dem="dem.dep", output="slope.dep")
+    return p
+
+
+def _age(data_dir, seconds):
+    # moves the modification times of every file back, so that a file
+    # written next is newer than all of them
+    for f in data_dir.iterdir():
+        st = os.stat(str(f))
+        os.utime(str(f), (st.st_atime - seconds, st.st_mtime - seconds))
+
+
+def test_steps_run_after_the_steps_they_read_from(wbt, data_dir, fake_runs):
+    p = _pipeline(wbt)
+    assert p.dependencies() == {'fill_depressions': set(), 'd8_pointer': {'fill_depressions'}, 'slope': set()}
+    assert p.run() == {'fill_depressions': 0, 'd8_pointer': 0, 'slope': 0}
+    tools = [r.split()[0] for r in fake_runs()]
+    assert sorted(tools) == ['D8Pointer', 'FillDepressions', 'Slope']
+    assert tools.index('FillDepressions') < tools.index('D8Pointer')
+
+
+def test_up_to_date_steps_are_skipped(wbt, data_dir, fake_runs):
+    _pipeline(wbt).run()
+    _age(data_dir, 10)
+    p = _pipeline(wbt)
+    assert p.run() == {'fill_depressions': 0, 'd8_pointer': 0, 'slope': 0}
+    assert [s.status for s in p.steps] == ['up-to-date'] * 3
+    assert len(fake_runs()) == 3
+
+
+def test_a_rerun_step_makes_its_dependants_out_of_date(wbt, data_dir, fake_runs):
+    _pipeline(wbt).run()
+    _age(data_dir, 10)
+    os.utime(str(data_dir / 'filled.dep'), (time.time() - 20, time.time() - 20))
+    p = _pipeline(wbt)
+    p.run()
+    assert [s.status for s in p.steps] == ['done', 'done', 'up-to-date']
+    assert [r.split()[0] for r in fake_runs()[3:]] == ['FillDepressions', 'D8Pointer']
+
+
+def test_make_false_runs_every_step(wbt, data_dir, fake_runs):
+    _pipeline(wbt).run()
+    _age(data_dir, 10)
+    p = _pipeline(wbt)
+    p.make = False
+    p.run()
+    assert len(fake_runs()) == 6
+
+
+def test_failure_stops_the_dependants_only(wbt, data_dir, monkeypatch):
+    monkeypatch.setenv('FAKE_EXIT', '1')
+    p = Pipeline(wbt)
+    p.add("fill_depressions", dem="dem.dep", output="filled.dep")
+    p.add("d8_pointer", dem="filled.dep", output="pointer.dep")
+    p.add("d8_flow_accumulation", i="pointer.dep", output="accum.dep", pntr=True)
+    assert p.run() == {'fill_depressions': 1, 'd8_pointer': None, 'd8_flow_accumulation': None}
+    assert [s.status for s in p.steps] == ['failed', 'not-run', 'not-run']
+
+
+def test_cycles_and_conflicting_outputs_are_rejected(wbt, data_dir):
+    p = Pipeline(wbt)
+    p.add("slope", dem="a.dep", output="b.dep")
+    p.add("aspect", dem="b.dep", output="a.dep")
+    with pytest.raises(ValueError, match="cycle"):
+        p.run()
+    with pytest.raises(ValueError, match="both write"):
+        p.add("hillshade", dem="dem.dep", output="b.dep")
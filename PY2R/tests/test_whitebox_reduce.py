@@ -0,0 +1,112 @@
+''' Tests of RasterReducer, against numpy on the same cells. The blocks are
+made small so that every reduction merges partial results of several blocks.
+'''
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import whitebox_raster as raster
+from whitebox_reduce import RasterReducer
+
+NODATA = -32768.0
+
+
+@pytest.fixture
+def cells():
+    rng = np.random.default_rng(7)
+    ret = rng.normal(100.0, 25.0, size=(37, 23))
+    ret[rng.random(ret.shape) < 0.1] = np.nan
+    return ret
+
+
+@pytest.fixture
+def dem(tmp_path, cells):
+    file_name = str(tmp_path / 'dem.dep')
+    raster.write_raster(file_name, cells, nodata=NODATA)
+    return file_name
+
+
+@pytest.fixture
+def reducer():
+    # 2 rows per block
+    return RasterReducer(max_workers=3, block_cells=50)
+
+
+def test_summary_stats(reducer, dem, cells):
+    valid = cells[~np.isnan(cells)]
+    stats = reducer.summary_stats(dem)
+    assert stats['count'] == valid.size
+    assert stats['nodata_count'] == cells.size - valid.size
+    assert stats['sum'] == pytest.approx(valid.sum(), rel=1e-12)
+    assert stats['mean'] == pytest.approx(valid.mean(), rel=1e-12)
+    assert stats['variance'] == pytest.approx(valid.var(), rel=1e-12)
+    assert stats['std_dev'] == pytest.approx(valid.std(), rel=1e-12)
+    assert (stats['min'], stats['max']) == (valid.min(), valid.max())
+
+
+def test_histogram(reducer, dem, cells):
+    valid = cells[~np.isnan(cells)]
+    counts, edges = reducer.histogram(dem, bins=17)
+    expected_counts, expected_edges = np.histogram(valid, bins=17)
+    np.testing.assert_array_equal(counts, expected_counts)
+    np.testing.assert_allclose(edges, expected_edges, rtol=1e-12)
+
+    counts, edges = reducer.histogram(dem, bins=4, value_range=(50.0, 150.0))
+    np.testing.assert_array_equal(counts, np.histogram(valid, bins=4, range=(50.0, 150.0))[0])
+
+
+def test_unique_values(tmp_path):
+    classes = np.array([[1, 2, 2, 3], [3, 3, -1, 1], [7, 7, 7, 7]], dtype=np.int16)
+    file_name = str(tmp_path / 'classes.dep')
+    raster.write_raster(file_name, classes, nodata=-1)
+    counts = RasterReducer(block_cells=4).unique_values(file_name)
+    assert counts == {1.0: 2, 2.0: 2, 3.0: 3, 7.0: 4}
+    assert list(counts) == sorted(counts)
+
+
+def test_exact_quantiles_match_numpy(reducer, dem, cells):
+    valid = cells[~np.isnan(cells)]
+    probs = [0.0, 0.01, 0.25, 0.5, 0.9, 0.999, 1.0]
+    got = reducer.quantiles(dem, probs, sketch_bins=64)
+    np.testing.assert_allclose(got, np.quantile(valid, probs), rtol=1e-12)
+
+
+def test_approximate_quantiles_are_within_a_bin(reducer, dem, cells):
+    valid = cells[~np.isnan(cells)]
+    probs = [0.1, 0.5, 0.9]
+    bins = 256
+    got = reducer.quantiles(dem, probs, exact=False, sketch_bins=bins)
+    width = (valid.max() - valid.min()) / bins
+    assert np.all(np.abs(np.array(got) - np.quantile(valid, probs)) <= width)
+
+
+def test_quantiles_of_constant_and_empty_rasters(reducer, tmp_path):
+    constant = str(tmp_path / 'constant.dep')
+    raster.write_raster(constant, np.full((5, 5), 3.5), nodata=NODATA)
+    assert reducer.quantiles(constant, [0.1, 0.9]) == [3.5, 3.5]
+    empty = str(tmp_path / 'empty.dep')
+    raster.write_raster(empty, np.full((5, 5), np.nan), nodata=NODATA)
+    assert all(np.isnan(reducer.quantiles(empty, [0.5])))
+
+
+def test_zonal_statistics(reducer, dem, cells, tmp_path):
+    zones = np.repeat(np.arange(cells.shape[1], dtype=np.int16)[np.newaxis, :] % 3, cells.shape[0], axis=0)
+    zones[0, :] = -1
+    zones_file = str(tmp_path / 'zones.dep')
+    raster.write_raster(zones_file, zones, nodata=-1)
+    by_zone = reducer.zonal_statistics(dem, zones_file)
+    assert sorted(by_zone) == [0.0, 1.0, 2.0]
+    for zone, stats in by_zone.items():
+        values = cells[(zones == zone) & ~np.isnan(cells)]
+        assert stats['count'] == values.size
+        assert stats['mean'] == pytest.approx(values.mean(), rel=1e-12)
+        assert stats['variance'] == pytest.approx(values.var(), rel=1e-12)
+        assert (stats['min'], stats['max']) == (values.min(), values.max())
+
+
+def test_zones_of_another_size_are_rejected(reducer, dem, tmp_path):
+    zones_file = str(tmp_path / 'zones.dep')
+    raster.write_raster(zones_file, np.zeros((3, 3), dtype=np.int16), nodata=-1)
+    with pytest.raises(ValueError, match="different dimensions"):
+        reducer.zonal_statistics(dem, zones_file)
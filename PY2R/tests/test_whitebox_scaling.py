@@ -0,0 +1,116 @@
+''' Tests of the max_procs scaling study with the stand-in executable.
+'''
+
+import json
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+import whitebox_scaling
+from whitebox_scaling import MaxProcsProfiles, format_table, plot_speedup, proc_counts, scaling_study
+
+ARGS = ["--dem='dem.tif'", "--output='slope.tif'"]
+
+ROWS = [
+    {'max_procs': 1, 'wall_time': 8.0, 'cpu_time': 8.0, 'max_rss': 2 ** 20, 'speedup': 1.0, 'efficiency': 1.0},
+    {'max_procs': 2, 'wall_time': 4.0, 'cpu_time': None, 'max_rss': 2 ** 21, 'speedup': 2.0, 'efficiency': 1.0},
+    {'max_procs': 4, 'wall_time': 2.5, 'cpu_time': 9.0, 'max_rss': 2 ** 21, 'speedup': 3.2, 'efficiency': 0.8},
+]
+
+
+def test_proc_counts():
+    assert proc_counts(6) == [1, 2, 4, 6]
+    assert proc_counts(4) == [1, 2, 4]
+    assert proc_counts(1) == [1]
+
+
+def test_study_runs_every_value_repeat_times(wbt, fake_runs):
+    engine = object() # fails if the study does not bypass it
+    wbt.engine = engine
+    rows = scaling_study(wbt, 'slope', ARGS, procs=[2, 1], repeat=2)
+    assert len(fake_runs()) == 1 + 2 * 2
+    assert [r['max_procs'] for r in rows] == [1, 2]
+    assert (rows[0]['speedup'], rows[0]['efficiency']) == (1.0, 1.0)
+    assert rows[1]['speedup'] == pytest.approx(rows[0]['wall_time'] / rows[1]['wall_time'])
+    assert rows[1]['efficiency'] == pytest.approx(rows[1]['speedup'] / 2)
+    assert wbt.engine is engine
+
+
+def test_study_raises_on_a_failed_run(wbt, monkeypatch):
+    monkeypatch.setenv('FAKE_EXIT', '1')
+    with pytest.raises(RuntimeError, match="slope failed with exit code 1"):
+        scaling_study(wbt, 'slope', ARGS, procs=[1], repeat=1, warmup=False)
+
+
+def test_format_table():
+    lines = format_table(ROWS).splitlines()
+    assert lines[0].split() == ['max_procs', 'wall', 's', 'cpu', 's', 'speedup', 'efficiency', 'rss', 'MB']
+    assert lines[1].split() == ['1', '8.000', '8.000', '1.00', '1.00', '1']
+    assert lines[2].split() == ['2', '4.000', '-', '2.00', '1.00', '2']
+
+
+def test_plot_is_valid_svg(tmp_path):
+    file_name = str(tmp_path / 'speedup.svg')
+    plot_speedup(ROWS, file_name, "slope <dem & more>")
+    root = ElementTree.parse(file_name).getroot()
+    assert root.tag == '{http://www.w3.org/2000/svg}svg'
+    texts = [e.text for e in root.iter('{http://www.w3.org/2000/svg}text')]
+    assert "slope <dem & more>" in texts
+    assert len(list(root.iter('{http://www.w3.org/2000/svg}circle'))) == len(ROWS)
+
+
+def test_command_line(fake_exe_dir, tmp_path, capsys):
+    out = str(tmp_path / 'rows.json')
+    assert whitebox_scaling.main(['slope', "--dem=dem.tif", "--output=slope.tif", '--exe-dir', str(fake_exe_dir),
+                                  '--procs', '1,2', '--repeat', '1', '--json', out]) == 0
+    with open(out) as f:
+        results = json.load(f)
+    assert results['args'] == ["--dem=dem.tif", "--output=slope.tif"]
+    assert [r['max_procs'] for r in results['rows']] == [1, 2]
+    assert capsys.readouterr().out.startswith("slope --dem=dem.tif --output=slope.tif\n")
+
+
+def test_profile_chooses_where_speedup_stops_paying_off():
+    assert MaxProcsProfiles().choose(ROWS) == 4
+    assert MaxProcsProfiles(tolerance=0.4).choose(ROWS) == 2
+
+
+def test_profile_lookup_by_nearest_size(tmp_path):
+    file_name = str(tmp_path / 'profiles.json')
+    profiles = MaxProcsProfiles(file_name, tolerance=0.4)
+    assert profiles.add('slope', 10 ** 8, ROWS) == 2
+    assert profiles.add('slope', 10 ** 6, ROWS[:1]) == 1
+    assert [e['size'] for e in profiles.profiles['slope']] == [10 ** 6, 10 ** 8]
+    assert profiles.lookup('slope', 5 * 10 ** 6) == 1
+    assert profiles.lookup('slope', 5 * 10 ** 7) == 2
+    assert profiles.lookup('aspect', 10 ** 6) is None
+    profiles.save(file_name)
+    assert MaxProcsProfiles(file_name).profiles == profiles.profiles
+
+
+def test_run_tool_takes_max_procs_from_the_profile(wbt, tmp_path, monkeypatch):
+    (tmp_path / 'data' / 'dem.tif').write_bytes(b"\0" * 1000)
+    profiles = MaxProcsProfiles()
+    profiles.profiles['slope'] = [{'size': 1000, 'max_procs': 3, 'speedup': 2.5, 'efficiency': 0.83}]
+    wbt.set_max_procs_profile(profiles)
+    used = []
+    tool_args = wbt._tool_args
+
+    def recording_tool_args(tool_name, args, max_procs=None):
+        used.append(max_procs)
+        return tool_args(tool_name, args, max_procs)
+
+    monkeypatch.setattr(wbt, '_tool_args', recording_tool_args)
+    wbt.run_tool('slope', ARGS)
+    wbt.run_tool('slope', ARGS, max_procs=5)
+    wbt.run_tool('aspect', ARGS)
+    assert used == [3, 5, None]
+
+
+def test_tune_records_and_saves_the_choice(wbt, tmp_path):
+    (tmp_path / 'data' / 'dem.tif').write_bytes(b"\0" * 1000)
+    file_name = str(tmp_path / 'profiles.json')
+    profiles = MaxProcsProfiles(file_name)
+    p = profiles.tune(wbt, 'slope', ARGS, procs=[1, 2], repeat=1)
+    assert p in (1, 2)
+    assert MaxProcsProfiles(file_name).lookup('slope', 1000) == p
@@ -0,0 +1,67 @@
+''' Tests of ScratchWorkspace with the stand-in executable.
+'''
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def dem(tmp_path):
+    data = tmp_path / 'data'
+    (data / 'dem.dep').write_text("header")
+    (data / 'dem.tas').write_bytes(b"\0" * 64)
+    return data
+
+
+def _chain(wbt, ws):
+    filled = ws.path("filled.dep")
+    assert wbt.fill_depressions("dem.dep", filled) == 0
+    assert wbt.d8_pointer(filled, ws.output("pointer.dep")) == 0
+    return filled
+
+
+def test_finals_are_moved_and_the_rest_removed_on_success(wbt, dem, tmp_path):
+    with wbt.scratch_workspace(str(tmp_path / 'scratch')) as ws:
+        filled = _chain(wbt, ws)
+        assert ws.is_intermediate(filled)
+        assert not ws.is_intermediate(ws.path("pointer.tas"))
+        assert os.path.exists(filled)
+    assert sorted(p.name for p in dem.iterdir()) == ['dem.dep', 'dem.tas', 'pointer.dep', 'pointer.tas']
+    assert (dem / 'pointer.tas').read_bytes() == b"\0" * 64
+    assert ws.moved == [str(dem / 'pointer.dep')]
+    assert list((tmp_path / 'scratch').iterdir()) == []
+    assert wbt.scratch_workspaces == []
+
+
+def test_everything_is_removed_on_an_exception(wbt, dem, tmp_path):
+    with pytest.raises(KeyError):
+        with wbt.scratch_workspace(str(tmp_path / 'scratch')) as ws:
+            _chain(wbt, ws)
+            raise KeyError("stop")
+    assert sorted(p.name for p in dem.iterdir()) == ['dem.dep', 'dem.tas']
+    assert list((tmp_path / 'scratch').iterdir()) == []
+    assert wbt.scratch_workspaces == []
+
+
+def test_abort_discards_the_finals(wbt, dem, tmp_path):
+    with wbt.scratch_workspace(str(tmp_path / 'scratch')) as ws:
+        _chain(wbt, ws)
+        ws.abort()
+    assert sorted(p.name for p in dem.iterdir()) == ['dem.dep', 'dem.tas']
+    assert list((tmp_path / 'scratch').iterdir()) == []
+
+
+def test_final_that_was_not_written_is_left_out(wbt, dem, tmp_path):
+    with wbt.scratch_workspace(str(tmp_path / 'scratch')) as ws:
+        ws.output("missing.dep")
+        _chain(wbt, ws)
+    assert ws.moved == [str(dem / 'pointer.dep')]
+    assert not (dem / 'missing.dep').exists()
+
+
+def test_paths_are_only_given_inside_the_with_block(wbt, tmp_path):
+    ws = wbt.scratch_workspace(str(tmp_path / 'scratch'))
+    with pytest.raises(RuntimeError):
+        ws.path("filled.dep")
+    assert not ws.is_intermediate(str(tmp_path / 'filled.dep'))
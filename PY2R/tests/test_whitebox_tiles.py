@@ -0,0 +1,60 @@
+''' Tests of TiledRunner with the stand-in executable.
+'''
+
+import sys
+
+import pytest
+
+import whitebox_raster as raster
+from whitebox_tiles import TiledRunner
+
+
+def test_halo_from_numeric_defaults():
+    runner = TiledRunner(None)
+    assert runner.halo('mean_filter', {}) == 2
+    assert runner.halo('median_filter', {}) == 6
+    assert runner.halo('gaussian_filter', {}) == 4
+    assert runner.halo('mean_filter', {'filterx': 7}) == 4
+
+
+def _dem(data_dir, np):
+    cells = np.arange(11 * 9, dtype=np.float32).reshape(11, 9)
+    cells[3, 4] = np.nan
+    raster.write_raster(str(data_dir / 'dem.dep'), cells, nodata=-32768.0)
+    return cells
+
+
+def test_tiled_run_with_default_halo_matches_untiled_run(wbt, fake_runs, tmp_path):
+    np = pytest.importorskip('numpy')
+    data = tmp_path / 'data'
+    _dem(data, np)
+    runner = TiledRunner(wbt, tile_size=4, max_workers=2)
+    assert runner.run('mean_filter', i='dem.dep', output='tiled.dep') == 0
+    assert len(fake_runs()) == 9
+    assert wbt.mean_filter('dem.dep', 'whole.dep') == 0
+
+    tiled, tiled_header = raster.read_raster(str(data / 'tiled.dep'))
+    whole, whole_header = raster.read_raster(str(data / 'whole.dep'))
+    np.testing.assert_array_equal(tiled, whole)
+    assert (tiled_header.rows, tiled_header.cols) == (whole_header.rows, whole_header.cols)
+    assert tiled_header.fields['Min'] == '0.0'
+    assert tiled_header.fields['Max'] == '98.0'
+    assert sorted(p.name for p in data.iterdir()) == ['dem.dep', 'dem.tas', 'tiled.dep', 'tiled.tas',
+                                                     'whole.dep', 'whole.tas']
+
+
+@pytest.mark.parametrize('with_numpy', [True, False])
+def test_paste_window_returns_the_range_of_valid_cells(tmp_path, monkeypatch, with_numpy):
+    np = pytest.importorskip('numpy')
+    cells = _dem(tmp_path, np)
+    header = raster.RasterHeader.read(str(tmp_path / 'dem.dep'))
+    raster.create(str(tmp_path / 'out.dep'), header)
+    if not with_numpy:
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+    assert raster.paste_window(str(tmp_path / 'dem.dep'), str(tmp_path / 'out.dep'),
+                               3, 5, 2, 7, 0, 0) == (29.0, 42.0)
+    assert raster.paste_window(str(tmp_path / 'dem.dep'), str(tmp_path / 'out.dep'),
+                               3, 4, 4, 5, 0, 0) is None
+    monkeypatch.undo()
+    out, _ = raster.read_raster(str(tmp_path / 'out.dep'))
+    np.testing.assert_array_equal(out[1, :5], cells[4, 2:7])
@@ -0,0 +1,186 @@
+''' Tests of WhiteboxTools with the stand-in executable.
+'''
+
+import os
+
+import pytest
+
+import whitebox_tools
+from whitebox_tools import ToolResult, _MetadataCache
+
+
+def test_run_tool_returns_result(wbt, fake_runs):
+    result = wbt.run_tool('slope', ["--dem='dem.tif'", "--output='slope.tif'"])
+    assert result == 0
+    assert result.tool_name == 'slope'
+    assert fake_runs() == ["Slope --dem='dem.tif' --output='slope.tif'"]
+
+
+def test_failing_metrics_sink_does_not_fail_run(wbt):
+    results, messages = [], []
+
+    def broken(result):
+        raise RuntimeError("sink is down")
+
+    wbt.default_callback = messages.append
+    wbt.add_metrics_sink(broken)
+    wbt.add_metrics_sink(results.append)
+    result = wbt.run_tool('slope', ["--dem='dem.tif'", "--output='slope.tif'"])
+    assert result == 0
+    assert results == [result]
+    assert any("sink is down" in m for m in messages)
+
+
+def test_run_tool_async_keeps_output_limit(wbt, monkeypatch):
+    import asyncio
+    monkeypatch.setenv('FAKE_LINES', '50')
+    wbt.output_limit = 1
+    result = asyncio.run(wbt.run_tool_async('slope', ["--dem='dem.tif'", "--output='slope.tif'"]))
+    assert result == 0
+    assert result.output == ["Elapsed Time (excluding I/O): 0.1s"]
+
+    wbt.capture_output = False
+    result = asyncio.run(wbt.run_tool_async('slope', ["--dem='dem.tif'", "--output='slope.tif'"]))
+    assert result == 0
+    assert result.output == []
+
+
+def test_set_whitebox_dir_reads_its_settings(wbt, fake_exe_dir, tmp_path):
+    (fake_exe_dir / 'settings.json').write_text(
+        '{"working_directory": "%s", "verbose_mode": "true", "max_procs": 2}' % tmp_path)
+    wbt.set_whitebox_dir(str(fake_exe_dir))
+    assert wbt.get_working_dir() == str(tmp_path)
+    assert wbt.get_verbose_mode() is True
+    assert wbt.get_max_procs() == 2
+
+
+def test_tool_async_awaits_to_a_result(wbt, fake_runs):
+    import asyncio
+    result = asyncio.run(wbt.slope_async('dem.tif', 'slope.tif', zfactor=2.0))
+    assert result == 0
+    assert isinstance(result, ToolResult)
+    assert result.tool_name == 'slope'
+    assert fake_runs() == ["Slope --dem='dem.tif' --output='slope.tif' --zfactor='2.0' --units=degrees"]
+
+
+def test_async_counterparts_are_for_tools_only(wbt):
+    for name in ('help_async', 'version_async', 'run_tool_async_async', 'no_such_tool_async'):
+        with pytest.raises(AttributeError):
+            getattr(wbt, name)
+
+
+def _touch(p):
+    # a later mtime than the file system clock may give within a test
+    st = os.stat(str(p))
+    os.utime(str(p), ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_list_tools_is_served_from_metadata_cache(wbt, monkeypatch):
+    assert len(wbt.list_tools()) == 2
+    monkeypatch.setenv('FAKE_TOOLS', '5')
+    assert len(wbt.list_tools()) == 2
+    wbt.use_metadata_cache = False
+    assert len(wbt.list_tools()) == 5
+    wbt.use_metadata_cache = True
+    assert len(wbt.list_tools()) == 2
+
+
+def test_metadata_cache_invalidated_by_new_exe(wbt, fake_exe_dir, monkeypatch):
+    exe = fake_exe_dir / 'whitebox_tools'
+    assert len(wbt.list_tools()) == 2
+    monkeypatch.setenv('FAKE_TOOLS', '5')
+    _touch(exe)
+    assert len(wbt.list_tools()) == 5
+
+    # same mtime, different size
+    st = os.stat(str(exe))
+    with open(str(exe), 'a') as f:
+        f.write("# upgraded\n")
+    os.utime(str(exe), ns=(st.st_atime_ns, st.st_mtime_ns))
+    monkeypatch.setenv('FAKE_TOOLS', '7')
+    assert len(wbt.list_tools()) == 7
+
+
+def test_metadata_cache_invalidated_by_plugins(wbt, fake_exe_dir, monkeypatch):
+    plugins = fake_exe_dir / 'plugins'
+    assert len(wbt.list_tools()) == 2
+    monkeypatch.setenv('FAKE_TOOLS', '5')
+    plugins.mkdir()
+    assert len(wbt.list_tools()) == 5
+
+    monkeypatch.setenv('FAKE_TOOLS', '7')
+    assert len(wbt.list_tools()) == 5
+    (plugins / 'gte').write_text("extension")
+    _touch(plugins)
+    assert len(wbt.list_tools()) == 7
+
+
+def test_metadata_cache_is_kept_on_disk(wbt, fake_exe_dir, tmp_path, monkeypatch):
+    exe_file = wbt.exe_file()
+    assert wbt.version().startswith("WhiteboxTools v2.4.0")
+    assert len(wbt.list_tools()) == 2
+    cache_file = whitebox_tools._metadata_cache.cache_file(exe_file)
+    assert os.path.dirname(cache_file) == str(fake_exe_dir / 'cache')
+    assert os.path.isfile(cache_file)
+
+    # a new process reads the entries back from the file
+    monkeypatch.setenv('FAKE_TOOLS', '5')
+    monkeypatch.setattr(whitebox_tools, '_metadata_cache', _MetadataCache())
+    assert len(wbt.list_tools()) == 2
+    assert whitebox_tools._metadata_cache.get(exe_file, "--version").startswith("WhiteboxTools v2.4.0")
+    assert _MetadataCache(str(tmp_path / 'other')).get(exe_file, "--listtools") is None
+
+    # but not once the executable has changed since they were written
+    _touch(exe_file)
+    assert _MetadataCache().get(exe_file, "--listtools") is None
+
+    wbt.clear_metadata_cache()
+    assert not os.path.exists(cache_file)
+    assert len(wbt.list_tools()) == 5
+
+
+def test_metadata_cache_ignores_missing_exe(tmp_path):
+    cache = _MetadataCache(str(tmp_path / 'cache'))
+    exe_file = str(tmp_path / 'whitebox_tools')
+    cache.put(exe_file, "--version", "WhiteboxTools v2.4.0")
+    assert cache.get(exe_file, "--version") is None
+    assert not os.path.exists(cache.cache_file(exe_file))
+
+
+def test_settings_round_trip(wbt, fake_exe_dir, tmp_path):
+    import json
+    settings_file = fake_exe_dir / 'settings.json'
+    settings_file.write_text('{"default_nodata": -32768.0, "max_procs": 8}')
+    wbt.set_working_dir(str(tmp_path))
+    wbt.set_verbose_mode(True)
+    wbt.set_compress_rasters(True)
+    wbt.set_max_procs(3)
+    assert wbt.save_settings() == 0
+    assert sorted(os.listdir(str(fake_exe_dir))) == ['settings.json', 'whitebox_tools']
+    assert json.loads(settings_file.read_text()) == {
+        'default_nodata': -32768.0, 'working_directory': str(tmp_path),
+        'verbose_mode': True, 'compress_rasters': True, 'max_procs': 3}
+
+    other = whitebox_tools.WhiteboxTools()
+    other.set_whitebox_dir(str(fake_exe_dir))
+    assert other.get_working_dir() == str(tmp_path)
+    assert other.get_verbose_mode() is True
+    assert other.get_compress_rasters() is True
+    assert other.get_max_procs() == 3
+
+
+def test_load_settings_keeps_values_without_a_file(wbt, fake_exe_dir, tmp_path):
+    work_dir = wbt.get_working_dir()
+    assert wbt.load_settings() is False
+    (fake_exe_dir / 'settings.json').write_text("{not json")
+    assert wbt.load_settings() is False
+    assert wbt.get_working_dir() == work_dir
+    assert wbt.get_verbose_mode() is False
+
+
+def test_save_settings_reports_errors(wbt, tmp_path):
+    messages = []
+    wbt.default_callback = messages.append
+    wbt.set_whitebox_dir(str(tmp_path / 'missing'))
+    assert wbt.save_settings() == 1
+    assert len(messages) == 1
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+''' Runs batches of WhiteboxTools jobs concurrently while sharing a global
+CPU budget between them.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_batch import BatchExecutor
+
+    wbt = WhiteboxTools()
+    jobs = [
+        ("slope", ["--dem='dem.tif'", "--output='slope.tif'"]),
+        ("aspect", ["--dem='dem.tif'", "--output='aspect.tif'"]),
+        ("hillshade", ["--dem='dem.tif'", "--output='hillshade.tif'"], 8),
+    ]
+    ret = BatchExecutor(wbt, max_procs=32).run(jobs)
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from whitebox_tools import WhiteboxTools
+
+
+class BatchExecutor(object):
+    '''
+    Runs a list of (tool_name, args) jobs concurrently. Each job is launched
+    with its own --max_procs value so that the jobs running at any moment
+    never use more than max_procs cores between them, instead of every job
+    claiming all of the cores.
+
+    Every tool already runs in its own process, so the jobs are dispatched
+    from a pool of threads that only wait on their child processes.
+    '''
+
+    def __init__(self, wbt=None, max_procs=None, max_workers=None):
+        '''
+        wbt -- WhiteboxTools object used to run the jobs; a new one is created if None.
+        max_procs -- Total number of cores shared by the running jobs; defaults to all cores.
+        max_workers -- Maximum number of jobs running at once; defaults to one per core.
+        '''
+        self.wbt = wbt if wbt is not None else WhiteboxTools()
+        self.max_procs = max_procs if max_procs is not None and max_procs > 0 else (os.cpu_count() or 1)
+        self.max_workers = max_workers
+        self.__free_procs = self.max_procs
+        self.__cond = threading.Condition()
+
+    def procs_per_job(self, num_jobs):
+        '''
+        Returns the core share given to jobs that do not specify their own.
+        '''
+        workers = self.max_workers or self.max_procs
+        workers = max(1, min(workers, num_jobs, self.max_procs))
+        return max(1, self.max_procs // workers)
+
+    def run(self, jobs, callback=None):
+        '''
+        Runs the jobs and returns the run_tool return code of each one, in
+        the order of the jobs. A job is a (tool_name, args) tuple, or a
+        (tool_name, args, procs) tuple to request a specific core share.
+        '''
+        jobs = [tuple(job) for job in jobs]
+        if len(jobs) == 0:
+            return []
+
+        share = self.procs_per_job(len(jobs))
+        workers = max(1, min(len(jobs), self.max_workers or self.max_procs))
+
+        def run_job(job):
+            tool_name, args = job[0], job[1]
+            procs = job[2] if len(job) > 2 and job[2] is not None else share
+            procs = max(1, min(procs, self.max_procs))
+            self.__acquire(procs)
+            try:
+                return self.wbt.run_tool(tool_name, args, callback, max_procs=procs)
+            finally:
+                self.__release(procs)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_job, jobs))
+
+    def __acquire(self, procs):
+        with self.__cond:
+            while self.__free_procs < procs:
+                self.__cond.wait()
+            self.__free_procs -= procs
+
+    def __release(self, procs):
+        with self.__cond:
+            self.__free_procs += procs
+            self.__cond.notify_all()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+''' A content-addressed cache of WhiteboxTools results, so that a tool run
+whose inputs have not changed since an earlier identical run is skipped.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_cache import ResultCache
+
+    wbt = WhiteboxTools()
+    wbt.set_result_cache(ResultCache("/data/wbt-cache"))
+    wbt.d8_pointer("dem.tif", "pointer.tif")  # runs the tool
+    wbt.d8_pointer("dem.tif", "pointer.tif")  # outputs are intact: skipped
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import os
+from os import path
+import hashlib
+import json
+import shutil
+import time
+
+from whitebox_tools import to_snakecase
+
+
+class ResultCache(object):
+    '''
+    Caches the outputs of tool runs under cache_dir. A run is identified by
+    the tool name, its normalised arguments, the WhiteboxTools version and
+    the size and modification time of every input file (or their contents
+    when hash_contents is True). When a run matches a cached entry, the
+    outputs are left alone if they are still intact and are otherwise
+    restored from the cache, and the recorded tool output is replayed to
+    the callback.
+
+    Outputs are stored as hard links where possible, so caching costs no
+    extra disk space on the same file system. A stored output that was
+    modified since it was cached invalidates its entry.
+
+    Only tools with file outputs described in whitebox_tools.json are
+    cached; other tools always run.
+    '''
+
+    def __init__(self, cache_dir, hash_contents=False):
+        self.cache_dir = path.abspath(cache_dir)
+        self.hash_contents = hash_contents
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, wbt, tool_name, args, inputs):
+        '''
+        Returns the cache key of a tool run, or None if an input is missing.
+        '''
+        h = hashlib.sha256()
+        h.update(to_snakecase(tool_name).encode('utf-8'))
+        h.update(str(wbt.version()).encode('utf-8'))
+        h.update(str(bool(wbt.get_compress_rasters())).encode('utf-8'))
+        for arg in sorted(_normalize_args(wbt, tool_name, args)):
+            h.update(b'\0' + arg.encode('utf-8'))
+        for f in inputs:
+            h.update(b'\0' + f.encode('utf-8'))
+            try:
+                if self.hash_contents:
+                    h.update(_file_digest(f).encode('utf-8'))
+                else:
+                    st = os.stat(f)
+                    h.update("{}:{}".format(st.st_size, st.st_mtime_ns).encode('utf-8'))
+            except OSError:
+                return None
+        return h.hexdigest()
+
+    def entry_dir(self, key):
+        return path.join(self.cache_dir, key[:2], key)
+
+    def run_tool(self, wbt, tool_name, args, callback=None, max_procs=None, output=None, usage=None):
+        '''
+        Runs a tool through the cache; called by WhiteboxTools.run_tool when
+        this cache is set with set_result_cache. The tool output, recorded
+        or replayed, is appended to output if it is given, and the resource
+        usage of a run that is not skipped is recorded in usage.
+        '''
+        if callback is None:
+            callback = wbt.default_callback
+
+        inputs, outputs = wbt.tool_files(tool_name, args)
+        key = self.key(wbt, tool_name, args, inputs) if len(outputs) > 0 else None
+        if key is None:
+            return wbt._run_tool(tool_name, args, callback, max_procs, output, usage)
+        if output is None:
+            output = []
+
+        if self.restore(key, callback if wbt.verbose else None, output):
+            self.hits += 1
+            return 0
+
+        self.misses += 1
+        lines = []
+        start = time.time()
+        ret = wbt._run_tool(tool_name, args, callback, max_procs, lines, usage)
+        output.extend(lines)
+        if ret == 0:
+            _, outputs = wbt.tool_files(tool_name, args)
+            if all(path.isfile(f) and os.stat(f).st_mtime >= start - 1 for f in outputs):
+                self.store(key, outputs, lines)
+        return ret
+
+    def restore(self, key, callback=None, output=None):
+        '''
+        Makes the outputs of a cached run available at their original paths,
+        and replays the recorded tool output to callback and output.
+        Returns False if there is no valid entry for the key.
+        '''
+        entry = self.entry_dir(key)
+        try:
+            with open(path.join(entry, 'manifest.json'), 'r') as f:
+                manifest = json.loads(f.read())
+        except (OSError, ValueError):
+            return False
+
+        # every stored copy must be unchanged before anything is touched
+        for out in manifest['outputs']:
+            if not _same_stat(path.join(entry, out['stored']), out):
+                self.evict(key)
+                return False
+
+        try:
+            for out in manifest['outputs']:
+                if _same_stat(out['path'], out):
+                    continue
+                os.makedirs(path.dirname(out['path']), exist_ok=True)
+                _link_or_copy(path.join(entry, out['stored']), out['path'])
+        except OSError:
+            return False
+
+        lines = manifest.get('lines', [])
+        if output is not None:
+            output.extend(lines)
+        if callback is not None:
+            for line in lines:
+                callback(line)
+        return True
+
+    def store(self, key, outputs, lines):
+        '''
+        Records the outputs of a successful run under key.
+        '''
+        entry = self.entry_dir(key)
+        tmp = "{}.{}.tmp".format(entry, os.getpid())
+        try:
+            os.makedirs(tmp, exist_ok=True)
+            manifest = {'outputs': [], 'lines': lines}
+            for i, f in enumerate(outputs):
+                stored = "{}-{}".format(i, path.basename(f))
+                _link_or_copy(f, path.join(tmp, stored))
+                st = os.stat(path.join(tmp, stored))
+                manifest['outputs'].append({'path': f, 'stored': stored,
+                                            'size': st.st_size, 'mtime_ns': st.st_mtime_ns})
+            with open(path.join(tmp, 'manifest.json'), 'w') as mf:
+                mf.write(json.dumps(manifest))
+            if path.isdir(entry):
+                shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp, entry)
+        except OSError:
+            pass # another process stored the same entry, or the cache is not writable
+        finally:
+            if path.isdir(tmp):
+                shutil.rmtree(tmp, ignore_errors=True)
+
+    def evict(self, key):
+        shutil.rmtree(self.entry_dir(key), ignore_errors=True)
+
+    def clear(self):
+        '''
+        Removes every entry from the cache.
+        '''
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+def _normalize_args(wbt, tool_name, args):
+    # file arguments are compared by absolute path, and the run-time flags
+    # that do not affect the outputs are left out
+    file_args = {}
+    for arg in args:
+        flag, sep, value = str(arg).partition('=')
+        value = value.strip().strip('\'"')
+        if sep != '' and value != '' and path.splitext(value)[1] != '':
+            file_args[arg] = "{}={}".format(flag, wbt.resolve_path(value))
+    return [file_args.get(arg, str(arg)) for arg in args
+            if not str(arg).startswith(('-v', '--max_procs', '--wd'))]
+
+
+def _file_digest(file_name):
+    h = hashlib.sha256()
+    with open(file_name, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _same_stat(file_name, record):
+    try:
+        st = os.stat(file_name)
+    except OSError:
+        return False
+    return st.st_size == record['size'] and st.st_mtime_ns == record['mtime_ns']
+
+
+def _link_or_copy(src, dst):
+    if path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+''' Fuses chains of element-wise Math and Stats tools into one
+raster_calculator run, so that a computation of many steps reads its input
+rasters and writes its output raster once instead of writing an
+intermediate raster at every step.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_expr import FusedTools
+
+    with FusedTools(WhiteboxTools()) as wbt:
+        wbt.subtract("nir.tif", "red.tif", "diff.tif")   # recorded, not run
+        wbt.add("nir.tif", "red.tif", "sum.tif")         # recorded, not run
+        wbt.divide("diff.tif", "sum.tif", "ndvi.tif")    # recorded, not run
+        wbt.greater_than("ndvi.tif", 0.3, "veg.tif")     # recorded, not run
+    # on exit: one raster_calculator run writes veg.tif, the only output
+    # that no other recorded step reads
+
+The same expressions can be built directly:
+
+    from whitebox_expr import raster
+
+    nir, red = raster("nir.tif"), raster("red.tif")
+    ((nir - red) / (nir + red) > 0.3).evaluate(WhiteboxTools(), "veg.tif")
+'''
+
+# License: MIT
+
+from __future__ import print_function
+
+from whitebox_tools import _RecordingRunner, _tool_method
+
+
+class RasterExpr(object):
+    '''
+    A node of a raster expression: a raster file, a constant, or an
+    operator or function applied to other nodes. Arithmetic operators, the
+    ordering comparisons and &, |, ^ and ~ (logical and, or, xor and not)
+    build new nodes; use eq() and ne() for equality, as == keeps its usual
+    meaning.
+    '''
+
+    def __init__(self, kind, value, operands=()):
+        # kind is 'raster', 'const', 'op' (infix operator value) or
+        # 'func' (value is a format string taking the operand statements)
+        self.kind = kind
+        self.value = value
+        self.operands = tuple(operands)
+
+    def statement(self):
+        '''
+        Returns the raster_calculator statement that computes the expression.
+        '''
+        if self.kind == 'raster':
+            return '"{}"'.format(self.value)
+        if self.kind == 'const':
+            return repr(self.value) if self.value >= 0 else "({!r})".format(self.value)
+        operands = [o.statement() for o in self.operands]
+        if self.kind == 'op':
+            return "({} {} {})".format(operands[0], self.value, operands[1])
+        return self.value.format(*operands)
+
+    def rasters(self):
+        '''
+        Returns the raster files the expression reads, in order of first use.
+        '''
+        if self.kind == 'raster':
+            return [self.value]
+        ret = []
+        for o in self.operands:
+            for f in o.rasters():
+                if f not in ret:
+                    ret.append(f)
+        return ret
+
+    def steps(self):
+        '''
+        Returns the number of tool runs the expression stands for.
+        '''
+        if self.kind in ('raster', 'const'):
+            return 0
+        return 1 + sum(o.steps() for o in self.operands)
+
+    def evaluate(self, wbt, output, callback=None):
+        '''
+        Writes the expression to the raster output with a single
+        raster_calculator run. Returns its run_tool return code.
+        '''
+        return wbt.raster_calculator(output, statement=self.statement(), callback=callback)
+
+    def __repr__(self):
+        return "RasterExpr({})".format(self.statement())
+
+    def __add__(self, other): return _op('+', self, other)
+    def __radd__(self, other): return _op('+', other, self)
+    def __sub__(self, other): return _op('-', self, other)
+    def __rsub__(self, other): return _op('-', other, self)
+    def __mul__(self, other): return _op('*', self, other)
+    def __rmul__(self, other): return _op('*', other, self)
+    def __truediv__(self, other): return _op('/', self, other)
+    def __rtruediv__(self, other): return _op('/', other, self)
+    def __mod__(self, other): return _op('%', self, other)
+    def __rmod__(self, other): return _op('%', other, self)
+    def __pow__(self, other): return _op('^', self, other)
+    def __rpow__(self, other): return _op('^', other, self)
+    def __neg__(self): return _func("(-{})", self)
+    def __abs__(self): return _func("abs({})", self)
+    def __gt__(self, other): return _op('>', self, other)
+    def __ge__(self, other): return _op('>=', self, other)
+    def __lt__(self, other): return _op('<', self, other)
+    def __le__(self, other): return _op('<=', self, other)
+    def __and__(self, other): return _func("(({} != 0) && ({} != 0))", self, other)
+    def __or__(self, other): return _func("(({} != 0) || ({} != 0))", self, other)
+    def __xor__(self, other): return _func("(({} != 0) != ({} != 0))", self, other)
+    def __invert__(self): return _func("({} == 0)", self)
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def eq(self, other):
+        return _op('==', self, other)
+
+    def ne(self, other):
+        return _op('!=', self, other)
+
+
+def raster(file_name):
+    '''
+    Returns the expression that reads the raster file_name.
+    '''
+    return RasterExpr('raster', file_name)
+
+
+def _as_expr(value):
+    if isinstance(value, RasterExpr):
+        return value
+    try:
+        return RasterExpr('const', float(value))
+    except (TypeError, ValueError):
+        return raster(value)
+
+
+def _op(op, a, b):
+    return RasterExpr('op', op, (_as_expr(a), _as_expr(b)))
+
+
+def _func(fmt, *operands):
+    return RasterExpr('func', fmt, [_as_expr(o) for o in operands])
+
+
+# Math and Stats tools that are evaluated cell by cell, with the
+# raster_calculator statement that matches each of them. The statement
+# language has no ln, sqrt or exp functions; they are written with log,
+# ^ and e().
+_unary_tools = {
+    'absolute_value': "abs({})",
+    'ceil': "ceil({})",
+    'floor': "floor({})",
+    'round': "round({})",
+    'negate': "(-{})",
+    'reciprocal': "(1.0 / {})",
+    'increment': "({} + 1.0)",
+    'decrement': "({} - 1.0)",
+    'square': "({} ^ 2.0)",
+    'square_root': "({} ^ 0.5)",
+    'exp': "(e() ^ {})",
+    'exp2': "(2.0 ^ {})",
+    'ln': "log(e(), {})",
+    'log10': "log(10.0, {})",
+    'log2': "log(2.0, {})",
+    'sin': "sin({})",
+    'cos': "cos({})",
+    'tan': "tan({})",
+    'arc_sin': "asin({})",
+    'arc_cos': "acos({})",
+    'arc_tan': "atan({})",
+    'sinh': "sinh({})",
+    'cosh': "cosh({})",
+    'tanh': "tanh({})",
+    'arsinh': "asinh({})",
+    'arcosh': "acosh({})",
+    'artanh': "atanh({})",
+    'to_degrees': "({} * 180.0 / pi())",
+    'to_radians': "({} * pi() / 180.0)",
+}
+
+_binary_tools = {
+    'add': "({} + {})",
+    'subtract': "({} - {})",
+    'multiply': "({} * {})",
+    'divide': "({} / {})",
+    'power': "({} ^ {})",
+    'modulo': "({} % {})",
+    'min': "min({}, {})",
+    'max': "max({}, {})",
+    'equal_to': "({} == {})",
+    'not_equal_to': "({} != {})",
+    'And': "(({} != 0) && ({} != 0))",
+    'Or': "(({} != 0) || ({} != 0))",
+    'xor': "(({} != 0) != ({} != 0))",
+    'Not': "(({} != 0) && ({} == 0))",
+}
+
+# (statement, statement with incl_equals)
+_comparison_tools = {
+    'greater_than': ("({} > {})", "({} >= {})"),
+    'less_than': ("({} < {})", "({} <= {})"),
+}
+
+fusable_tools = sorted(list(_unary_tools) + list(_binary_tools) + list(_comparison_tools))
+
+
+class FusedTools(object):
+    '''
+    Wraps a WhiteboxTools object so that calls of the tools in
+    fusable_tools are recorded as raster expressions instead of being run.
+    A recorded output read by a later recorded call is substituted by its
+    expression, so it is never written. Pending outputs are written by
+    flush(), or when a tool that is not fusable reads them or replaces a
+    file they read or write; all other
+    methods are passed through to the wrapped object.
+
+    raster_calculator treats a cell that is NoData in any input raster as
+    NoData in the output, like the individual tools do.
+    '''
+
+    def __init__(self, wbt):
+        self.wbt = wbt
+        self.pending = {} # resolved output path: (output as given, expression, callback)
+        self.fused = set() # pending outputs that a later expression reads
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+        else:
+            self.pending.clear()
+            self.fused.clear()
+
+    def __getattr__(self, name):
+        if name in _unary_tools:
+            fmt = _unary_tools[name]
+
+            def record(i, output, callback=None):
+                return self.record(output, _func(fmt, self.expr(i)), callback)
+        elif name in _binary_tools:
+            fmt = _binary_tools[name]
+
+            def record(input1, input2, output, callback=None):
+                return self.record(output, _func(fmt, self.expr(input1), self.expr(input2)), callback)
+        elif name in _comparison_tools:
+            fmts = _comparison_tools[name]
+
+            def record(input1, input2, output, incl_equals=False, callback=None):
+                fmt = fmts[1] if incl_equals else fmts[0]
+                return self.record(output, _func(fmt, self.expr(input1), self.expr(input2)), callback)
+        else:
+            attr = getattr(self.wbt, name)
+            if _tool_method(name) is None:
+                return attr
+
+            def record(*args, **kwargs):
+                # write the pending rasters that the tool reads first, and
+                # those that read or write a file the tool is about to replace
+                tool_name, tool_args, _ = _tool_method(name)(_RecordingRunner(), *args, **kwargs)
+                inputs, outputs = self.wbt.tool_files(tool_name, tool_args)
+                ret = self.flush([g for g, (_, e, _) in self.pending.items()
+                                  if g in inputs or g in outputs or
+                                  any(self.wbt.resolve_path(r) in outputs for r in e.rasters())])
+                if ret != 0:
+                    return ret
+                return attr(*args, **kwargs)
+        record.__name__ = name
+        return record
+
+    def expr(self, value):
+        '''
+        Returns the expression for a tool argument: a constant, a raster
+        file, or the pending expression of a recorded output.
+        '''
+        if isinstance(value, RasterExpr):
+            return value
+        e = _as_expr(value)
+        if e.kind == 'raster':
+            pending = self.pending.get(self.wbt.resolve_path(e.value))
+            if pending is not None:
+                self.fused.add(self.wbt.resolve_path(e.value))
+                return pending[1]
+        return e
+
+    def record(self, output, expr, callback=None):
+        '''
+        Records that output is computed by expr, to be written by flush().
+        Returns 0, as a successful tool run would.
+        '''
+        f = self.wbt.resolve_path(output)
+        readers = [g for g, (_, e, _) in self.pending.items()
+                   if f in (self.wbt.resolve_path(r) for r in e.rasters())]
+        if readers:
+            # the pending expressions must read output before it is replaced
+            ret = self.flush(readers)
+            if ret != 0:
+                return ret
+        self.fused.discard(f)
+        self.pending[f] = (output, expr, callback)
+        return 0
+
+    def flush(self, outputs=None):
+        '''
+        Writes pending outputs with one raster_calculator run each. By
+        default, writes the outputs that no other pending expression reads;
+        the intermediate outputs that are read are fused into them and never
+        written. Returns the first non-zero return code, or 0.
+        '''
+        if outputs is None:
+            outputs = [f for f in self.pending if f not in self.fused]
+            discard = list(self.pending)
+        else:
+            outputs = [self.wbt.resolve_path(f) for f in outputs]
+            discard = outputs
+
+        for f in outputs:
+            output, expr, callback = self.pending[f]
+            ret = expr.evaluate(self.wbt, output, callback)
+            if ret != 0:
+                return ret
+        for f in discard:
+            self.pending.pop(f, None)
+            self.fused.discard(f)
+        return 0
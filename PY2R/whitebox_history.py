@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+''' A history of tool runs in a local SQLite database, and predictions of
+the run time and peak memory of a run before it starts, from a per-tool
+cost model fitted to the history: log-linear in the size of the input
+(raster cells, LiDAR points, or bytes for other inputs).
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_history import RuntimeHistory
+
+    wbt = WhiteboxTools()
+    history = RuntimeHistory("runs.sqlite", wbt)   # records every run of wbt
+    wbt.slope("dem.tif", "slope.tif")
+    ...
+    estimate = history.predict("slope", ["--dem='big_dem.tif'", "--output='big_slope.tif'"])
+    print(estimate['wall_time'], estimate['wall_time_p90'], estimate['max_rss'])
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import json
+import math
+import os
+import sqlite3
+import struct
+import threading
+import time
+
+import whitebox_raster as raster
+
+
+_schema = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    tool TEXT NOT NULL,
+    version TEXT,
+    exit_code INTEGER NOT NULL,
+    args TEXT,
+    cells INTEGER,
+    points INTEGER,
+    input_bytes INTEGER,
+    wall_time REAL,
+    user_time REAL,
+    system_time REAL,
+    max_rss INTEGER,
+    read_bytes INTEGER,
+    write_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_tool ON runs (tool, exit_code);
+'''
+
+# size measures, in order of preference for a cost model
+size_kinds = ('points', 'cells', 'input_bytes')
+
+
+def input_sizes(wbt, tool_name, args):
+    '''
+    Returns the size of the inputs of a tool run as a dict: cells, the
+    total rows x cols of the input rasters (Whitebox and GeoTIFF rasters
+    are read), points, the total point count of the input LAS files, and
+    input_bytes, the total size of the input files.
+    '''
+    inputs, _ = wbt.tool_files(tool_name, args)
+    ret = {'cells': 0, 'points': 0, 'input_bytes': 0}
+    for f in inputs:
+        if not os.path.isfile(f):
+            continue
+        ret['input_bytes'] += os.path.getsize(f)
+        ext = os.path.splitext(f)[1].lower()
+        try:
+            if ext == '.dep':
+                header = raster.RasterHeader.read(f)
+                ret['cells'] += header.rows * header.cols
+            elif ext in ('.tif', '.tiff'):
+                ret['cells'] += _tiff_cells(f)
+            elif ext == '.las':
+                ret['points'] += _las_points(f)
+        except (OSError, ValueError, struct.error):
+            pass
+    return ret
+
+
+def _tiff_cells(file_name):
+    # rows x cols of the first image of a TIFF or BigTIFF file
+    with open(file_name, 'rb') as f:
+        head = f.read(16)
+        order = {b'II': '<', b'MM': '>'}[head[:2]]
+        magic = struct.unpack(order + 'H', head[2:4])[0]
+        if magic == 42:
+            ifd = struct.unpack(order + 'I', head[4:8])[0]
+            count_fmt, entry_size, value_fmt = 'H', 12, 'I'
+        elif magic == 43:
+            ifd = struct.unpack(order + 'Q', head[8:16])[0]
+            count_fmt, entry_size, value_fmt = 'Q', 20, 'Q'
+        else:
+            raise ValueError("{} is not a TIFF file".format(file_name))
+        f.seek(ifd)
+        count_size = struct.calcsize(count_fmt)
+        n = struct.unpack(order + count_fmt, f.read(count_size))[0]
+        entries = f.read(n * entry_size)
+    dims = {}
+    for i in range(n):
+        entry = entries[i * entry_size:(i + 1) * entry_size]
+        tag, kind = struct.unpack(order + 'HH', entry[:4])
+        if tag in (256, 257): # ImageWidth, ImageLength
+            value = entry[4 + struct.calcsize(value_fmt):]
+            fmt = {3: 'H', 16: 'Q'}.get(kind, 'I') # SHORT, LONG8 (BigTIFF) or LONG
+            dims[tag] = struct.unpack(order + fmt, value[:struct.calcsize(fmt)])[0]
+    return dims.get(256, 0) * dims.get(257, 0)
+
+
+def _las_points(file_name):
+    with open(file_name, 'rb') as f:
+        head = f.read(255)
+    if head[:4] != b'LASF':
+        raise ValueError("{} is not a LAS file".format(file_name))
+    points = struct.unpack('<I', head[107:111])[0]
+    if points == 0 and len(head) >= 255 and head[24:26] >= b'\x01\x04':
+        # LAS 1.4 keeps counts over 2^32 in the extended field only
+        points = struct.unpack('<Q', head[247:255])[0]
+    return points
+
+
+class CostModel(object):
+    '''
+    A per-tool model of the wall time and the peak memory of a run as
+    log-linear functions of the input size, log(y) = a + b log(size),
+    fitted by least squares to the successful runs in a history. With a
+    single input size, b is 0 and the model predicts the geometric mean.
+    '''
+
+    def __init__(self, tool_name, kind, sizes, wall_times, max_rss):
+        self.tool_name = tool_name
+        self.kind = kind
+        self.runs = len(sizes)
+        self.wall = _fit(sizes, wall_times)
+        self.rss = _fit([s for s, m in zip(sizes, max_rss) if m], [m for m in max_rss if m])
+
+    def predict(self, size):
+        '''
+        Returns the predicted wall_time (seconds) and max_rss (bytes) of a
+        run on an input of size (in the model's kind of size) as a dict,
+        with wall_time_p90 and max_rss_p90, the values that 90% of runs
+        are expected to stay under.
+        '''
+        ret = {'tool': self.tool_name, 'kind': self.kind, 'size': size, 'runs': self.runs}
+        for name, fit in (('wall_time', self.wall), ('max_rss', self.rss)):
+            if fit is None:
+                ret[name] = ret[name + '_p90'] = None
+                continue
+            a, b, sigma = fit
+            mu = a + b * math.log(max(size, 1))
+            ret[name] = math.exp(mu)
+            ret[name + '_p90'] = math.exp(mu + 1.2816 * sigma)
+        return ret
+
+
+def _fit(sizes, values):
+    # least squares of log(value) on log(size): returns (a, b, residual standard deviation)
+    pairs = [(math.log(max(s, 1)), math.log(v)) for s, v in zip(sizes, values) if v and v > 0]
+    if not pairs:
+        return None
+    n = len(pairs)
+    mx = sum(x for x, _ in pairs) / n
+    my = sum(y for _, y in pairs) / n
+    sxx = sum((x - mx) ** 2 for x, _ in pairs)
+    b = sum((x - mx) * (y - my) for x, y in pairs) / sxx if sxx > 1e-12 else 0.0
+    a = my - b * mx
+    dof = n - (2 if sxx > 1e-12 else 1)
+    sigma = math.sqrt(sum((y - a - b * x) ** 2 for x, y in pairs) / dof) if dof > 0 else 0.0
+    return a, b, sigma
+
+
+class RuntimeHistory(object):
+    '''
+    A metrics sink that records every tool run, with the size of its
+    inputs (see input_sizes), its arguments, the WhiteboxTools version and
+    the resources used, in a SQLite database, and predicts the cost of
+    runs from them. The database may be shared by several processes.
+    '''
+
+    def __init__(self, file_name, wbt=None):
+        '''
+        file_name -- SQLite database file, created if needed.
+        wbt -- WhiteboxTools object whose runs are recorded, and whose version labels them.
+        '''
+        self.file_name = file_name
+        self.wbt = wbt
+        self.version = None
+        self.__lock = threading.Lock()
+        self.__db = sqlite3.connect(file_name, timeout=30.0, check_same_thread=False)
+        with self.__lock, self.__db:
+            self.__db.execute("PRAGMA journal_mode=WAL")
+            self.__db.executescript(_schema)
+        if wbt is not None:
+            from whitebox_metrics import _version_number
+            self.version = _version_number(wbt.version()) or None
+            wbt.add_metrics_sink(self)
+
+    def close(self):
+        if self.wbt is not None and self in self.wbt.metrics_sinks:
+            self.wbt.remove_metrics_sink(self)
+        with self.__lock:
+            self.__db.close()
+
+    def __call__(self, result):
+        sizes = {'cells': None, 'points': None, 'input_bytes': None}
+        if self.wbt is not None:
+            sizes = input_sizes(self.wbt, result.tool_name, result.args)
+        u = result.usage
+        row = (time.time(), result.tool_name, self.version, int(result), json.dumps(result.args),
+               sizes['cells'], sizes['points'], sizes['input_bytes'],
+               u.get('wall_time'), u.get('user_time'), u.get('system_time'), u.get('max_rss'),
+               u.get('read_bytes'), u.get('write_bytes'))
+        with self.__lock, self.__db:
+            self.__db.execute("INSERT INTO runs (time, tool, version, exit_code, args, cells, points, input_bytes, "
+                              "wall_time, user_time, system_time, max_rss, read_bytes, write_bytes) "
+                              "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+
+    def runs(self, tool_name=None):
+        '''
+        Returns the recorded runs, of one tool or all, as a list of dicts.
+        '''
+        sql = "SELECT * FROM runs" + (" WHERE tool = ?" if tool_name else "") + " ORDER BY id"
+        with self.__lock:
+            cursor = self.__db.execute(sql, (tool_name,) if tool_name else ())
+            names = [d[0] for d in cursor.description]
+            rows = cursor.fetchall()
+        ret = []
+        for row in rows:
+            r = dict(zip(names, row))
+            r['args'] = json.loads(r['args']) if r['args'] else []
+            ret.append(r)
+        return ret
+
+    def model(self, tool_name, version=None):
+        '''
+        Fits the cost model of a tool to its successful runs, of one
+        WhiteboxTools version if given, and returns it, or None if there
+        are no runs to fit it to. The size measure is the first of
+        size_kinds that the latest run has. Where the platform reports the
+        CPU time of tool processes, runs without it are left out: they were
+        served by a result cache or computed in-process by an engine.
+        '''
+        sql = ("SELECT points, cells, input_bytes, wall_time, max_rss, user_time FROM runs "
+               "WHERE tool = ? AND exit_code = 0")
+        params = [tool_name]
+        if version is not None:
+            sql += " AND version = ?"
+            params.append(version)
+        with self.__lock:
+            rows = self.__db.execute(sql + " ORDER BY id", params).fetchall()
+        if any(r[5] is not None for r in rows):
+            rows = [r for r in rows if r[5] is not None]
+        if not rows:
+            return None
+        latest = rows[-1]
+        k = next((i for i in range(len(size_kinds)) if latest[i]), 2)
+        rows = [r for r in rows if r[k] and r[3]]
+        if not rows:
+            return None
+        return CostModel(tool_name, size_kinds[k], [r[k] for r in rows], [r[3] for r in rows], [r[4] for r in rows])
+
+    def predict(self, tool_name, args, version=None):
+        '''
+        Returns the predicted cost of running a tool with args, from the
+        sizes of its input files, as a dict (see CostModel.predict), or
+        None if the tool has no successful runs in the history.
+        '''
+        if self.wbt is None:
+            raise ValueError("A WhiteboxTools object is needed to read the inputs of a run")
+        model = self.model(tool_name, version)
+        if model is None:
+            return None
+        return model.predict(input_sizes(self.wbt, tool_name, args)[model.kind])
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+''' Metrics sinks for WhiteboxTools runs. A sink is any callable given the
+ToolResult of every run of a WhiteboxTools object it is added to with
+add_metrics_sink; the result holds the wall time and resource usage of the
+tool process (see ToolResult.usage).
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_metrics import JsonLinesSink, MetricsRecorder, PrometheusExporter
+
+    wbt = WhiteboxTools()
+    recorder = MetricsRecorder()
+    wbt.add_metrics_sink(recorder)
+    wbt.add_metrics_sink(JsonLinesSink("runs.jsonl"))
+    PrometheusExporter(wbt).serve(9464)  # http://127.0.0.1:9464/metrics
+    wbt.slope("dem.tif", "slope.tif")
+    print(recorder.summary()["slope"]["max_rss"])
+
+A timeline of a workflow, to open in Perfetto (https://ui.perfetto.dev) or
+chrome://tracing:
+
+    from whitebox_metrics import ChromeTrace
+
+    with ChromeTrace(wbt, "workflow.json") as trace:
+        with trace.stage("hydrology"):
+            wbt.breach_depressions("dem.tif", "breached.tif")
+            wbt.d8_pointer("breached.tif", "pointer.tif")
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+def run_record(result):
+    '''
+    Returns a dict describing a tool run, for logging.
+    '''
+    record = {'time': time.time(), 'tool': result.tool_name, 'exit_code': int(result)}
+    record.update(result.usage)
+    return record
+
+
+class JsonLinesSink(object):
+    '''
+    Appends one JSON object per tool run to a file.
+    '''
+
+    def __init__(self, file_name):
+        self.file_name = file_name
+        self.__lock = threading.Lock()
+
+    def __call__(self, result):
+        line = json.dumps(run_record(result)) + "\n"
+        with self.__lock:
+            with open(self.file_name, 'a') as f:
+                f.write(line)
+
+
+class MetricsRecorder(object):
+    '''
+    Keeps the record of every tool run in memory.
+    '''
+
+    def __init__(self):
+        self.records = []
+        self.__lock = threading.Lock()
+
+    def __call__(self, result):
+        record = run_record(result)
+        with self.__lock:
+            self.records.append(record)
+
+    def summary(self):
+        '''
+        Returns, for each tool, the number of runs and failures, the total
+        wall and CPU time in seconds, the largest peak RSS and the total
+        bytes read and written.
+        '''
+        ret = {}
+        with self.__lock:
+            records = list(self.records)
+        for r in records:
+            s = ret.setdefault(r['tool'], {'runs': 0, 'failures': 0, 'wall_time': 0.0, 'cpu_time': 0.0,
+                                           'max_rss': 0, 'read_bytes': 0, 'write_bytes': 0})
+            s['runs'] += 1
+            s['failures'] += 1 if r['exit_code'] != 0 else 0
+            s['wall_time'] += r.get('wall_time', 0.0)
+            s['cpu_time'] += r.get('user_time', 0.0) + r.get('system_time', 0.0)
+            s['max_rss'] = max(s['max_rss'], r.get('max_rss', 0))
+            s['read_bytes'] += r.get('read_bytes', 0)
+            s['write_bytes'] += r.get('write_bytes', 0)
+        return ret
+
+
+# default histogram buckets: seconds for durations, bytes for peak memory
+duration_buckets = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+memory_buckets = tuple(float(1 << n) for n in range(24, 38, 1)) # 16 MiB to 128 GiB
+
+
+class _Histogram(object):
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.total += value
+
+
+class PrometheusExporter(object):
+    '''
+    A metrics sink that keeps per-tool counters and histograms in the
+    Prometheus text exposition format:
+
+    whitebox_tool_runs_total{tool,status} -- runs by status: success, failure or cancelled
+    whitebox_tool_duration_seconds{tool} -- histogram of wall times
+    whitebox_tool_cpu_seconds_total{tool,mode} -- user and system CPU time
+    whitebox_tool_peak_rss_bytes{tool} -- histogram of peak resident memory
+    whitebox_tool_read_bytes_total{tool}, whitebox_tool_write_bytes_total{tool} -- I/O
+
+    Every series also has a version label with the WhiteboxTools version
+    when wbt is given, so that latency can be compared across upgrades.
+    The metrics are served by serve(), written for the node_exporter
+    textfile collector by write_textfile(), or both.
+    '''
+
+    def __init__(self, wbt=None, textfile=None, duration_buckets=duration_buckets,
+                 memory_buckets=memory_buckets):
+        '''
+        wbt -- WhiteboxTools object whose version labels the series; the exporter is added to it as a metrics sink.
+        textfile -- File rewritten with the metrics after every run, e.g. for the textfile collector.
+        '''
+        self.textfile = textfile
+        self.duration_buckets = tuple(duration_buckets)
+        self.memory_buckets = tuple(memory_buckets)
+        self.version = ''
+        self.runs = {} # (tool, status): count
+        self.durations = {} # tool: _Histogram
+        self.cpu = {} # (tool, mode): seconds
+        self.memory = {} # tool: _Histogram
+        self.io = {} # (tool, direction): bytes
+        self.__lock = threading.Lock()
+        if wbt is not None:
+            self.version = _version_number(wbt.version())
+            wbt.add_metrics_sink(self)
+
+    def __call__(self, result):
+        tool = result.tool_name
+        status = {0: 'success', 2: 'cancelled'}.get(int(result), 'failure')
+        usage = result.usage
+        with self.__lock:
+            self.runs[(tool, status)] = self.runs.get((tool, status), 0) + 1
+            if 'wall_time' in usage:
+                self.durations.setdefault(tool, _Histogram(self.duration_buckets)).observe(usage['wall_time'])
+            for mode in ('user', 'system'):
+                if mode + '_time' in usage:
+                    self.cpu[(tool, mode)] = self.cpu.get((tool, mode), 0.0) + usage[mode + '_time']
+            if 'max_rss' in usage:
+                self.memory.setdefault(tool, _Histogram(self.memory_buckets)).observe(usage['max_rss'])
+            for direction in ('read', 'write'):
+                if direction + '_bytes' in usage:
+                    key = (tool, direction)
+                    self.io[key] = self.io.get(key, 0) + usage[direction + '_bytes']
+        if self.textfile is not None:
+            self.write_textfile(self.textfile)
+
+    def render(self):
+        '''
+        Returns the metrics in the Prometheus text exposition format.
+        '''
+        lines = []
+
+        def labels(**kwargs):
+            if self.version:
+                kwargs['version'] = self.version
+            return "{" + ",".join('{}="{}"'.format(k, _escape(v)) for k, v in sorted(kwargs.items())) + "}"
+
+        def histogram(name, help_text, histograms):
+            lines.append("# HELP {} {}".format(name, help_text))
+            lines.append("# TYPE {} histogram".format(name))
+            for tool in sorted(histograms):
+                h = histograms[tool]
+                for bound, count in zip(h.buckets, h.counts):
+                    lines.append("{}_bucket{} {}".format(name, labels(tool=tool, le=_number(bound)), count))
+                lines.append("{}_bucket{} {}".format(name, labels(tool=tool, le="+Inf"), h.count))
+                lines.append("{}_sum{} {}".format(name, labels(tool=tool), _number(h.total)))
+                lines.append("{}_count{} {}".format(name, labels(tool=tool), h.count))
+
+        with self.__lock:
+            lines.append("# HELP whitebox_tool_runs_total WhiteboxTools tool runs by status.")
+            lines.append("# TYPE whitebox_tool_runs_total counter")
+            for (tool, status) in sorted(self.runs):
+                lines.append("whitebox_tool_runs_total{} {}".format(
+                    labels(tool=tool, status=status), self.runs[(tool, status)]))
+
+            histogram("whitebox_tool_duration_seconds", "Wall time of WhiteboxTools tool runs.", self.durations)
+
+            lines.append("# HELP whitebox_tool_cpu_seconds_total CPU time used by WhiteboxTools tool runs.")
+            lines.append("# TYPE whitebox_tool_cpu_seconds_total counter")
+            for (tool, mode) in sorted(self.cpu):
+                lines.append("whitebox_tool_cpu_seconds_total{} {}".format(
+                    labels(tool=tool, mode=mode), _number(self.cpu[(tool, mode)])))
+
+            histogram("whitebox_tool_peak_rss_bytes", "Peak resident memory of WhiteboxTools tool runs.", self.memory)
+
+            for direction in ('read', 'write'):
+                name = "whitebox_tool_{}_bytes_total".format(direction)
+                lines.append("# HELP {} Bytes {} by WhiteboxTools tool runs.".format(
+                    name, 'read' if direction == 'read' else 'written'))
+                lines.append("# TYPE {} counter".format(name))
+                for (tool, d) in sorted(self.io):
+                    if d == direction:
+                        lines.append("{}{} {}".format(name, labels(tool=tool), self.io[(tool, d)]))
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, file_name):
+        '''
+        Writes the metrics to file_name in a single atomic replace, as the
+        node_exporter textfile collector requires.
+        '''
+        tmp = "{}.{}.tmp".format(file_name, os.getpid())
+        with open(tmp, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp, file_name)
+
+    def serve(self, port=9464, addr='127.0.0.1'):
+        '''
+        Serves the metrics over HTTP at http://addr:port/metrics from a
+        daemon thread. Returns the server; call its shutdown() to stop it.
+        '''
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/', '/metrics'):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass # keep scrapes out of the tool output
+
+        server = ThreadingHTTPServer((addr, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, name="whitebox-metrics", daemon=True)
+        thread.start()
+        return server
+
+
+class ChromeTrace(object):
+    '''
+    A metrics sink that records a span for every tool run, and for the
+    workflow stages marked with stage(), in the Chrome Trace Event format.
+    Spans are drawn on the track of the thread that ran them, so runs from
+    a thread pool appear side by side and stages enclose the runs they
+    contain. Spans recorded from an asyncio event loop, e.g. the runs of
+    run_tool_async, that overlap without nesting are drawn on tracks of
+    their own under the event loop's thread. A tool span holds the tool's arguments, exit code and resource
+    usage, including cpu_cores, the CPU time divided by the wall time; a
+    "running tools" counter track shows how many tools ran at once.
+
+    Used in a with block, the trace is added to wbt as a metrics sink on
+    entry and, on exit, removed and saved to file_name.
+    '''
+
+    def __init__(self, wbt=None, file_name=None):
+        '''
+        wbt -- WhiteboxTools object to trace in a with block.
+        file_name -- File the trace is saved to at the end of the with block.
+        '''
+        self.wbt = wbt
+        self.file_name = file_name
+        self.origin = time.time()
+        self.events = []
+        self.__threads = {}
+        self.__async_tracks = {} # thread ident: [(tid, [(start, end), ...]), ...]
+        self.__async_tids = 0
+        self.__lock = threading.Lock()
+
+    def __enter__(self):
+        if self.wbt is not None:
+            self.wbt.add_metrics_sink(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.wbt is not None:
+            self.wbt.remove_metrics_sink(self)
+        if self.file_name is not None:
+            self.save(self.file_name)
+
+    def __call__(self, result):
+        end = time.time()
+        start = result.start_time if result.start_time is not None else end - (result.wall_time or 0.0)
+        usage = result.usage
+        args = {'args': [str(a) for a in result.args], 'exit_code': int(result)}
+        args.update(usage)
+        if usage.get('wall_time') and 'user_time' in usage:
+            args['cpu_cores'] = round((usage['user_time'] + usage.get('system_time', 0.0)) / usage['wall_time'], 2)
+        self.__span(result.tool_name, 'tool', start, end, args)
+
+    @contextmanager
+    def stage(self, name, **args):
+        '''
+        Records the with block it encloses as a span named name, with args
+        as its details. Stages nest.
+        '''
+        start = time.time()
+        try:
+            yield self
+        finally:
+            self.__span(name, 'stage', start, time.time(), args)
+
+    def trace_events(self):
+        '''
+        Returns the trace as a list of Trace Event dicts.
+        '''
+        with self.__lock:
+            events = list(self.events)
+        # a counter of the tools running at once, stepped at each start and end
+        steps = []
+        for e in events:
+            if e.get('cat') == 'tool':
+                steps.append((e['ts'], 1))
+                steps.append((round(e['ts'] + e['dur'], 1), -1))
+        running = 0
+        for ts, step in sorted(steps):
+            running += step
+            events.append({'name': 'running tools', 'ph': 'C', 'ts': ts, 'pid': os.getpid(),
+                           'args': {'tools': running}})
+        return events
+
+    def save(self, file_name):
+        '''
+        Writes the trace to file_name as Trace Event JSON.
+        '''
+        with open(file_name, 'w') as f:
+            json.dump({'traceEvents': self.trace_events(), 'displayTimeUnit': 'ms'}, f)
+
+    def __span(self, name, category, start, end, args):
+        thread = threading.current_thread()
+        event = {'name': name, 'cat': category, 'ph': 'X', 'pid': os.getpid(), 'tid': thread.ident,
+                 'ts': round((start - self.origin) * 1e6, 1), 'dur': round((end - start) * 1e6, 1),
+                 'args': args}
+        with self.__lock:
+            if thread.ident not in self.__threads:
+                self.__threads[thread.ident] = thread.name
+                self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(),
+                                    'tid': thread.ident, 'args': {'name': thread.name}})
+            if _in_event_loop():
+                event['tid'] = self.__async_track(thread, start, end)
+            self.events.append(event)
+
+    def __async_track(self, thread, start, end):
+        # The spans of the coroutines of one event loop all come from its
+        # thread, so they may overlap. Each goes on the first track of the
+        # thread where it overlaps no span other than by nesting.
+        tracks = self.__async_tracks.setdefault(thread.ident, [(thread.ident, [])])
+        for tid, spans in tracks:
+            if all(e <= start or end <= s or (s <= start and end <= e) or (start <= s and e <= end)
+                   for s, e in spans):
+                spans.append((start, end))
+                return tid
+        self.__async_tids += 1
+        tid = self.__async_tids # thread idents are never this small
+        tracks.append((tid, [(start, end)]))
+        self.events.append({'name': 'thread_name', 'ph': 'M', 'pid': os.getpid(), 'tid': tid,
+                            'args': {'name': "{} (async {})".format(thread.name, len(tracks) - 1)}})
+        return tid
+
+
+def _in_event_loop():
+    # True if called from a coroutine or callback of a running asyncio event loop
+    asyncio = sys.modules.get('asyncio')
+    if asyncio is None:
+        return False
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
+
+def _version_number(version_text):
+    # "WhiteboxTools v2.4.0 (c) Dr. John Lindsay..." -> "2.4.0"
+    for word in str(version_text).split():
+        if word.startswith('v') and word[1:2].isdigit():
+            return word[1:]
+    return ''
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(float(value)) if value != int(value) else str(int(value)) + ".0"
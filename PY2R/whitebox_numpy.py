@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+''' An in-process engine for the cell-by-cell Math and Stats tools. When
+the inputs and output are uncompressed Whitebox GAT rasters (.dep/.tas),
+the engine memory-maps them and computes the result with NumPy, one block
+of rows at a time, instead of starting the WhiteboxTools executable. Any
+other run falls back to the executable. NumPy is optional; without it
+every run falls back.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_numpy import NumpyEngine
+
+    wbt = WhiteboxTools()
+    wbt.set_engine(NumpyEngine())
+    wbt.add("a.dep", "b.dep", "sum.dep")      # computed in-process
+    wbt.add("a.tif", "b.tif", "sum.tif")      # run by the executable
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+import whitebox_raster as raster
+
+
+# Tools of one raster, by the name passed to run_tool. is_no_data is
+# handled separately, as its result is the NoData mask itself.
+_unary_tools = {
+    'absolute_value': lambda x: np.abs(x),
+    'ceil': lambda x: np.ceil(x),
+    'floor': lambda x: np.floor(x),
+    'round': lambda x: np.where(np.abs(x - np.trunc(x)) >= 0.5, np.trunc(x) + np.sign(x), np.trunc(x)), # as f64::round
+    'negate': lambda x: np.negative(x),
+    'reciprocal': lambda x: 1.0 / x,
+    'increment': lambda x: x + 1.0,
+    'decrement': lambda x: x - 1.0,
+    'square': lambda x: np.square(x),
+    'square_root': lambda x: np.sqrt(x),
+    'exp': lambda x: np.exp(x),
+    'exp2': lambda x: np.exp2(x),
+    'ln': lambda x: np.log(x),
+    'log10': lambda x: np.log10(x),
+    'log2': lambda x: np.log2(x),
+    'sin': lambda x: np.sin(x),
+    'cos': lambda x: np.cos(x),
+    'tan': lambda x: np.tan(x),
+    'arc_sin': lambda x: np.arcsin(x),
+    'arc_cos': lambda x: np.arccos(x),
+    'arc_tan': lambda x: np.arctan(x),
+    'sinh': lambda x: np.sinh(x),
+    'cosh': lambda x: np.cosh(x),
+    'tanh': lambda x: np.tanh(x),
+    'arsinh': lambda x: np.arcsinh(x),
+    'arcosh': lambda x: np.arccosh(x),
+    'artanh': lambda x: np.arctanh(x),
+    'to_degrees': lambda x: np.degrees(x),
+    'to_radians': lambda x: np.radians(x),
+    'is_no_data': None,
+}
+
+# Tools of two rasters or constants. Comparisons take incl_equals.
+_binary_tools = {
+    'add': lambda a, b, eq: a + b,
+    'subtract': lambda a, b, eq: a - b,
+    'multiply': lambda a, b, eq: a * b,
+    'divide': lambda a, b, eq: a / b,
+    'power': lambda a, b, eq: np.power(a, b),
+    'modulo': lambda a, b, eq: np.fmod(a, b),
+    'min': lambda a, b, eq: np.minimum(a, b),
+    'max': lambda a, b, eq: np.maximum(a, b),
+    'atan2': lambda y, x, eq: np.arctan2(y, x),
+    'equal_to': lambda a, b, eq: a == b,
+    'not_equal_to': lambda a, b, eq: a != b,
+    'greater_than': lambda a, b, eq: a >= b if eq else a > b,
+    'less_than': lambda a, b, eq: a <= b if eq else a < b,
+    'and': lambda a, b, eq: (a != 0) & (b != 0),
+    'or': lambda a, b, eq: (a != 0) | (b != 0),
+    'xor': lambda a, b, eq: (a != 0) ^ (b != 0),
+    'not': lambda a, b, eq: (a != 0) & (b == 0),
+}
+
+supported_tools = sorted(list(_unary_tools) + list(_binary_tools))
+
+class NumpyEngine(object):
+    '''
+    Computes the tools in supported_tools in-process when every raster
+    they read or write is a Whitebox GAT raster of the same dimensions.
+    Set on a WhiteboxTools object with set_engine.
+
+    As with the executable, a cell that is NoData in any input is NoData
+    in the output, and so is a cell whose result is not finite (e.g. a
+    division by zero or the logarithm of a negative value). Outputs are
+    written as FLOAT rasters, or DOUBLE if an input is DOUBLE.
+    '''
+
+    def __init__(self, block_cells=1 << 22):
+        '''
+        block_cells -- Number of cells computed at once, rounded to whole rows.
+        '''
+        self.block_cells = block_cells
+        self.runs = 0
+        self.fallbacks = 0
+
+    def run_tool(self, wbt, tool_name, args, callback=None):
+        '''
+        Computes a tool run in-process and returns 0, or returns None if the
+        run is not supported and must be run by the executable. Called by
+        WhiteboxTools.run_tool when this engine is set with set_engine.
+        '''
+        if tool_name not in _unary_tools and tool_name not in _binary_tools:
+            return None
+        if np is None:
+            self.fallbacks += 1
+            return None
+
+        if callback is None:
+            callback = wbt.default_callback
+        start = time.time()
+        try:
+            ret = self.__run(wbt, tool_name, _parse_args(args))
+        except (OSError, ValueError, KeyError):
+            ret = None # let the executable run it and report the problem
+        if ret is None:
+            self.fallbacks += 1
+            return None
+
+        self.runs += 1
+        if wbt.verbose:
+            callback("Elapsed Time (excluding I/O): {:.3f}s".format(time.time() - start))
+        return ret
+
+    def __run(self, wbt, tool_name, args):
+        if tool_name in _unary_tools:
+            names = ['input']
+        elif tool_name == 'atan2':
+            names = ['input_y', 'input_x']
+        else:
+            names = ['input1', 'input2']
+
+        output = wbt.resolve_path(args['output'])
+        if raster.dep_file(output) != output or not raster.is_whitebox_raster(output):
+            return None
+
+        operands, headers = [], [] # operands: (constant or cells, header or None)
+        for name in names:
+            value = args[name]
+            try:
+                operands.append((float(value), None))
+                continue
+            except ValueError:
+                pass
+            f = wbt.resolve_path(value)
+            if not raster.is_whitebox_raster(f) or raster.dep_file(f) == output:
+                return None
+            cells, header = raster.read_raster(f)
+            operands.append((cells, header))
+            headers.append(header)
+
+        if len(headers) == 0:
+            return None
+        rows, cols = headers[0].rows, headers[0].cols
+        if any(h.rows != rows or h.cols != cols for h in headers):
+            return None
+
+        out_type = 'double' if any(h.data_type == 'double' for h in headers) else 'float'
+        out_dtype = np.dtype('f8' if out_type == 'double' else 'f4')
+        nodata = headers[0].nodata
+        # (constant or memory-mapped cells, NoData value or None)
+        inputs = [(value, None if header is None else header.nodata) for value, header in operands]
+
+        out_header = headers[0].copy()
+        out_header.fields['Data Type'] = out_type.upper()
+        out_header.fields['Byte Order'] = 'LITTLE_ENDIAN' if sys.byteorder == 'little' else 'BIG_ENDIAN'
+        out_header.fields['NoData'] = repr(nodata)
+        out = np.memmap(raster.tas_file(output), dtype=out_dtype, mode='w+', shape=(rows, cols))
+
+        fn = _unary_tools[tool_name] if tool_name in _unary_tools else _binary_tools[tool_name]
+        incl_equals = args.get('incl_equals') is True
+        block_rows = max(1, self.block_cells // max(cols, 1))
+        lo, hi = None, None
+        with np.errstate(all='ignore'):
+            for row0 in range(0, rows, block_rows):
+                row1 = min(row0 + block_rows, rows)
+                mask = np.zeros((row1 - row0, cols), dtype=bool)
+                values = []
+                for data, nd in inputs:
+                    if nd is None:
+                        values.append(data)
+                    else:
+                        block = data[row0:row1]
+                        mask |= block == nd
+                        values.append(block.astype(out_dtype))
+
+                if tool_name == 'is_no_data':
+                    result = mask.astype(out_dtype)
+                    invalid = np.zeros_like(mask)
+                else:
+                    if len(values) == 1:
+                        result = fn(values[0])
+                    else:
+                        result = fn(values[0], values[1], incl_equals)
+                    result = np.asarray(result, dtype=out_dtype)
+                    invalid = mask | ~np.isfinite(result)
+                    result[invalid] = nodata
+
+                out[row0:row1] = result
+                valid = result[~invalid]
+                if valid.size > 0:
+                    block_lo, block_hi = float(valid.min()), float(valid.max())
+                    lo = block_lo if lo is None else min(lo, block_lo)
+                    hi = block_hi if hi is None else max(hi, block_hi)
+        out.flush()
+        del out
+
+        if lo is None:
+            lo, hi = nodata, nodata
+        for key, value in (('Min', lo), ('Max', hi), ('Display Min', lo), ('Display Max', hi)):
+            out_header.fields[key] = repr(value)
+        out_header.write(output)
+        return 0
+
+
+def _parse_args(args):
+    # "--flag='value'" -> {'flag': 'value'}; "--flag" -> {'flag': True}
+    ret = {}
+    for arg in args:
+        flag, sep, value = str(arg).partition('=')
+        flag = flag.lstrip('-')
+        if flag == 'i':
+            flag = 'input'
+        ret[flag] = value.strip().strip('\'"') if sep else True
+    return ret
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+''' Chains WhiteboxTools tools into a pipeline whose steps run as soon as
+the files they read have been written, with independent branches running
+concurrently and up-to-date steps skipped, as make does.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_pipeline import Pipeline
+
+    p = Pipeline(WhiteboxTools(), max_workers=4)
+    p.add("fill_depressions", dem="dem.tif", output="filled.tif")
+    p.add("d8_pointer", dem="filled.tif", output="pointer.tif")
+    p.add("d8_flow_accumulation", i="pointer.tif", output="accum.tif", pntr=True)
+    p.add("extract_streams", flow_accum="accum.tif", output="streams.tif", threshold=1000.0)
+    p.add("slope", dem="dem.tif", output="slope.tif")
+    p.add("aspect", dem="dem.tif", output="aspect.tif")
+    ret = p.run()
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import os
+from os import path
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from whitebox_tools import _tool_method, _RecordingRunner
+
+
+class Step(object):
+    '''
+    A tool run in a pipeline. status is one of 'pending', 'running', 'done',
+    'up-to-date', 'failed' or 'not-run' (an upstream step failed).
+    '''
+
+    def __init__(self, name, tool_name, args, callback, inputs, outputs):
+        self.name = name
+        self.tool_name = tool_name
+        self.args = args
+        self.callback = callback
+        self.inputs = inputs
+        self.outputs = outputs
+        self.depends_on = []
+        self.status = 'pending'
+        self.ret = None
+
+    def up_to_date(self):
+        '''
+        Returns True if every output exists and none is older than any input.
+        '''
+        try:
+            oldest_output = min(os.stat(f).st_mtime for f in self.outputs)
+        except (OSError, ValueError):
+            return False
+        newest_input = max([os.stat(f).st_mtime for f in self.inputs if path.exists(f)] or [0])
+        return newest_input <= oldest_output
+
+    def __repr__(self):
+        return "Step({!r}, {!r}, status={!r})".format(self.name, self.tool_name, self.status)
+
+
+class Pipeline(object):
+    '''
+    A set of tool steps run by a WhiteboxTools object. A step depends on
+    every other step that writes one of the files it reads, as named by the
+    file parameters of the tools in whitebox_tools.json.
+    '''
+
+    def __init__(self, wbt, max_workers=None, make=True):
+        '''
+        wbt -- WhiteboxTools object used to run the steps.
+        max_workers -- Maximum number of steps running at once; defaults to the number of cores.
+        make -- Skip steps whose outputs are newer than their inputs.
+        '''
+        self.wbt = wbt
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.make = make
+        self.steps = []
+
+    def add(self, tool, name=None, after=(), **kwargs):
+        '''
+        Adds a step that calls the tool method named tool with kwargs, e.g.
+        `add("slope", dem="dem.tif", output="slope.tif")`. The step also runs
+        after the steps named in after, for dependencies that do not go
+        through files. Returns the step.
+        '''
+        method = _tool_method(tool)
+        if method is None:
+            method = getattr(type(self.wbt), tool, None)
+        if method is None:
+            raise ValueError("Unknown tool: {}".format(tool))
+
+        tool_name, args, callback = method(_RecordingRunner(), **kwargs)
+        inputs, outputs = self.wbt.tool_files(tool_name, args)
+
+        if name is None:
+            name = tool
+            n = 1
+            while self.step(name) is not None:
+                n += 1
+                name = "{}_{}".format(tool, n)
+        elif self.step(name) is not None:
+            raise ValueError("Duplicate step name: {}".format(name))
+
+        for other in self.steps:
+            for f in outputs:
+                if f in other.outputs:
+                    raise ValueError("{} and {} both write {}".format(other.name, name, f))
+
+        step = Step(name, tool_name, args, callback, inputs, outputs)
+        step.depends_on = list(after)
+        self.steps.append(step)
+        return step
+
+    def step(self, name):
+        for step in self.steps:
+            if step.name == name:
+                return step
+        return None
+
+    def dependencies(self):
+        '''
+        Returns the names of the steps that each step depends on.
+        '''
+        writers = {}
+        for step in self.steps:
+            for f in step.outputs:
+                writers[f] = step.name
+
+        deps = {}
+        for step in self.steps:
+            d = set(step.depends_on)
+            for f in step.inputs:
+                if f in writers and writers[f] != step.name:
+                    d.add(writers[f])
+            deps[step.name] = d
+        return deps
+
+    def order(self):
+        '''
+        Returns the step names in an order that respects the dependencies.
+        Raises ValueError if the steps form a cycle.
+        '''
+        deps = self.dependencies()
+        done, ret = set(), []
+        while len(ret) < len(self.steps):
+            ready = [s.name for s in self.steps if s.name not in done and deps[s.name] <= done]
+            if len(ready) == 0:
+                raise ValueError("The pipeline steps form a cycle: {}".format(
+                    ", ".join(sorted(set(deps) - done))))
+            ret.extend(ready)
+            done.update(ready)
+        return ret
+
+    def run(self):
+        '''
+        Runs the pipeline and returns the run_tool return code of each step
+        by name; up-to-date steps return 0 and steps that were not run
+        because an upstream step failed return None.
+        '''
+        deps = self.dependencies()
+        for name in deps:
+            missing = deps[name] - set(s.name for s in self.steps)
+            if missing:
+                raise ValueError("{} runs after unknown steps: {}".format(name, ", ".join(sorted(missing))))
+        self.order() # raises if there is a cycle
+
+        for step in self.steps:
+            step.status, step.ret = 'pending', None
+
+        def run_step(step):
+            # checked here rather than up front, as an upstream step that ran
+            # makes its dependants out of date
+            if self.make and step.up_to_date():
+                return 'up-to-date', 0
+            ret = self.wbt.run_tool(step.tool_name, step.args, step.callback)
+            return ('done' if ret == 0 else 'failed'), ret
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+            while True:
+                for step in self.steps:
+                    if step.status != 'pending':
+                        continue
+                    upstream = [self.step(d).status for d in deps[step.name]]
+                    if any(s in ('failed', 'not-run') for s in upstream):
+                        step.status = 'not-run'
+                    elif all(s in ('done', 'up-to-date') for s in upstream):
+                        step.status = 'running'
+                        running[executor.submit(run_step, step)] = step
+
+                if len(running) == 0:
+                    if any(s.status == 'pending' for s in self.steps):
+                        continue # a not-run step was just marked; propagate it
+                    break
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    try:
+                        step.status, step.ret = future.result()
+                    except Exception:
+                        step.status, step.ret = 'failed', 1
+                        raise
+
+        return dict((step.name, step.ret) for step in self.steps)
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+''' Helpers for the Whitebox GAT raw raster format, which WhiteboxTools reads
+and writes natively: a text header (.dep) describing the grid and a data file
+(.tas) holding the cell values row by row, starting with the northern row.
+Because the data file is plain binary, tiles and mosaics can be cut and
+assembled by copying byte ranges, without decoding the raster, and NumPy
+arrays can be mapped straight onto it.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_raster import read_raster, write_raster
+
+    write_raster("in.dep", array, header)  # no GeoTIFF encoding
+    WhiteboxTools().gaussian_filter("in.dep", "out.dep", sigma=2.0)
+    smoothed, header = read_raster("out.dep")  # a numpy.memmap, not decoded
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import os
+import sys
+from os import path
+from array import array
+
+# Data Type header value: (array typecode, bytes per cell)
+_data_types = {
+    'float': ('f', 4),
+    'double': ('d', 8),
+    'integer': ('h', 2),
+    'byte': ('B', 1),
+}
+
+# Data Type header value: NumPy type without byte order
+_numpy_types = {
+    'float': 'f4',
+    'double': 'f8',
+    'integer': 'i2',
+    'byte': 'u1',
+}
+
+# the order in which WhiteboxTools writes the header fields
+_header_fields = [
+    'Min', 'Max', 'North', 'South', 'East', 'West', 'Cols', 'Rows', 'Stacks',
+    'Data Type', 'Z Units', 'XY Units', 'Projection', 'Data Scale',
+    'Display Min', 'Display Max', 'Preferred Palette', 'NoData', 'Byte Order',
+    'Palette Nonlinearity',
+]
+
+
+class RasterHeader(object):
+    '''
+    The header of a Whitebox GAT raster. fields holds the raw header values
+    by name; the commonly used ones are also available as typed properties.
+    '''
+
+    def __init__(self, fields=None):
+        self.fields = dict(fields or {})
+
+    @classmethod
+    def read(cls, file_name):
+        '''
+        Reads the .dep header of file_name (either the .dep or the .tas file).
+        '''
+        fields = {}
+        with open(dep_file(file_name), 'r') as f:
+            for line in f:
+                if ':' not in line:
+                    continue
+                key, value = line.split(':', 1)
+                fields[key.strip()] = value.strip()
+        return cls(fields)
+
+    def write(self, file_name):
+        '''
+        Writes the header to the .dep file of file_name.
+        '''
+        keys = [k for k in _header_fields if k in self.fields]
+        keys += [k for k in self.fields if k not in _header_fields]
+        with open(dep_file(file_name), 'w') as f:
+            for k in keys:
+                f.write("{}:\t{}\n".format(k, self.fields[k]))
+
+    def copy(self):
+        return RasterHeader(self.fields)
+
+    def _float(self, key, default=0.0):
+        try:
+            return float(self.fields[key])
+        except (KeyError, ValueError):
+            return default
+
+    @property
+    def rows(self):
+        return int(self._float('Rows'))
+
+    @property
+    def cols(self):
+        return int(self._float('Cols'))
+
+    @property
+    def north(self):
+        return self._float('North')
+
+    @property
+    def south(self):
+        return self._float('South')
+
+    @property
+    def east(self):
+        return self._float('East')
+
+    @property
+    def west(self):
+        return self._float('West')
+
+    @property
+    def nodata(self):
+        return self._float('NoData', -32768.0)
+
+    @property
+    def cell_size_x(self):
+        return (self.east - self.west) / self.cols
+
+    @property
+    def cell_size_y(self):
+        return (self.north - self.south) / self.rows
+
+    @property
+    def data_type(self):
+        return self.fields.get('Data Type', 'float').lower()
+
+    @property
+    def typecode(self):
+        return _data_types[self.data_type][0]
+
+    @property
+    def itemsize(self):
+        return _data_types[self.data_type][1]
+
+    @property
+    def byte_order(self):
+        if 'big' in self.fields.get('Byte Order', 'LITTLE_ENDIAN').lower():
+            return 'big'
+        return 'little'
+
+    @property
+    def dtype(self):
+        '''
+        The NumPy type string of the cells, e.g. '<f4'.
+        '''
+        return ('<' if self.byte_order == 'little' else '>') + _numpy_types[self.data_type]
+
+    def window(self, row0, row1, col0, col1):
+        '''
+        Returns the header of the sub-grid rows row0..row1-1 and columns
+        col0..col1-1.
+        '''
+        h = self.copy()
+        h.fields['Rows'] = str(row1 - row0)
+        h.fields['Cols'] = str(col1 - col0)
+        h.fields['North'] = repr(self.north - row0 * self.cell_size_y)
+        h.fields['South'] = repr(self.north - row1 * self.cell_size_y)
+        h.fields['West'] = repr(self.west + col0 * self.cell_size_x)
+        h.fields['East'] = repr(self.west + col1 * self.cell_size_x)
+        return h
+
+
+def dep_file(file_name):
+    return path.splitext(file_name)[0] + '.dep'
+
+
+def tas_file(file_name):
+    return path.splitext(file_name)[0] + '.tas'
+
+
+def is_whitebox_raster(file_name):
+    return path.splitext(file_name)[1].lower() in ('.dep', '.tas')
+
+
+def copy_window(src, dst, row0, row1, col0, col1):
+    '''
+    Writes the sub-grid rows row0..row1-1 and columns col0..col1-1 of the
+    Whitebox raster src to a new Whitebox raster dst, copying bytes only.
+    '''
+    header = RasterHeader.read(src)
+    size = header.itemsize
+    with open(tas_file(src), 'rb') as fin, open(tas_file(dst), 'wb') as fout:
+        for row in range(row0, row1):
+            fin.seek((row * header.cols + col0) * size)
+            fout.write(fin.read((col1 - col0) * size))
+    sub = header.window(row0, row1, col0, col1)
+    sub.write(dst)
+    return sub
+
+
+def create(file_name, header):
+    '''
+    Creates a Whitebox raster filled with zero bytes, to be written into
+    with paste_window, and writes its header.
+    '''
+    with open(tas_file(file_name), 'wb') as f:
+        f.truncate(header.rows * header.cols * header.itemsize)
+    header.write(file_name)
+
+
+def paste_window(src, dst, src_row0, src_row1, src_col0, src_col1, dst_row0, dst_col0):
+    '''
+    Copies the sub-grid src_row0..src_row1-1, src_col0..src_col1-1 of the
+    Whitebox raster src into the existing raster dst at dst_row0, dst_col0.
+    Both rasters must have the same data type. Returns the (min, max) of the
+    copied cells that are not NoData, or None if all of them are NoData;
+    they are computed with NumPy when it is installed.
+    '''
+    src_header = RasterHeader.read(src)
+    dst_header = RasterHeader.read(dst)
+    if src_header.data_type != dst_header.data_type:
+        raise ValueError("{} and {} have different data types".format(src, dst))
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    size = src_header.itemsize
+    nodata = src_header.nodata
+    lo, hi = None, None
+    with open(tas_file(src), 'rb') as fin, open(tas_file(dst), 'r+b') as fout:
+        for i, row in enumerate(range(src_row0, src_row1)):
+            fin.seek((row * src_header.cols + src_col0) * size)
+            data = fin.read((src_col1 - src_col0) * size)
+            fout.seek(((dst_row0 + i) * dst_header.cols + dst_col0) * size)
+            fout.write(data)
+            if np is not None:
+                continue
+
+            values = array(src_header.typecode, data)
+            if src_header.byte_order != sys.byteorder:
+                values.byteswap()
+            row_lo, row_hi = min(values), max(values)
+            if row_lo == nodata or row_hi == nodata:
+                values = [v for v in values if v != nodata]
+                if len(values) == 0:
+                    continue
+                row_lo, row_hi = min(values), max(values)
+            lo = row_lo if lo is None else min(lo, row_lo)
+            hi = row_hi if hi is None else max(hi, row_hi)
+
+    if np is not None:
+        # blocks of about a million cells of the memory-mapped source
+        cells, _ = read_raster(src)
+        block_rows = max(1, (1 << 20) // max(src_col1 - src_col0, 1))
+        for row0 in range(src_row0, src_row1, block_rows):
+            block = cells[row0:min(row0 + block_rows, src_row1), src_col0:src_col1]
+            valid = block[block != nodata]
+            if valid.size == 0:
+                continue
+            block_lo, block_hi = valid.min().item(), valid.max().item()
+            lo = block_lo if lo is None else min(lo, block_lo)
+            hi = block_hi if hi is None else max(hi, block_hi)
+        del cells
+
+    if lo is None:
+        return None
+    return lo, hi
+
+
+def remove(file_name):
+    '''
+    Removes both files of a Whitebox raster, if they exist.
+    '''
+    for f in (dep_file(file_name), tas_file(file_name)):
+        if path.exists(f):
+            os.remove(f)
+
+
+def read_raster(file_name, mode='r'):
+    '''
+    Maps the cells of the Whitebox raster file_name into a numpy.memmap of
+    shape (rows, cols), without reading or decoding them. mode is passed to
+    numpy.memmap: 'r' (read-only), 'r+' (changes are written to the file)
+    or 'c' (changes are kept in memory). Returns the array and the header.
+    '''
+    import numpy as np
+
+    header = RasterHeader.read(file_name)
+    data = np.memmap(tas_file(file_name), dtype=np.dtype(header.dtype), mode=mode,
+                     shape=(header.rows, header.cols))
+    return data, header
+
+
+def write_raster(file_name, data, header=None, nodata=None):
+    '''
+    Writes a 2-D array as the Whitebox raster file_name. header supplies the
+    georeferencing and other fields, e.g. the header returned by read_raster
+    for the raster the array was derived from; by default the raster has
+    unit cells with its south-west corner at (0, 0). nodata defaults to the
+    NoData value of header, or -32768. NaN cells are written as NoData.
+    float64 arrays are written as DOUBLE rasters, int16 and int8 arrays as
+    INTEGER, uint8 and bool arrays as BYTE, other integer arrays as DOUBLE
+    and all other arrays as FLOAT. Returns the header written.
+    '''
+    import numpy as np
+
+    source = data
+    data = np.asarray(data)
+    if data.ndim != 2:
+        raise ValueError("A raster must be a 2-D array, not {}-D".format(data.ndim))
+    rows, cols = data.shape
+
+    if data.dtype == np.float64 or (data.dtype.kind in 'iu' and data.dtype.itemsize > 2):
+        data_type = 'double'
+    elif data.dtype in (np.int16, np.int8):
+        data_type = 'integer'
+    elif data.dtype in (np.uint8, np.bool_):
+        data_type = 'byte'
+    else:
+        data_type = 'float'
+
+    if header is None:
+        header = RasterHeader({'North': str(rows), 'South': '0', 'East': str(cols), 'West': '0',
+                               'Stacks': '1', 'Z Units': 'not specified',
+                               'XY Units': 'not specified', 'Projection': 'not specified',
+                               'Data Scale': 'continuous', 'Preferred Palette': 'spectrum.plt'})
+    else:
+        if header.rows != rows or header.cols != cols:
+            header = header.window(0, rows, 0, cols)
+        header = header.copy()
+    if nodata is None:
+        nodata = header.nodata
+
+    header.fields['Rows'] = str(rows)
+    header.fields['Cols'] = str(cols)
+    header.fields['Data Type'] = data_type.upper()
+    header.fields['Byte Order'] = 'LITTLE_ENDIAN' if sys.byteorder == 'little' else 'BIG_ENDIAN'
+    header.fields['NoData'] = repr(float(nodata))
+
+    cells = data.astype(_numpy_types[data_type], copy=False)
+    if cells.dtype.kind == 'f' and np.isnan(cells).any():
+        cells = np.where(np.isnan(cells), nodata, cells).astype(cells.dtype)
+    if isinstance(source, np.memmap) and source.filename is not None \
+            and path.exists(tas_file(file_name)) and path.samefile(source.filename, tas_file(file_name)):
+        # the array maps the cells of file_name itself, e.g. from read_raster(file_name, 'r+')
+        if np.shares_memory(cells, source) and source.offset == 0 and source.shape == (rows, cols):
+            source.flush()
+        else:
+            cells = np.array(cells)
+            cells.tofile(tas_file(file_name))
+    else:
+        cells.tofile(tas_file(file_name))
+
+    valid = cells[cells != nodata]
+    if valid.size > 0:
+        lo, hi = float(valid.min()), float(valid.max())
+    else:
+        lo, hi = float(nodata), float(nodata)
+    for key, value in (('Min', lo), ('Max', hi), ('Display Min', lo), ('Display Max', hi)):
+        header.fields[key] = repr(value)
+    header.write(file_name)
+    return header
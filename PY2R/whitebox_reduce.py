@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+''' Partitioned raster reductions: summary statistics, histograms, unique
+values, quantiles and zonal statistics computed from blocks of rows in
+parallel and merged exactly, returned as Python values rather than tool
+text. Requires NumPy.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_reduce import RasterReducer
+
+    r = RasterReducer(WhiteboxTools())
+    stats = r.summary_stats("dem.tif")         # {'count': ..., 'mean': ..., ...}
+    counts, edges = r.histogram("dem.tif", bins=100)
+    median, p99 = r.quantiles("dem.tif", [0.5, 0.99])
+    by_zone = r.zonal_statistics("dem.tif", "basins.tif")
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+import whitebox_raster as raster
+
+
+class Moments(object):
+    '''
+    Count, sum, minimum, maximum, mean and sum of squared deviations (M2)
+    of a set of values. Partial moments of disjoint sets are merged with
+    the pairwise update of Chan et al., which keeps Welford's numerical
+    stability.
+    '''
+
+    def __init__(self, count=0, total=0.0, mean=0.0, m2=0.0, lo=math.inf, hi=-math.inf):
+        self.count = count
+        self.total = total
+        self.mean = mean
+        self.m2 = m2
+        self.min = lo
+        self.max = hi
+
+    @classmethod
+    def of(cls, values):
+        '''
+        Returns the moments of a 1-D array of values.
+        '''
+        if values.size == 0:
+            return cls()
+        values = values.astype(np.float64, copy=False)
+        mean = float(values.mean())
+        return cls(int(values.size), float(values.sum()), mean,
+                   float(np.square(values - mean).sum()), float(values.min()), float(values.max()))
+
+    def merge(self, other):
+        '''
+        Adds the moments of a disjoint set of values to these.
+        '''
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self):
+        # population variance, as reported by raster_summary_stats
+        return self.m2 / self.count if self.count > 0 else math.nan
+
+    @property
+    def std_dev(self):
+        return math.sqrt(self.variance)
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.mean if self.count > 0 else math.nan,
+            'variance': self.variance,
+            'std_dev': self.std_dev,
+            'min': self.min if self.count > 0 else math.nan,
+            'max': self.max if self.count > 0 else math.nan,
+        }
+
+
+class RasterReducer(object):
+    '''
+    Computes reductions of rasters block by block on a thread pool; NumPy
+    releases the GIL in the reductions, so the blocks are processed on all
+    cores. Whitebox GAT rasters (.dep/.tas) are memory-mapped; rasters in
+    other formats are first converted to one in a scratch workspace with
+    the wbt object.
+    '''
+
+    def __init__(self, wbt=None, max_workers=None, block_cells=1 << 22):
+        '''
+        wbt -- WhiteboxTools object used to convert rasters that are not .dep; not needed otherwise.
+        max_workers -- Number of blocks reduced at once; defaults to the number of cores.
+        block_cells -- Number of cells in a block, rounded to whole rows.
+        '''
+        self.wbt = wbt
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.block_cells = block_cells
+
+    def summary_stats(self, file_name):
+        '''
+        Returns the count, sum, mean, population variance and standard
+        deviation, minimum and maximum of the valid cells of a raster, and
+        the number of NoData cells, as a dict.
+        '''
+        with self.__open(file_name) as (cells, header):
+            moments = self.__reduce(cells, header, Moments.of, Moments.merge, Moments())
+        ret = moments.as_dict()
+        ret['nodata_count'] = header.rows * header.cols - moments.count
+        return ret
+
+    def histogram(self, file_name, bins=256, value_range=None):
+        '''
+        Returns the counts of the valid cells of a raster in bins equal
+        bins over value_range (by default the raster's minimum to maximum), and
+        the bins + 1 bin edges, as numpy.histogram does.
+        '''
+        with self.__open(file_name) as (cells, header):
+            if value_range is None:
+                moments = self.__reduce(cells, header, Moments.of, Moments.merge, Moments())
+                value_range = (moments.min, moments.max) if moments.count > 0 else (0.0, 1.0)
+            edges = np.linspace(value_range[0], value_range[1], bins + 1)
+            counts = self.__reduce(cells, header, lambda v: np.histogram(v, edges)[0],
+                                   np.add, np.zeros(bins, dtype=np.int64))
+        return counts, edges
+
+    def unique_values(self, file_name):
+        '''
+        Returns the number of cells of each distinct valid value of a
+        raster, as a dict sorted by value.
+        '''
+        def count(values):
+            return dict(zip(*np.unique(values, return_counts=True)))
+
+        def merge(a, b):
+            for k, n in b.items():
+                a[k] = a.get(k, 0) + n
+            return a
+
+        with self.__open(file_name) as (cells, header):
+            counts = self.__reduce(cells, header, count, merge, {})
+        return dict((float(k), int(counts[k])) for k in sorted(counts))
+
+    def quantiles(self, file_name, probs, exact=True, sketch_bins=1 << 16):
+        '''
+        Returns the values at the given probabilities (0 to 1) of the valid
+        cells of a raster, interpolated between ranks as numpy.quantile does.
+        A first pass builds a mergeable sketch, a histogram of sketch_bins
+        bins from the minimum to the maximum. With exact False, values are
+        interpolated within their sketch bin, which bounds the error by the
+        bin width; otherwise a second pass collects the cells of the bins
+        that hold the wanted ranks and returns the exact values.
+        '''
+        with self.__open(file_name) as (cells, header):
+            moments = self.__reduce(cells, header, Moments.of, Moments.merge, Moments())
+            if moments.count == 0:
+                return [math.nan for _ in probs]
+            lo, hi = moments.min, moments.max
+            if lo == hi:
+                return [lo for _ in probs]
+            edges = np.linspace(lo, hi, sketch_bins + 1)
+            sketch = self.__reduce(cells, header, lambda v: np.histogram(v, edges)[0],
+                                   np.add, np.zeros(sketch_bins, dtype=np.int64))
+            below = np.concatenate(([0], np.cumsum(sketch)))
+
+            # the ranks each probability interpolates between, and their bins
+            ranks = {}
+            for p in probs:
+                pos = p * (moments.count - 1)
+                for k in (int(math.floor(pos)), int(math.ceil(pos))):
+                    ranks[k] = int(np.searchsorted(below, k, side='right')) - 1
+
+            if exact:
+                wanted = sorted(set(ranks.values()))
+
+                def collect(values):
+                    b = np.clip(np.searchsorted(edges, values, side='right') - 1, 0, sketch_bins - 1)
+                    return dict((i, values[b == i]) for i in wanted)
+
+                def merge(a, b):
+                    for i in wanted:
+                        a[i] = np.concatenate((a.get(i, np.empty(0)), b[i]))
+                    return a
+
+                in_bins = self.__reduce(cells, header, collect, merge, {})
+                for i in wanted:
+                    in_bins[i] = np.sort(in_bins.get(i, np.empty(0)).astype(np.float64))
+
+                def value(k):
+                    b = ranks[k]
+                    return float(in_bins[b][k - below[b]])
+            else:
+                def value(k):
+                    b = ranks[k]
+                    frac = (k - below[b] + 0.5) / sketch[b]
+                    return float(edges[b] + frac * (edges[b + 1] - edges[b]))
+
+        ret = []
+        for p in probs:
+            pos = p * (moments.count - 1)
+            k0, k1 = int(math.floor(pos)), int(math.ceil(pos))
+            v0, v1 = value(k0), value(k1)
+            ret.append(v0 + (v1 - v0) * (pos - k0))
+        return ret
+
+    def zonal_statistics(self, file_name, zones_file):
+        '''
+        Returns the summary statistics of the valid cells of a raster within
+        each zone of a zones raster of the same size, as a dict of dicts
+        keyed by zone value. Cells that are NoData in either raster are
+        left out.
+        '''
+        def zone_moments(values, zones):
+            keys, inverse = np.unique(zones, return_inverse=True)
+            values = values.astype(np.float64, copy=False)
+            count = np.bincount(inverse, minlength=keys.size)
+            total = np.bincount(inverse, weights=values, minlength=keys.size)
+            mean = total / count
+            m2 = np.bincount(inverse, weights=np.square(values - mean[inverse]), minlength=keys.size)
+            lo = np.full(keys.size, math.inf)
+            hi = np.full(keys.size, -math.inf)
+            np.minimum.at(lo, inverse, values)
+            np.maximum.at(hi, inverse, values)
+            return dict((float(keys[i]), Moments(int(count[i]), float(total[i]), float(mean[i]),
+                                                 float(m2[i]), float(lo[i]), float(hi[i])))
+                        for i in range(keys.size))
+
+        def merge(a, b):
+            for zone, m in b.items():
+                if zone in a:
+                    a[zone].merge(m)
+                else:
+                    a[zone] = m
+            return a
+
+        with self.__open(file_name) as (cells, header), self.__open(zones_file) as (zones, zones_header):
+            if (zones_header.rows, zones_header.cols) != (header.rows, header.cols):
+                raise ValueError("{} and {} have different dimensions".format(file_name, zones_file))
+            by_zone = self.__reduce(cells, header, zone_moments, merge, {}, zones, zones_header)
+        return dict((zone, by_zone[zone].as_dict()) for zone in sorted(by_zone))
+
+    @contextmanager
+    def __open(self, file_name):
+        if raster.is_whitebox_raster(file_name):
+            cells, header = raster.read_raster(file_name)
+            yield cells, header
+            return
+        if self.wbt is None:
+            raise ValueError("A WhiteboxTools object is needed to read {}".format(file_name))
+        with self.wbt.scratch_workspace() as ws:
+            converted = ws.path(os.path.splitext(os.path.basename(file_name))[0] + '.dep')
+            if self.wbt.convert_raster_format(file_name, converted) != 0:
+                raise OSError("Could not convert {} to a Whitebox raster".format(file_name))
+            cells, header = raster.read_raster(converted)
+            yield cells, header
+            del cells
+
+    def __reduce(self, cells, header, map_fn, merge_fn, initial, zones=None, zones_header=None):
+        # map_fn gets the valid cells of one block (and their zones) and
+        # returns a partial result; merge_fn combines two partial results
+        rows, cols = cells.shape
+        block_rows = max(1, self.block_cells // max(cols, 1))
+
+        def map_block(row0):
+            block = cells[row0:row0 + block_rows]
+            valid = (block != header.nodata)
+            if block.dtype.kind == 'f':
+                valid &= np.isfinite(block)
+            if zones is None:
+                return map_fn(block[valid])
+            zone_block = zones[row0:row0 + block_rows]
+            valid &= (zone_block != zones_header.nodata)
+            return map_fn(block[valid], zone_block[valid])
+
+        ret = initial
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for partial in executor.map(map_block, range(0, rows, block_rows)):
+                ret = merge_fn(ret, partial)
+        return ret
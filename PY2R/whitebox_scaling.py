@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+''' Measures how a tool's run time scales with --max_procs: the tool is run
+on a fixed input with max_procs swept from 1 to all cores, and the wall
+time, CPU time, speedup and parallel efficiency of each setting are
+reported as a table, and optionally as an SVG plot of the speedup curve.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_scaling import scaling_study, format_table, plot_speedup
+
+    wbt = WhiteboxTools()
+    rows = scaling_study(wbt, "slope", ["--dem='dem.tif'", "--output='slope.tif'"])
+    print(format_table(rows))
+    plot_speedup(rows, "slope_speedup.svg")
+
+or from the command line, with the tool's arguments after its name:
+
+    python whitebox_scaling.py slope --dem=dem.tif --output=slope.tif --repeat 3 --plot slope.svg
+
+The studies can be kept as per-tool profiles that pick max_procs for each
+run by the size of its input:
+
+    from whitebox_scaling import MaxProcsProfiles
+
+    profiles = MaxProcsProfiles("max_procs.json")
+    profiles.tune(wbt, "slope", ["--dem='dem.tif'", "--output='slope.tif'"])
+    wbt.set_max_procs_profile(profiles)
+    wbt.slope("other_dem.tif", "other_slope.tif")   # runs with the tuned max_procs
+
+    python whitebox_scaling.py slope --dem=dem.tif --output=slope.tif --profile max_procs.json
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import json
+import math
+import os
+import statistics
+import sys
+
+
+def proc_counts(max_procs=None):
+    '''
+    Returns the max_procs values of a sweep: 1, 2, 4, ... up to max_procs
+    (by default the number of cores), and max_procs itself.
+    '''
+    max_procs = max_procs or os.cpu_count() or 1
+    ret = []
+    p = 1
+    while p < max_procs:
+        ret.append(p)
+        p *= 2
+    ret.append(max_procs)
+    return ret
+
+
+def scaling_study(wbt, tool_name, args, procs=None, repeat=3, warmup=True, callback=None):
+    '''
+    Runs a tool with each max_procs value in procs (see proc_counts),
+    repeat times each, and returns a list with one dict per value:
+    max_procs, wall_time and cpu_time (medians, in seconds), max_rss (the
+    largest, in bytes), speedup (the wall time of the smallest max_procs
+    divided by this one's) and efficiency (speedup per process, relative
+    to the smallest max_procs). The sweeps are interleaved, so that drift
+    in the machine's load spreads over all the values. A first, untimed
+    run warms up the file cache unless warmup is False. The result cache
+    and engine of wbt are bypassed. Raises RuntimeError if a run fails.
+    '''
+    procs = sorted(set(procs or proc_counts()))
+    runs = dict((p, []) for p in procs)
+    cache, engine = wbt.result_cache, wbt.engine
+    wbt.result_cache, wbt.engine = None, None
+    try:
+        if warmup:
+            _check(wbt.run_tool(tool_name, args, callback, max_procs=procs[-1]))
+        for _ in range(repeat):
+            for p in procs:
+                runs[p].append(_check(wbt.run_tool(tool_name, args, callback, max_procs=p)))
+    finally:
+        wbt.result_cache, wbt.engine = cache, engine
+
+    rows = []
+    for p in procs:
+        usage = [r.usage for r in runs[p]]
+        cpu = [u['user_time'] + u.get('system_time', 0.0) for u in usage if 'user_time' in u]
+        rows.append({
+            'max_procs': p,
+            'wall_time': statistics.median(r.wall_time for r in runs[p]),
+            'cpu_time': statistics.median(cpu) if cpu else None,
+            'max_rss': max(u.get('max_rss', 0) for u in usage),
+        })
+    base = rows[0]
+    for row in rows:
+        row['speedup'] = base['wall_time'] / row['wall_time'] if row['wall_time'] > 0 else 0.0
+        row['efficiency'] = row['speedup'] * base['max_procs'] / row['max_procs']
+    return rows
+
+
+def _check(result):
+    if result != 0:
+        raise RuntimeError("{} failed with exit code {}: {}".format(
+            result.tool_name, int(result), "\n".join(result.output[-5:])))
+    return result
+
+
+def format_table(rows):
+    '''
+    Returns the rows of a scaling study as a text table.
+    '''
+    lines = ["{:>9} {:>10} {:>10} {:>8} {:>10} {:>8}".format(
+        "max_procs", "wall s", "cpu s", "speedup", "efficiency", "rss MB")]
+    for r in rows:
+        lines.append("{:>9} {:>10.3f} {:>10} {:>8.2f} {:>10.2f} {:>8.0f}".format(
+            r['max_procs'], r['wall_time'],
+            "{:.3f}".format(r['cpu_time']) if r['cpu_time'] is not None else "-",
+            r['speedup'], r['efficiency'], r['max_rss'] / 2.0 ** 20))
+    return "\n".join(lines)
+
+
+def plot_speedup(rows, file_name, title=""):
+    '''
+    Writes the speedup curve of a scaling study, with the ideal linear
+    speedup for reference, as an SVG image.
+    '''
+    width, height, margin = 480, 360, 50
+    max_p = max(r['max_procs'] for r in rows)
+    max_s = max([max_p] + [r['speedup'] for r in rows])
+
+    def x(p):
+        return margin + (width - 2 * margin) * p / float(max_p)
+
+    def y(s):
+        return height - margin - (height - 2 * margin) * s / float(max_s)
+
+    curve = " ".join("{:.1f},{:.1f}".format(x(r['max_procs']), y(r['speedup'])) for r in rows)
+    parts = [
+        '<svg xmlns="http://www.w3.org/2000/svg" width="{}" height="{}" font-family="sans-serif" font-size="12">'.format(width, height),
+        '<rect width="100%" height="100%" fill="white"/>',
+        '<text x="{}" y="20" text-anchor="middle" font-size="14">{}</text>'.format(width / 2, _xml(title)),
+        '<line x1="{0}" y1="{1}" x2="{2}" y2="{1}" stroke="black"/>'.format(margin, height - margin, width - margin),
+        '<line x1="{0}" y1="{1}" x2="{0}" y2="{2}" stroke="black"/>'.format(margin, height - margin, margin),
+        '<text x="{}" y="{}" text-anchor="middle">max_procs</text>'.format(width / 2, height - 10),
+        '<text x="15" y="{0}" text-anchor="middle" transform="rotate(-90 15 {0})">speedup</text>'.format(height / 2),
+        '<line x1="{:.1f}" y1="{:.1f}" x2="{:.1f}" y2="{:.1f}" stroke="grey" stroke-dasharray="4 4"/>'.format(
+            x(0), y(0), x(max_p), y(max_p)),
+        '<polyline points="{}" fill="none" stroke="steelblue" stroke-width="2"/>'.format(curve),
+    ]
+    for r in rows:
+        parts.append('<circle cx="{:.1f}" cy="{:.1f}" r="3" fill="steelblue"/>'.format(x(r['max_procs']), y(r['speedup'])))
+        parts.append('<text x="{:.1f}" y="{}" text-anchor="middle">{}</text>'.format(
+            x(r['max_procs']), height - margin + 15, r['max_procs']))
+    for s in sorted(set([1, int(max_s)])):
+        parts.append('<text x="{}" y="{:.1f}" text-anchor="end">{}</text>'.format(margin - 5, y(s) + 4, s))
+    parts.append('</svg>')
+    with open(file_name, 'w') as f:
+        f.write("\n".join(parts) + "\n")
+
+
+def _xml(text):
+    return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def input_size(wbt, tool_name, args):
+    '''
+    Returns the total size in bytes of the input files of a tool run,
+    which the profiles use as the measure of the size of its input.
+    '''
+    inputs, _ = wbt.tool_files(tool_name, args)
+    return sum(os.path.getsize(f) for f in inputs if os.path.isfile(f))
+
+
+class MaxProcsProfiles(object):
+    '''
+    Per-tool profiles of the max_procs value to run a tool with, by the
+    size of its input, chosen from scaling studies. The chosen value is the
+    smallest max_procs whose speedup is within tolerance of the best
+    speedup of the study, i.e. where adding processes stops paying off, so
+    that tools that scale poorly leave cores free for other jobs.
+
+    Set on a WhiteboxTools object with set_max_procs_profile; a run of a
+    tool that has a profile then uses the value chosen for the profiled
+    input size nearest to its own (by ratio), and other runs use the value
+    of set_max_procs. The profiles are kept in a JSON file if file_name is
+    given.
+    '''
+
+    def __init__(self, file_name=None, tolerance=0.1):
+        '''
+        file_name -- JSON file the profiles are loaded from, if it exists, and saved to by tune.
+        tolerance -- Fraction of the best speedup that may be given up for fewer processes.
+        '''
+        self.file_name = file_name
+        self.tolerance = tolerance
+        self.profiles = {} # tool_name: list of {'size', 'max_procs', 'speedup', 'efficiency'}
+        if file_name is not None and os.path.exists(file_name):
+            self.load(file_name)
+
+    def choose(self, rows):
+        '''
+        Returns the max_procs value to use, given the rows of a scaling study.
+        '''
+        best = max(r['speedup'] for r in rows)
+        return min(r['max_procs'] for r in rows if r['speedup'] >= (1.0 - self.tolerance) * best)
+
+    def add(self, tool_name, size, rows):
+        '''
+        Records the max_procs value chosen from a scaling study of a tool on
+        an input of size bytes, replacing any for the same size, and
+        returns it.
+        '''
+        p = self.choose(rows)
+        row = [r for r in rows if r['max_procs'] == p][0]
+        entries = [e for e in self.profiles.get(tool_name, []) if e['size'] != size]
+        entries.append({'size': size, 'max_procs': p, 'speedup': row['speedup'], 'efficiency': row['efficiency']})
+        self.profiles[tool_name] = sorted(entries, key=lambda e: e['size'])
+        return p
+
+    def lookup(self, tool_name, size):
+        '''
+        Returns the max_procs value of the profiled input size of a tool
+        nearest to size, or None if the tool has no profile.
+        '''
+        entries = self.profiles.get(tool_name)
+        if not entries:
+            return None
+        log_size = math.log(max(size, 1))
+        return min(entries, key=lambda e: abs(math.log(max(e['size'], 1)) - log_size))['max_procs']
+
+    def max_procs(self, wbt, tool_name, args):
+        '''
+        Returns the max_procs value for a tool run, or None if the tool has
+        no profile. Called by WhiteboxTools.run_tool.
+        '''
+        if tool_name not in self.profiles:
+            return None
+        try:
+            return self.lookup(tool_name, input_size(wbt, tool_name, args))
+        except OSError:
+            return None
+
+    def tune(self, wbt, tool_name, args, procs=None, repeat=3, callback=None):
+        '''
+        Runs a scaling study of a tool run (see scaling_study), records the
+        max_procs value chosen from it for the size of the run's input,
+        saves the profiles if they have a file, and returns the value.
+        '''
+        rows = scaling_study(wbt, tool_name, args, procs, repeat, callback=callback)
+        p = self.add(tool_name, input_size(wbt, tool_name, args), rows)
+        if self.file_name is not None:
+            self.save(self.file_name)
+        return p
+
+    def load(self, file_name):
+        with open(file_name, 'r') as f:
+            self.profiles = json.load(f)
+
+    def save(self, file_name):
+        tmp = "{}.{}.tmp".format(file_name, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump(self.profiles, f, indent=2, sort_keys=True)
+        os.replace(tmp, file_name)
+
+
+def main(argv=None):
+    import argparse
+    from whitebox_tools import WhiteboxTools
+
+    parser = argparse.ArgumentParser(
+        description="Measures the speedup of a WhiteboxTools tool against --max_procs.",
+        usage="%(prog)s tool_name [--tool_arg=value ...] [options]", allow_abbrev=False)
+    parser.add_argument("tool_name", help="tool to run, e.g. slope")
+    parser.add_argument("--procs", help="comma-separated max_procs values; by default 1, 2, 4, ... all cores")
+    parser.add_argument("--max-procs", type=int, help="largest max_procs of the default sweep")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each max_procs value")
+    parser.add_argument("--exe-dir", help="directory of the whitebox_tools executable")
+    parser.add_argument("--plot", help="write the speedup curve to this SVG file")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    parser.add_argument("--profile", help="record the chosen max_procs in this MaxProcsProfiles file")
+    opts, tool_args = parser.parse_known_args(argv)
+
+    wbt = WhiteboxTools()
+    if opts.exe_dir:
+        wbt.set_whitebox_dir(opts.exe_dir)
+    wbt.set_verbose_mode(False)
+    procs = [int(p) for p in opts.procs.split(",")] if opts.procs else proc_counts(opts.max_procs)
+
+    try:
+        rows = scaling_study(wbt, opts.tool_name, tool_args, procs, opts.repeat)
+    except RuntimeError as err:
+        print(err)
+        return 1
+    print("{} {}".format(opts.tool_name, " ".join(tool_args)))
+    print(format_table(rows))
+    if opts.plot:
+        plot_speedup(rows, opts.plot, opts.tool_name)
+    if opts.json:
+        with open(opts.json, 'w') as f:
+            json.dump({'tool_name': opts.tool_name, 'args': tool_args, 'rows': rows}, f, indent=2)
+    if opts.profile:
+        profiles = MaxProcsProfiles(opts.profile)
+        p = profiles.add(opts.tool_name, input_size(wbt, opts.tool_name, tool_args), rows)
+        profiles.save(opts.profile)
+        print("{}: max_procs {} recorded in {}".format(opts.tool_name, p, opts.profile))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+''' A scratch workspace for the intermediate files of a tool chain, kept on a
+RAM disk (/dev/shm by default) and removed when the chain ends, so that
+short-lived multi-gigabyte intermediates never reach durable storage.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+
+    wbt = WhiteboxTools()
+    with wbt.scratch_workspace() as ws:
+        filled = ws.path("filled.tif")
+        pointer = ws.path("pointer.tif")
+        wbt.fill_depressions("dem.tif", filled)
+        wbt.d8_pointer(filled, pointer)
+        wbt.d8_flow_accumulation(pointer, ws.output("accum.tif"), pntr=True)
+    # accum.tif is now in the working directory; filled.tif and pointer.tif are gone
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import os
+from os import path
+import shutil
+import tempfile
+
+from whitebox_tools import _companion_files
+
+
+def default_scratch_dir():
+    '''
+    Returns the directory in which scratch workspaces are created: the
+    WBT_SCRATCH_DIR environment variable if set, otherwise /dev/shm if it
+    is writable, otherwise the system temporary directory.
+    '''
+    if os.environ.get('WBT_SCRATCH_DIR'):
+        return os.environ['WBT_SCRATCH_DIR']
+    if path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+class ScratchWorkspace(object):
+    '''
+    A uniquely named directory for intermediate files, created on entering
+    the with block and removed with everything in it on leaving it, even if
+    the block raises. Files named with output() are the final outputs:
+    they are written in the workspace as well, and moved to their durable
+    destination when the block ends without an exception.
+
+    While the workspace is in use, runs of its WhiteboxTools object whose
+    outputs are all intermediate files are given --compress_rasters=false,
+    whatever set_compress_rasters says; runs that write a final output use
+    the object's setting.
+    '''
+
+    def __init__(self, wbt, scratch_dir=None):
+        '''
+        wbt -- WhiteboxTools object that runs the tool chain.
+        scratch_dir -- Directory, ideally on a RAM disk, to create the workspace in; see default_scratch_dir.
+        '''
+        self.wbt = wbt
+        self.scratch_dir = scratch_dir or default_scratch_dir()
+        self.dir = None
+        self.finals = {} # path in the workspace: destination path
+        self.moved = []
+        self.aborted = False
+
+    def __enter__(self):
+        os.makedirs(self.scratch_dir, exist_ok=True)
+        self.dir = tempfile.mkdtemp(prefix='wbt_scratch_', dir=self.scratch_dir)
+        self.wbt.scratch_workspaces.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None and not self.aborted:
+                self.commit()
+        finally:
+            self.wbt.scratch_workspaces.remove(self)
+            shutil.rmtree(self.dir, ignore_errors=True)
+
+    def path(self, name):
+        '''
+        Returns the path in the workspace of the intermediate file name.
+        '''
+        if self.dir is None:
+            raise RuntimeError("The scratch workspace is used outside its with block")
+        p = path.join(self.dir, name)
+        os.makedirs(path.dirname(p), exist_ok=True)
+        return p
+
+    def output(self, name, dest=None):
+        '''
+        Returns the path in the workspace of a final output, which is moved
+        to dest (by default name, resolved against the working directory)
+        when the with block ends.
+        '''
+        p = self.path(name)
+        self.finals[p] = self.wbt.resolve_path(dest or name)
+        return p
+
+    def abort(self):
+        '''
+        Discards the final outputs along with the intermediate files.
+        '''
+        self.aborted = True
+
+    def is_intermediate(self, file_name):
+        '''
+        Returns True if file_name is in the workspace and is not a final
+        output or one of its companion files.
+        '''
+        if self.dir is None:
+            return False
+        f = path.abspath(file_name)
+        if not f.startswith(self.dir + os.sep):
+            return False
+        stem = path.splitext(f)[0]
+        return not any(path.splitext(p)[0] == stem for p in self.finals)
+
+    def commit(self):
+        '''
+        Moves the final outputs that were written, with their companion
+        files, to their destinations. A final output that does not exist
+        (the tool that writes it failed) is left out. Returns the
+        destinations moved to, which are also kept in moved.
+        '''
+        for src, dest in self.finals.items():
+            if not path.exists(src):
+                continue
+            dest_stem = path.splitext(dest)[0]
+            for f in _companion_files(src):
+                target = dest if f == src else dest_stem + path.splitext(f)[1]
+                os.makedirs(path.dirname(target), exist_ok=True)
+                # move next to the destination first, so that it appears whole
+                tmp = "{}.{}.tmp".format(target, os.getpid())
+                shutil.move(f, tmp)
+                os.replace(tmp, target)
+            self.moved.append(dest)
+        return self.moved
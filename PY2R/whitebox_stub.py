@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+''' Writes whitebox_tools.pyi, the type stub that lists the tool methods
+which whitebox_tools.py creates on first access from whitebox_tools.json,
+so that text editors and IDEs can still autocomplete them.
+
+Run it whenever whitebox_tools.json or the WhiteboxTools class changes:
+
+    python whitebox_stub.py [output.pyi]
+'''
+
+# License: MIT
+
+import os
+import sys
+import inspect
+
+import whitebox_tools
+
+
+def stub_source():
+    lines = []
+    lines.append("# Generated by whitebox_stub.py from whitebox_tools.json: do not edit by hand")
+    lines.append("")
+    lines.append("from typing import Any, Dict, List, Optional")
+    lines.append("")
+    lines.append("running_windows: bool")
+    lines.append("")
+    for fn in (whitebox_tools.default_callback, whitebox_tools.to_camelcase, whitebox_tools.to_snakecase):
+        lines.append("def {}{}: ...".format(fn.__name__, inspect.signature(fn)))
+    lines.append("")
+    lines.append("class ToolResult(int):")
+    lines.append("    tool_name: str")
+    lines.append("    args: List[str]")
+    lines.append("    start_time: Optional[float]")
+    lines.append("    output: List[str]")
+    lines.append("    wall_time: Optional[float]")
+    lines.append("    usage: Dict[str, float]")
+    lines.append("    @property")
+    lines.append("    def exit_code(self) -> int: ...")
+    lines.append("    @property")
+    lines.append("    def elapsed_time(self) -> Optional[float]: ...")
+    lines.append("    @property")
+    lines.append("    def fields(self) -> Dict[str, Any]: ...")
+    lines.append("")
+    lines.append("class WhiteboxTools(object):")
+
+    # the methods of the class itself
+    for name, member in whitebox_tools.WhiteboxTools.__dict__.items():
+        if not inspect.isfunction(member):
+            continue
+        if name.startswith('_') and name != '__init__':
+            continue
+        prefix = "async def" if inspect.iscoroutinefunction(member) else "def"
+        lines.append("    {} {}{}: ...".format(prefix, name, inspect.signature(member)))
+
+    # the tool methods and their coroutine counterparts
+    tools = whitebox_tools._tool_metadata()
+    for name in sorted(tools, key=str.lower):
+        tool = tools[name]
+        sig = whitebox_tools._tool_signature(tool)
+        lines.append("    def {}({}) -> ToolResult:".format(name, sig))
+        lines.append("        " + whitebox_tools._tool_docstring(tool))
+        lines.append("        ...")
+        lines.append("    async def {}_async({}) -> ToolResult: ...".format(name, sig))
+
+    lines.append("    def __getattr__(self, name: str) -> Any: ...")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == '__main__':
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    stub_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(dir_path, "whitebox_tools.pyi")
+    with open(stub_path, 'w') as f:
+        f.write(stub_source())
+    print(stub_path)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+''' Runs neighbourhood raster tools on very large rasters tile by tile: the
+input is cut into tiles with a halo wide enough for the tool's moving
+window, the tool runs on the tiles in parallel processes, and the tiles are
+trimmed of their halos and mosaicked back into one output raster.
+
+Example:
+
+    from whitebox_tools import WhiteboxTools
+    from whitebox_tiles import TiledRunner
+
+    runner = TiledRunner(WhiteboxTools(), tile_size=4096, max_procs=64)
+    runner.run("gaussian_filter", i="dem.dep", output="smoothed.dep", sigma=2.0)
+'''
+
+# License: MIT
+
+from __future__ import print_function
+import math
+from os import path
+import shutil
+import tempfile
+
+import whitebox_raster as raster
+from whitebox_batch import BatchExecutor
+from whitebox_tools import _RecordingRunner, _param_name, _tool_metadata, _tool_method, _tool_params
+
+
+def _window_halo(kwargs, defaults):
+    # filterx/filtery are the window dimensions in cells
+    filterx = int(kwargs.get('filterx', defaults.get('filterx', 3)))
+    filtery = int(kwargs.get('filtery', defaults.get('filtery', filterx)))
+    return max(filterx, filtery) // 2 + 1
+
+
+def _gaussian_halo(kwargs, defaults):
+    # the kernel of gaussian_filter extends to where the weight falls below 0.001
+    sigma = float(kwargs.get('sigma', defaults.get('sigma', 0.75)))
+    two_sigma_sqr = 2.0 * sigma * sigma
+    for i in range(250):
+        if math.exp(-1.0 * i * i / two_sigma_sqr) / (math.sqrt(2.0 * math.pi) * sigma) <= 0.001:
+            return i + 1
+    return 251
+
+
+def _surface_halo(kwargs, defaults):
+    # 3x3 (or 5x5 for some curvature estimators) moving window
+    return 3
+
+
+# Halo width in cells needed by each supported tool, from its arguments.
+halo_rules = {
+    'mean_filter': _window_halo,
+    'median_filter': _window_halo,
+    'percentile_filter': _window_halo,
+    'minimum_filter': _window_halo,
+    'maximum_filter': _window_halo,
+    'range_filter': _window_halo,
+    'total_filter': _window_halo,
+    'standard_deviation_filter': _window_halo,
+    'olympic_filter': _window_halo,
+    'majority_filter': _window_halo,
+    'diversity_filter': _window_halo,
+    'gaussian_filter': _gaussian_halo,
+    'slope': _surface_halo,
+    'aspect': _surface_halo,
+    'hillshade': _surface_halo,
+    'ruggedness_index': _surface_halo,
+    'plan_curvature': _surface_halo,
+    'profile_curvature': _surface_halo,
+    'tangential_curvature': _surface_halo,
+    'total_curvature': _surface_halo,
+}
+
+
+class TiledRunner(object):
+    '''
+    Runs a local-window raster tool tile by tile. Tiles are cut from and
+    mosaicked into Whitebox GAT rasters (.dep/.tas) by copying bytes, so
+    neither step holds more than one row in memory; inputs and outputs in
+    other formats are converted with convert_raster_format, which loads the
+    raster once. For rasters that do not fit in memory even once, use .dep
+    inputs and outputs.
+
+    The mosaic is identical to running the tool on the whole raster, as
+    long as the tool only looks at cells within the halo. Tools that derive
+    parameters from the whole raster (e.g. a z-factor from the mid-latitude
+    of a geographic raster) should be given those parameters explicitly.
+    '''
+
+    def __init__(self, wbt, tile_size=4096, max_procs=None, max_workers=None, scratch_dir=None):
+        '''
+        wbt -- WhiteboxTools object used to run the tools.
+        tile_size -- Width and height of a tile in cells, not counting the halo.
+        max_procs -- Total number of cores shared by the tile runs; defaults to all cores.
+        max_workers -- Maximum number of tiles processed at once.
+        scratch_dir -- Directory for the tiles; defaults to the directory of the output.
+        '''
+        self.wbt = wbt
+        self.tile_size = tile_size
+        self.max_procs = max_procs
+        self.max_workers = max_workers
+        self.scratch_dir = scratch_dir
+
+    def halo(self, tool, kwargs):
+        '''
+        Returns the halo width in cells that the tool needs with kwargs.
+        '''
+        rule = halo_rules.get(tool)
+        if rule is None:
+            raise ValueError("No halo rule for {}; pass halo= explicitly".format(tool))
+        defaults = {}
+        for name, _, _, default in _tool_params(_tool_metadata()[tool]):
+            if default not in (None, 'None'):
+                defaults[name] = str(default).strip('\'"')
+        return rule(kwargs, defaults)
+
+    def tiles(self, rows, cols, halo):
+        '''
+        Returns the tiles of a rows x cols raster as (core, window) pairs of
+        (row0, row1, col0, col1) extents, the window including the halo.
+        '''
+        ret = []
+        for row0 in range(0, rows, self.tile_size):
+            row1 = min(row0 + self.tile_size, rows)
+            for col0 in range(0, cols, self.tile_size):
+                col1 = min(col0 + self.tile_size, cols)
+                window = (max(row0 - halo, 0), min(row1 + halo, rows),
+                          max(col0 - halo, 0), min(col1 + halo, cols))
+                ret.append(((row0, row1, col0, col1), window))
+        return ret
+
+    def run(self, tool, halo=None, callback=None, **kwargs):
+        '''
+        Runs the tool method named tool with kwargs on tiles of its input
+        raster and writes the mosaic to its output raster. halo overrides
+        the halo width given by halo_rules. Returns the first non-zero
+        run_tool return code of a tile, or 0.
+        '''
+        method = _tool_method(tool)
+        if method is None:
+            raise ValueError("Unknown tool: {}".format(tool))
+        input_param, output_param = _raster_params(_tool_metadata()[tool])
+        if halo is None:
+            halo = self.halo(tool, kwargs)
+
+        input_file = self.wbt.resolve_path(kwargs[input_param])
+        output_file = self.wbt.resolve_path(kwargs[output_param])
+        scratch = tempfile.mkdtemp(prefix='wbt_tiles_',
+                                   dir=self.scratch_dir or path.dirname(output_file))
+        try:
+            if raster.is_whitebox_raster(input_file):
+                source = input_file
+            else:
+                source = path.join(scratch, 'input.dep')
+                ret = self.wbt.convert_raster_format(input_file, source, callback=callback)
+                if ret != 0:
+                    return ret
+
+            header = raster.RasterHeader.read(source)
+            tiles = self.tiles(header.rows, header.cols, halo)
+
+            jobs = []
+            for n, (_, window) in enumerate(tiles):
+                tile_in = path.join(scratch, 'tile_{}_in.dep'.format(n))
+                tile_out = path.join(scratch, 'tile_{}_out.dep'.format(n))
+                raster.copy_window(source, tile_in, *window)
+                tile_kwargs = dict(kwargs)
+                tile_kwargs[input_param] = tile_in
+                tile_kwargs[output_param] = tile_out
+                tool_name, args, _ = method(_RecordingRunner(), **tile_kwargs)
+                jobs.append((tool_name, args))
+
+            executor = BatchExecutor(self.wbt, max_procs=self.max_procs, max_workers=self.max_workers)
+            for ret in executor.run(jobs, callback):
+                if ret != 0:
+                    return ret
+
+            if raster.is_whitebox_raster(output_file):
+                mosaic = output_file
+            else:
+                mosaic = path.join(scratch, 'output.dep')
+            self.mosaic(scratch, tiles, header, mosaic)
+
+            if mosaic != output_file:
+                return self.wbt.convert_raster_format(mosaic, output_file, callback=callback)
+            return 0
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    def mosaic(self, scratch, tiles, header, output_file):
+        '''
+        Trims the halo off every tile output and writes the tiles into
+        output_file, a Whitebox raster with the extent of header.
+        '''
+        tile_header = raster.RasterHeader.read(path.join(scratch, 'tile_0_out.dep'))
+        out_header = header.copy()
+        for key in ('Data Type', 'NoData', 'Z Units', 'Data Scale', 'Preferred Palette', 'Byte Order'):
+            if key in tile_header.fields:
+                out_header.fields[key] = tile_header.fields[key]
+        raster.create(output_file, out_header)
+
+        lo, hi = None, None
+        for n, (core, window) in enumerate(tiles):
+            tile_out = path.join(scratch, 'tile_{}_out.dep'.format(n))
+            row0, row1, col0, col1 = core
+            src_row0, src_col0 = row0 - window[0], col0 - window[2]
+            rng = raster.paste_window(tile_out, output_file,
+                                      src_row0, src_row0 + row1 - row0,
+                                      src_col0, src_col0 + col1 - col0,
+                                      row0, col0)
+            if rng is not None:
+                lo = rng[0] if lo is None else min(lo, rng[0])
+                hi = rng[1] if hi is None else max(hi, rng[1])
+            raster.remove(tile_out)
+
+        if lo is not None:
+            for key, value in (('Min', lo), ('Max', hi), ('Display Min', lo), ('Display Max', hi)):
+                out_header.fields[key] = repr(value)
+            out_header.write(output_file)
+
+
+def _raster_params(tool):
+    '''
+    Returns the names of the input and output raster parameters of a tool.
+    '''
+    input_param, output_param = None, None
+    for name, p in tool['parameters'].items():
+        if p['parameter_type'] == {'ExistingFile': 'Raster'} and input_param is None:
+            input_param = _param_name(name)
+        elif p['parameter_type'] == {'NewFile': 'Raster'} and output_param is None:
+            output_param = _param_name(name)
+    if input_param is None or output_param is None:
+        raise ValueError("{} does not read and write a single raster".format(tool['tool_name']))
+    return input_param, output_param
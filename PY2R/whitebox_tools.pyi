@@ -0,0 +1,7196 @@
+# Generated by whitebox_stub.py from whitebox_tools.json: do not edit by hand
+
+from typing import Any, Dict, List, Optional
+
+running_windows: bool
+
+def default_callback(value): ...
+def to_camelcase(name): ...
+def to_snakecase(name): ...
+
+class ToolResult(int):
+    tool_name: str
+    args: List[str]
+    start_time: Optional[float]
+    output: List[str]
+    wall_time: Optional[float]
+    usage: Dict[str, float]
+    @property
+    def exit_code(self) -> int: ...
+    @property
+    def elapsed_time(self) -> Optional[float]: ...
+    @property
+    def fields(self) -> Dict[str, Any]: ...
+
+class WhiteboxTools(object):
+    def __init__(self): ...
+    def set_whitebox_dir(self, path_str): ...
+    def set_working_dir(self, path_str): ...
+    def get_working_dir(self): ...
+    def get_verbose_mode(self): ...
+    def set_verbose_mode(self, val=True): ...
+    def set_default_callback(self, callback_func): ...
+    def set_compress_rasters(self, val=True): ...
+    def get_compress_rasters(self): ...
+    def set_max_procs(self, val=-1): ...
+    def get_max_procs(self): ...
+    def settings_file(self): ...
+    def load_settings(self): ...
+    def save_settings(self): ...
+    def resolve_path(self, file_name): ...
+    def tool_files(self, tool_name, args): ...
+    def exe_file(self): ...
+    def clear_metadata_cache(self): ...
+    def scratch_workspace(self, scratch_dir=None): ...
+    def set_result_cache(self, cache): ...
+    def set_engine(self, engine): ...
+    def set_max_procs_profile(self, profile): ...
+    def add_metrics_sink(self, sink): ...
+    def remove_metrics_sink(self, sink): ...
+    def run_tool(self, tool_name, args, callback=None, max_procs=None): ...
+    async def run_tool_async(self, tool_name, args, callback=None, max_procs=None): ...
+    def help(self): ...
+    def license(self, toolname=None): ...
+    def version(self): ...
+    def tool_help(self, tool_name=''): ...
+    def tool_parameters(self, tool_name): ...
+    def toolbox(self, tool_name=''): ...
+    def view_code(self, tool_name): ...
+    def list_tools(self, keywords=[]): ...
+    def install_wbt_extension(self, ext_name=''): ...
+    def activate_license(self): ...
+    def absolute_value(self, i, output, callback=None) -> ToolResult:
+        """Calculates the absolute value of every cell in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def absolute_value_async(self, i, output, callback=None) -> ToolResult: ...
+    def accumulation_curvature(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates accumulation curvature from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def accumulation_curvature_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def adaptive_filter(self, i, output, filterx=11, filtery=11, threshold=2.0, callback=None) -> ToolResult:
+        """Performs an adaptive filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        threshold -- Difference from mean threshold, in standard deviations. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def adaptive_filter_async(self, i, output, filterx=11, filtery=11, threshold=2.0, callback=None) -> ToolResult: ...
+    def add(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs an addition operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def add_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def add_point_coordinates_to_table(self, i, callback=None) -> ToolResult:
+        """Modifies the attribute table of a point vector by adding fields containing each point's X and Y coordinates.
+
+        Keyword arguments:
+
+        i -- Input vector Points file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def add_point_coordinates_to_table_async(self, i, callback=None) -> ToolResult: ...
+    def aggregate_raster(self, i, output, agg_factor=2, type="mean", callback=None) -> ToolResult:
+        """Aggregates a raster to a lower resolution.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        agg_factor -- Aggregation factor, in pixels. 
+        type -- Statistic used to fill output pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def aggregate_raster_async(self, i, output, agg_factor=2, type="mean", callback=None) -> ToolResult: ...
+    def And(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a logical AND operator on two Boolean raster images.
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def And_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def anova(self, i, features, output, callback=None) -> ToolResult:
+        """Performs an analysis of variance (ANOVA) test on a raster dataset.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        features -- Feature definition (or class) raster. 
+        output -- Output HTML file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def anova_async(self, i, features, output, callback=None) -> ToolResult: ...
+    def arc_cos(self, i, output, callback=None) -> ToolResult:
+        """Returns the inverse cosine (arccos) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def arc_cos_async(self, i, output, callback=None) -> ToolResult: ...
+    def arc_sin(self, i, output, callback=None) -> ToolResult:
+        """Returns the inverse sine (arcsin) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def arc_sin_async(self, i, output, callback=None) -> ToolResult: ...
+    def arc_tan(self, i, output, callback=None) -> ToolResult:
+        """Returns the inverse tangent (arctan) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def arc_tan_async(self, i, output, callback=None) -> ToolResult: ...
+    def arcosh(self, i, output, callback=None) -> ToolResult:
+        """Returns the inverse hyperbolic cosine (arcosh) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def arcosh_async(self, i, output, callback=None) -> ToolResult: ...
+    def arsinh(self, i, output, callback=None) -> ToolResult:
+        """Returns the inverse hyperbolic sine (arsinh) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def arsinh_async(self, i, output, callback=None) -> ToolResult: ...
+    def artanh(self, i, output, callback=None) -> ToolResult:
+        """Returns the inverse hyperbolic tangent (arctanh) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def artanh_async(self, i, output, callback=None) -> ToolResult: ...
+    def ascii_to_las(self, inputs, pattern, proj=None, callback=None) -> ToolResult:
+        """Converts one or more ASCII files containing LiDAR points into LAS files.
+
+        Keyword arguments:
+
+        inputs -- Input LiDAR  ASCII files (.csv). 
+        pattern -- Input field pattern. 
+        proj -- Well-known-text string or EPSG code describing projection. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def ascii_to_las_async(self, inputs, pattern, proj=None, callback=None) -> ToolResult: ...
+    def aspect(self, dem, output, zfactor=None, callback=None) -> ToolResult:
+        """Calculates an aspect raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def aspect_async(self, dem, output, zfactor=None, callback=None) -> ToolResult: ...
+    def assess_route(self, routes, dem, output, length="", dist=20, callback=None) -> ToolResult:
+        """This tool assesses a route for slope, elevation, and visibility variation.
+
+        Keyword arguments:
+
+        routes -- Name of the input routes vector file. 
+        dem -- Name of the input DEM raster file. 
+        output -- Name of the output lines shapefile. 
+        length -- Maximum segment length (m). 
+        dist -- Search distance, in grid cells, used in visibility analysis. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def assess_route_async(self, routes, dem, output, length="", dist=20, callback=None) -> ToolResult: ...
+    def atan2(self, input_y, input_x, output, callback=None) -> ToolResult:
+        """Returns the 2-argument inverse tangent (atan2).
+
+        Keyword arguments:
+
+        input_y -- Input y raster file or constant value (rise). 
+        input_x -- Input x raster file or constant value (run). 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def atan2_async(self, input_y, input_x, output, callback=None) -> ToolResult: ...
+    def attribute_correlation(self, i, output=None, callback=None) -> ToolResult:
+        """Performs a correlation analysis on attribute fields from a vector database.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def attribute_correlation_async(self, i, output=None, callback=None) -> ToolResult: ...
+    def attribute_correlation_neighbourhood_analysis(self, i, field1, field2, radius=None, min_points=None, stat="pearson", callback=None) -> ToolResult:
+        """Performs a correlation on two input vector attributes within a neighbourhood search windows.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        field1 -- First input field name (dependent variable) in attribute table. 
+        field2 -- Second input field name (independent variable) in attribute table. 
+        radius -- Search Radius (in map units). 
+        min_points -- Minimum number of points. 
+        stat -- Correlation type; one of 'pearson' (default) and 'spearman'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def attribute_correlation_neighbourhood_analysis_async(self, i, field1, field2, radius=None, min_points=None, stat="pearson", callback=None) -> ToolResult: ...
+    def attribute_histogram(self, i, field, output, callback=None) -> ToolResult:
+        """Creates a histogram for the field values of a vector's attribute table.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        field -- Input field name in attribute table. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def attribute_histogram_async(self, i, field, output, callback=None) -> ToolResult: ...
+    def attribute_scattergram(self, i, fieldx, fieldy, output, trendline=False, callback=None) -> ToolResult:
+        """Creates a scattergram for two field values of a vector's attribute table.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        fieldx -- Input field name in attribute table for the x-axis. 
+        fieldy -- Input field name in attribute table for the y-axis. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        trendline -- Draw the trendline. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def attribute_scattergram_async(self, i, fieldx, fieldy, output, trendline=False, callback=None) -> ToolResult: ...
+    def average_flowpath_slope(self, dem, output, callback=None) -> ToolResult:
+        """Measures the average slope gradient from each grid cell to all upslope divide cells.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def average_flowpath_slope_async(self, dem, output, callback=None) -> ToolResult: ...
+    def average_normal_vector_angular_deviation(self, dem, output, filter=11, callback=None) -> ToolResult:
+        """Calculates the circular variance of aspect at a scale for a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filter -- Size of the filter kernel. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def average_normal_vector_angular_deviation_async(self, dem, output, filter=11, callback=None) -> ToolResult: ...
+    def average_overlay(self, inputs, output, callback=None) -> ToolResult:
+        """Calculates the average for each grid cell from a group of raster images.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def average_overlay_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def average_upslope_flowpath_length(self, dem, output, callback=None) -> ToolResult:
+        """Measures the average length of all upslope flowpaths draining each grid cell.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def average_upslope_flowpath_length_async(self, dem, output, callback=None) -> ToolResult: ...
+    def balance_contrast_enhancement(self, i, output, band_mean=100.0, callback=None) -> ToolResult:
+        """Performs a balance contrast enhancement on a colour-composite image of multispectral data.
+
+        Keyword arguments:
+
+        i -- Input colour composite image file. 
+        output -- Output raster file. 
+        band_mean -- Band mean value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def balance_contrast_enhancement_async(self, i, output, band_mean=100.0, callback=None) -> ToolResult: ...
+    def basins(self, d8_pntr, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Identifies drainage basins that drain to the DEM edge.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def basins_async(self, d8_pntr, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def bilateral_filter(self, i, output, sigma_dist=0.75, sigma_int=1.0, callback=None) -> ToolResult:
+        """A bilateral filter is an edge-preserving smoothing filter introduced by Tomasi and Manduchi (1998).
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        sigma_dist -- Standard deviation in distance in pixels. 
+        sigma_int -- Standard deviation in intensity in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def bilateral_filter_async(self, i, output, sigma_dist=0.75, sigma_int=1.0, callback=None) -> ToolResult: ...
+    def block_maximum_gridding(self, i, field, output, use_z=False, cell_size=None, base=None, callback=None) -> ToolResult:
+        """Creates a raster grid based on a set of vector points and assigns grid values using a block maximum scheme.
+
+        Keyword arguments:
+
+        i -- Input vector Points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use z-coordinate instead of field?. 
+        output -- Output raster file. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def block_maximum_gridding_async(self, i, field, output, use_z=False, cell_size=None, base=None, callback=None) -> ToolResult: ...
+    def block_minimum_gridding(self, i, field, output, use_z=False, cell_size=None, base=None, callback=None) -> ToolResult:
+        """Creates a raster grid based on a set of vector points and assigns grid values using a block minimum scheme.
+
+        Keyword arguments:
+
+        i -- Input vector Points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use z-coordinate instead of field?. 
+        output -- Output raster file. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def block_minimum_gridding_async(self, i, field, output, use_z=False, cell_size=None, base=None, callback=None) -> ToolResult: ...
+    def boundary_shape_complexity(self, i, output, callback=None) -> ToolResult:
+        """Calculates the complexity of the boundaries of raster polygons.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def boundary_shape_complexity_async(self, i, output, callback=None) -> ToolResult: ...
+    def breach_depressions(self, dem, output, max_depth=None, max_length=None, flat_increment=None, fill_pits=False, callback=None) -> ToolResult:
+        """Breaches all of the depressions in a DEM using Lindsay's (2016) algorithm. This should be preferred over depression filling in most cases.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        max_depth -- Optional maximum breach depth (default is Inf). 
+        max_length -- Optional maximum breach channel length (in grid cells; default is Inf). 
+        flat_increment -- Optional elevation increment applied to flat areas. 
+        fill_pits -- Optional flag indicating whether to fill single-cell pits. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def breach_depressions_async(self, dem, output, max_depth=None, max_length=None, flat_increment=None, fill_pits=False, callback=None) -> ToolResult: ...
+    def breach_depressions_least_cost(self, dem, output, dist, max_cost=None, min_dist=True, flat_increment=None, fill=True, callback=None) -> ToolResult:
+        """Breaches the depressions in a DEM using a least-cost pathway method.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        dist -- Maximum search distance for breach paths in cells. 
+        max_cost -- Optional maximum breach cost (default is Inf). 
+        min_dist -- Optional flag indicating whether to minimize breach distances. 
+        flat_increment -- Optional elevation increment applied to flat areas. 
+        fill -- Optional flag indicating whether to fill any remaining unbreached depressions. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def breach_depressions_least_cost_async(self, dem, output, dist, max_cost=None, min_dist=True, flat_increment=None, fill=True, callback=None) -> ToolResult: ...
+    def breach_single_cell_pits(self, dem, output, callback=None) -> ToolResult:
+        """Removes single-cell pits from an input DEM by breaching.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def breach_single_cell_pits_async(self, dem, output, callback=None) -> ToolResult: ...
+    def breakline_mapping(self, dem, output, threshold=2.0, min_length=3, callback=None) -> ToolResult:
+        """This tool maps breaklines from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster image file. 
+        output -- Name of the output vector lines file. 
+        threshold -- Threshold value (0 - infinity but typically 1 to 5 works well). 
+        min_length -- Minimum line length, in grid cells. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def breakline_mapping_async(self, dem, output, threshold=2.0, min_length=3, callback=None) -> ToolResult: ...
+    def buffer_raster(self, i, output, size, gridcells=False, callback=None) -> ToolResult:
+        """Maps a distance-based buffer around each non-background (non-zero/non-nodata) grid cell in an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        size -- Buffer size. 
+        gridcells -- Optional flag to indicate that the 'size' threshold should be measured in grid cells instead of the default map units. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def buffer_raster_async(self, i, output, size, gridcells=False, callback=None) -> ToolResult: ...
+    def burn_streams_at_roads(self, dem, streams, roads, output, width=None, callback=None) -> ToolResult:
+        """Burns-in streams at the sites of road embankments.
+
+        Keyword arguments:
+
+        dem -- Input raster digital elevation model (DEM) file. 
+        streams -- Input vector streams file. 
+        roads -- Input vector roads file. 
+        output -- Output raster file. 
+        width -- Maximum road embankment width, in map units. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def burn_streams_at_roads_async(self, dem, streams, roads, output, width=None, callback=None) -> ToolResult: ...
+    def canny_edge_detection(self, i, output, sigma=0.5, low=0.05, high=0.15, add_back=False, callback=None) -> ToolResult:
+        """This tool performs a Canny edge-detection filter on an input image.
+
+        Keyword arguments:
+
+        i -- Name of the input raster image file. 
+        output -- Name of the output raster image file. 
+        sigma -- Sigma value used in Gaussian filtering, default = 0.5. 
+        low -- Low threshold, default = 0.05. 
+        high -- High threshold, default = 0.15. 
+        add_back -- Add the edge cells back to the input image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def canny_edge_detection_async(self, i, output, sigma=0.5, low=0.05, high=0.15, add_back=False, callback=None) -> ToolResult: ...
+    def ceil(self, i, output, callback=None) -> ToolResult:
+        """Returns the smallest (closest to negative infinity) value that is greater than or equal to the values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def ceil_async(self, i, output, callback=None) -> ToolResult: ...
+    def centroid(self, i, output, text_output=False, callback=None) -> ToolResult:
+        """Calculates the centroid, or average location, of raster polygon objects.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        text_output -- Optional text output. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def centroid_async(self, i, output, text_output=False, callback=None) -> ToolResult: ...
+    def centroid_vector(self, i, output, callback=None) -> ToolResult:
+        """Identifies the centroid point of a vector polyline or polygon feature or a group of vector points.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def centroid_vector_async(self, i, output, callback=None) -> ToolResult: ...
+    def change_vector_analysis(self, date1, date2, magnitude, direction, callback=None) -> ToolResult:
+        """Performs a change vector analysis on a two-date multi-spectral dataset.
+
+        Keyword arguments:
+
+        date1 -- Input raster files for the earlier date. 
+        date2 -- Input raster files for the later date. 
+        magnitude -- Output vector magnitude raster file. 
+        direction -- Output vector Direction raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def change_vector_analysis_async(self, date1, date2, magnitude, direction, callback=None) -> ToolResult: ...
+    def circular_variance_of_aspect(self, dem, output, filter=11, callback=None) -> ToolResult:
+        """Calculates the circular variance of aspect at a scale for a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filter -- Size of the filter kernel. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def circular_variance_of_aspect_async(self, dem, output, filter=11, callback=None) -> ToolResult: ...
+    def classify_buildings_in_lidar(self, i, buildings, output, callback=None) -> ToolResult:
+        """Reclassifies a LiDAR points that lie within vector building footprints.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        buildings -- Input vector polygons file. 
+        output -- Output LiDAR file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def classify_buildings_in_lidar_async(self, i, buildings, output, callback=None) -> ToolResult: ...
+    def classify_lidar(self, i=None, output=None, radius=1.5, grd_threshold=0.1, oto_threshold=2.0, planarity_threshold=0.85, linearity_threshold=0.7, iterations=30, facade_threshold=0.5, callback=None) -> ToolResult:
+        """Classify points within a LiDAR point cloud based on point properties.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        radius -- Search distance used in neighbourhood search (metres). 
+        grd_threshold -- Ground threshold (metres). 
+        oto_threshold -- Off-terrain object threshold (metres). 
+        planarity_threshold -- Planarity threshold (0-1). 
+        linearity_threshold -- Linearity threshold (0-1). 
+        iterations -- Number of iterations. 
+        facade_threshold -- Facade threshold (metres). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def classify_lidar_async(self, i=None, output=None, radius=1.5, grd_threshold=0.1, oto_threshold=2.0, planarity_threshold=0.85, linearity_threshold=0.7, iterations=30, facade_threshold=0.5, callback=None) -> ToolResult: ...
+    def classify_overlap_points(self, i, output, resolution=2.0, criterion="max scan angle", filter=False, callback=None) -> ToolResult:
+        """Classifies or filters LAS points in regions of overlapping flight lines.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        resolution -- The size of the square area used to evaluate nearby points in the LiDAR data. 
+        criterion -- Criterion used to identify overlapping points; options are 'max scan angle', 'not min point source ID', 'not min time', 'multiple point source IDs'. 
+        filter -- Filter out points from overlapping flightlines? If false, overlaps will simply be classified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def classify_overlap_points_async(self, i, output, resolution=2.0, criterion="max scan angle", filter=False, callback=None) -> ToolResult: ...
+    def clean_vector(self, i, output, callback=None) -> ToolResult:
+        """Removes null features and lines/polygons with fewer than the required number of vertices.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def clean_vector_async(self, i, output, callback=None) -> ToolResult: ...
+    def clip(self, i, clip, output, callback=None) -> ToolResult:
+        """Extract all the features, or parts of features, that overlap with the features of the clip vector.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        clip -- Input clip polygon vector file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def clip_async(self, i, clip, output, callback=None) -> ToolResult: ...
+    def clip_lidar_to_polygon(self, i, polygons, output, callback=None) -> ToolResult:
+        """Clips a LiDAR point cloud to a vector polygon or polygons.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        polygons -- Input vector polygons file. 
+        output -- Output LiDAR file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def clip_lidar_to_polygon_async(self, i, polygons, output, callback=None) -> ToolResult: ...
+    def clip_raster_to_polygon(self, i, polygons, output, maintain_dimensions=False, callback=None) -> ToolResult:
+        """Clips a raster to a vector polygon.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        polygons -- Input vector polygons file. 
+        output -- Output raster file. 
+        maintain_dimensions -- Maintain input raster dimensions?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def clip_raster_to_polygon_async(self, i, polygons, output, maintain_dimensions=False, callback=None) -> ToolResult: ...
+    def closing(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """A closing is a mathematical morphology operation involving an erosion (min filter) of a dilation (max filter) set.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def closing_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def clump(self, i, output, diag=True, zero_back=False, callback=None) -> ToolResult:
+        """Groups cells that form discrete areas, assigning them unique identifiers.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        diag -- Flag indicating whether diagonal connections should be considered. 
+        zero_back -- Flag indicating whether zero values should be treated as a background. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def clump_async(self, i, output, diag=True, zero_back=False, callback=None) -> ToolResult: ...
+    def colourize_based_on_class(self, i=None, output=None, intensity_blending=50.0, clr_str="", use_unique_clrs_for_buildings=False, radius="", callback=None) -> ToolResult:
+        """Sets the RGB values of a LiDAR point cloud based on the point classification values.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        intensity_blending -- Intensity blending amount (0-100%). 
+        clr_str -- Colour values, e.g. 2: (184, 167, 108); 5: #9ab86c. 
+        use_unique_clrs_for_buildings -- Use unique colours for each building?. 
+        radius -- Search distance used in neighbourhood search. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def colourize_based_on_class_async(self, i=None, output=None, intensity_blending=50.0, clr_str="", use_unique_clrs_for_buildings=False, radius="", callback=None) -> ToolResult: ...
+    def colourize_based_on_point_returns(self, i=None, output=None, intensity_blending=50.0, only="(230,214,170)", first="(0,140,0)", intermediate="(255,0,255)", last="(0,0,255)", callback=None) -> ToolResult:
+        """Sets the RGB values of a LiDAR point cloud based on the point returns.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        intensity_blending -- Intensity blending amount (0-100%). 
+        only -- Only return colour, e.g. (230,214,170), #e6d6aa, or 0xe6d6aa. 
+        first -- First return colour, e.g. (230,214,170), #e6d6aa, or 0xe6d6aa. 
+        intermediate -- Intermediate return colour, e.g. (230,214,170), #e6d6aa, or 0xe6d6aa. 
+        last -- Last return colour, e.g. (230,214,170), #e6d6aa, or 0xe6d6aa. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def colourize_based_on_point_returns_async(self, i=None, output=None, intensity_blending=50.0, only="(230,214,170)", first="(0,140,0)", intermediate="(255,0,255)", last="(0,0,255)", callback=None) -> ToolResult: ...
+    def compactness_ratio(self, i, callback=None) -> ToolResult:
+        """Calculates the compactness ratio (A/P), a measure of shape complexity, for vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def compactness_ratio_async(self, i, callback=None) -> ToolResult: ...
+    def conditional_evaluation(self, i, output, statement="", true=None, false=None, callback=None) -> ToolResult:
+        """Performs a conditional evaluation (if-then-else) operation on a raster.
+
+        Keyword arguments:
+
+        i -- Name of the input raster file. 
+        statement -- Conditional statement e.g. value > 35.0. This statement must be a valid Rust statement. 
+        true -- Value where condition evaluates TRUE (input raster or constant value). 
+        false -- Value where condition evaluates FALSE (input raster or constant value). 
+        output -- Name of the output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def conditional_evaluation_async(self, i, output, statement="", true=None, false=None, callback=None) -> ToolResult: ...
+    def conditioned_latin_hypercube(self, inputs, output, samples=500, iterations=25000, seed=None, prob=0.5, threshold=None, temp=1.0, temp_decay=0.05, cycle=10, average=False, callback=None) -> ToolResult:
+        """Implements conditioned Latin Hypercube sampling.
+
+        Keyword arguments:
+
+        inputs -- Name of the input raster file. 
+        output -- Output shapefile. 
+        samples -- Number of sample sites returned. 
+        iterations -- Maximum iterations (if stopping criteria not reached). 
+        seed -- Seed for RNG consistency. 
+        prob -- Probability of random resample or resampling worst strata between [0,1]. 
+        threshold -- Objective function values below the threshold stop the resampling iterations. 
+        temp -- Initial annealing temperature between [0,1]. 
+        temp_decay -- Annealing temperature decay proportion between [0,1]. Reduce temperature by this proportion each annealing cycle. 
+        cycle -- Number of iterations before decaying annealing temperature. 
+        average -- Weight the continuous objective function by the 1/N contributing strata. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def conditioned_latin_hypercube_async(self, inputs, output, samples=500, iterations=25000, seed=None, prob=0.5, threshold=None, temp=1.0, temp_decay=0.05, cycle=10, average=False, callback=None) -> ToolResult: ...
+    def conservative_smoothing_filter(self, i, output, filterx=3, filtery=3, callback=None) -> ToolResult:
+        """Performs a conservative-smoothing filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def conservative_smoothing_filter_async(self, i, output, filterx=3, filtery=3, callback=None) -> ToolResult: ...
+    def construct_vector_tin(self, i, output, field=None, use_z=False, max_triangle_edge_length=None, callback=None) -> ToolResult:
+        """Creates a vector triangular irregular network (TIN) for a set of vector points.
+
+        Keyword arguments:
+
+        i -- Input vector points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use the 'z' dimension of the Shapefile's geometry instead of an attribute field?. 
+        output -- Output vector polygon file. 
+        max_triangle_edge_length -- Optional maximum triangle edge length; triangles larger than this size will not be gridded. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def construct_vector_tin_async(self, i, output, field=None, use_z=False, max_triangle_edge_length=None, callback=None) -> ToolResult: ...
+    def contours_from_points(self, i, output, field=None, use_z=False, max_triangle_edge_length=None, interval=10.0, base=0.0, smooth=5, callback=None) -> ToolResult:
+        """Creates a contour coverage from a set of input points.
+
+        Keyword arguments:
+
+        i -- Input vector points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use the 'z' dimension of the Shapefile's geometry instead of an attribute field?. 
+        output -- Output vector lines file. 
+        max_triangle_edge_length -- Optional maximum triangle edge length; triangles larger than this size will not be gridded. 
+        interval -- Contour interval. 
+        base -- Base contour height. 
+        smooth -- Smoothing filter size (in num. points), e.g. 3, 5, 7, 9, 11. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def contours_from_points_async(self, i, output, field=None, use_z=False, max_triangle_edge_length=None, interval=10.0, base=0.0, smooth=5, callback=None) -> ToolResult: ...
+    def contours_from_raster(self, i, output, interval=10.0, base=0.0, smooth=9, tolerance=10.0, callback=None) -> ToolResult:
+        """Derives a vector contour coverage from a raster surface.
+
+        Keyword arguments:
+
+        i -- Input surface raster file. 
+        output -- Output vector contour file. 
+        interval -- Contour interval. 
+        base -- Base contour height. 
+        smooth -- Smoothing filter size (in num. points), e.g. 3, 5, 7, 9, 11. 
+        tolerance -- Tolerance factor, in degrees (0-45); determines generalization level. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def contours_from_raster_async(self, i, output, interval=10.0, base=0.0, smooth=9, tolerance=10.0, callback=None) -> ToolResult: ...
+    def convert_nodata_to_zero(self, i, output, callback=None) -> ToolResult:
+        """Converts nodata values in a raster to zero.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def convert_nodata_to_zero_async(self, i, output, callback=None) -> ToolResult: ...
+    def convert_raster_format(self, i, output, callback=None) -> ToolResult:
+        """Converts raster data from one format to another.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def convert_raster_format_async(self, i, output, callback=None) -> ToolResult: ...
+    def corner_detection(self, i, output, callback=None) -> ToolResult:
+        """Identifies corner patterns in boolean images using hit-and-miss pattern matching.
+
+        Keyword arguments:
+
+        i -- Input boolean image. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def corner_detection_async(self, i, output, callback=None) -> ToolResult: ...
+    def correct_vignetting(self, i, pp, output, focal_length=304.8, image_width=228.6, n=4.0, callback=None) -> ToolResult:
+        """Corrects the darkening of images towards corners.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        pp -- Input principal point file. 
+        output -- Output raster file. 
+        focal_length -- Camera focal length, in millimeters. 
+        image_width -- Distance between photograph edges, in millimeters. 
+        n -- The 'n' parameter. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def correct_vignetting_async(self, i, pp, output, focal_length=304.8, image_width=228.6, n=4.0, callback=None) -> ToolResult: ...
+    def cos(self, i, output, callback=None) -> ToolResult:
+        """Returns the cosine (cos) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def cos_async(self, i, output, callback=None) -> ToolResult: ...
+    def cosh(self, i, output, callback=None) -> ToolResult:
+        """Returns the hyperbolic cosine (cosh) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def cosh_async(self, i, output, callback=None) -> ToolResult: ...
+    def cost_allocation(self, source, backlink, output, callback=None) -> ToolResult:
+        """Identifies the source cell to which each grid cell is connected by a least-cost pathway in a cost-distance analysis.
+
+        Keyword arguments:
+
+        source -- Input source raster file. 
+        backlink -- Input backlink raster file generated by the cost-distance tool. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def cost_allocation_async(self, source, backlink, output, callback=None) -> ToolResult: ...
+    def cost_distance(self, source, cost, out_accum, out_backlink, callback=None) -> ToolResult:
+        """Performs cost-distance accumulation on a cost surface and a group of source cells.
+
+        Keyword arguments:
+
+        source -- Input source raster file. 
+        cost -- Input cost (friction) raster file. 
+        out_accum -- Output cost accumulation raster file. 
+        out_backlink -- Output backlink raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def cost_distance_async(self, source, cost, out_accum, out_backlink, callback=None) -> ToolResult: ...
+    def cost_pathway(self, destination, backlink, output, zero_background=False, callback=None) -> ToolResult:
+        """Performs cost-distance pathway analysis using a series of destination grid cells.
+
+        Keyword arguments:
+
+        destination -- Input destination raster file. 
+        backlink -- Input backlink raster file generated by the cost-distance tool. 
+        output -- Output cost pathway raster file. 
+        zero_background -- Flag indicating whether zero values should be treated as a background. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def cost_pathway_async(self, destination, backlink, output, zero_background=False, callback=None) -> ToolResult: ...
+    def count_if(self, inputs, output, value, callback=None) -> ToolResult:
+        """Counts the number of occurrences of a specified value in a cell-stack of rasters.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        value -- Search value (e.g. countif value = 5.0). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def count_if_async(self, inputs, output, value, callback=None) -> ToolResult: ...
+    def create_colour_composite(self, red, green, blue, output, opacity=None, enhance=True, zeros=False, callback=None) -> ToolResult:
+        """Creates a colour-composite image from three bands of multispectral imagery.
+
+        Keyword arguments:
+
+        red -- Input red band image file. 
+        green -- Input green band image file. 
+        blue -- Input blue band image file. 
+        opacity -- Input opacity band image file (optional). 
+        output -- Output colour composite file. 
+        enhance -- Optional flag indicating whether a balance contrast enhancement is performed. 
+        zeros -- Optional flag to indicate if zeros are nodata values. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def create_colour_composite_async(self, red, green, blue, output, opacity=None, enhance=True, zeros=False, callback=None) -> ToolResult: ...
+    def create_hexagonal_vector_grid(self, i, output, width, orientation="horizontal", callback=None) -> ToolResult:
+        """Creates a hexagonal vector grid.
+
+        Keyword arguments:
+
+        i -- Input base file. 
+        output -- Output vector polygon file. 
+        width -- The grid cell width. 
+        orientation -- Grid Orientation, 'horizontal' or 'vertical'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def create_hexagonal_vector_grid_async(self, i, output, width, orientation="horizontal", callback=None) -> ToolResult: ...
+    def create_plane(self, base, output, gradient=15.0, aspect=90.0, constant=0.0, callback=None) -> ToolResult:
+        """Creates a raster image based on the equation for a simple plane.
+
+        Keyword arguments:
+
+        base -- Input base raster file. 
+        output -- Output raster file. 
+        gradient -- Slope gradient in degrees (-85.0 to 85.0). 
+        aspect -- Aspect (direction) in degrees clockwise from north (0.0-360.0). 
+        constant -- Constant value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def create_plane_async(self, base, output, gradient=15.0, aspect=90.0, constant=0.0, callback=None) -> ToolResult: ...
+    def create_rectangular_vector_grid(self, i, output, width, height, xorig=0, yorig=0, callback=None) -> ToolResult:
+        """Creates a rectangular vector grid.
+
+        Keyword arguments:
+
+        i -- Input base file. 
+        output -- Output vector polygon file. 
+        width -- The grid cell width. 
+        height -- The grid cell height. 
+        xorig -- The grid origin x-coordinate. 
+        yorig -- The grid origin y-coordinate. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def create_rectangular_vector_grid_async(self, i, output, width, height, xorig=0, yorig=0, callback=None) -> ToolResult: ...
+    def crispness_index(self, i, output=None, callback=None) -> ToolResult:
+        """Calculates the Crispness Index, which is used to quantify how crisp (or conversely how fuzzy) a probability image is.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Optional output html file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def crispness_index_async(self, i, output=None, callback=None) -> ToolResult: ...
+    def cross_tabulation(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a cross-tabulation on two categorical images.
+
+        Keyword arguments:
+
+        input1 -- Input raster file 1. 
+        input2 -- Input raster file 1. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def cross_tabulation_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def csv_points_to_vector(self, i, output, xfield=0, yfield=1, epsg=None, callback=None) -> ToolResult:
+        """Converts a CSV text file to vector points.
+
+        Keyword arguments:
+
+        i -- Input CSV file (i.e. source of data to be imported). 
+        output -- Output vector file. 
+        xfield -- X field number (e.g. 0 for first field). 
+        yfield -- Y field number (e.g. 1 for second field). 
+        epsg -- EPSG projection (e.g. 2958). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def csv_points_to_vector_async(self, i, output, xfield=0, yfield=1, epsg=None, callback=None) -> ToolResult: ...
+    def cumulative_distribution(self, i, output, callback=None) -> ToolResult:
+        """Converts a raster image to its cumulative distribution function.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def cumulative_distribution_async(self, i, output, callback=None) -> ToolResult: ...
+    def curvedness(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates curvedness from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def curvedness_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def d8_flow_accumulation(self, i, output, out_type="cells", log=False, clip=False, pntr=False, esri_pntr=False, callback=None) -> ToolResult:
+        """Calculates a D8 flow accumulation raster from an input DEM or flow pointer.
+
+        Keyword arguments:
+
+        i -- Input raster DEM or D8 pointer file. 
+        output -- Output raster file. 
+        out_type -- Output type; one of 'cells' (default), 'catchment area', and 'specific contributing area'. 
+        log -- Optional flag to request the output be log-transformed. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        pntr -- Is the input raster a D8 flow pointer rather than a DEM?. 
+        esri_pntr -- Input D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def d8_flow_accumulation_async(self, i, output, out_type="cells", log=False, clip=False, pntr=False, esri_pntr=False, callback=None) -> ToolResult: ...
+    def d8_mass_flux(self, dem, loading, efficiency, absorption, output, callback=None) -> ToolResult:
+        """Performs a D8 mass flux calculation.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        loading -- Input loading raster file. 
+        efficiency -- Input efficiency raster file. 
+        absorption -- Input absorption raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def d8_mass_flux_async(self, dem, loading, efficiency, absorption, output, callback=None) -> ToolResult: ...
+    def d8_pointer(self, dem, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Calculates a D8 flow pointer raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def d8_pointer_async(self, dem, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def d_inf_flow_accumulation(self, i, output, out_type="Specific Contributing Area", threshold=None, log=False, clip=False, pntr=False, callback=None) -> ToolResult:
+        """Calculates a D-infinity flow accumulation raster from an input DEM.
+
+        Keyword arguments:
+
+        i -- Input raster DEM or D-infinity pointer file. 
+        output -- Output raster file. 
+        out_type -- Output type; one of 'cells', 'sca' (default), and 'ca'. 
+        threshold -- Optional convergence threshold parameter, in grid cells; default is infinity. 
+        log -- Optional flag to request the output be log-transformed. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        pntr -- Is the input raster a D-infinity flow pointer rather than a DEM?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def d_inf_flow_accumulation_async(self, i, output, out_type="Specific Contributing Area", threshold=None, log=False, clip=False, pntr=False, callback=None) -> ToolResult: ...
+    def d_inf_mass_flux(self, dem, loading, efficiency, absorption, output, callback=None) -> ToolResult:
+        """Performs a D-infinity mass flux calculation.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        loading -- Input loading raster file. 
+        efficiency -- Input efficiency raster file. 
+        absorption -- Input absorption raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def d_inf_mass_flux_async(self, dem, loading, efficiency, absorption, output, callback=None) -> ToolResult: ...
+    def d_inf_pointer(self, dem, output, callback=None) -> ToolResult:
+        """Calculates a D-infinity flow pointer (flow direction) raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def d_inf_pointer_async(self, dem, output, callback=None) -> ToolResult: ...
+    def dbscan(self, inputs, output, scaling="Normalize", search_dist=0.01, min_points=5, callback=None) -> ToolResult:
+        """Performs a DBSCAN-based unsupervised clustering operation.
+
+        Keyword arguments:
+
+        inputs -- Names of the input rasters. 
+        scaling -- Scaling method for predictors. Options include 'None', 'Normalize', and 'Standardize'. 
+        output -- Name of the output raster file. 
+        search_dist -- Search-distance parameter. 
+        min_points -- Minimum point density needed to define 'core' point in cluster. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def dbscan_async(self, inputs, output, scaling="Normalize", search_dist=0.01, min_points=5, callback=None) -> ToolResult: ...
+    def decrement(self, i, output, callback=None) -> ToolResult:
+        """Decreases the values of each grid cell in an input raster by 1.0 (see also InPlaceSubtract).
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def decrement_async(self, i, output, callback=None) -> ToolResult: ...
+    def dem_void_filling(self, dem, fill, output, mean_plane_dist=20, edge_treatment="use DEM", weight_value=2.0, callback=None) -> ToolResult:
+        """This tool can be used to fill the void areas of a DEM using another fill DEM data set.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file, containing the void areas. 
+        fill -- Name of the input fill DEM file, containing the values used to fill the void areas in the other DEM. 
+        output -- Name of the output void-filled DEM file. 
+        mean_plane_dist -- Distance to void edge at which the mean-plane value is used as an offset, measured in grid cells. 
+        edge_treatment -- How should void-edge cells be treated? Options include 'use DEM' (default), 'use Fill', 'average'. 
+        weight_value -- Weight value used for IDW interpolation (default is 2.0). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def dem_void_filling_async(self, dem, fill, output, mean_plane_dist=20, edge_treatment="use DEM", weight_value=2.0, callback=None) -> ToolResult: ...
+    def depth_in_sink(self, dem, output, zero_background=False, callback=None) -> ToolResult:
+        """Measures the depth of sinks (depressions) in a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        zero_background -- Flag indicating whether the background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def depth_in_sink_async(self, dem, output, zero_background=False, callback=None) -> ToolResult: ...
+    def depth_to_water(self, dem, output, streams=None, lakes=None, callback=None) -> ToolResult:
+        """This tool calculates cartographic depth-to-water (DTW) index.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        streams -- Name of the input streams vector (optional). 
+        lakes -- Name of the input lakes vector (optional). 
+        output -- Name of the output raster image file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def depth_to_water_async(self, dem, output, streams=None, lakes=None, callback=None) -> ToolResult: ...
+    def dev_from_mean_elev(self, dem, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Calculates deviation from mean elevation.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def dev_from_mean_elev_async(self, dem, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def diff_from_mean_elev(self, dem, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Calculates difference from mean elevation (equivalent to a high-pass filter).
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def diff_from_mean_elev_async(self, dem, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def diff_of_gaussian_filter(self, i, output, sigma1=2.0, sigma2=4.0, callback=None) -> ToolResult:
+        """Performs a Difference of Gaussian (DoG) filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        sigma1 -- Standard deviation distance in pixels. 
+        sigma2 -- Standard deviation distance in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def diff_of_gaussian_filter_async(self, i, output, sigma1=2.0, sigma2=4.0, callback=None) -> ToolResult: ...
+    def difference(self, i, overlay, output, callback=None) -> ToolResult:
+        """Outputs the features that occur in one of the two vector inputs but not both, i.e. no overlapping features.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        overlay -- Input overlay vector file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def difference_async(self, i, overlay, output, callback=None) -> ToolResult: ...
+    def difference_curvature(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates difference curvature from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def difference_curvature_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def direct_decorrelation_stretch(self, i, output, k=0.5, clip=1.0, callback=None) -> ToolResult:
+        """Performs a direct decorrelation stretch enhancement on a colour-composite image of multispectral data.
+
+        Keyword arguments:
+
+        i -- Input colour composite image file. 
+        output -- Output raster file. 
+        k -- Achromatic factor (k) ranges between 0 (no effect) and 1 (full saturation stretch), although typical values range from 0.3 to 0.7. 
+        clip -- Optional percent to clip the upper tail by during the stretch. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def direct_decorrelation_stretch_async(self, i, output, k=0.5, clip=1.0, callback=None) -> ToolResult: ...
+    def directional_relief(self, dem, output, azimuth=0.0, max_dist=None, callback=None) -> ToolResult:
+        """Calculates relief for cells in an input DEM for a specified direction.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        azimuth -- Wind azimuth in degrees. 
+        max_dist -- Optional maximum search distance (unspecified if none; in xy units). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def directional_relief_async(self, dem, output, azimuth=0.0, max_dist=None, callback=None) -> ToolResult: ...
+    def dissolve(self, i, output, field=None, snap=0.0, callback=None) -> ToolResult:
+        """Removes the interior, or shared, boundaries within a vector polygon coverage.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        field -- Dissolve field attribute (optional). 
+        output -- Output vector file. 
+        snap -- Snap tolerance. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def dissolve_async(self, i, output, field=None, snap=0.0, callback=None) -> ToolResult: ...
+    def distance_to_outlet(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Calculates the distance of stream grid cells to the channel network outlet cell.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def distance_to_outlet_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def diversity_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Assigns each cell in the output grid the number of different values in a moving window centred on each grid cell in the input raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def diversity_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def divide(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a division operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def divide_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def downslope_distance_to_stream(self, dem, streams, output, dinf=False, callback=None) -> ToolResult:
+        """Measures distance to the nearest downslope stream cell.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        dinf -- Use the D-infinity flow algorithm instead of D8?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def downslope_distance_to_stream_async(self, dem, streams, output, dinf=False, callback=None) -> ToolResult: ...
+    def downslope_flowpath_length(self, d8_pntr, output, watersheds=None, weights=None, esri_pntr=False, callback=None) -> ToolResult:
+        """Calculates the downslope flowpath length from each cell to basin outlet.
+
+        Keyword arguments:
+
+        d8_pntr -- Input D8 pointer raster file. 
+        watersheds -- Optional input watershed raster file. 
+        weights -- Optional input weights raster file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def downslope_flowpath_length_async(self, d8_pntr, output, watersheds=None, weights=None, esri_pntr=False, callback=None) -> ToolResult: ...
+    def downslope_index(self, dem, output, drop=2.0, out_type="tangent", callback=None) -> ToolResult:
+        """Calculates the Hjerdt et al. (2004) downslope index.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        drop -- Vertical drop value (default is 2.0). 
+        out_type -- Output type, options include 'tangent', 'degrees', 'radians', 'distance' (default is 'tangent'). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def downslope_index_async(self, dem, output, drop=2.0, out_type="tangent", callback=None) -> ToolResult: ...
+    def edge_contamination(self, dem, output, flow_type="mfd", zfactor="", callback=None) -> ToolResult:
+        """Identifies grid cells within an input DEM that may be impacted by edge contamination for hydrological applications.
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file; must be depressionless. 
+        output -- Name of the output raster file. 
+        flow_type -- Flow algorithm type, one of 'd8', 'mfd', or 'dinf'. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def edge_contamination_async(self, dem, output, flow_type="mfd", zfactor="", callback=None) -> ToolResult: ...
+    def edge_density(self, dem, output, filter=11, norm_diff=5.0, zfactor=None, callback=None) -> ToolResult:
+        """Calculates the density of edges, or breaks-in-slope within DEMs.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filter -- Size of the filter kernel. 
+        norm_diff -- Maximum difference in normal vectors, in degrees. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def edge_density_async(self, dem, output, filter=11, norm_diff=5.0, zfactor=None, callback=None) -> ToolResult: ...
+    def edge_preserving_mean_filter(self, i, output, threshold, filter=11, callback=None) -> ToolResult:
+        """Performs a simple edge-preserving mean filter on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filter -- Size of the filter kernel. 
+        threshold -- Maximum difference in values. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def edge_preserving_mean_filter_async(self, i, output, threshold, filter=11, callback=None) -> ToolResult: ...
+    def edge_proportion(self, i, output, output_text=False, callback=None) -> ToolResult:
+        """Calculate the proportion of cells in a raster polygon that are edge cells.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        output_text -- flag indicating whether a text report should also be output. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def edge_proportion_async(self, i, output, output_text=False, callback=None) -> ToolResult: ...
+    def elev_above_pit(self, dem, output, callback=None) -> ToolResult:
+        """Calculate the elevation of each grid cell above the nearest downstream pit cell or grid edge cell.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def elev_above_pit_async(self, dem, output, callback=None) -> ToolResult: ...
+    def elev_percentile(self, dem, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult:
+        """Calculates the elevation percentile raster from a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        sig_digits -- Number of significant digits. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def elev_percentile_async(self, dem, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult: ...
+    def elev_relative_to_min_max(self, dem, output, callback=None) -> ToolResult:
+        """Calculates the elevation of a location relative to the minimum and maximum elevations in a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def elev_relative_to_min_max_async(self, dem, output, callback=None) -> ToolResult: ...
+    def elev_relative_to_watershed_min_max(self, dem, watersheds, output, callback=None) -> ToolResult:
+        """Calculates the elevation of a location relative to the minimum and maximum elevations in a watershed.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        watersheds -- Input raster watersheds file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def elev_relative_to_watershed_min_max_async(self, dem, watersheds, output, callback=None) -> ToolResult: ...
+    def elevation_above_stream(self, dem, streams, output, callback=None) -> ToolResult:
+        """Calculates the elevation of cells above the nearest downslope stream cell.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def elevation_above_stream_async(self, dem, streams, output, callback=None) -> ToolResult: ...
+    def elevation_above_stream_euclidean(self, dem, streams, output, callback=None) -> ToolResult:
+        """Calculates the elevation of cells above the nearest (Euclidean distance) stream cell.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def elevation_above_stream_euclidean_async(self, dem, streams, output, callback=None) -> ToolResult: ...
+    def eliminate_coincident_points(self, i, output, tolerance, callback=None) -> ToolResult:
+        """Removes any coincident, or nearly coincident, points from a vector points file.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector points file. 
+        tolerance -- The distance tolerance for points. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def eliminate_coincident_points_async(self, i, output, tolerance, callback=None) -> ToolResult: ...
+    def elongation_ratio(self, i, callback=None) -> ToolResult:
+        """Calculates the elongation ratio for vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def elongation_ratio_async(self, i, callback=None) -> ToolResult: ...
+    def embankment_mapping(self, dem, road_vec, output, search_dist=2.5, min_road_width=6.0, typical_width=30.0, max_height=2.0, max_width=60.0, max_increment=0.05, spillout_slope=4.0, remove_embankments=False, callback=None) -> ToolResult:
+        """Maps and/or removes road embankments from an input fine-resolution DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        road_vec -- Input vector polygons file. 
+        output -- Output raster file. 
+        search_dist -- Search distance used to reposition transportation vectors onto road embankments (in map units). 
+        min_road_width -- Minimum road width; this is the width of the paved road surface (in map units). 
+        typical_width -- Typical embankment width; this is the maximum width of an embankment with roadside ditches (in map units). 
+        max_height -- Typical embankment maximum height; this is the height a typical embankment with roadside ditches (in map units). 
+        max_width -- Maximum embankment width, typically where embankments traverse steep-sided valleys (in map units). 
+        max_increment -- Maximum upwards increment between neighbouring cells on an embankment (in elevation units). 
+        spillout_slope -- Spillout slope (in degrees). 
+        remove_embankments -- Optional flag indicating whether to output a DEM with embankments removed (true) or an embankment raster map (false). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def embankment_mapping_async(self, dem, road_vec, output, search_dist=2.5, min_road_width=6.0, typical_width=30.0, max_height=2.0, max_width=60.0, max_increment=0.05, spillout_slope=4.0, remove_embankments=False, callback=None) -> ToolResult: ...
+    def emboss_filter(self, i, output, direction="n", clip=0.0, callback=None) -> ToolResult:
+        """Performs an emboss filter on an image, similar to a hillshade operation.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        direction -- Direction of reflection; options include 'n', 's', 'e', 'w', 'ne', 'se', 'nw', 'sw'. 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def emboss_filter_async(self, i, output, direction="n", clip=0.0, callback=None) -> ToolResult: ...
+    def equal_to(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a equal-to comparison operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def equal_to_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def erase(self, i, erase, output, callback=None) -> ToolResult:
+        """Removes all the features, or parts of features, that overlap with the features of the erase vector polygon.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        erase -- Input erase polygon vector file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def erase_async(self, i, erase, output, callback=None) -> ToolResult: ...
+    def erase_polygon_from_lidar(self, i, polygons, output, callback=None) -> ToolResult:
+        """Erases (cuts out) a vector polygon or polygons from a LiDAR point cloud.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        polygons -- Input vector polygons file. 
+        output -- Output LiDAR file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def erase_polygon_from_lidar_async(self, i, polygons, output, callback=None) -> ToolResult: ...
+    def erase_polygon_from_raster(self, i, polygons, output, callback=None) -> ToolResult:
+        """Erases (cuts out) a vector polygon from a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        polygons -- Input vector polygons file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def erase_polygon_from_raster_async(self, i, polygons, output, callback=None) -> ToolResult: ...
+    def euclidean_allocation(self, i, output, callback=None) -> ToolResult:
+        """Assigns grid cells in the output raster the value of the nearest target cell in the input image, measured by the Shih and Wu (2004) Euclidean distance transform.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def euclidean_allocation_async(self, i, output, callback=None) -> ToolResult: ...
+    def euclidean_distance(self, i, output, callback=None) -> ToolResult:
+        """Calculates the Shih and Wu (2004) Euclidean distance transform.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def euclidean_distance_async(self, i, output, callback=None) -> ToolResult: ...
+    def evaluate_training_sites(self, inputs, polys, field, output, callback=None) -> ToolResult:
+        """This tool can be used to inspect the overlap in spectral signatures of training sites for various classes.
+
+        Keyword arguments:
+
+        inputs -- Name of the input band images. 
+        polys -- Name of the input training site polygons shapefile. 
+        field -- Name of the attribute containing class name data. 
+        output -- Name of the output report file (*.html). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def evaluate_training_sites_async(self, inputs, polys, field, output, callback=None) -> ToolResult: ...
+    def exp(self, i, output, callback=None) -> ToolResult:
+        """Returns the exponential (base e) of values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def exp_async(self, i, output, callback=None) -> ToolResult: ...
+    def exp2(self, i, output, callback=None) -> ToolResult:
+        """Returns the exponential (base 2) of values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def exp2_async(self, i, output, callback=None) -> ToolResult: ...
+    def export_table_to_csv(self, i, output, headers=True, callback=None) -> ToolResult:
+        """Exports an attribute table to a CSV text file.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output csv file. 
+        headers -- Export field names as file header?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def export_table_to_csv_async(self, i, output, headers=True, callback=None) -> ToolResult: ...
+    def exposure_towards_wind_flux(self, dem, output, azimuth="", max_dist="", zfactor="", callback=None) -> ToolResult:
+        """Evaluates hydrologic connectivity within a DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file. 
+        output -- Name of the output raster file. 
+        azimuth -- Wind azimuth, in degrees. 
+        max_dist -- Optional maximum search distance. Minimum value is 5 x cell size. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def exposure_towards_wind_flux_async(self, dem, output, azimuth="", max_dist="", zfactor="", callback=None) -> ToolResult: ...
+    def extend_vector_lines(self, i, output, dist, extend="both ends", callback=None) -> ToolResult:
+        """Extends vector lines by a specified distance.
+
+        Keyword arguments:
+
+        i -- Input vector polyline file. 
+        output -- Output vector polyline file. 
+        dist -- The distance to extend. 
+        extend -- Extend direction, 'both ends' (default), 'line start', 'line end'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def extend_vector_lines_async(self, i, output, dist, extend="both ends", callback=None) -> ToolResult: ...
+    def extract_nodes(self, i, output, callback=None) -> ToolResult:
+        """Converts vector lines or polygons into vertex points.
+
+        Keyword arguments:
+
+        i -- Input vector lines or polygon file. 
+        output -- Output vector points file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def extract_nodes_async(self, i, output, callback=None) -> ToolResult: ...
+    def extract_raster_values_at_points(self, inputs, points, out_text=False, callback=None) -> ToolResult:
+        """Extracts the values of raster(s) at vector point locations.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        points -- Input vector points file. 
+        out_text -- Output point values as text? Otherwise, the only output is to to the points file's attribute table. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def extract_raster_values_at_points_async(self, inputs, points, out_text=False, callback=None) -> ToolResult: ...
+    def extract_streams(self, flow_accum, output, threshold, zero_background=False, callback=None) -> ToolResult:
+        """Extracts stream grid cells from a flow accumulation raster.
+
+        Keyword arguments:
+
+        flow_accum -- Input raster D8 flow accumulation file. 
+        output -- Output raster file. 
+        threshold -- Threshold in flow accumulation values for channelization. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def extract_streams_async(self, flow_accum, output, threshold, zero_background=False, callback=None) -> ToolResult: ...
+    def extract_valleys(self, dem, output, variant="LQ", line_thin=True, filter=5, callback=None) -> ToolResult:
+        """Identifies potential valley bottom grid cells based on local topolography alone.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        variant -- Options include 'LQ' (lower quartile), 'JandR' (Johnston and Rosenfeld), and 'PandD' (Peucker and Douglas); default is 'LQ'. 
+        line_thin -- Optional flag indicating whether post-processing line-thinning should be performed. 
+        filter -- Optional argument (only used when variant='lq') providing the filter size, in grid cells, used for lq-filtering (default is 5). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def extract_valleys_async(self, dem, output, variant="LQ", line_thin=True, filter=5, callback=None) -> ToolResult: ...
+    def farthest_channel_head(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Calculates the distance to the furthest upstream channel head for each stream cell.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def farthest_channel_head_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def fast_almost_gaussian_filter(self, i, output, sigma=1.8, callback=None) -> ToolResult:
+        """Performs a fast approximate Gaussian filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        sigma -- Standard deviation distance in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fast_almost_gaussian_filter_async(self, i, output, sigma=1.8, callback=None) -> ToolResult: ...
+    def fd8_flow_accumulation(self, dem, output, out_type="specific contributing area", exponent=1.1, threshold=None, log=False, clip=False, callback=None) -> ToolResult:
+        """Calculates an FD8 flow accumulation raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        out_type -- Output type; one of 'cells', 'specific contributing area' (default), and 'catchment area'. 
+        exponent -- Optional exponent parameter; default is 1.1. 
+        threshold -- Optional convergence threshold parameter, in grid cells; default is infinity. 
+        log -- Optional flag to request the output be log-transformed. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fd8_flow_accumulation_async(self, dem, output, out_type="specific contributing area", exponent=1.1, threshold=None, log=False, clip=False, callback=None) -> ToolResult: ...
+    def fd8_pointer(self, dem, output, callback=None) -> ToolResult:
+        """Calculates an FD8 flow pointer raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fd8_pointer_async(self, dem, output, callback=None) -> ToolResult: ...
+    def feature_preserving_smoothing(self, dem, output, filter=11, norm_diff=15.0, num_iter=3, max_diff=0.5, zfactor=None, callback=None) -> ToolResult:
+        """Reduces short-scale variation in an input DEM using a modified Sun et al. (2007) algorithm.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filter -- Size of the filter kernel. 
+        norm_diff -- Maximum difference in normal vectors, in degrees. 
+        num_iter -- Number of iterations. 
+        max_diff -- Maximum allowable absolute elevation change (optional). 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def feature_preserving_smoothing_async(self, dem, output, filter=11, norm_diff=15.0, num_iter=3, max_diff=0.5, zfactor=None, callback=None) -> ToolResult: ...
+    def fetch_analysis(self, dem, output, azimuth=0.0, hgt_inc=0.05, callback=None) -> ToolResult:
+        """Performs an analysis of fetch or upwind distance to an obstacle.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        azimuth -- Wind azimuth in degrees in degrees. 
+        hgt_inc -- Height increment value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fetch_analysis_async(self, dem, output, azimuth=0.0, hgt_inc=0.05, callback=None) -> ToolResult: ...
+    def fill_burn(self, dem, streams, output, callback=None) -> ToolResult:
+        """Burns streams into a DEM using the FillBurn (Saunders, 1999) method.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        streams -- Input vector streams file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fill_burn_async(self, dem, streams, output, callback=None) -> ToolResult: ...
+    def fill_depressions(self, dem, output, fix_flats=True, flat_increment=None, max_depth=None, callback=None) -> ToolResult:
+        """Fills all of the depressions in a DEM. Depression breaching should be preferred in most cases.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        fix_flats -- Optional flag indicating whether flat areas should have a small gradient applied. 
+        flat_increment -- Optional elevation increment applied to flat areas. 
+        max_depth -- Optional maximum depression depth to fill. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fill_depressions_async(self, dem, output, fix_flats=True, flat_increment=None, max_depth=None, callback=None) -> ToolResult: ...
+    def fill_depressions_planchon_and_darboux(self, dem, output, fix_flats=True, flat_increment=None, callback=None) -> ToolResult:
+        """Fills all of the depressions in a DEM using the Planchon and Darboux (2002) method.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        fix_flats -- Optional flag indicating whether flat areas should have a small gradient applied. 
+        flat_increment -- Optional elevation increment applied to flat areas. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fill_depressions_planchon_and_darboux_async(self, dem, output, fix_flats=True, flat_increment=None, callback=None) -> ToolResult: ...
+    def fill_depressions_wang_and_liu(self, dem, output, fix_flats=True, flat_increment=None, callback=None) -> ToolResult:
+        """Fills all of the depressions in a DEM using the Wang and Liu (2006) method. Depression breaching should be preferred in most cases.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        fix_flats -- Optional flag indicating whether flat areas should have a small gradient applied. 
+        flat_increment -- Optional elevation increment applied to flat areas. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fill_depressions_wang_and_liu_async(self, dem, output, fix_flats=True, flat_increment=None, callback=None) -> ToolResult: ...
+    def fill_missing_data(self, i, output, filter=11, weight=2.0, no_edges=True, callback=None) -> ToolResult:
+        """Fills NoData holes in a DEM.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filter -- Filter size (cells). 
+        weight -- IDW weight value. 
+        no_edges -- Optional flag indicating whether to exclude NoData cells in edge regions. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fill_missing_data_async(self, i, output, filter=11, weight=2.0, no_edges=True, callback=None) -> ToolResult: ...
+    def fill_single_cell_pits(self, dem, output, callback=None) -> ToolResult:
+        """Raises pit cells to the elevation of their lowest neighbour.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fill_single_cell_pits_async(self, dem, output, callback=None) -> ToolResult: ...
+    def filter_lidar(self, i=None, output=None, statement="", callback=None) -> ToolResult:
+        """Filters points within a LiDAR point cloud based on point properties.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        statement -- Filter statement e.g. x < 5000.0 && y > 100.0 && is_late && !is_noise. This statement must be a valid Rust statement. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def filter_lidar_async(self, i=None, output=None, statement="", callback=None) -> ToolResult: ...
+    def filter_lidar_classes(self, i, output, exclude_cls=None, callback=None) -> ToolResult:
+        """Removes points in a LAS file with certain specified class values.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def filter_lidar_classes_async(self, i, output, exclude_cls=None, callback=None) -> ToolResult: ...
+    def filter_lidar_scan_angles(self, i, output, threshold, callback=None) -> ToolResult:
+        """Removes points in a LAS file with scan angles greater than a threshold.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        threshold -- Scan angle threshold. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def filter_lidar_scan_angles_async(self, i, output, threshold, callback=None) -> ToolResult: ...
+    def filter_raster_features_by_area(self, i, output, threshold, background="zero", callback=None) -> ToolResult:
+        """Removes small-area features from a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        threshold -- Remove features with fewer grid cells than this threshold value. 
+        background -- Background value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def filter_raster_features_by_area_async(self, i, output, threshold, background="zero", callback=None) -> ToolResult: ...
+    def find_flightline_edge_points(self, i, output, callback=None) -> ToolResult:
+        """Identifies points along a flightline's edge in a LAS file.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def find_flightline_edge_points_async(self, i, output, callback=None) -> ToolResult: ...
+    def find_lowest_or_highest_points(self, i, output, out_type="lowest", callback=None) -> ToolResult:
+        """Locates the lowest and/or highest valued cells in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output vector points file. 
+        out_type -- Output type; one of 'area' (default) and 'volume'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def find_lowest_or_highest_points_async(self, i, output, out_type="lowest", callback=None) -> ToolResult: ...
+    def find_main_stem(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Finds the main stem, based on stream lengths, of each stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def find_main_stem_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def find_no_flow_cells(self, dem, output, callback=None) -> ToolResult:
+        """Finds grid cells with no downslope neighbours.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def find_no_flow_cells_async(self, dem, output, callback=None) -> ToolResult: ...
+    def find_parallel_flow(self, d8_pntr, streams, output, callback=None) -> ToolResult:
+        """Finds areas of parallel flow in D8 flow direction rasters.
+
+        Keyword arguments:
+
+        d8_pntr -- Input D8 pointer raster file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def find_parallel_flow_async(self, d8_pntr, streams, output, callback=None) -> ToolResult: ...
+    def find_patch_or_class_edge_cells(self, i, output, callback=None) -> ToolResult:
+        """Finds all cells located on the edge of patch or class features.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def find_patch_or_class_edge_cells_async(self, i, output, callback=None) -> ToolResult: ...
+    def find_ridges(self, dem, output, line_thin=True, callback=None) -> ToolResult:
+        """Identifies potential ridge and peak grid cells.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        line_thin -- Optional flag indicating whether post-processing line-thinning should be performed. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def find_ridges_async(self, dem, output, line_thin=True, callback=None) -> ToolResult: ...
+    def fix_dangling_arcs(self, i, output, dist="", callback=None) -> ToolResult:
+        """This tool fixes undershot and overshot arcs, two common topological errors, in an input vector lines file.
+
+        Keyword arguments:
+
+        i -- Name of the input lines vector file. 
+        output -- Name of the output lines vector file. 
+        dist -- Snap distance, in xy units (metres). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def fix_dangling_arcs_async(self, i, output, dist="", callback=None) -> ToolResult: ...
+    def flatten_lakes(self, dem, lakes, output, callback=None) -> ToolResult:
+        """Flattens lake polygons in a raster DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        lakes -- Input lakes vector polygons file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def flatten_lakes_async(self, dem, lakes, output, callback=None) -> ToolResult: ...
+    def flightline_overlap(self, i=None, output=None, resolution=1.0, callback=None) -> ToolResult:
+        """Reads a LiDAR (LAS) point file and outputs a raster containing the number of overlapping flight-lines in each grid cell.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output file. 
+        resolution -- Output raster's grid resolution. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def flightline_overlap_async(self, i=None, output=None, resolution=1.0, callback=None) -> ToolResult: ...
+    def flip_image(self, i, output, direction="vertical", callback=None) -> ToolResult:
+        """Reflects an image in the vertical or horizontal axis.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        direction -- Direction of reflection; options include 'v' (vertical), 'h' (horizontal), and 'b' (both). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def flip_image_async(self, i, output, direction="vertical", callback=None) -> ToolResult: ...
+    def flood_order(self, dem, output, callback=None) -> ToolResult:
+        """Assigns each DEM grid cell its order in the sequence of inundations that are encountered during a search starting from the edges, moving inward at increasing elevations.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def flood_order_async(self, dem, output, callback=None) -> ToolResult: ...
+    def floor(self, i, output, callback=None) -> ToolResult:
+        """Returns the largest (closest to positive infinity) value that is less than or equal to the values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def floor_async(self, i, output, callback=None) -> ToolResult: ...
+    def flow_accumulation_full_workflow(self, dem, out_dem, out_pntr, out_accum, out_type="Specific Contributing Area", log=False, clip=False, esri_pntr=False, callback=None) -> ToolResult:
+        """Resolves all of the depressions in a DEM, outputting a breached DEM, an aspect-aligned non-divergent flow pointer, and a flow accumulation raster.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_dem -- Output raster DEM file. 
+        out_pntr -- Output raster flow pointer file. 
+        out_accum -- Output raster flow accumulation file. 
+        out_type -- Output type; one of 'cells', 'sca' (default), and 'ca'. 
+        log -- Optional flag to request the output be log-transformed. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def flow_accumulation_full_workflow_async(self, dem, out_dem, out_pntr, out_accum, out_type="Specific Contributing Area", log=False, clip=False, esri_pntr=False, callback=None) -> ToolResult: ...
+    def flow_length_diff(self, d8_pntr, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Calculates the local maximum absolute difference in downslope flowpath length, useful in mapping drainage divides and ridges.
+
+        Keyword arguments:
+
+        d8_pntr -- Input D8 pointer raster file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def flow_length_diff_async(self, d8_pntr, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def gamma_correction(self, i, output, gamma=0.5, callback=None) -> ToolResult:
+        """Performs a gamma correction on an input images.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        gamma -- Gamma value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def gamma_correction_async(self, i, output, gamma=0.5, callback=None) -> ToolResult: ...
+    def gaussian_contrast_stretch(self, i, output, num_tones=256, callback=None) -> ToolResult:
+        """Performs a Gaussian contrast stretch on input images.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        num_tones -- Number of tones in the output image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def gaussian_contrast_stretch_async(self, i, output, num_tones=256, callback=None) -> ToolResult: ...
+    def gaussian_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a mean curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def gaussian_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def gaussian_filter(self, i, output, sigma=0.75, callback=None) -> ToolResult:
+        """Performs a Gaussian filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        sigma -- Standard deviation distance in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def gaussian_filter_async(self, i, output, sigma=0.75, callback=None) -> ToolResult: ...
+    def gaussian_scale_space(self, dem, output, output_zscore, output_scale, points=None, sigma=0.5, step=0.5, num_steps=10, lsp="Slope", z_factor=None, callback=None) -> ToolResult:
+        """Uses the fast Gaussian approximation algorithm to produce scaled land-surface parameter measurements from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file. 
+        points -- Name of the input vector points shapefile. 
+        output -- Name of the output land-surface parameter raster file. 
+        output_zscore -- Name of the output z-score raster file. 
+        output_scale -- Name of the output scale raster file. 
+        sigma -- Initial sigma value (cells). 
+        step -- Step size as any positive non-zero integer. 
+        num_steps -- Number of steps. 
+        lsp -- Output land-surface parameter; one of 'AnisotropyLTP', 'Aspect', 'DiffMeanElev', 'Eastness', 'Elevation', 'Hillshade', 'MeanCurvature', 'Northness', 'PlanCurvature', 'ProfileCurvature', 'Ruggedness', 'Slope', 'TanCurvature', 'TotalCurvature'. 
+        z_factor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def gaussian_scale_space_async(self, dem, output, output_zscore, output_scale, points=None, sigma=0.5, step=0.5, num_steps=10, lsp="Slope", z_factor=None, callback=None) -> ToolResult: ...
+    def generalize_classified_raster(self, i, output, min_size=4, method="longest", callback=None) -> ToolResult:
+        """Generalizes a raster containing class or object features by removing small features.
+
+        Keyword arguments:
+
+        i -- Name of the input raster image file. 
+        output -- Name of the output raster file. 
+        min_size -- Minimum feature size, in grid cells. 
+        method -- Grouping method; one of 'longest' (default), 'largest', and 'nearest'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def generalize_classified_raster_async(self, i, output, min_size=4, method="longest", callback=None) -> ToolResult: ...
+    def generalize_with_similarity(self, i, similarity, output, min_size=4, callback=None) -> ToolResult:
+        """Generalizes a raster containing class or object features by removing small features using similarity criteria of neighbouring features.
+
+        Keyword arguments:
+
+        i -- Name of the input raster image file. 
+        similarity -- Names of the input similarity images. 
+        output -- Name of the output raster file. 
+        min_size -- Minimum feature size, in grid cells. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def generalize_with_similarity_async(self, i, similarity, output, min_size=4, callback=None) -> ToolResult: ...
+    def generating_function(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates generating function from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def generating_function_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def geomorphons(self, dem, output, search=50, threshold=0.0, fdist=0, skip=0, forms=True, residuals=False, callback=None) -> ToolResult:
+        """Computes geomorphon patterns.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        search -- Look up distance (in cells). 
+        threshold -- Flatness threshold for the classification function (in degrees). 
+        fdist -- Distance (in cells) to begin reducing the flatness threshold to avoid problems with pseudo-flat lines-of-sight. 
+        skip -- Distance (in cells) to begin calculating lines-of-sight. 
+        forms -- Classify geomorphons into 10 common land morphologies, else output ternary pattern. 
+        residuals -- Convert elevation to residuals of a linear model. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def geomorphons_async(self, dem, output, search=50, threshold=0.0, fdist=0, skip=0, forms=True, residuals=False, callback=None) -> ToolResult: ...
+    def greater_than(self, input1, input2, output, incl_equals=False, callback=None) -> ToolResult:
+        """Performs a greater-than comparison operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        incl_equals -- Perform a greater-than-or-equal-to operation. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def greater_than_async(self, input1, input2, output, incl_equals=False, callback=None) -> ToolResult: ...
+    def hack_stream_order(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Assigns the Hack stream order to each tributary in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def hack_stream_order_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def heat_map(self, i, output, weight_field=None, bandwidth="", kernel="quartic", cell_size="", base=None, callback=None) -> ToolResult:
+        """Calculates a heat map, or kernel density estimation (KDE), for an input point set.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        weight_field -- Optional name of the attribute containing point weight. 
+        output -- Name of the output raster image file. 
+        bandwidth -- Bandwidth (metres). 
+        kernel -- Kernel type; one of 'uniform', 'triangular', 'epanechnikov', 'quartic', 'triweight', 'tricube', 'gaussian', 'cosine', 'logistic', 'sigmoid', 'silverman'. 
+        cell_size -- Optionally specified cell size of output raster, in metres. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def heat_map_async(self, i, output, weight_field=None, bandwidth="", kernel="quartic", cell_size="", base=None, callback=None) -> ToolResult: ...
+    def height_above_ground(self, i=None, output=None, callback=None) -> ToolResult:
+        """Normalizes a LiDAR point cloud, providing the height above the nearest ground-classified point.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file (including extension). 
+        output -- Output lidar file (including extension). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def height_above_ground_async(self, i=None, output=None, callback=None) -> ToolResult: ...
+    def high_pass_bilateral_filter(self, i, output, sigma_dist=0.75, sigma_int=1.0, callback=None) -> ToolResult:
+        """Performs a high-pass bilateral filter, by differencing an input image by the bilateral filter by Tomasi and Manduchi (1998).
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        sigma_dist -- Standard deviation in distance in pixels. 
+        sigma_int -- Standard deviation in intensity in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def high_pass_bilateral_filter_async(self, i, output, sigma_dist=0.75, sigma_int=1.0, callback=None) -> ToolResult: ...
+    def high_pass_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Performs a high-pass filter on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def high_pass_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def high_pass_median_filter(self, i, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult:
+        """Performs a high pass median filter on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        sig_digits -- Number of significant digits. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def high_pass_median_filter_async(self, i, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult: ...
+    def highest_position(self, inputs, output, callback=None) -> ToolResult:
+        """Identifies the stack position of the maximum value within a raster stack on a cell-by-cell basis.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def highest_position_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def hillshade(self, dem, output, azimuth=315.0, altitude=30.0, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a hillshade raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        azimuth -- Illumination source azimuth in degrees. 
+        altitude -- Illumination source altitude in degrees. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def hillshade_async(self, dem, output, azimuth=315.0, altitude=30.0, zfactor=None, callback=None) -> ToolResult: ...
+    def hillslopes(self, d8_pntr, streams, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Identifies the individual hillslopes draining to each link in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def hillslopes_async(self, d8_pntr, streams, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def histogram_equalization(self, i, output, num_tones=256, callback=None) -> ToolResult:
+        """Performs a histogram equalization contrast enhancement on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        num_tones -- Number of tones in the output image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def histogram_equalization_async(self, i, output, num_tones=256, callback=None) -> ToolResult: ...
+    def histogram_matching(self, i, histo_file, output, callback=None) -> ToolResult:
+        """Alters the statistical distribution of a raster image matching it to a specified PDF.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        histo_file -- Input reference probability distribution function (pdf) text file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def histogram_matching_async(self, i, histo_file, output, callback=None) -> ToolResult: ...
+    def histogram_matching_two_images(self, input1, input2, output, callback=None) -> ToolResult:
+        """Alters the cumulative distribution function of a raster image to that of another image.
+
+        Keyword arguments:
+
+        input1 -- Input raster file to modify. 
+        input2 -- Input reference raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def histogram_matching_two_images_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def hole_proportion(self, i, callback=None) -> ToolResult:
+        """Calculates the proportion of the total area of a polygon's holes relative to the area of the polygon's hull.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def hole_proportion_async(self, i, callback=None) -> ToolResult: ...
+    def horizon_angle(self, dem, output, azimuth=0.0, max_dist=100.0, callback=None) -> ToolResult:
+        """Calculates horizon angle (maximum upwind slope) for each grid cell in an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        azimuth -- Azimuth, in degrees. 
+        max_dist -- Optional maximum search distance (unspecified if none; in xy units). Minimum value is 5 x cell size. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def horizon_angle_async(self, dem, output, azimuth=0.0, max_dist=100.0, callback=None) -> ToolResult: ...
+    def horizontal_excess_curvature(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates horizontal excess curvature from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def horizontal_excess_curvature_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def horton_stream_order(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Assigns the Horton stream order to each tributary in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def horton_stream_order_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def hydrologic_connectivity(self, dem, output1, output2, exponent=1.0, threshold=None, callback=None) -> ToolResult:
+        """This tool evaluates hydrologic connectivity within a DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file; must be depressionless. 
+        output1 -- Name of the output downslope unsaturated length (DUL) file. 
+        output2 -- Name of the output upslope disconnected saturated area (UDSA) file. 
+        exponent -- Optional exponent parameter; default is 1.0. 
+        threshold -- Optional convergence threshold parameter, in grid cells; default is infinity. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def hydrologic_connectivity_async(self, dem, output1, output2, exponent=1.0, threshold=None, callback=None) -> ToolResult: ...
+    def hypsometric_analysis(self, inputs, output, watershed=None, callback=None) -> ToolResult:
+        """Calculates a hypsometric curve for one or more DEMs.
+
+        Keyword arguments:
+
+        inputs -- Input DEM files. 
+        watershed -- Input watershed files (optional). 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def hypsometric_analysis_async(self, inputs, output, watershed=None, callback=None) -> ToolResult: ...
+    def hypsometrically_tinted_hillshade(self, dem, output, altitude=45.0, hs_weight=0.5, brightness=0.5, atmospheric=0.0, palette="atlas", reverse=False, zfactor=None, full_mode=False, callback=None) -> ToolResult:
+        """Creates an colour shaded relief image from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        altitude -- Illumination source altitude in degrees. 
+        hs_weight -- Weight given to hillshade relative to relief (0.0-1.0). 
+        brightness -- Brightness factor (0.0-1.0). 
+        atmospheric -- Atmospheric effects weight (0.0-1.0). 
+        palette -- Options include 'atlas', 'high_relief', 'arid', 'soft', 'muted', 'purple', 'viridis', 'gn_yl', 'pi_y_g', 'bl_yl_rd', and 'deep'. 
+        reverse -- Optional flag indicating whether to use reverse the palette. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        full_mode -- Optional flag indicating whether to use full 360-degrees of illumination sources. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def hypsometrically_tinted_hillshade_async(self, dem, output, altitude=45.0, hs_weight=0.5, brightness=0.5, atmospheric=0.0, palette="atlas", reverse=False, zfactor=None, full_mode=False, callback=None) -> ToolResult: ...
+    def idw_interpolation(self, i, field, output, use_z=False, weight=2.0, radius=None, min_points=None, cell_size=None, base=None, callback=None) -> ToolResult:
+        """Interpolates vector points into a raster surface using an inverse-distance weighted scheme.
+
+        Keyword arguments:
+
+        i -- Input vector Points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use z-coordinate instead of field?. 
+        output -- Output raster file. 
+        weight -- IDW weight value. 
+        radius -- Search Radius in map units. 
+        min_points -- Minimum number of points. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def idw_interpolation_async(self, i, field, output, use_z=False, weight=2.0, radius=None, min_points=None, cell_size=None, base=None, callback=None) -> ToolResult: ...
+    def ihs_to_rgb(self, intensity, hue, saturation, red=None, green=None, blue=None, output=None, callback=None) -> ToolResult:
+        """Converts intensity, hue, and saturation (IHS) images into red, green, and blue (RGB) images.
+
+        Keyword arguments:
+
+        intensity -- Input intensity file. 
+        hue -- Input hue file. 
+        saturation -- Input saturation file. 
+        red -- Output red band file. Optionally specified if colour-composite not specified. 
+        green -- Output green band file. Optionally specified if colour-composite not specified. 
+        blue -- Output blue band file. Optionally specified if colour-composite not specified. 
+        output -- Output colour-composite file. Only used if individual bands are not specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def ihs_to_rgb_async(self, intensity, hue, saturation, red=None, green=None, blue=None, output=None, callback=None) -> ToolResult: ...
+    def image_autocorrelation(self, inputs, output, contiguity="Rook", callback=None) -> ToolResult:
+        """Performs Moran's I analysis on two or more input images.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        contiguity -- Contiguity type. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def image_autocorrelation_async(self, inputs, output, contiguity="Rook", callback=None) -> ToolResult: ...
+    def image_correlation(self, inputs, output=None, callback=None) -> ToolResult:
+        """Performs image correlation on two or more input images.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def image_correlation_async(self, inputs, output=None, callback=None) -> ToolResult: ...
+    def image_correlation_neighbourhood_analysis(self, input1, input2, output1, output2, filter=11, stat="pearson", callback=None) -> ToolResult:
+        """Performs image correlation on two input images neighbourhood search windows.
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file. 
+        output1 -- Output correlation (r-value or rho) raster file. 
+        output2 -- Output significance (p-value) raster file. 
+        filter -- Size of the filter kernel. 
+        stat -- Correlation type; one of 'pearson' (default) and 'spearman'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def image_correlation_neighbourhood_analysis_async(self, input1, input2, output1, output2, filter=11, stat="pearson", callback=None) -> ToolResult: ...
+    def image_regression(self, input1, input2, output, out_residuals=None, standardize=False, scattergram=False, num_samples=1000, callback=None) -> ToolResult:
+        """Performs image regression analysis on two input images.
+
+        Keyword arguments:
+
+        input1 -- Input raster file (independent variable, X). 
+        input2 -- Input raster file (dependent variable, Y). 
+        output -- Output HTML file for regression summary report. 
+        out_residuals -- Output raster regression residual file. 
+        standardize -- Optional flag indicating whether to standardize the residuals map. 
+        scattergram -- Optional flag indicating whether to output a scattergram. 
+        num_samples -- Number of samples used to create scattergram. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def image_regression_async(self, input1, input2, output, out_residuals=None, standardize=False, scattergram=False, num_samples=1000, callback=None) -> ToolResult: ...
+    def image_segmentation(self, inputs, output, threshold=0.5, steps=10, min_area=4, callback=None) -> ToolResult:
+        """Performs a region-growing based segmentation on a set of multi-spectral images.
+
+        Keyword arguments:
+
+        inputs -- Names of the input band images. 
+        output -- Name of the output raster file. 
+        threshold -- Distance threshold, in z-scores. 
+        steps -- Number of steps. 
+        min_area -- Minimum object area, in grid cells (1-8). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def image_segmentation_async(self, inputs, output, threshold=0.5, steps=10, min_area=4, callback=None) -> ToolResult: ...
+    def image_slider(self, input1, input2, output, palette1="grey", reverse1=False, label1="", palette2="grey", reverse2=False, label2="", height=600, callback=None) -> ToolResult:
+        """This tool creates an image slider from two input images.
+
+        Keyword arguments:
+
+        input1 -- Name of the left input image file. 
+        palette1 -- Left image palette; options are 'grey', 'atlas', 'high_relief', 'arid', 'soft', 'muted', 'purple', 'viridi', 'gn_yl', 'pi_y_g', 'bl_yl_rd', 'deep', and 'rgb'. 
+        reverse1 -- Reverse left image palette?. 
+        label1 -- Left image label (leave blank for none). 
+        input2 -- Name of the right input image file. 
+        palette2 -- Right image palette; options are 'grey', 'atlas', 'high_relief', 'arid', 'soft', 'muted', 'purple', 'viridi', 'gn_yl', 'pi_y_g', 'bl_yl_rd', 'deep', and 'rgb'. 
+        reverse2 -- Reverse right image palette?. 
+        label2 -- Right image label (leave blank for none). 
+        output -- Name of the output HTML file (*.html). 
+        height -- Image height, in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def image_slider_async(self, input1, input2, output, palette1="grey", reverse1=False, label1="", palette2="grey", reverse2=False, label2="", height=600, callback=None) -> ToolResult: ...
+    def image_stack_profile(self, inputs, points, output, callback=None) -> ToolResult:
+        """Plots an image stack profile (i.e. signature) for a set of points and multispectral images.
+
+        Keyword arguments:
+
+        inputs -- Input multispectral image files. 
+        points -- Input vector points file. 
+        output -- Output HTML file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def image_stack_profile_async(self, inputs, points, output, callback=None) -> ToolResult: ...
+    def impoundment_size_index(self, dem, damlength, out_mean=None, out_max=None, out_volume=None, out_area=None, out_dam_height=None, callback=None) -> ToolResult:
+        """Calculates the impoundment size resulting from damming a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_mean -- Output mean flooded depth file. 
+        out_max -- Output maximum flooded depth file. 
+        out_volume -- Output flooded volume file. 
+        out_area -- Output flooded area file. 
+        out_dam_height -- Output dam height file. 
+        damlength -- Maximum length of the dam. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def impoundment_size_index_async(self, dem, damlength, out_mean=None, out_max=None, out_volume=None, out_area=None, out_dam_height=None, callback=None) -> ToolResult: ...
+    def in_place_add(self, input1, input2, callback=None) -> ToolResult:
+        """Performs an in-place addition operation (input1 += input2).
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file or constant value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def in_place_add_async(self, input1, input2, callback=None) -> ToolResult: ...
+    def in_place_divide(self, input1, input2, callback=None) -> ToolResult:
+        """Performs an in-place division operation (input1 /= input2).
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file or constant value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def in_place_divide_async(self, input1, input2, callback=None) -> ToolResult: ...
+    def in_place_multiply(self, input1, input2, callback=None) -> ToolResult:
+        """Performs an in-place multiplication operation (input1 *= input2).
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file or constant value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def in_place_multiply_async(self, input1, input2, callback=None) -> ToolResult: ...
+    def in_place_subtract(self, input1, input2, callback=None) -> ToolResult:
+        """Performs an in-place subtraction operation (input1 -= input2).
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file or constant value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def in_place_subtract_async(self, input1, input2, callback=None) -> ToolResult: ...
+    def increment(self, i, output, callback=None) -> ToolResult:
+        """Increases the values of each grid cell in an input raster by 1.0. (see also InPlaceAdd).
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def increment_async(self, i, output, callback=None) -> ToolResult: ...
+    def individual_tree_detection(self, i=None, output=None, min_search_radius=1.0, min_height=0.0, max_search_radius="", max_height="", only_use_veg=False, callback=None) -> ToolResult:
+        """Identifies points in a LiDAR point cloud that are associated with the tops of individual trees.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR file. 
+        output -- Name of the output vector points file. 
+        min_search_radius -- Minimum search radius (m). 
+        min_height -- Minimum height (m). 
+        max_search_radius -- Maximum search radius (m). 
+        max_height -- Maximum height (m). 
+        only_use_veg -- Only use veg. class points?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def individual_tree_detection_async(self, i=None, output=None, min_search_radius=1.0, min_height=0.0, max_search_radius="", max_height="", only_use_veg=False, callback=None) -> ToolResult: ...
+    def insert_dams(self, dem, dam_pts, output, damlength, callback=None) -> ToolResult:
+        """Calculates the impoundment size resulting from damming a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        dam_pts -- Input vector dam points file. 
+        output -- Output file. 
+        damlength -- Maximum length of the dam. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def insert_dams_async(self, dem, dam_pts, output, damlength, callback=None) -> ToolResult: ...
+    def install_wb_extension(self, install_extension="General Toolset Extension", callback=None) -> ToolResult:
+        """Use to install a Whitebox extension product.
+
+        Keyword arguments:
+
+        install_extension -- Name of the extension product to install. Options include: 'General Toolset Extension', 'DEM & Spatial Hydrology Extension', 'Lidar & Remote Sensing Extension', and 'Agriculture Extension'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def install_wb_extension_async(self, install_extension="General Toolset Extension", callback=None) -> ToolResult: ...
+    def integer_division(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs an integer division operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def integer_division_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def integral_image(self, i, output, callback=None) -> ToolResult:
+        """Transforms an input image (summed area table) into its integral image equivalent.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def integral_image_async(self, i, output, callback=None) -> ToolResult: ...
+    def intersect(self, i, overlay, output, snap=0.0, callback=None) -> ToolResult:
+        """Identifies the parts of features in common between two input vector layers.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        overlay -- Input overlay vector file. 
+        output -- Output vector file. 
+        snap -- Snap tolerance. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def intersect_async(self, i, overlay, output, snap=0.0, callback=None) -> ToolResult: ...
+    def inverse_principal_component_analysis(self, inputs, report, callback=None) -> ToolResult:
+        """This tool performs an inverse principal component analysis on a series of input component images.
+
+        Keyword arguments:
+
+        inputs -- Name of the input PCA component images. 
+        report -- Name of the PCA report file (*.html). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def inverse_principal_component_analysis_async(self, inputs, report, callback=None) -> ToolResult: ...
+    def is_no_data(self, i, output, callback=None) -> ToolResult:
+        """Identifies NoData valued pixels in an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def is_no_data_async(self, i, output, callback=None) -> ToolResult: ...
+    def isobasins(self, dem, output, size, connections=False, callback=None) -> ToolResult:
+        """Divides a landscape into nearly equal sized drainage basins (i.e. watersheds).
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        size -- Target basin size, in grid cells. 
+        connections -- Output upstream-downstream flow connections among basins?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def isobasins_async(self, dem, output, size, connections=False, callback=None) -> ToolResult: ...
+    def jenson_snap_pour_points(self, pour_pts, streams, output, snap_dist, callback=None) -> ToolResult:
+        """Moves outlet points used to specify points of interest in a watershedding operation to the nearest stream cell.
+
+        Keyword arguments:
+
+        pour_pts -- Input vector pour points (outlet) file. 
+        streams -- Input raster streams file. 
+        output -- Output vector file. 
+        snap_dist -- Maximum snap distance in map units. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def jenson_snap_pour_points_async(self, pour_pts, streams, output, snap_dist, callback=None) -> ToolResult: ...
+    def join_tables(self, input1, pkey, input2, fkey, import_field=None, callback=None) -> ToolResult:
+        """Merge a vector's attribute table with another table based on a common field.
+
+        Keyword arguments:
+
+        input1 -- Input primary vector file (i.e. the table to be modified). 
+        pkey -- Primary key field. 
+        input2 -- Input foreign vector file (i.e. source of data to be imported). 
+        fkey -- Foreign key field. 
+        import_field -- Imported field (all fields will be imported if not specified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def join_tables_async(self, input1, pkey, input2, fkey, import_field=None, callback=None) -> ToolResult: ...
+    def k_means_clustering(self, inputs, output, classes, out_html=None, max_iterations=10, class_change=2.0, initialize="diagonal", min_class_size=10, callback=None) -> ToolResult:
+        """Performs a k-means clustering operation on a multi-spectral dataset.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        out_html -- Output HTML report file. 
+        classes -- Number of classes. 
+        max_iterations -- Maximum number of iterations. 
+        class_change -- Minimum percent of cells changed between iterations before completion. 
+        initialize -- How to initialize cluster centres?. 
+        min_class_size -- Minimum class size, in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def k_means_clustering_async(self, inputs, output, classes, out_html=None, max_iterations=10, class_change=2.0, initialize="diagonal", min_class_size=10, callback=None) -> ToolResult: ...
+    def k_nearest_mean_filter(self, i, output, filterx=11, filtery=11, k=5, callback=None) -> ToolResult:
+        """A k-nearest mean filter is a type of edge-preserving smoothing filter.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        k -- k-value in pixels; this is the number of nearest-valued neighbours to use. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def k_nearest_mean_filter_async(self, i, output, filterx=11, filtery=11, k=5, callback=None) -> ToolResult: ...
+    def kappa_index(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a kappa index of agreement (KIA) analysis on two categorical raster files.
+
+        Keyword arguments:
+
+        input1 -- Input classification raster file. 
+        input2 -- Input reference raster file. 
+        output -- Output HTML file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def kappa_index_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def knn_classification(self, inputs, training, field, scaling="Normalize", output=None, k=5, clip=True, test_proportion=0.2, callback=None) -> ToolResult:
+        """Performs a supervised k-nearest neighbour classification using training site polygons/points and predictor rasters.
+
+        Keyword arguments:
+
+        inputs -- Names of the input predictor rasters. 
+        scaling -- Scaling method for predictors. Options include 'None', 'Normalize', and 'Standardize'. 
+        training -- Name of the input training site polygons/points shapefile. 
+        field -- Name of the attribute containing class name data. 
+        output -- Name of the output raster file. 
+        k -- k-parameter, which determines the number of nearest neighbours used. 
+        clip -- Perform training data clipping to remove outlier pixels?. 
+        test_proportion -- The proportion of the dataset to include in the test split; default is 0.2. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def knn_classification_async(self, inputs, training, field, scaling="Normalize", output=None, k=5, clip=True, test_proportion=0.2, callback=None) -> ToolResult: ...
+    def knn_regression(self, inputs, training, field, scaling="Normalize", output=None, k=5, weight=True, test_proportion=0.2, callback=None) -> ToolResult:
+        """Performs a supervised k-nearest neighbour regression using training site points and predictor rasters.
+
+        Keyword arguments:
+
+        inputs -- Names of the input predictor rasters. 
+        scaling -- Scaling method for predictors. Options include 'None', 'Normalize', and 'Standardize'. 
+        training -- Name of the input training site points Shapefile. 
+        field -- Name of the attribute containing response variable name data. 
+        output -- Name of the output raster file. 
+        k -- k-parameter, which determines the number of nearest neighbours used. 
+        weight -- Use distance weighting?. 
+        test_proportion -- The proportion of the dataset to include in the test split; default is 0.2. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def knn_regression_async(self, inputs, training, field, scaling="Normalize", output=None, k=5, weight=True, test_proportion=0.2, callback=None) -> ToolResult: ...
+    def ks_test_for_normality(self, i, output, num_samples=None, callback=None) -> ToolResult:
+        """Evaluates whether the values in a raster are normally distributed.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output HTML file. 
+        num_samples -- Number of samples. Leave blank to use whole image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def ks_test_for_normality_async(self, i, output, num_samples=None, callback=None) -> ToolResult: ...
+    def laplacian_filter(self, i, output, variant="3x3(1)", clip=0.0, callback=None) -> ToolResult:
+        """Performs a Laplacian filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        variant -- Optional variant value. Options include 3x3(1), 3x3(2), 3x3(3), 3x3(4), 5x5(1), and 5x5(2) (default is 3x3(1)). 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def laplacian_filter_async(self, i, output, variant="3x3(1)", clip=0.0, callback=None) -> ToolResult: ...
+    def laplacian_of_gaussian_filter(self, i, output, sigma=0.75, callback=None) -> ToolResult:
+        """Performs a Laplacian-of-Gaussian (LoG) filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        sigma -- Standard deviation in pixels. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def laplacian_of_gaussian_filter_async(self, i, output, sigma=0.75, callback=None) -> ToolResult: ...
+    def las_to_ascii(self, inputs, callback=None) -> ToolResult:
+        """Converts one or more LAS files into ASCII text files.
+
+        Keyword arguments:
+
+        inputs -- Input LiDAR files. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def las_to_ascii_async(self, inputs, callback=None) -> ToolResult: ...
+    def las_to_laz(self, i=None, output=None, callback=None) -> ToolResult:
+        """This tool converts one or more LAS files into the LAZ format.
+
+        Keyword arguments:
+
+        i -- Name of the input LAS files (leave blank to use all LAS files in WorkingDirectory. 
+        output -- Output LAZ file (including extension). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def las_to_laz_async(self, i=None, output=None, callback=None) -> ToolResult: ...
+    def las_to_multipoint_shapefile(self, i=None, callback=None) -> ToolResult:
+        """Converts one or more LAS files into MultipointZ vector Shapefiles. When the input parameter is not specified, the tool grids all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def las_to_multipoint_shapefile_async(self, i=None, callback=None) -> ToolResult: ...
+    def las_to_shapefile(self, i=None, callback=None) -> ToolResult:
+        """Converts one or more LAS files into a vector Shapefile of POINT ShapeType.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def las_to_shapefile_async(self, i=None, callback=None) -> ToolResult: ...
+    def las_to_zlidar(self, inputs=None, outdir=None, compress="brotli", level=5, callback=None) -> ToolResult:
+        """Converts one or more LAS files into the zlidar compressed LiDAR data format.
+
+        Keyword arguments:
+
+        inputs -- Input LAS files. 
+        outdir -- Output directory into which zlidar files are created. If unspecified, it is assumed to be the same as the inputs. 
+        compress -- Compression method, including 'brotli' and 'deflate'. 
+        level -- Compression level (1-9). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def las_to_zlidar_async(self, inputs=None, outdir=None, compress="brotli", level=5, callback=None) -> ToolResult: ...
+    def launch_wb_runner(self, clear_app_state=False, callback=None) -> ToolResult:
+        """Opens the Whitebox Runner application.
+
+        Keyword arguments:
+
+        clear_app_state -- Clear the application state memory?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def launch_wb_runner_async(self, clear_app_state=False, callback=None) -> ToolResult: ...
+    def layer_footprint(self, i, output, callback=None) -> ToolResult:
+        """Creates a vector polygon footprint of the area covered by a raster grid or vector layer.
+
+        Keyword arguments:
+
+        i -- Input raster or vector file. 
+        output -- Output vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def layer_footprint_async(self, i, output, callback=None) -> ToolResult: ...
+    def laz_to_las(self, i=None, output=None, callback=None) -> ToolResult:
+        """This tool converts one or more LAZ files into the LAS format.
+
+        Keyword arguments:
+
+        i -- Name of the input LAZ files (leave blank to use all LAZ files in WorkingDirectory. 
+        output -- Output LAS file (including extension). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def laz_to_las_async(self, i=None, output=None, callback=None) -> ToolResult: ...
+    def lee_sigma_filter(self, i, output, filterx=11, filtery=11, sigma=10.0, m=5.0, callback=None) -> ToolResult:
+        """Performs a Lee (Sigma) smoothing filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        sigma -- Sigma value should be related to the standard deviation of the distribution of image speckle noise. 
+        m -- M-threshold value the minimum allowable number of pixels within the intensity range. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lee_sigma_filter_async(self, i, output, filterx=11, filtery=11, sigma=10.0, m=5.0, callback=None) -> ToolResult: ...
+    def length_of_upstream_channels(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Calculates the total length of channels upstream.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def length_of_upstream_channels_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def less_than(self, input1, input2, output, incl_equals=False, callback=None) -> ToolResult:
+        """Performs a less-than comparison operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        incl_equals -- Perform a less-than-or-equal-to operation. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def less_than_async(self, input1, input2, output, incl_equals=False, callback=None) -> ToolResult: ...
+    def lidar_block_maximum(self, i=None, output=None, resolution=1.0, callback=None) -> ToolResult:
+        """Creates a block-maximum raster from an input LAS file. When the input/output parameters are not specified, the tool grids all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output file. 
+        resolution -- Output raster's grid resolution. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_block_maximum_async(self, i=None, output=None, resolution=1.0, callback=None) -> ToolResult: ...
+    def lidar_block_minimum(self, i=None, output=None, resolution=1.0, callback=None) -> ToolResult:
+        """Creates a block-minimum raster from an input LAS file. When the input/output parameters are not specified, the tool grids all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output file. 
+        resolution -- Output raster's grid resolution. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_block_minimum_async(self, i=None, output=None, resolution=1.0, callback=None) -> ToolResult: ...
+    def lidar_classify_subset(self, base, subset, output, subset_class, nonsubset_class=None, callback=None) -> ToolResult:
+        """Classifies the values in one LiDAR point cloud that correspond with points in a subset cloud.
+
+        Keyword arguments:
+
+        base -- Input base LiDAR file. 
+        subset -- Input subset LiDAR file. 
+        output -- Output LiDAR file. 
+        subset_class -- Subset point class value (must be 0-18; see LAS specifications). 
+        nonsubset_class -- Non-subset point class value (must be 0-18; see LAS specifications). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_classify_subset_async(self, base, subset, output, subset_class, nonsubset_class=None, callback=None) -> ToolResult: ...
+    def lidar_colourize(self, in_lidar, in_image, output, callback=None) -> ToolResult:
+        """Adds the red-green-blue colour fields of a LiDAR (LAS) file based on an input image.
+
+        Keyword arguments:
+
+        in_lidar -- Input LiDAR file. 
+        in_image -- Input colour image file. 
+        output -- Output LiDAR file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_colourize_async(self, in_lidar, in_image, output, callback=None) -> ToolResult: ...
+    def lidar_contour(self, i=None, output=None, interval=10.0, base=0.0, smooth=5, parameter="elevation", returns="all", exclude_cls=None, minz=None, maxz=None, max_triangle_edge_length=None, callback=None) -> ToolResult:
+        """This tool creates a vector contour coverage from an input LiDAR point file.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output vector lines file. 
+        interval -- Contour interval. 
+        base -- Base contour. 
+        smooth -- Smoothing filter size (in num. points), e.g. 3, 5, 7, 9, 11. 
+        parameter -- Interpolation parameter; options are 'elevation' (default), 'intensity', 'user_data'. 
+        returns -- Point return types to include; options are 'all' (default), 'last', 'first'. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        max_triangle_edge_length -- Optional maximum triangle edge length; triangles larger than this size will not be gridded. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_contour_async(self, i=None, output=None, interval=10.0, base=0.0, smooth=5, parameter="elevation", returns="all", exclude_cls=None, minz=None, maxz=None, max_triangle_edge_length=None, callback=None) -> ToolResult: ...
+    def lidar_digital_surface_model(self, i=None, output=None, resolution=1.0, radius=0.5, minz=None, maxz=None, max_triangle_edge_length=None, callback=None) -> ToolResult:
+        """Creates a top-surface digital surface model (DSM) from a LiDAR point cloud.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file (including extension). 
+        output -- Output raster file (including extension). 
+        resolution -- Output raster's grid resolution. 
+        radius -- Search Radius. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        max_triangle_edge_length -- Optional maximum triangle edge length; triangles larger than this size will not be gridded. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_digital_surface_model_async(self, i=None, output=None, resolution=1.0, radius=0.5, minz=None, maxz=None, max_triangle_edge_length=None, callback=None) -> ToolResult: ...
+    def lidar_eigenvalue_features(self, i=None, num_neighbours=None, radius=None, callback=None) -> ToolResult:
+        """Calculate eigenvalue-based metrics from a LiDAR point cloud.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        num_neighbours -- Number of neighbours used in search. 
+        radius -- Search distance used in neighbourhood search. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_eigenvalue_features_async(self, i=None, num_neighbours=None, radius=None, callback=None) -> ToolResult: ...
+    def lidar_elevation_slice(self, i, output, minz=None, maxz=None, cls=False, inclassval=2, outclassval=1, callback=None) -> ToolResult:
+        """Outputs all of the points within a LiDAR (LAS) point file that lie between a specified elevation range.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        minz -- Minimum elevation value (optional). 
+        maxz -- Maximum elevation value (optional). 
+        cls -- Optional boolean flag indicating whether points outside the range should be retained in output but reclassified. 
+        inclassval -- Optional parameter specifying the class value assigned to points within the slice. 
+        outclassval -- Optional parameter specifying the class value assigned to points within the slice. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_elevation_slice_async(self, i, output, minz=None, maxz=None, cls=False, inclassval=2, outclassval=1, callback=None) -> ToolResult: ...
+    def lidar_ground_point_filter(self, i, output, radius=2.0, min_neighbours=0, slope_threshold=45.0, height_threshold=1.0, classify=True, slope_norm=True, height_above_ground=False, callback=None) -> ToolResult:
+        """Identifies ground points within LiDAR dataset using a slope-based method.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        radius -- Search Radius. 
+        min_neighbours -- The minimum number of neighbouring points within search areas. If fewer points than this threshold are identified during the fixed-radius search, a subsequent kNN search is performed to identify the k number of neighbours. 
+        slope_threshold -- Maximum inter-point slope to be considered an off-terrain point. 
+        height_threshold -- Inter-point height difference to be considered an off-terrain point. 
+        classify -- Classify points as ground (2) or off-ground (1). 
+        slope_norm -- Perform initial ground slope normalization?. 
+        height_above_ground -- Transform output to height above average ground elevation?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_ground_point_filter_async(self, i, output, radius=2.0, min_neighbours=0, slope_threshold=45.0, height_threshold=1.0, classify=True, slope_norm=True, height_above_ground=False, callback=None) -> ToolResult: ...
+    def lidar_hex_binning(self, i, output, width, orientation="horizontal", callback=None) -> ToolResult:
+        """Hex-bins a set of LiDAR points.
+
+        Keyword arguments:
+
+        i -- Input base file. 
+        output -- Output vector polygon file. 
+        width -- The grid cell width. 
+        orientation -- Grid Orientation, 'horizontal' or 'vertical'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_hex_binning_async(self, i, output, width, orientation="horizontal", callback=None) -> ToolResult: ...
+    def lidar_hillshade(self, i, output, azimuth=315.0, altitude=30.0, radius=1.0, callback=None) -> ToolResult:
+        """Calculates a hillshade value for points within a LAS file and stores these data in the RGB field.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output file. 
+        azimuth -- Illumination source azimuth in degrees. 
+        altitude -- Illumination source altitude in degrees. 
+        radius -- Search Radius. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_hillshade_async(self, i, output, azimuth=315.0, altitude=30.0, radius=1.0, callback=None) -> ToolResult: ...
+    def lidar_histogram(self, i, output, parameter="elevation", clip=1.0, callback=None) -> ToolResult:
+        """Creates a histogram of LiDAR data.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        parameter -- Parameter; options are 'elevation' (default), 'intensity', 'scan angle', 'class', 'time'. 
+        clip -- Amount to clip distribution tails (in percent). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_histogram_async(self, i, output, parameter="elevation", clip=1.0, callback=None) -> ToolResult: ...
+    def lidar_idw_interpolation(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, weight=1.0, radius=2.5, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult:
+        """Interpolates LAS files using an inverse-distance weighted (IDW) scheme. When the input/output parameters are not specified, the tool interpolates all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file (including extension). 
+        output -- Output raster file (including extension). 
+        parameter -- Interpolation parameter; options are 'elevation' (default), 'intensity', 'class', 'return_number', 'number_of_returns', 'scan angle', 'rgb', 'user data'. 
+        returns -- Point return types to include; options are 'all' (default), 'last', 'first'. 
+        resolution -- Output raster's grid resolution. 
+        weight -- IDW weight value. 
+        radius -- Search Radius. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_idw_interpolation_async(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, weight=1.0, radius=2.5, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult: ...
+    def lidar_info(self, i, output, density=True, vlr=True, geokeys=True, callback=None) -> ToolResult:
+        """Prints information about a LiDAR (LAS) dataset, including header, point return frequency, and classification data and information about the variable length records (VLRs) and geokeys.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output HTML file for summary report. 
+        density -- Flag indicating whether or not to calculate the average point density and nominal point spacing. 
+        vlr -- Flag indicating whether or not to print the variable length records (VLRs). 
+        geokeys -- Flag indicating whether or not to print the geokeys. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_info_async(self, i, output, density=True, vlr=True, geokeys=True, callback=None) -> ToolResult: ...
+    def lidar_join(self, inputs, output, callback=None) -> ToolResult:
+        """Joins multiple LiDAR (LAS) files into a single LAS file.
+
+        Keyword arguments:
+
+        inputs -- Input LiDAR files. 
+        output -- Output LiDAR file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_join_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def lidar_kappa_index(self, input1, input2, output, class_accuracy, resolution=1.0, callback=None) -> ToolResult:
+        """Performs a kappa index of agreement (KIA) analysis on the classifications of two LAS files.
+
+        Keyword arguments:
+
+        input1 -- Input LiDAR classification file. 
+        input2 -- Input LiDAR reference file. 
+        output -- Output HTML file. 
+        class_accuracy -- Output classification accuracy raster file. 
+        resolution -- Output raster's grid resolution. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_kappa_index_async(self, input1, input2, output, class_accuracy, resolution=1.0, callback=None) -> ToolResult: ...
+    def lidar_nearest_neighbour_gridding(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, radius=2.5, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult:
+        """Grids LiDAR files using nearest-neighbour scheme. When the input/output parameters are not specified, the tool grids all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file (including extension). 
+        output -- Output raster file (including extension). 
+        parameter -- Interpolation parameter; options are 'elevation' (default), 'intensity', 'class', 'return_number', 'number_of_returns', 'scan angle', 'rgb', 'user data', 'time'. 
+        returns -- Point return types to include; options are 'all' (default), 'last', 'first'. 
+        resolution -- Output raster's grid resolution. 
+        radius -- Search Radius. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_nearest_neighbour_gridding_async(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, radius=2.5, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult: ...
+    def lidar_point_density(self, i=None, output=None, returns="all", resolution=1.0, radius=2.5, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult:
+        """Calculates the spatial pattern of point density for a LiDAR data set. When the input/output parameters are not specified, the tool grids all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file (including extension). 
+        output -- Output raster file (including extension). 
+        returns -- Point return types to include; options are 'all' (default), 'last', 'first'. 
+        resolution -- Output raster's grid resolution. 
+        radius -- Search radius. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_point_density_async(self, i=None, output=None, returns="all", resolution=1.0, radius=2.5, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult: ...
+    def lidar_point_return_analysis(self, i, output=None, callback=None) -> ToolResult:
+        """This tool performs a quality control check on the return values of points in a LiDAR file.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_point_return_analysis_async(self, i, output=None, callback=None) -> ToolResult: ...
+    def lidar_point_stats(self, i=None, resolution=1.0, num_points=True, num_pulses=False, avg_points_per_pulse=True, z_range=False, intensity_range=False, predom_class=False, callback=None) -> ToolResult:
+        """Creates several rasters summarizing the distribution of LAS point data. When the input/output parameters are not specified, the tool works on all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        resolution -- Output raster's grid resolution. 
+        num_points -- Flag indicating whether or not to output the number of points (returns) raster. 
+        num_pulses -- Flag indicating whether or not to output the number of pulses raster. 
+        avg_points_per_pulse -- Flag indicating whether or not to output the average number of points (returns) per pulse raster. 
+        z_range -- Flag indicating whether or not to output the elevation range raster. 
+        intensity_range -- Flag indicating whether or not to output the intensity range raster. 
+        predom_class -- Flag indicating whether or not to output the predominant classification raster. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_point_stats_async(self, i=None, resolution=1.0, num_points=True, num_pulses=False, avg_points_per_pulse=True, z_range=False, intensity_range=False, predom_class=False, callback=None) -> ToolResult: ...
+    def lidar_ransac_planes(self, i, output, radius=2.0, num_iter=50, num_samples=5, threshold=0.35, model_size=8, max_slope=80.0, classify=False, last_returns=False, callback=None) -> ToolResult:
+        """Performs a RANSAC analysis to identify points within a LiDAR point cloud that belong to linear planes.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        radius -- Search Radius. 
+        num_iter -- Number of iterations. 
+        num_samples -- Number of sample points on which to build the model. 
+        threshold -- Threshold used to determine inlier points. 
+        model_size -- Acceptable model size. 
+        max_slope -- Maximum planar slope. 
+        classify -- Classify points as ground (2) or off-ground (1). 
+        last_returns -- Only include last- and only-return points. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_ransac_planes_async(self, i, output, radius=2.0, num_iter=50, num_samples=5, threshold=0.35, model_size=8, max_slope=80.0, classify=False, last_returns=False, callback=None) -> ToolResult: ...
+    def lidar_rbf_interpolation(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, num_points=20, exclude_cls=None, minz=None, maxz=None, func_type="ThinPlateSpline", poly_order="none", weight=5, callback=None) -> ToolResult:
+        """Interpolates LAS files using a radial basis function (RBF) scheme. When the input/output parameters are not specified, the tool interpolates all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file (including extension). 
+        output -- Output raster file (including extension). 
+        parameter -- Interpolation parameter; options are 'elevation' (default), 'intensity', 'class', 'return_number', 'number_of_returns', 'scan angle', 'rgb', 'user data'. 
+        returns -- Point return types to include; options are 'all' (default), 'last', 'first'. 
+        resolution -- Output raster's grid resolution. 
+        num_points -- Number of points. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        func_type -- Radial basis function type; options are 'ThinPlateSpline' (default), 'PolyHarmonic', 'Gaussian', 'MultiQuadric', 'InverseMultiQuadric'. 
+        poly_order -- Polynomial order; options are 'none' (default), 'constant', 'affine'. 
+        weight -- Weight parameter used in basis function. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_rbf_interpolation_async(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, num_points=20, exclude_cls=None, minz=None, maxz=None, func_type="ThinPlateSpline", poly_order="none", weight=5, callback=None) -> ToolResult: ...
+    def lidar_remove_duplicates(self, i, output, include_z=False, callback=None) -> ToolResult:
+        """Removes duplicate points from a LiDAR data set.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        include_z -- Include z-values in point comparison?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_remove_duplicates_async(self, i, output, include_z=False, callback=None) -> ToolResult: ...
+    def lidar_remove_outliers(self, i, output, radius=2.0, elev_diff=50.0, use_median=False, classify=True, callback=None) -> ToolResult:
+        """Removes outliers (high and low points) in a LiDAR point cloud.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        radius -- Search Radius. 
+        elev_diff -- Max. elevation difference. 
+        use_median -- Optional flag indicating whether to use the difference from median elevation rather than mean. 
+        classify -- Classify points as ground (2) or off-ground (1). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_remove_outliers_async(self, i, output, radius=2.0, elev_diff=50.0, use_median=False, classify=True, callback=None) -> ToolResult: ...
+    def lidar_rooftop_analysis(self, buildings, output, i=None, radius=2.0, num_iter=50, num_samples=10, threshold=0.15, model_size=15, max_slope=65.0, norm_diff=10.0, azimuth=180.0, altitude=30.0, callback=None) -> ToolResult:
+        """Identifies roof segments in a LiDAR point cloud.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        buildings -- Input vector build footprint polygons file. 
+        output -- Output vector polygon file. 
+        radius -- Search Radius. 
+        num_iter -- Number of iterations. 
+        num_samples -- Number of sample points on which to build the model. 
+        threshold -- Threshold used to determine inlier points (in elevation units). 
+        model_size -- Acceptable model size, in points. 
+        max_slope -- Maximum planar slope, in degrees. 
+        norm_diff -- Maximum difference in normal vectors, in degrees. 
+        azimuth -- Illumination source azimuth, in degrees. 
+        altitude -- Illumination source altitude in degrees. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_rooftop_analysis_async(self, buildings, output, i=None, radius=2.0, num_iter=50, num_samples=10, threshold=0.15, model_size=15, max_slope=65.0, norm_diff=10.0, azimuth=180.0, altitude=30.0, callback=None) -> ToolResult: ...
+    def lidar_segmentation(self, i, output, radius=2.0, num_iter=50, num_samples=10, threshold=0.15, model_size=15, max_slope=80.0, norm_diff=10.0, maxzdiff=1.0, classes=False, ground=False, callback=None) -> ToolResult:
+        """Segments a LiDAR point cloud based on differences in the orientation of fitted planar surfaces and point proximity.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        radius -- Search Radius. 
+        num_iter -- Number of iterations. 
+        num_samples -- Number of sample points on which to build the model. 
+        threshold -- Threshold used to determine inlier points. 
+        model_size -- Acceptable model size. 
+        max_slope -- Maximum planar slope. 
+        norm_diff -- Maximum difference in normal vectors, in degrees. 
+        maxzdiff -- Maximum difference in elevation (z units) between neighbouring points of the same segment. 
+        classes -- Segments don't cross class boundaries. 
+        ground -- Classify the largest segment as ground points?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_segmentation_async(self, i, output, radius=2.0, num_iter=50, num_samples=10, threshold=0.15, model_size=15, max_slope=80.0, norm_diff=10.0, maxzdiff=1.0, classes=False, ground=False, callback=None) -> ToolResult: ...
+    def lidar_segmentation_based_filter(self, i, output, radius=5.0, norm_diff=2.0, maxzdiff=1.0, classify=False, callback=None) -> ToolResult:
+        """Identifies ground points within LiDAR point clouds using a segmentation based approach.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output file. 
+        radius -- Search Radius. 
+        norm_diff -- Maximum difference in normal vectors, in degrees. 
+        maxzdiff -- Maximum difference in elevation (z units) between neighbouring points of the same segment. 
+        classify -- Classify points as ground (2) or off-ground (1). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_segmentation_based_filter_async(self, i, output, radius=5.0, norm_diff=2.0, maxzdiff=1.0, classify=False, callback=None) -> ToolResult: ...
+    def lidar_shift(self, i, output, x_shift="", y_shift="", z_shift="", callback=None) -> ToolResult:
+        """Shifts the x,y,z coordinates of a LiDAR file.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        x_shift -- x-shift value, blank for none. 
+        y_shift -- y-shift value, blank for none. 
+        z_shift -- z-shift value, blank for none. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_shift_async(self, i, output, x_shift="", y_shift="", z_shift="", callback=None) -> ToolResult: ...
+    def lidar_sibson_interpolation(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult:
+        """This tool interpolates one or more LiDAR tiles using Sibson's natural neighbour method.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points (leave blank to use all files in WorkingDirectory. 
+        output -- Output raster file (including extension). 
+        parameter -- Interpolation parameter; options are 'elevation' (default), 'intensity', 'class', 'return_number', 'number_of_returns', 'scan angle', 'user_data'. 
+        returns -- Point return types to include; options are 'all' (default), 'last', 'first'. 
+        resolution -- Output raster's grid resolution. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_sibson_interpolation_async(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, exclude_cls=None, minz=None, maxz=None, callback=None) -> ToolResult: ...
+    def lidar_sort_by_time(self, i, output, callback=None) -> ToolResult:
+        """This tool sorts the points in a LiDAR file by the GPS time.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_sort_by_time_async(self, i, output, callback=None) -> ToolResult: ...
+    def lidar_thin(self, i, output, resolution=2.0, method="lowest", save_filtered=False, callback=None) -> ToolResult:
+        """Thins a LiDAR point cloud, reducing point density.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        resolution -- The size of the square area used to evaluate nearby points in the LiDAR data. 
+        method -- Point selection method; options are 'first', 'last', 'lowest' (default), 'highest', 'nearest'. 
+        save_filtered -- Save filtered points to separate file?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_thin_async(self, i, output, resolution=2.0, method="lowest", save_filtered=False, callback=None) -> ToolResult: ...
+    def lidar_thin_high_density(self, i, output, density, resolution=1.0, save_filtered=False, callback=None) -> ToolResult:
+        """Thins points from high density areas within a LiDAR point cloud.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        resolution -- Output raster's grid resolution. 
+        density -- Max. point density (points / m^3). 
+        save_filtered -- Save filtered points to separate file?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_thin_high_density_async(self, i, output, density, resolution=1.0, save_filtered=False, callback=None) -> ToolResult: ...
+    def lidar_tile(self, i, width=1000.0, height=1000.0, origin_x=0.0, origin_y=0.0, min_points=2, callback=None) -> ToolResult:
+        """Tiles a LiDAR LAS file into multiple LAS files.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        width -- Width of tiles in the X dimension; default 1000.0. 
+        height -- Height of tiles in the Y dimension. 
+        origin_x -- Origin point X coordinate for tile grid. 
+        origin_y -- Origin point Y coordinate for tile grid. 
+        min_points -- Minimum number of points contained in a tile for it to be saved. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_tile_async(self, i, width=1000.0, height=1000.0, origin_x=0.0, origin_y=0.0, min_points=2, callback=None) -> ToolResult: ...
+    def lidar_tile_footprint(self, output, i=None, hull=False, callback=None) -> ToolResult:
+        """Creates a vector polygon of the convex hull of a LiDAR point cloud. When the input/output parameters are not specified, the tool works with all LAS files contained within the working directory.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output vector polygon file. 
+        hull -- Identify the convex hull around points. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_tile_footprint_async(self, output, i=None, hull=False, callback=None) -> ToolResult: ...
+    def lidar_tin_gridding(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, exclude_cls="7,18", minz=None, maxz=None, max_triangle_edge_length=None, callback=None) -> ToolResult:
+        """Creates a raster grid based on a Delaunay triangular irregular network (TIN) fitted to LiDAR points.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file (including extension). 
+        output -- Output raster file (including extension). 
+        parameter -- Interpolation parameter; options are 'elevation' (default), 'intensity', 'class', 'return_number', 'number_of_returns', 'scan angle', 'rgb', 'user data'. 
+        returns -- Point return types to include; options are 'all' (default), 'last', 'first'. 
+        resolution -- Output raster's grid resolution. 
+        exclude_cls -- Optional exclude classes from interpolation; Valid class values range from 0 to 18, based on LAS specifications. Example, --exclude_cls='3,4,5,6,7,18'. 
+        minz -- Optional minimum elevation for inclusion in interpolation. 
+        maxz -- Optional maximum elevation for inclusion in interpolation. 
+        max_triangle_edge_length -- Optional maximum triangle edge length; triangles larger than this size will not be gridded. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_tin_gridding_async(self, i=None, output=None, parameter="elevation", returns="all", resolution=1.0, exclude_cls="7,18", minz=None, maxz=None, max_triangle_edge_length=None, callback=None) -> ToolResult: ...
+    def lidar_tophat_transform(self, i, output, radius=1.0, callback=None) -> ToolResult:
+        """Performs a white top-hat transform on a Lidar dataset; as an estimate of height above ground, this is useful for modelling the vegetation canopy.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        radius -- Search Radius. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lidar_tophat_transform_async(self, i, output, radius=1.0, callback=None) -> ToolResult: ...
+    def line_detection_filter(self, i, output, variant="vertical", absvals=False, clip=0.0, callback=None) -> ToolResult:
+        """Performs a line-detection filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        variant -- Optional variant value. Options include 'v' (vertical), 'h' (horizontal), '45', and '135' (default is 'v'). 
+        absvals -- Optional flag indicating whether outputs should be absolute values. 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def line_detection_filter_async(self, i, output, variant="vertical", absvals=False, clip=0.0, callback=None) -> ToolResult: ...
+    def line_intersections(self, input1, input2, output, callback=None) -> ToolResult:
+        """Identifies points where the features of two vector line layers intersect.
+
+        Keyword arguments:
+
+        input1 -- Input vector polyline file. 
+        input2 -- Input vector polyline file. 
+        output -- Output vector point file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def line_intersections_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def line_thinning(self, i, output, callback=None) -> ToolResult:
+        """Performs line thinning a on Boolean raster image; intended to be used with the RemoveSpurs tool.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def line_thinning_async(self, i, output, callback=None) -> ToolResult: ...
+    def linearity_index(self, i, callback=None) -> ToolResult:
+        """Calculates the linearity index for vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def linearity_index_async(self, i, callback=None) -> ToolResult: ...
+    def lines_to_polygons(self, i, output, callback=None) -> ToolResult:
+        """Converts vector polylines to polygons.
+
+        Keyword arguments:
+
+        i -- Input vector line file. 
+        output -- Output vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lines_to_polygons_async(self, i, output, callback=None) -> ToolResult: ...
+    def list_unique_values(self, i, field, output, callback=None) -> ToolResult:
+        """Lists the unique values contained in a field within a vector's attribute table.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        field -- Input field name in attribute table. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def list_unique_values_async(self, i, field, output, callback=None) -> ToolResult: ...
+    def list_unique_values_raster(self, i, callback=None) -> ToolResult:
+        """Lists the unique values contained in a field within a vector's attribute table.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def list_unique_values_raster_async(self, i, callback=None) -> ToolResult: ...
+    def ln(self, i, output, callback=None) -> ToolResult:
+        """Returns the natural logarithm of values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def ln_async(self, i, output, callback=None) -> ToolResult: ...
+    def local_hypsometric_analysis(self, i, out_mag, out_scale, min_scale=4, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult:
+        """This tool calculates a local, neighbourhood-based hypsometric integral raster.
+
+        Keyword arguments:
+
+        i -- Name of the input raster DEM file. 
+        out_mag -- Name of the openness output raster file. 
+        out_scale -- Name of the openness output raster file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        num_steps -- Number of steps. 
+        step_nonlinearity -- Step nonlinearity factor (1.0-2.0 is typical). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def local_hypsometric_analysis_async(self, i, out_mag, out_scale, min_scale=4, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult: ...
+    def local_quadratic_regression(self, dem, output, filter=3, callback=None) -> ToolResult:
+        """An implementation of the constrained quadratic regression algorithm using a flexible window size described in Wood (1996).
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file. 
+        output -- Name of the output raster file. 
+        filter -- Edge length of the filter kernel. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def local_quadratic_regression_async(self, dem, output, filter=3, callback=None) -> ToolResult: ...
+    def log10(self, i, output, callback=None) -> ToolResult:
+        """Returns the base-10 logarithm of values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def log10_async(self, i, output, callback=None) -> ToolResult: ...
+    def log2(self, i, output, callback=None) -> ToolResult:
+        """Returns the base-2 logarithm of values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def log2_async(self, i, output, callback=None) -> ToolResult: ...
+    def logistic_regression(self, inputs, training, field, scaling="Normalize", output=None, test_proportion=0.2, callback=None) -> ToolResult:
+        """Performs a logistic regression analysis using training site polygons/points and predictor rasters.
+
+        Keyword arguments:
+
+        inputs -- Names of the input predictor rasters. 
+        scaling -- Scaling method for predictors. Options include 'None', 'Normalize', and 'Standardize'. 
+        training -- Name of the input training site polygons/points shapefile. 
+        field -- Name of the attribute containing class data. 
+        output -- Name of the output raster file. 
+        test_proportion -- The proportion of the dataset to include in the test split; default is 0.2. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def logistic_regression_async(self, inputs, training, field, scaling="Normalize", output=None, test_proportion=0.2, callback=None) -> ToolResult: ...
+    def long_profile(self, d8_pntr, streams, dem, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Plots the stream longitudinal profiles for one or more rivers.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        dem -- Input raster DEM file. 
+        output -- Output HTML file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def long_profile_async(self, d8_pntr, streams, dem, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def long_profile_from_points(self, d8_pntr, points, dem, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Plots the longitudinal profiles from flow-paths initiating from a set of vector points.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        points -- Input vector points file. 
+        dem -- Input raster DEM file. 
+        output -- Output HTML file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def long_profile_from_points_async(self, d8_pntr, points, dem, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def longest_flowpath(self, dem, basins, output, callback=None) -> ToolResult:
+        """Delineates the longest flowpaths for a group of subbasins or watersheds.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        basins -- Input raster basins file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def longest_flowpath_async(self, dem, basins, output, callback=None) -> ToolResult: ...
+    def low_points_on_headwater_divides(self, dem, streams, output, callback=None) -> ToolResult:
+        """This tool locates saddle points along ridges within a digital elevation model (DEM).
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file. 
+        streams -- Name of the input stream channel raster file. 
+        output -- Name of the output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def low_points_on_headwater_divides_async(self, dem, streams, output, callback=None) -> ToolResult: ...
+    def lowest_position(self, inputs, output, callback=None) -> ToolResult:
+        """Identifies the stack position of the minimum value within a raster stack on a cell-by-cell basis.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def lowest_position_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def majority_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Assigns each cell in the output grid the most frequently occurring value (mode) in a moving window centred on each grid cell in the input raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def majority_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def map_off_terrain_objects(self, dem, output, max_slope=40.0, min_size=1, callback=None) -> ToolResult:
+        """Maps off-terrain objects in a digital elevation model (DEM).
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        max_slope -- Maximum inter-cell absolute slope. 
+        min_size -- Minimum feature size, in grid cells. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def map_off_terrain_objects_async(self, dem, output, max_slope=40.0, min_size=1, callback=None) -> ToolResult: ...
+    def max(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a MAX operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def max_absolute_overlay(self, inputs, output, callback=None) -> ToolResult:
+        """Evaluates the maximum absolute value for each grid cell from a stack of input rasters.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_absolute_overlay_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def max_anisotropy_dev(self, dem, out_mag, out_scale, max_scale, min_scale=3, step=2, callback=None) -> ToolResult:
+        """Calculates the maximum anisotropy (directionality) in elevation deviation over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_mag -- Output raster DEVmax magnitude file. 
+        out_scale -- Output raster DEVmax scale file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_anisotropy_dev_async(self, dem, out_mag, out_scale, max_scale, min_scale=3, step=2, callback=None) -> ToolResult: ...
+    def max_anisotropy_dev_signature(self, dem, points, output, max_scale, min_scale=1, step=1, callback=None) -> ToolResult:
+        """Calculates the anisotropy in deviation from mean for points over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        points -- Input vector points file. 
+        output -- Output HTML file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_anisotropy_dev_signature_async(self, dem, points, output, max_scale, min_scale=1, step=1, callback=None) -> ToolResult: ...
+    def max_branch_length(self, dem, output, log=False, callback=None) -> ToolResult:
+        """Lindsay and Seibert's (2013) branch length index is used to map drainage divides or ridge lines.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Optional flag to request the output be log-transformed. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_branch_length_async(self, dem, output, log=False, callback=None) -> ToolResult: ...
+    def max_difference_from_mean(self, dem, out_mag, out_scale, min_scale, max_scale, step=1, callback=None) -> ToolResult:
+        """Calculates the maximum difference from mean elevation over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_mag -- Output raster DIFFmax magnitude file. 
+        out_scale -- Output raster DIFFmax scale file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_difference_from_mean_async(self, dem, out_mag, out_scale, min_scale, max_scale, step=1, callback=None) -> ToolResult: ...
+    def max_downslope_elev_change(self, dem, output, callback=None) -> ToolResult:
+        """Calculates the maximum downslope change in elevation between a grid cell and its eight downslope neighbors.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_downslope_elev_change_async(self, dem, output, callback=None) -> ToolResult: ...
+    def max_elev_dev_signature(self, dem, points, output, min_scale, max_scale, step=10, callback=None) -> ToolResult:
+        """Calculates the maximum elevation deviation over a range of spatial scales and for a set of points.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        points -- Input vector points file. 
+        output -- Output HTML file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_elev_dev_signature_async(self, dem, points, output, min_scale, max_scale, step=10, callback=None) -> ToolResult: ...
+    def max_elevation_deviation(self, dem, out_mag, out_scale, min_scale, max_scale, step=1, callback=None) -> ToolResult:
+        """Calculates the maximum elevation deviation over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_mag -- Output raster DEVmax magnitude file. 
+        out_scale -- Output raster DEVmax scale file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_elevation_deviation_async(self, dem, out_mag, out_scale, min_scale, max_scale, step=1, callback=None) -> ToolResult: ...
+    def max_overlay(self, inputs, output, callback=None) -> ToolResult:
+        """Evaluates the maximum value for each grid cell from a stack of input rasters.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_overlay_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def max_upslope_elev_change(self, dem, output, callback=None) -> ToolResult:
+        """Calculates the maximum upslope change in elevation between a grid cell and its eight downslope neighbors.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_upslope_elev_change_async(self, dem, output, callback=None) -> ToolResult: ...
+    def max_upslope_flowpath_length(self, dem, output, callback=None) -> ToolResult:
+        """Measures the maximum length of all upslope flowpaths draining each grid cell.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_upslope_flowpath_length_async(self, dem, output, callback=None) -> ToolResult: ...
+    def max_upslope_value(self, dem, values, output, callback=None) -> ToolResult:
+        """Calculates the maximum upslope value from an input values raster along flowpaths.
+
+        Keyword arguments:
+
+        dem -- Input DEM; it must be depressionless. 
+        values -- Name of the input values raster file. 
+        output -- Name of the output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def max_upslope_value_async(self, dem, values, output, callback=None) -> ToolResult: ...
+    def maximal_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a mean curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def maximal_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def maximum_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Assigns each cell in the output grid the maximum value in a moving window centred on each grid cell in the input raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def maximum_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def md_inf_flow_accumulation(self, dem, output, out_type="specific contributing area", exponent=1.1, threshold=None, log=False, clip=False, callback=None) -> ToolResult:
+        """Calculates an FD8 flow accumulation raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        out_type -- Output type; one of 'cells', 'specific contributing area' (default), and 'catchment area'. 
+        exponent -- Optional exponent parameter; default is 1.1. 
+        threshold -- Optional convergence threshold parameter, in grid cells; default is infinity. 
+        log -- Optional flag to request the output be log-transformed. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def md_inf_flow_accumulation_async(self, dem, output, out_type="specific contributing area", exponent=1.1, threshold=None, log=False, clip=False, callback=None) -> ToolResult: ...
+    def mean_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a mean curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def mean_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def mean_filter(self, i, output, filterx=3, filtery=3, callback=None) -> ToolResult:
+        """Performs a mean filter (low-pass filter) on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def mean_filter_async(self, i, output, filterx=3, filtery=3, callback=None) -> ToolResult: ...
+    def median_filter(self, i, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult:
+        """Performs a median filter on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        sig_digits -- Number of significant digits. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def median_filter_async(self, i, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult: ...
+    def medoid(self, i, output, callback=None) -> ToolResult:
+        """Calculates the medoid for a series of vector features contained in a shapefile.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def medoid_async(self, i, output, callback=None) -> ToolResult: ...
+    def merge_line_segments(self, i, output, snap=0.0, callback=None) -> ToolResult:
+        """Merges vector line segments into larger features.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector file. 
+        snap -- Snap tolerance. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def merge_line_segments_async(self, i, output, snap=0.0, callback=None) -> ToolResult: ...
+    def merge_table_with_csv(self, i, pkey, csv, fkey, import_field=None, callback=None) -> ToolResult:
+        """Merge a vector's attribute table with a table contained within a CSV text file.
+
+        Keyword arguments:
+
+        i -- Input primary vector file (i.e. the table to be modified). 
+        pkey -- Primary key field. 
+        csv -- Input CSV file (i.e. source of data to be imported). 
+        fkey -- Foreign key field. 
+        import_field -- Imported field (all fields will be imported if not specified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def merge_table_with_csv_async(self, i, pkey, csv, fkey, import_field=None, callback=None) -> ToolResult: ...
+    def merge_vectors(self, inputs, output, callback=None) -> ToolResult:
+        """Combines two or more input vectors of the same ShapeType creating a single, new output vector.
+
+        Keyword arguments:
+
+        inputs -- Input vector files. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def merge_vectors_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def min(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a MIN operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def min_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def min_absolute_overlay(self, inputs, output, callback=None) -> ToolResult:
+        """Evaluates the minimum absolute value for each grid cell from a stack of input rasters.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def min_absolute_overlay_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def min_dist_classification(self, inputs, polys, field, output, threshold=None, callback=None) -> ToolResult:
+        """Performs a supervised minimum-distance classification using training site polygons and multi-spectral images.
+
+        Keyword arguments:
+
+        inputs -- Names of the input band images. 
+        polys -- Name of the input training site polygons shapefile. 
+        field -- Name of the attribute containing class name data. 
+        output -- Name of the output raster file. 
+        threshold -- Distance threshold, in z-scores; blank for none. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def min_dist_classification_async(self, inputs, polys, field, output, threshold=None, callback=None) -> ToolResult: ...
+    def min_downslope_elev_change(self, dem, output, callback=None) -> ToolResult:
+        """Calculates the minimum downslope change in elevation between a grid cell and its eight downslope neighbors.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def min_downslope_elev_change_async(self, dem, output, callback=None) -> ToolResult: ...
+    def min_max_contrast_stretch(self, i, output, min_val, max_val, num_tones=256, callback=None) -> ToolResult:
+        """Performs a min-max contrast stretch on an input greytone image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        min_val -- Lower tail clip value. 
+        max_val -- Upper tail clip value. 
+        num_tones -- Number of tones in the output image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def min_max_contrast_stretch_async(self, i, output, min_val, max_val, num_tones=256, callback=None) -> ToolResult: ...
+    def min_overlay(self, inputs, output, callback=None) -> ToolResult:
+        """Evaluates the minimum value for each grid cell from a stack of input rasters.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def min_overlay_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def minimal_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a mean curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def minimal_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def minimum_bounding_box(self, i, output, criterion="area", features=True, callback=None) -> ToolResult:
+        """Creates a vector minimum bounding rectangle around vector features.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector polygon file. 
+        criterion -- Minimization criterion; options include 'area' (default), 'length', 'width', and 'perimeter'. 
+        features -- Find the minimum bounding rectangles around each individual vector feature. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def minimum_bounding_box_async(self, i, output, criterion="area", features=True, callback=None) -> ToolResult: ...
+    def minimum_bounding_circle(self, i, output, features=True, callback=None) -> ToolResult:
+        """Delineates the minimum bounding circle (i.e. smallest enclosing circle) for a group of vectors.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector polygon file. 
+        features -- Find the minimum bounding circle around each individual vector feature. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def minimum_bounding_circle_async(self, i, output, features=True, callback=None) -> ToolResult: ...
+    def minimum_bounding_envelope(self, i, output, features=True, callback=None) -> ToolResult:
+        """Creates a vector axis-aligned minimum bounding rectangle (envelope) around vector features.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector polygon file. 
+        features -- Find the minimum bounding envelop around each individual vector feature. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def minimum_bounding_envelope_async(self, i, output, features=True, callback=None) -> ToolResult: ...
+    def minimum_convex_hull(self, i, output, features=True, callback=None) -> ToolResult:
+        """Creates a vector convex polygon around vector features.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        output -- Output vector polygon file. 
+        features -- Find the hulls around each vector feature. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def minimum_convex_hull_async(self, i, output, features=True, callback=None) -> ToolResult: ...
+    def minimum_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Assigns each cell in the output grid the minimum value in a moving window centred on each grid cell in the input raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def minimum_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def modified_k_means_clustering(self, inputs, output, out_html=None, start_clusters=1000, merge_dist=None, max_iterations=10, class_change=2.0, callback=None) -> ToolResult:
+        """Performs a modified k-means clustering operation on a multi-spectral dataset.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        out_html -- Output HTML report file. 
+        start_clusters -- Initial number of clusters. 
+        merge_dist -- Cluster merger distance. 
+        max_iterations -- Maximum number of iterations. 
+        class_change -- Minimum percent of cells changed between iterations before completion. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def modified_k_means_clustering_async(self, inputs, output, out_html=None, start_clusters=1000, merge_dist=None, max_iterations=10, class_change=2.0, callback=None) -> ToolResult: ...
+    def modify_lidar(self, i=None, output=None, statement="", callback=None) -> ToolResult:
+        """Modify points within a LiDAR point cloud based on point properties.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        statement -- Modify statement e.g. x += 5000.0. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def modify_lidar_async(self, i=None, output=None, statement="", callback=None) -> ToolResult: ...
+    def modify_no_data_value(self, i, new_value="-32768.0", callback=None) -> ToolResult:
+        """Modifies nodata values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        new_value -- New NoData value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def modify_no_data_value_async(self, i, new_value="-32768.0", callback=None) -> ToolResult: ...
+    def modulo(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a modulo operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def modulo_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def mosaic(self, output, inputs=None, method="nn", callback=None) -> ToolResult:
+        """Mosaics two or more images together.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        method -- Resampling method; options include 'nn' (nearest neighbour), 'bilinear', and 'cc' (cubic convolution). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def mosaic_async(self, output, inputs=None, method="nn", callback=None) -> ToolResult: ...
+    def mosaic_with_feathering(self, input1, input2, output, method="cc", weight=4.0, callback=None) -> ToolResult:
+        """Mosaics two images together using a feathering technique in overlapping areas to reduce edge-effects.
+
+        Keyword arguments:
+
+        input1 -- Input raster file to modify. 
+        input2 -- Input reference raster file. 
+        output -- Output raster file. 
+        method -- Resampling method; options include 'nn' (nearest neighbour), 'bilinear', and 'cc' (cubic convolution). 
+        weight -- . 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def mosaic_with_feathering_async(self, input1, input2, output, method="cc", weight=4.0, callback=None) -> ToolResult: ...
+    def multi_part_to_single_part(self, i, output, exclude_holes=True, callback=None) -> ToolResult:
+        """Converts a vector file containing multi-part features into a vector containing only single-part features.
+
+        Keyword arguments:
+
+        i -- Input vector line or polygon file. 
+        output -- Output vector line or polygon file. 
+        exclude_holes -- Exclude hole parts from the feature splitting? (holes will continue to belong to their features in output.). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multi_part_to_single_part_async(self, i, output, exclude_holes=True, callback=None) -> ToolResult: ...
+    def multidirectional_hillshade(self, dem, output, altitude=45.0, zfactor=None, full_mode=False, callback=None) -> ToolResult:
+        """Calculates a multi-direction hillshade raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        altitude -- Illumination source altitude in degrees. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        full_mode -- Optional flag indicating whether to use full 360-degrees of illumination sources. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multidirectional_hillshade_async(self, dem, output, altitude=45.0, zfactor=None, full_mode=False, callback=None) -> ToolResult: ...
+    def multiply(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a multiplication operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiply_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def multiply_overlay(self, inputs, output, callback=None) -> ToolResult:
+        """Calculates the sum for each grid cell from a group of raster images.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiply_overlay_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def multiscale_curvatures(self, dem, out_mag, curv_type="ProfileCurv", out_scale=None, min_scale=0, step=1, num_steps=1, step_nonlinearity=1.0, log=True, standardize=False, callback=None) -> ToolResult:
+        """This tool calculates several multiscale curvatures and curvature-based indices from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        curv_type -- Curvature type. 
+        out_mag -- Output raster magnitude file. 
+        out_scale -- Output raster scale file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        num_steps -- Number of steps. 
+        step_nonlinearity -- Step nonlinearity factor (1.0-2.0 is typical). 
+        log -- Display output values using a log-scale. 
+        standardize -- Should each scale be standardized to z-scores?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiscale_curvatures_async(self, dem, out_mag, curv_type="ProfileCurv", out_scale=None, min_scale=0, step=1, num_steps=1, step_nonlinearity=1.0, log=True, standardize=False, callback=None) -> ToolResult: ...
+    def multiscale_elevation_percentile(self, dem, out_mag, out_scale, sig_digits=3, min_scale=4, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult:
+        """Calculates surface roughness over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_mag -- Output raster roughness magnitude file. 
+        out_scale -- Output raster roughness scale file. 
+        sig_digits -- Number of significant digits. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        num_steps -- Number of steps. 
+        step_nonlinearity -- Step nonlinearity factor (1.0-2.0 is typical). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiscale_elevation_percentile_async(self, dem, out_mag, out_scale, sig_digits=3, min_scale=4, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult: ...
+    def multiscale_roughness(self, dem, out_mag, out_scale, max_scale, min_scale=1, step=1, callback=None) -> ToolResult:
+        """Calculates surface roughness over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_mag -- Output raster roughness magnitude file. 
+        out_scale -- Output raster roughness scale file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiscale_roughness_async(self, dem, out_mag, out_scale, max_scale, min_scale=1, step=1, callback=None) -> ToolResult: ...
+    def multiscale_roughness_signature(self, dem, points, output, max_scale, min_scale=1, step=1, callback=None) -> ToolResult:
+        """Calculates the surface roughness for points over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        points -- Input vector points file. 
+        output -- Output HTML file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiscale_roughness_signature_async(self, dem, points, output, max_scale, min_scale=1, step=1, callback=None) -> ToolResult: ...
+    def multiscale_std_dev_normals(self, dem, out_mag, out_scale, min_scale=1, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult:
+        """Calculates surface roughness over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        out_mag -- Output raster roughness magnitude file. 
+        out_scale -- Output raster roughness scale file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        num_steps -- Number of steps. 
+        step_nonlinearity -- Step nonlinearity factor (1.0-2.0 is typical). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiscale_std_dev_normals_async(self, dem, out_mag, out_scale, min_scale=1, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult: ...
+    def multiscale_std_dev_normals_signature(self, dem, points, output, min_scale=1, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult:
+        """Calculates the surface roughness for points over a range of spatial scales.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        points -- Input vector points file. 
+        output -- Output HTML file. 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        step -- Step size as any positive non-zero integer. 
+        num_steps -- Number of steps. 
+        step_nonlinearity -- Step nonlinearity factor (1.0-2.0 is typical). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiscale_std_dev_normals_signature_async(self, dem, points, output, min_scale=1, step=1, num_steps=10, step_nonlinearity=1.0, callback=None) -> ToolResult: ...
+    def multiscale_topographic_position_image(self, local, meso, broad, output, hillshade=None, lightness=1.2, callback=None) -> ToolResult:
+        """Creates a multiscale topographic position image from three DEVmax rasters of differing spatial scale ranges.
+
+        Keyword arguments:
+
+        local -- Input local-scale topographic position (DEVmax) raster file. 
+        meso -- Input meso-scale topographic position (DEVmax) raster file. 
+        broad -- Input broad-scale topographic position (DEVmax) raster file. 
+        hillshade -- Input optional hillshade raster file. Note: a multi-directional (360-degree option) hillshade tends to work best in this application. 
+        output -- Output raster file. 
+        lightness -- Image lightness value (default is 1.2). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def multiscale_topographic_position_image_async(self, local, meso, broad, output, hillshade=None, lightness=1.2, callback=None) -> ToolResult: ...
+    def narrowness_index(self, i, output, callback=None) -> ToolResult:
+        """Calculates the narrowness of raster polygons.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def narrowness_index_async(self, i, output, callback=None) -> ToolResult: ...
+    def natural_neighbour_interpolation(self, i, output, field=None, use_z=False, cell_size=None, base=None, clip=True, callback=None) -> ToolResult:
+        """Creates a raster grid based on Sibson's natural neighbour method.
+
+        Keyword arguments:
+
+        i -- Input vector points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use the 'z' dimension of the Shapefile's geometry instead of an attribute field?. 
+        output -- Output raster file. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        clip -- Clip the data to the convex hull of the points?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def natural_neighbour_interpolation_async(self, i, output, field=None, use_z=False, cell_size=None, base=None, clip=True, callback=None) -> ToolResult: ...
+    def nearest_neighbour_gridding(self, i, field, output, use_z=False, cell_size=None, base=None, max_dist=None, callback=None) -> ToolResult:
+        """Creates a raster grid based on a set of vector points and assigns grid values using the nearest neighbour.
+
+        Keyword arguments:
+
+        i -- Input vector Points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use z-coordinate instead of field?. 
+        output -- Output raster file. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        max_dist -- Maximum search distance (optional). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def nearest_neighbour_gridding_async(self, i, field, output, use_z=False, cell_size=None, base=None, max_dist=None, callback=None) -> ToolResult: ...
+    def negate(self, i, output, callback=None) -> ToolResult:
+        """Changes the sign of values in a raster or the 0-1 values of a Boolean raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def negate_async(self, i, output, callback=None) -> ToolResult: ...
+    def new_raster_from_base(self, base, output, value="nodata", data_type="float", cell_size=None, callback=None) -> ToolResult:
+        """Creates a new raster using a base image.
+
+        Keyword arguments:
+
+        base -- Input base raster file. 
+        output -- Output raster file. 
+        value -- Constant value to fill raster with; either 'nodata' or numeric value. 
+        data_type -- Output raster data type; options include 'double' (64-bit), 'float' (32-bit), and 'integer' (signed 16-bit) (default is 'float'). 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def new_raster_from_base_async(self, base, output, value="nodata", data_type="float", cell_size=None, callback=None) -> ToolResult: ...
+    def normal_vectors(self, i, output, radius=1.0, callback=None) -> ToolResult:
+        """Calculates normal vectors for points within a LAS file and stores these data (XYZ vector components) in the RGB field.
+
+        Keyword arguments:
+
+        i -- Input LiDAR file. 
+        output -- Output LiDAR file. 
+        radius -- Search Radius. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def normal_vectors_async(self, i, output, radius=1.0, callback=None) -> ToolResult: ...
+    def normalize_lidar(self, i, output, dtm, callback=None) -> ToolResult:
+        """Normalizes a LiDAR point cloud.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR file. 
+        output -- Name of the output LiDAR file. 
+        dtm -- Name of the input digital terrain model (DTM) raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def normalize_lidar_async(self, i, output, dtm, callback=None) -> ToolResult: ...
+    def normalized_difference_index(self, input1, input2, output, clip=0.0, correction=0.0, callback=None) -> ToolResult:
+        """Calculate a normalized-difference index (NDI) from two bands of multispectral image data.
+
+        Keyword arguments:
+
+        input1 -- Input image 1 (e.g. near-infrared band). 
+        input2 -- Input image 2 (e.g. red band). 
+        output -- Output raster file. 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        correction -- Optional adjustment value (e.g. 1, or 0.16 for the optimal soil adjusted vegetation index, OSAVI). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def normalized_difference_index_async(self, input1, input2, output, clip=0.0, correction=0.0, callback=None) -> ToolResult: ...
+    def Not(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a logical NOT operator on two Boolean raster images.
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def Not_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def not_equal_to(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a not-equal-to comparison operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def not_equal_to_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def num_downslope_neighbours(self, dem, output, callback=None) -> ToolResult:
+        """Calculates the number of downslope neighbours to each grid cell in a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def num_downslope_neighbours_async(self, dem, output, callback=None) -> ToolResult: ...
+    def num_inflowing_neighbours(self, dem, output, callback=None) -> ToolResult:
+        """Computes the number of inflowing neighbours to each cell in an input DEM based on the D8 algorithm.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def num_inflowing_neighbours_async(self, dem, output, callback=None) -> ToolResult: ...
+    def num_upslope_neighbours(self, dem, output, callback=None) -> ToolResult:
+        """Calculates the number of upslope neighbours to each grid cell in a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def num_upslope_neighbours_async(self, dem, output, callback=None) -> ToolResult: ...
+    def olympic_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Performs an olympic smoothing filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def olympic_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def opening(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """An opening is a mathematical morphology operation involving a dilation (max filter) of an erosion (min filter) set.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def opening_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def openness(self, i, pos_output, neg_output, dist=20, callback=None) -> ToolResult:
+        """This tool calculates the topographic openness index from an input DEM.
+
+        Keyword arguments:
+
+        i -- Name of the input raster DEM file. 
+        pos_output -- Name of the positive openness output raster file. 
+        neg_output -- Name of the negative openness output raster file. 
+        dist -- Search distance, in grid cells. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def openness_async(self, i, pos_output, neg_output, dist=20, callback=None) -> ToolResult: ...
+    def Or(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a logical OR operator on two Boolean raster images.
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def Or_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def paired_sample_t_test(self, input1, input2, output, num_samples=None, callback=None) -> ToolResult:
+        """Performs a 2-sample K-S test for significant differences on two input rasters.
+
+        Keyword arguments:
+
+        input1 -- First input raster file. 
+        input2 -- Second input raster file. 
+        output -- Output HTML file. 
+        num_samples -- Number of samples. Leave blank to use whole image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def paired_sample_t_test_async(self, input1, input2, output, num_samples=None, callback=None) -> ToolResult: ...
+    def panchromatic_sharpening(self, pan, output, red=None, green=None, blue=None, composite=None, method="brovey", callback=None) -> ToolResult:
+        """Increases the spatial resolution of image data by combining multispectral bands with panchromatic data.
+
+        Keyword arguments:
+
+        red -- Input red band image file. Optionally specified if colour-composite not specified. 
+        green -- Input green band image file. Optionally specified if colour-composite not specified. 
+        blue -- Input blue band image file. Optionally specified if colour-composite not specified. 
+        composite -- Input colour-composite image file. Only used if individual bands are not specified. 
+        pan -- Input panchromatic band file. 
+        output -- Output colour composite file. 
+        method -- Options include 'brovey' (default) and 'ihs'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def panchromatic_sharpening_async(self, pan, output, red=None, green=None, blue=None, composite=None, method="brovey", callback=None) -> ToolResult: ...
+    def parallelepiped_classification(self, inputs, polys, field, output, callback=None) -> ToolResult:
+        """Performs a supervised parallelepiped classification using training site polygons and multi-spectral images.
+
+        Keyword arguments:
+
+        inputs -- Name of the input band images. 
+        polys -- Name of the input training site polygons shapefile. 
+        field -- Name of the attribute containing class name data. 
+        output -- Name of the output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def parallelepiped_classification_async(self, inputs, polys, field, output, callback=None) -> ToolResult: ...
+    def patch_orientation(self, i, callback=None) -> ToolResult:
+        """Calculates the orientation of vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def patch_orientation_async(self, i, callback=None) -> ToolResult: ...
+    def pennock_landform_class(self, dem, output, slope=3.0, prof=0.1, plan=0.0, zfactor=None, callback=None) -> ToolResult:
+        """Classifies hillslope zones based on slope, profile curvature, and plan curvature.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        slope -- Slope threshold value, in degrees (default is 3.0). 
+        prof -- Profile curvature threshold value (default is 0.1). 
+        plan -- Plan curvature threshold value (default is 0.0). 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def pennock_landform_class_async(self, dem, output, slope=3.0, prof=0.1, plan=0.0, zfactor=None, callback=None) -> ToolResult: ...
+    def percent_elev_range(self, dem, output, filterx=3, filtery=3, callback=None) -> ToolResult:
+        """Calculates percent of elevation range from a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def percent_elev_range_async(self, dem, output, filterx=3, filtery=3, callback=None) -> ToolResult: ...
+    def percent_equal_to(self, inputs, comparison, output, callback=None) -> ToolResult:
+        """Calculates the percentage of a raster stack that have cell values equal to an input on a cell-by-cell basis.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        comparison -- Input comparison raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def percent_equal_to_async(self, inputs, comparison, output, callback=None) -> ToolResult: ...
+    def percent_greater_than(self, inputs, comparison, output, callback=None) -> ToolResult:
+        """Calculates the percentage of a raster stack that have cell values greater than an input on a cell-by-cell basis.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        comparison -- Input comparison raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def percent_greater_than_async(self, inputs, comparison, output, callback=None) -> ToolResult: ...
+    def percent_less_than(self, inputs, comparison, output, callback=None) -> ToolResult:
+        """Calculates the percentage of a raster stack that have cell values less than an input on a cell-by-cell basis.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        comparison -- Input comparison raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def percent_less_than_async(self, inputs, comparison, output, callback=None) -> ToolResult: ...
+    def percentage_contrast_stretch(self, i, output, clip=1.0, tail="both", num_tones=256, callback=None) -> ToolResult:
+        """Performs a percentage linear contrast stretch on input images.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        tail -- Specified which tails to clip; options include 'upper', 'lower', and 'both' (default is 'both'). 
+        num_tones -- Number of tones in the output image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def percentage_contrast_stretch_async(self, i, output, clip=1.0, tail="both", num_tones=256, callback=None) -> ToolResult: ...
+    def percentile_filter(self, i, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult:
+        """Performs a percentile filter on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        sig_digits -- Number of significant digits. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def percentile_filter_async(self, i, output, filterx=11, filtery=11, sig_digits=2, callback=None) -> ToolResult: ...
+    def perimeter_area_ratio(self, i, callback=None) -> ToolResult:
+        """Calculates the perimeter-area ratio of vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def perimeter_area_ratio_async(self, i, callback=None) -> ToolResult: ...
+    def phi_coefficient(self, input1, input2, output, callback=None) -> ToolResult:
+        """This tool performs a binary classification accuracy assessment.
+
+        Keyword arguments:
+
+        input1 -- Name of the first input raster image file. 
+        input2 -- Name of the second input raster image file. 
+        output -- Name of the output HTML file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def phi_coefficient_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def pick_from_list(self, inputs, pos_input, output, callback=None) -> ToolResult:
+        """Outputs the value from a raster stack specified by a position raster.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        pos_input -- Input position raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def pick_from_list_async(self, inputs, pos_input, output, callback=None) -> ToolResult: ...
+    def piecewise_contrast_stretch(self, i, output, function="", greytones=1024, callback=None) -> ToolResult:
+        """Performs a piecewise contrast stretch on an input image.
+
+        Keyword arguments:
+
+        i -- Name of the input raster image file. 
+        output -- Name of the output raster image file. 
+        function -- Piecewise function break-points e.g. '(50, 0.1); (150, 0.8); (255; 1.0). 
+        greytones -- Number of greytones in the output image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def piecewise_contrast_stretch_async(self, i, output, function="", greytones=1024, callback=None) -> ToolResult: ...
+    def plan_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a plan (contour) curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def plan_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def polygon_area(self, i, callback=None) -> ToolResult:
+        """Calculates the area of vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def polygon_area_async(self, i, callback=None) -> ToolResult: ...
+    def polygon_long_axis(self, i, output, callback=None) -> ToolResult:
+        """Used to map the long axis of polygon features.
+
+        Keyword arguments:
+
+        i -- Input vector polygons file. 
+        output -- Output vector polyline file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def polygon_long_axis_async(self, i, output, callback=None) -> ToolResult: ...
+    def polygon_perimeter(self, i, callback=None) -> ToolResult:
+        """Calculates the perimeter of vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def polygon_perimeter_async(self, i, callback=None) -> ToolResult: ...
+    def polygon_short_axis(self, i, output, callback=None) -> ToolResult:
+        """Used to map the short axis of polygon features.
+
+        Keyword arguments:
+
+        i -- Input vector polygons file. 
+        output -- Output vector polyline file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def polygon_short_axis_async(self, i, output, callback=None) -> ToolResult: ...
+    def polygonize(self, inputs, output, callback=None) -> ToolResult:
+        """Creates a polygon layer from two or more intersecting line features contained in one or more input vector line files.
+
+        Keyword arguments:
+
+        inputs -- Input vector polyline file. 
+        output -- Output vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def polygonize_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def polygons_to_lines(self, i, output, callback=None) -> ToolResult:
+        """Converts vector polygons to polylines.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        output -- Output vector lines file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def polygons_to_lines_async(self, i, output, callback=None) -> ToolResult: ...
+    def power(self, input1, input2, output, callback=None) -> ToolResult:
+        """Raises the values in grid cells of one rasters, or a constant value, by values in another raster or constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def power_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def prewitt_filter(self, i, output, clip=0.0, callback=None) -> ToolResult:
+        """Performs a Prewitt edge-detection filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def prewitt_filter_async(self, i, output, clip=0.0, callback=None) -> ToolResult: ...
+    def principal_component_analysis(self, inputs, output, num_comp=None, standardized=False, callback=None) -> ToolResult:
+        """Performs a principal component analysis (PCA) on a multi-spectral dataset.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output HTML report file. 
+        num_comp -- Number of component images to output; <= to num. input images. 
+        standardized -- Perform standardized PCA?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def principal_component_analysis_async(self, inputs, output, num_comp=None, standardized=False, callback=None) -> ToolResult: ...
+    def print_geo_tiff_tags(self, i, callback=None) -> ToolResult:
+        """Prints the tags within a GeoTIFF.
+
+        Keyword arguments:
+
+        i -- Input GeoTIFF file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def print_geo_tiff_tags_async(self, i, callback=None) -> ToolResult: ...
+    def profile(self, lines, surface, output, callback=None) -> ToolResult:
+        """Plots profiles from digital surface models.
+
+        Keyword arguments:
+
+        lines -- Input vector line file. 
+        surface -- Input raster surface file. 
+        output -- Output HTML file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def profile_async(self, lines, surface, output, callback=None) -> ToolResult: ...
+    def profile_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a profile curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def profile_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def qin_flow_accumulation(self, dem, output, out_type="specific contributing area", exponent=10.0, max_slope=45.0, threshold=None, log=False, clip=False, callback=None) -> ToolResult:
+        """Calculates Qin et al. (2007) flow accumulation.
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file; must be depressionless. 
+        output -- Name of the output raster file. 
+        out_type -- Output type; one of 'cells', 'specific contributing area' (default), and 'catchment area'. 
+        exponent -- Optional upper-bound exponent parameter; default is 10.0. 
+        max_slope -- Optional upper-bound slope parameter, in degrees (0-90); default is 45.0. 
+        threshold -- Optional convergence threshold parameter, in grid cells; default is infinity. 
+        log -- Log-transform the output values?. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def qin_flow_accumulation_async(self, dem, output, out_type="specific contributing area", exponent=10.0, max_slope=45.0, threshold=None, log=False, clip=False, callback=None) -> ToolResult: ...
+    def quantiles(self, i, output, num_quantiles=5, callback=None) -> ToolResult:
+        """Transforms raster values into quantiles.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        num_quantiles -- Number of quantiles. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def quantiles_async(self, i, output, num_quantiles=5, callback=None) -> ToolResult: ...
+    def quinn_flow_accumulation(self, dem, output, out_type="specific contributing area", exponent=1.0, threshold=None, log=False, clip=False, callback=None) -> ToolResult:
+        """Calculates Quinn et al. (1995) flow accumulation.
+
+        Keyword arguments:
+
+        dem -- Name of the input DEM raster file; must be depressionless. 
+        output -- Name of the output raster file. 
+        out_type -- Output type; one of 'cells', 'specific contributing area' (default), and 'catchment area'. 
+        exponent -- Optional exponent parameter; default is 1.0. 
+        threshold -- Optional convergence threshold parameter, in grid cells; default is infinity. 
+        log -- Log-transform the output values?. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def quinn_flow_accumulation_async(self, dem, output, out_type="specific contributing area", exponent=1.0, threshold=None, log=False, clip=False, callback=None) -> ToolResult: ...
+    def radial_basis_function_interpolation(self, i, field, output, use_z=False, radius=None, min_points=None, func_type="ThinPlateSpline", poly_order="none", weight=0.1, cell_size=None, base=None, callback=None) -> ToolResult:
+        """Interpolates vector points into a raster surface using a radial basis function scheme.
+
+        Keyword arguments:
+
+        i -- Input vector points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use z-coordinate instead of field?. 
+        output -- Output raster file. 
+        radius -- Search Radius (in map units). 
+        min_points -- Minimum number of points. 
+        func_type -- Radial basis function type; options are 'ThinPlateSpline' (default), 'PolyHarmonic', 'Gaussian', 'MultiQuadric', 'InverseMultiQuadric'. 
+        poly_order -- Polynomial order; options are 'none' (default), 'constant', 'affine'. 
+        weight -- Weight parameter used in basis function. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def radial_basis_function_interpolation_async(self, i, field, output, use_z=False, radius=None, min_points=None, func_type="ThinPlateSpline", poly_order="none", weight=0.1, cell_size=None, base=None, callback=None) -> ToolResult: ...
+    def radius_of_gyration(self, i, output, text_output=False, callback=None) -> ToolResult:
+        """Calculates the distance of cells from their polygon's centroid.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        text_output -- Optional text output. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def radius_of_gyration_async(self, i, output, text_output=False, callback=None) -> ToolResult: ...
+    def raise_walls(self, i, dem, output, breach=None, height=100.0, callback=None) -> ToolResult:
+        """Raises walls in a DEM along a line or around a polygon, e.g. a watershed.
+
+        Keyword arguments:
+
+        i -- Input vector lines or polygons file. 
+        breach -- Optional input vector breach lines. 
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        height -- Wall height. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raise_walls_async(self, i, dem, output, breach=None, height=100.0, callback=None) -> ToolResult: ...
+    def random_field(self, base, output, callback=None) -> ToolResult:
+        """Creates an image containing random values.
+
+        Keyword arguments:
+
+        base -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def random_field_async(self, base, output, callback=None) -> ToolResult: ...
+    def random_forest_classification(self, inputs, training, field, output=None, split_criterion="Gini", n_trees=500, min_samples_leaf=1, min_samples_split=2, test_proportion=0.2, callback=None) -> ToolResult:
+        """Performs a supervised random forest classification using training site polygons/points and predictor rasters.
+
+        Keyword arguments:
+
+        inputs -- Names of the input predictor rasters. 
+        training -- Name of the input training site polygons/points shapefile. 
+        field -- Name of the attribute containing class data. 
+        output -- Name of the output raster file. 
+        split_criterion -- Split criterion to use when building a tree. Options include 'Gini', 'Entropy', and 'ClassificationError'. 
+        n_trees -- The number of trees in the forest. 
+        min_samples_leaf -- The minimum number of samples required to be at a leaf node. 
+        min_samples_split -- The minimum number of samples required to split an internal node. 
+        test_proportion -- The proportion of the dataset to include in the test split; default is 0.2. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def random_forest_classification_async(self, inputs, training, field, output=None, split_criterion="Gini", n_trees=500, min_samples_leaf=1, min_samples_split=2, test_proportion=0.2, callback=None) -> ToolResult: ...
+    def random_forest_regression(self, inputs, training, field, output=None, n_trees=100, min_samples_leaf=1, min_samples_split=2, test_proportion=0.2, callback=None) -> ToolResult:
+        """Performs a random forest regression analysis using training site data and predictor rasters.
+
+        Keyword arguments:
+
+        inputs -- Names of the input predictor rasters. 
+        training -- Name of the input training site points shapefile. 
+        field -- Name of the attribute containing response variable name data. 
+        output -- Name of the output raster file. This parameter is optional. When unspecified, the tool will only build the model. When specified, the tool will use the built model and predictor rasters to perform a spatial prediction. 
+        n_trees -- The number of trees in the forest. 
+        min_samples_leaf -- The minimum number of samples required to be at a leaf node. 
+        min_samples_split -- The minimum number of samples required to split an internal node. 
+        test_proportion -- The proportion of the dataset to include in the test split; default is 0.2. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def random_forest_regression_async(self, inputs, training, field, output=None, n_trees=100, min_samples_leaf=1, min_samples_split=2, test_proportion=0.2, callback=None) -> ToolResult: ...
+    def random_sample(self, base, output, num_samples=1000, callback=None) -> ToolResult:
+        """Creates an image containing randomly located sample grid cells with unique IDs.
+
+        Keyword arguments:
+
+        base -- Input raster file. 
+        output -- Output raster file. 
+        num_samples -- Number of samples. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def random_sample_async(self, base, output, num_samples=1000, callback=None) -> ToolResult: ...
+    def range_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Assigns each cell in the output grid the range of values in a moving window centred on each grid cell in the input raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def range_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def raster_area(self, i, output=None, out_text=False, units="grid cells", zero_back=False, callback=None) -> ToolResult:
+        """Calculates the area of polygons or classes within a raster image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        out_text -- Would you like to output polygon areas to text?. 
+        units -- Area units; options include 'grid cells' and 'map units'. 
+        zero_back -- Flag indicating whether zero values should be treated as a background. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_area_async(self, i, output=None, out_text=False, units="grid cells", zero_back=False, callback=None) -> ToolResult: ...
+    def raster_calculator(self, output, statement="", callback=None) -> ToolResult:
+        """Performs a complex mathematical operations on one or more input raster images on a cell-to-cell basis.
+
+        Keyword arguments:
+
+        statement -- Statement e.g. cos("raster1") * 35.0 + "raster2". This statement must be a valid Rust statement. 
+        output -- Name of the output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_calculator_async(self, output, statement="", callback=None) -> ToolResult: ...
+    def raster_cell_assignment(self, i, output, assign="column", callback=None) -> ToolResult:
+        """Assign row or column number to cells.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        assign -- Which variable would you like to assign to grid cells? Options include 'column', 'row', 'x', and 'y'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_cell_assignment_async(self, i, output, assign="column", callback=None) -> ToolResult: ...
+    def raster_histogram(self, i, output, callback=None) -> ToolResult:
+        """Creates a histogram from raster values.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_histogram_async(self, i, output, callback=None) -> ToolResult: ...
+    def raster_perimeter(self, i, output=None, out_text=False, units="grid cells", zero_back=False, callback=None) -> ToolResult:
+        """Calculates the perimeters of polygons or classes within a raster image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        out_text -- Would you like to output polygon areas to text?. 
+        units -- Area units; options include 'grid cells' and 'map units'. 
+        zero_back -- Flag indicating whether zero values should be treated as a background. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_perimeter_async(self, i, output=None, out_text=False, units="grid cells", zero_back=False, callback=None) -> ToolResult: ...
+    def raster_streams_to_vector(self, streams, d8_pntr, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Converts a raster stream file into a vector file.
+
+        Keyword arguments:
+
+        streams -- Input raster streams file. 
+        d8_pntr -- Input raster D8 pointer file. 
+        output -- Output vector file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_streams_to_vector_async(self, streams, d8_pntr, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def raster_summary_stats(self, i, callback=None) -> ToolResult:
+        """Measures a rasters min, max, average, standard deviation, num. non-nodata cells, and total.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_summary_stats_async(self, i, callback=None) -> ToolResult: ...
+    def raster_to_vector_lines(self, i, output, callback=None) -> ToolResult:
+        """Converts a raster lines features into a vector of the POLYLINE shapetype.
+
+        Keyword arguments:
+
+        i -- Input raster lines file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_to_vector_lines_async(self, i, output, callback=None) -> ToolResult: ...
+    def raster_to_vector_points(self, i, output, callback=None) -> ToolResult:
+        """Converts a raster dataset to a vector of the POINT shapetype.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output vector points file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_to_vector_points_async(self, i, output, callback=None) -> ToolResult: ...
+    def raster_to_vector_polygons(self, i, output, callback=None) -> ToolResult:
+        """Converts a raster dataset to a vector of the POLYGON shapetype.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output vector polygons file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def raster_to_vector_polygons_async(self, i, output, callback=None) -> ToolResult: ...
+    def rasterize_streams(self, streams, base, output, nodata=True, feature_id=False, callback=None) -> ToolResult:
+        """Rasterizes vector streams based on Lindsay (2016) method.
+
+        Keyword arguments:
+
+        streams -- Input vector streams file. 
+        base -- Input base raster file. 
+        output -- Output raster file. 
+        nodata -- Use NoData value for background?. 
+        feature_id -- Use feature number as output value?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def rasterize_streams_async(self, streams, base, output, nodata=True, feature_id=False, callback=None) -> ToolResult: ...
+    def reciprocal(self, i, output, callback=None) -> ToolResult:
+        """Returns the reciprocal (i.e. 1 / z) of values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def reciprocal_async(self, i, output, callback=None) -> ToolResult: ...
+    def reclass(self, i, output, reclass_vals, assign_mode=False, callback=None) -> ToolResult:
+        """Reclassifies the values in a raster image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        reclass_vals -- Reclassification triplet values (new value; from value; to less than), e.g. '0.0;0.0;1.0;1.0;1.0;2.0'. 
+        assign_mode -- Optional Boolean flag indicating whether to operate in assign mode, reclass_vals values are interpreted as new value; old value pairs. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def reclass_async(self, i, output, reclass_vals, assign_mode=False, callback=None) -> ToolResult: ...
+    def reclass_equal_interval(self, i, output, interval=10.0, start_val=None, end_val=None, callback=None) -> ToolResult:
+        """Reclassifies the values in a raster image based on equal-ranges.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        interval -- Class interval size. 
+        start_val -- Optional starting value (default is input minimum value). 
+        end_val -- Optional ending value (default is input maximum value). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def reclass_equal_interval_async(self, i, output, interval=10.0, start_val=None, end_val=None, callback=None) -> ToolResult: ...
+    def reclass_from_file(self, i, reclass_file, output, callback=None) -> ToolResult:
+        """Reclassifies the values in a raster image using reclass ranges in a text file.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        reclass_file -- Input text file containing reclass ranges. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def reclass_from_file_async(self, i, reclass_file, output, callback=None) -> ToolResult: ...
+    def reconcile_multiple_headers(self, i, region_field, yield_field, output, radius=None, min_yield=None, max_yield=None, mean_tonnage=None, callback=None) -> ToolResult:
+        """This tool adjusts the crop yield values for data sets collected with multiple headers or combines.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        region_field -- Name of the attribute containing region data. 
+        yield_field -- Name of the attribute containing yield data. 
+        output -- Name of the output points shapefile. 
+        radius -- Optional search radius, in metres. Only specify this value if you want to calculate locally normalized yield. 
+        min_yield -- Minimum yield value in output. 
+        max_yield -- Maximum yield value in output. 
+        mean_tonnage -- Use this optional parameter to force the output to have a certain overall average tonnage. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def reconcile_multiple_headers_async(self, i, region_field, yield_field, output, radius=None, min_yield=None, max_yield=None, mean_tonnage=None, callback=None) -> ToolResult: ...
+    def recover_flightline_info(self, i, output, max_time_diff=5.0, pt_src_id=False, user_data=False, rgb=False, callback=None) -> ToolResult:
+        """Associates LiDAR points by their flightlines.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        max_time_diff -- Maximum in-flightline time difference (seconds). 
+        pt_src_id -- Add flightline information to the point source ID. 
+        user_data -- Add flightline information to the user data. 
+        rgb -- Add flightline information to the RGB colour data. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def recover_flightline_info_async(self, i, output, max_time_diff=5.0, pt_src_id=False, user_data=False, rgb=False, callback=None) -> ToolResult: ...
+    def recreate_pass_lines(self, i, yield_field_name, output_lines, output_points, max_change_in_heading=25.0, ignore_zeros=False, callback=None) -> ToolResult:
+        """This tool can be used to approximate the harvester pass lines from yield points.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        yield_field_name -- Name of the attribute containing yield data. 
+        output_lines -- Name of the output pass lines shapefile. 
+        output_points -- Name of the output points shapefile. 
+        max_change_in_heading -- Max change in heading. 
+        ignore_zeros -- Ignore zero-valued yield points?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def recreate_pass_lines_async(self, i, yield_field_name, output_lines, output_points, max_change_in_heading=25.0, ignore_zeros=False, callback=None) -> ToolResult: ...
+    def reinitialize_attribute_table(self, i, callback=None) -> ToolResult:
+        """Reinitializes a vector's attribute table deleting all fields but the feature ID (FID).
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def reinitialize_attribute_table_async(self, i, callback=None) -> ToolResult: ...
+    def related_circumscribing_circle(self, i, callback=None) -> ToolResult:
+        """Calculates the related circumscribing circle of vector polygons.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def related_circumscribing_circle_async(self, i, callback=None) -> ToolResult: ...
+    def relative_aspect(self, dem, output, azimuth=0.0, zfactor=None, callback=None) -> ToolResult:
+        """Calculates relative aspect (relative to a user-specified direction) from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        azimuth -- Illumination source azimuth. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def relative_aspect_async(self, dem, output, azimuth=0.0, zfactor=None, callback=None) -> ToolResult: ...
+    def relative_topographic_position(self, dem, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Calculates the relative topographic position index from a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def relative_topographic_position_async(self, dem, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def remove_field_edge_points(self, i, output, dist=None, max_change_in_heading=25.0, flag_edges=False, callback=None) -> ToolResult:
+        """This tool can be used to remove, or flag, most of the points along the edges from a crop yield data set.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        output -- Name of the output points shapefile. 
+        dist -- Average distance between passes, in meters. 
+        max_change_in_heading -- Max change in heading. 
+        flag_edges -- Don't remove edge points, just flag them in the attribute table?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def remove_field_edge_points_async(self, i, output, dist=None, max_change_in_heading=25.0, flag_edges=False, callback=None) -> ToolResult: ...
+    def remove_off_terrain_objects(self, dem, output, filter=11, slope=15.0, callback=None) -> ToolResult:
+        """Removes off-terrain objects from a raster digital elevation model (DEM).
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filter -- Filter size (cells). 
+        slope -- Slope threshold value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def remove_off_terrain_objects_async(self, dem, output, filter=11, slope=15.0, callback=None) -> ToolResult: ...
+    def remove_polygon_holes(self, i, output, callback=None) -> ToolResult:
+        """Removes holes within the features of a vector polygon file.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        output -- Output vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def remove_polygon_holes_async(self, i, output, callback=None) -> ToolResult: ...
+    def remove_raster_polygon_holes(self, i, output, threshold=3, use_diagonals=True, callback=None) -> ToolResult:
+        """Removes polygon holes, or 'donut-holes', from raster polygons.
+
+        Keyword arguments:
+
+        i -- Name of the input raster image file. 
+        output -- Name of the output raster file. 
+        threshold -- Maximum size of removed holes, in grid cells. Blank for no threshold, i.e. remove all holes. 
+        use_diagonals -- Use diagonal neighbours during clumping operation. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def remove_raster_polygon_holes_async(self, i, output, threshold=3, use_diagonals=True, callback=None) -> ToolResult: ...
+    def remove_short_streams(self, d8_pntr, streams, output, min_length, esri_pntr=False, callback=None) -> ToolResult:
+        """Removes short first-order streams from a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        min_length -- Minimum tributary length (in map units) used for network pruning. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def remove_short_streams_async(self, d8_pntr, streams, output, min_length, esri_pntr=False, callback=None) -> ToolResult: ...
+    def remove_spurs(self, i, output, iterations=10, callback=None) -> ToolResult:
+        """Removes the spurs (pruning operation) from a Boolean line image; intended to be used on the output of the LineThinning tool.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        iterations -- Maximum number of iterations. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def remove_spurs_async(self, i, output, iterations=10, callback=None) -> ToolResult: ...
+    def repair_stream_vector_topology(self, i, output, dist="", callback=None) -> ToolResult:
+        """This tool resolves topological errors and inconsistencies associated with digitized vector streams.
+
+        Keyword arguments:
+
+        i -- Name of the input lines vector file. 
+        output -- Name of the output lines vector file. 
+        dist -- Snap distance, in xy units (metres). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def repair_stream_vector_topology_async(self, i, output, dist="", callback=None) -> ToolResult: ...
+    def resample(self, inputs, output, cell_size=None, base=None, method="cc", callback=None) -> ToolResult:
+        """Resamples one or more input images into a destination image.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        method -- Resampling method; options include 'nn' (nearest neighbour), 'bilinear', and 'cc' (cubic convolution). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def resample_async(self, inputs, output, cell_size=None, base=None, method="cc", callback=None) -> ToolResult: ...
+    def rescale_value_range(self, i, output, out_min_val, out_max_val, clip_min=None, clip_max=None, callback=None) -> ToolResult:
+        """Performs a min-max contrast stretch on an input greytone image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        out_min_val -- New minimum value in output image. 
+        out_max_val -- New maximum value in output image. 
+        clip_min -- Optional lower tail clip value. 
+        clip_max -- Optional upper tail clip value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def rescale_value_range_async(self, i, output, out_min_val, out_max_val, clip_min=None, clip_max=None, callback=None) -> ToolResult: ...
+    def rgb_to_ihs(self, intensity, hue, saturation, red=None, green=None, blue=None, composite=None, callback=None) -> ToolResult:
+        """Converts red, green, and blue (RGB) images into intensity, hue, and saturation (IHS) images.
+
+        Keyword arguments:
+
+        red -- Input red band image file. Optionally specified if colour-composite not specified. 
+        green -- Input green band image file. Optionally specified if colour-composite not specified. 
+        blue -- Input blue band image file. Optionally specified if colour-composite not specified. 
+        composite -- Input colour-composite image file. Only used if individual bands are not specified. 
+        intensity -- Output intensity raster file. 
+        hue -- Output hue raster file. 
+        saturation -- Output saturation raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def rgb_to_ihs_async(self, intensity, hue, saturation, red=None, green=None, blue=None, composite=None, callback=None) -> ToolResult: ...
+    def rho8_flow_accumulation(self, i, output, out_type="specific contributing area", log=False, clip=False, pntr=False, esri_pntr=False, callback=None) -> ToolResult:
+        """Calculates Fairfield and Leymarie (1991) flow accumulation.
+
+        Keyword arguments:
+
+        i -- Input DEM or Rho8 pointer file; if a DEM is used, it must be depressionless. 
+        output -- Name of the output raster file. 
+        out_type -- Output type; one of 'cells', 'specific contributing area' (default), and 'catchment area'. 
+        log -- Log-transform the output values?. 
+        clip -- Optional flag to request clipping the display max by 1%. 
+        pntr -- Is the input raster a Rho8 flow pointer rather than a DEM?. 
+        esri_pntr -- Does the input Rho8 pointer use the ESRI style scheme?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def rho8_flow_accumulation_async(self, i, output, out_type="specific contributing area", log=False, clip=False, pntr=False, esri_pntr=False, callback=None) -> ToolResult: ...
+    def rho8_pointer(self, dem, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Calculates a stochastic Rho8 flow pointer raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def rho8_pointer_async(self, dem, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def ring_curvature(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates ring curvature from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def ring_curvature_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def river_centerlines(self, i, output, min_length=3, radius=4, callback=None) -> ToolResult:
+        """Maps river centerlines from an input water raster.
+
+        Keyword arguments:
+
+        i -- Name of the input raster image file. 
+        output -- Name of the output vector lines file. 
+        min_length -- Minimum line length, in grid cells. 
+        radius -- Search radius for joining distant endnodes, in grid cells. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def river_centerlines_async(self, i, output, min_length=3, radius=4, callback=None) -> ToolResult: ...
+    def roberts_cross_filter(self, i, output, clip=0.0, callback=None) -> ToolResult:
+        """Performs a Robert's cross edge-detection filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def roberts_cross_filter_async(self, i, output, clip=0.0, callback=None) -> ToolResult: ...
+    def root_mean_square_error(self, i, base, callback=None) -> ToolResult:
+        """Calculates the RMSE and other accuracy statistics.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        base -- Input base raster file used for comparison. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def root_mean_square_error_async(self, i, base, callback=None) -> ToolResult: ...
+    def rotor(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates rotor from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def rotor_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def round(self, i, output, callback=None) -> ToolResult:
+        """Rounds the values in an input raster to the nearest integer value.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def round_async(self, i, output, callback=None) -> ToolResult: ...
+    def ruggedness_index(self, dem, output, callback=None) -> ToolResult:
+        """Calculates the Riley et al.'s (1999) terrain ruggedness index from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def ruggedness_index_async(self, dem, output, callback=None) -> ToolResult: ...
+    def scharr_filter(self, i, output, clip=0.0, callback=None) -> ToolResult:
+        """Performs a Scharr edge-detection filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        clip -- Optional amount to clip the distribution tails by, in percent. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def scharr_filter_async(self, i, output, clip=0.0, callback=None) -> ToolResult: ...
+    def sediment_transport_index(self, sca, slope, output, sca_exponent=0.4, slope_exponent=1.3, callback=None) -> ToolResult:
+        """Calculates the sediment transport index.
+
+        Keyword arguments:
+
+        sca -- Input raster specific contributing area (SCA) file. 
+        slope -- Input raster slope file. 
+        output -- Output raster file. 
+        sca_exponent -- SCA exponent value. 
+        slope_exponent -- Slope exponent value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sediment_transport_index_async(self, sca, slope, output, sca_exponent=0.4, slope_exponent=1.3, callback=None) -> ToolResult: ...
+    def select_tiles_by_polygon(self, indir, outdir, polygons, callback=None) -> ToolResult:
+        """Copies LiDAR tiles overlapping with a polygon into an output directory.
+
+        Keyword arguments:
+
+        indir -- Input LAS file source directory. 
+        outdir -- Output directory into which LAS files within the polygon are copied. 
+        polygons -- Input vector polygons file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def select_tiles_by_polygon_async(self, indir, outdir, polygons, callback=None) -> ToolResult: ...
+    def set_nodata_value(self, i, output, back_value=0.0, callback=None) -> ToolResult:
+        """Assign the NoData value for an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        back_value -- Background value to set to nodata. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def set_nodata_value_async(self, i, output, back_value=0.0, callback=None) -> ToolResult: ...
+    def shadow_animation(self, i, output, palette="atlas", max_dist="", date="21/06/2021", interval=15, location="43.5448/-80.2482/-4", height=600, delay=250, label="", callback=None) -> ToolResult:
+        """This tool creates an animated GIF of shadows based on an input DEM.
+
+        Keyword arguments:
+
+        i -- Name of the input digital surface model (DSM) raster file. 
+        palette -- DSM image palette; options are 'atlas', 'high_relief', 'arid', 'soft', 'muted', 'light_quant', 'purple', 'viridis', 'gn_yl', 'pi_y_g', 'bl_yl_rd', 'deep', and 'none'. 
+        output -- Name of the output HTML file (*.html). 
+        max_dist -- Optional maximum search distance, in xy units. Minimum value is 5 x cell size. 
+        date -- Date in format DD/MM/YYYY. 
+        interval -- Time interval, in minutes (1-60). 
+        location -- Location, defined as Lat/Long/UTC-offset (e.g. 43.5448/-80.2482/-4). 
+        height -- Image height, in pixels. 
+        delay -- GIF time delay in milliseconds. 
+        label -- Label text (leave blank for none). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def shadow_animation_async(self, i, output, palette="atlas", max_dist="", date="21/06/2021", interval=15, location="43.5448/-80.2482/-4", height=600, delay=250, label="", callback=None) -> ToolResult: ...
+    def shadow_image(self, i, output, palette="soft", max_dist="", date="21/06/2021", time="13:00", location="43.5448/-80.2482/-4", callback=None) -> ToolResult:
+        """This tool creates a raster of shadow areas based on an input DEM.
+
+        Keyword arguments:
+
+        i -- Name of the input digital surface model (DSM) raster file. 
+        palette -- DSM image palette; options are 'atlas', 'high_relief', 'arid', 'soft', 'muted', 'light_quant', 'purple', 'viridi', 'gn_yl', 'pi_y_g', 'bl_yl_rd', 'deep', and 'none'. 
+        output -- Name of the output raster file. 
+        max_dist -- Optional maximum search distance, in xy unites. Minimum value is 5 x cell size. 
+        date -- Date in format DD/MM/YYYY. 
+        time -- Time in format HH::MM, e.g. 03:15AM or 14:30. 
+        location -- Location, defined as Lat/Long/UTC-offset (e.g. 43.5448/-80.2482/-4). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def shadow_image_async(self, i, output, palette="soft", max_dist="", date="21/06/2021", time="13:00", location="43.5448/-80.2482/-4", callback=None) -> ToolResult: ...
+    def shape_complexity_index(self, i, callback=None) -> ToolResult:
+        """Calculates overall polygon shape complexity or irregularity.
+
+        Keyword arguments:
+
+        i -- Input vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def shape_complexity_index_async(self, i, callback=None) -> ToolResult: ...
+    def shape_complexity_index_raster(self, i, output, callback=None) -> ToolResult:
+        """Calculates the complexity of raster polygons or classes.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def shape_complexity_index_raster_async(self, i, output, callback=None) -> ToolResult: ...
+    def shape_index(self, dem, output, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates the shape index from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def shape_index_async(self, dem, output, zfactor=1.0, callback=None) -> ToolResult: ...
+    def shreve_stream_magnitude(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Assigns the Shreve stream magnitude to each link in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def shreve_stream_magnitude_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def sigmoidal_contrast_stretch(self, i, output, cutoff=0.0, gain=1.0, num_tones=256, callback=None) -> ToolResult:
+        """Performs a sigmoidal contrast stretch on input images.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        cutoff -- Cutoff value between 0.0 and 0.95. 
+        gain -- Gain value. 
+        num_tones -- Number of tones in the output image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sigmoidal_contrast_stretch_async(self, i, output, cutoff=0.0, gain=1.0, num_tones=256, callback=None) -> ToolResult: ...
+    def sin(self, i, output, callback=None) -> ToolResult:
+        """Returns the sine (sin) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sin_async(self, i, output, callback=None) -> ToolResult: ...
+    def single_part_to_multi_part(self, i, output, field=None, callback=None) -> ToolResult:
+        """Converts a vector file containing multi-part features into a vector containing only single-part features.
+
+        Keyword arguments:
+
+        i -- Input vector line or polygon file. 
+        field -- Grouping ID field name in attribute table. 
+        output -- Output vector line or polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def single_part_to_multi_part_async(self, i, output, field=None, callback=None) -> ToolResult: ...
+    def sinh(self, i, output, callback=None) -> ToolResult:
+        """Returns the hyperbolic sine (sinh) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sinh_async(self, i, output, callback=None) -> ToolResult: ...
+    def sink(self, i, output, zero_background=False, callback=None) -> ToolResult:
+        """Identifies the depressions in a DEM, giving each feature a unique identifier.
+
+        Keyword arguments:
+
+        i -- Input raster DEM file. 
+        output -- Output raster file. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sink_async(self, i, output, zero_background=False, callback=None) -> ToolResult: ...
+    def slope(self, dem, output, zfactor=None, units="degrees", callback=None) -> ToolResult:
+        """Calculates a slope raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        units -- Units of output raster; options include 'degrees', 'radians', 'percent'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def slope_async(self, dem, output, zfactor=None, units="degrees", callback=None) -> ToolResult: ...
+    def slope_vs_aspect_plot(self, i, output, bin_size=2.0, min_slope=0.1, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool creates a slope-aspect relation plot from an input DEM.
+
+        Keyword arguments:
+
+        i -- Name of the input raster image file. 
+        output -- Name of the output report file (*.html). 
+        bin_size -- Aspect bin size, in degrees. 
+        min_slope -- Minimum slope, in degrees. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def slope_vs_aspect_plot_async(self, i, output, bin_size=2.0, min_slope=0.1, zfactor=1.0, callback=None) -> ToolResult: ...
+    def slope_vs_elevation_plot(self, inputs, output, watershed=None, callback=None) -> ToolResult:
+        """Creates a slope vs. elevation plot for one or more DEMs.
+
+        Keyword arguments:
+
+        inputs -- Input DEM files. 
+        watershed -- Input watershed files (optional). 
+        output -- Output HTML file (default name will be based on input file if unspecified). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def slope_vs_elevation_plot_async(self, inputs, output, watershed=None, callback=None) -> ToolResult: ...
+    def smooth_vectors(self, i, output, filter=3, callback=None) -> ToolResult:
+        """Smooths a vector coverage of either a POLYLINE or POLYGON base ShapeType.
+
+        Keyword arguments:
+
+        i -- Input vector POLYLINE or POLYGON file. 
+        output -- Output vector file. 
+        filter -- The filter size, any odd integer greater than or equal to 3; default is 3. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def smooth_vectors_async(self, i, output, filter=3, callback=None) -> ToolResult: ...
+    def smooth_vegetation_residual(self, i, output, max_scale=30, dev_threshold=1.0, scale_threshold=5, callback=None) -> ToolResult:
+        """This tool can smooth the residual roughness due to vegetation cover in LiDAR DEMs.
+
+        Keyword arguments:
+
+        i -- Name of the input digital elevation model (DEM) raster file. 
+        output -- Name of the output raster file. 
+        max_scale -- Maximum search neighbourhood radius in grid cells. 
+        dev_threshold -- DEVmax Threshold. 
+        scale_threshold -- DEVmax scale threshold. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def smooth_vegetation_residual_async(self, i, output, max_scale=30, dev_threshold=1.0, scale_threshold=5, callback=None) -> ToolResult: ...
+    def snap_pour_points(self, pour_pts, flow_accum, output, snap_dist, callback=None) -> ToolResult:
+        """Moves outlet points used to specify points of interest in a watershedding operation to the cell with the highest flow accumulation in its neighbourhood.
+
+        Keyword arguments:
+
+        pour_pts -- Input vector pour points (outlet) file. 
+        flow_accum -- Input raster D8 flow accumulation file. 
+        output -- Output vector file. 
+        snap_dist -- Maximum snap distance in map units. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def snap_pour_points_async(self, pour_pts, flow_accum, output, snap_dist, callback=None) -> ToolResult: ...
+    def sobel_filter(self, i, output, variant="3x3", clip=0.0, callback=None) -> ToolResult:
+        """Performs a Sobel edge-detection filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        variant -- Optional variant value. Options include 3x3 and 5x5 (default is 3x3). 
+        clip -- Optional amount to clip the distribution tails by, in percent (default is 0.0). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sobel_filter_async(self, i, output, variant="3x3", clip=0.0, callback=None) -> ToolResult: ...
+    def sort_lidar(self, i=None, output=None, criteria="", callback=None) -> ToolResult:
+        """Sorts LiDAR points based on their properties.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        output -- Name of the output LiDAR points. 
+        criteria -- Sort criteria e.g. 'x 50.0, y 50.0, z'; criteria may include x, y, z, intensity, class, user_data, point_source_id, and scan_angle. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sort_lidar_async(self, i=None, output=None, criteria="", callback=None) -> ToolResult: ...
+    def spherical_std_dev_of_normals(self, dem, output, filter=11, callback=None) -> ToolResult:
+        """Calculates the spherical standard deviation of surface normals for a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        filter -- Size of the filter kernel. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def spherical_std_dev_of_normals_async(self, dem, output, filter=11, callback=None) -> ToolResult: ...
+    def split_colour_composite(self, i, red=None, green=None, blue=None, callback=None) -> ToolResult:
+        """Splits an RGB colour composite image into separate multispectral images.
+
+        Keyword arguments:
+
+        i -- Input colour composite image file. 
+        red -- Output red band file. 
+        green -- Output green band file. 
+        blue -- Output blue band file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def split_colour_composite_async(self, i, red=None, green=None, blue=None, callback=None) -> ToolResult: ...
+    def split_lidar(self, i=None, criterion="num_pts", interval="", min_pts=5, callback=None) -> ToolResult:
+        """Splits LiDAR points up into a series of new files based on their properties.
+
+        Keyword arguments:
+
+        i -- Name of the input LiDAR points. 
+        criterion -- Criterion on which to base the split of the input file. Options include 'num_pts, 'x', 'y', 'z', intensity, 'class', 'user_data', 'point_source_id', 'scan_angle', 'time'. 
+        interval -- Interval. 
+        min_pts -- Minimum number of points in an output file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def split_lidar_async(self, i=None, criterion="num_pts", interval="", min_pts=5, callback=None) -> ToolResult: ...
+    def split_vector_lines(self, i, output, length=None, callback=None) -> ToolResult:
+        """Used to split a vector line coverage into even-lengthed segments.
+
+        Keyword arguments:
+
+        i -- Name of the input lines shapefile. 
+        output -- Name of the output lines shapefile. 
+        length -- Maximum segment length (m). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def split_vector_lines_async(self, i, output, length=None, callback=None) -> ToolResult: ...
+    def split_with_lines(self, i, split, output, callback=None) -> ToolResult:
+        """Splits the lines or polygons in one layer using the lines in another layer.
+
+        Keyword arguments:
+
+        i -- Input vector line or polygon file. 
+        split -- Input vector polyline file. 
+        output -- Output vector file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def split_with_lines_async(self, i, split, output, callback=None) -> ToolResult: ...
+    def square(self, i, output, callback=None) -> ToolResult:
+        """Squares the values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def square_async(self, i, output, callback=None) -> ToolResult: ...
+    def square_root(self, i, output, callback=None) -> ToolResult:
+        """Returns the square root of the values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def square_root_async(self, i, output, callback=None) -> ToolResult: ...
+    def standard_deviation_contrast_stretch(self, i, output, stdev=2.0, num_tones=256, callback=None) -> ToolResult:
+        """Performs a standard-deviation contrast stretch on input images.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        stdev -- Standard deviation clip value. 
+        num_tones -- Number of tones in the output image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def standard_deviation_contrast_stretch_async(self, i, output, stdev=2.0, num_tones=256, callback=None) -> ToolResult: ...
+    def standard_deviation_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Assigns each cell in the output grid the standard deviation of values in a moving window centred on each grid cell in the input raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def standard_deviation_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def standard_deviation_of_slope(self, i, output, zfactor=None, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Calculates the standard deviation of slope from an input DEM.
+
+        Keyword arguments:
+
+        i -- Input raster DEM file. 
+        output -- Output raster DEM file. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def standard_deviation_of_slope_async(self, i, output, zfactor=None, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def stochastic_depression_analysis(self, dem, output, rmse, range, iterations=100, callback=None) -> ToolResult:
+        """Performs a stochastic analysis of depressions within a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output file. 
+        rmse -- The DEM's root-mean-square-error (RMSE), in z units. This determines error magnitude. 
+        range -- The error field's correlation length, in xy-units. 
+        iterations -- The number of iterations. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def stochastic_depression_analysis_async(self, dem, output, rmse, range, iterations=100, callback=None) -> ToolResult: ...
+    def strahler_order_basins(self, d8_pntr, streams, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Identifies Strahler-order basins from an input stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def strahler_order_basins_async(self, d8_pntr, streams, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def strahler_stream_order(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Assigns the Strahler stream order to each link in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def strahler_stream_order_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def stream_link_class(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Identifies the exterior/interior links and nodes in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def stream_link_class_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def stream_link_identifier(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Assigns a unique identifier to each link in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def stream_link_identifier_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def stream_link_length(self, d8_pntr, linkid, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Estimates the length of each link (or tributary) in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        linkid -- Input raster streams link ID (or tributary ID) file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def stream_link_length_async(self, d8_pntr, linkid, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def stream_link_slope(self, d8_pntr, linkid, dem, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Estimates the average slope of each link (or tributary) in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        linkid -- Input raster streams link ID (or tributary ID) file. 
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def stream_link_slope_async(self, d8_pntr, linkid, dem, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def stream_power_index(self, sca, slope, output, exponent=1.0, callback=None) -> ToolResult:
+        """Calculates the relative stream power index.
+
+        Keyword arguments:
+
+        sca -- Input raster specific contributing area (SCA) file. 
+        slope -- Input raster slope file. 
+        output -- Output raster file. 
+        exponent -- SCA exponent value. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def stream_power_index_async(self, sca, slope, output, exponent=1.0, callback=None) -> ToolResult: ...
+    def stream_slope_continuous(self, d8_pntr, streams, dem, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Estimates the slope of each grid cell in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def stream_slope_continuous_async(self, d8_pntr, streams, dem, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def subbasins(self, d8_pntr, streams, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Identifies the catchments, or sub-basin, draining to each link in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input D8 pointer raster file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def subbasins_async(self, d8_pntr, streams, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def subtract(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a differencing operation on two rasters or a raster and a constant value.
+
+        Keyword arguments:
+
+        input1 -- Input raster file or constant value. 
+        input2 -- Input raster file or constant value. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def subtract_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def sum_overlay(self, inputs, output, callback=None) -> ToolResult:
+        """Calculates the sum for each grid cell from a group of raster images.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def sum_overlay_async(self, inputs, output, callback=None) -> ToolResult: ...
+    def surface_area_ratio(self, dem, output, callback=None) -> ToolResult:
+        """Calculates a the surface area ratio of each grid cell in an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def surface_area_ratio_async(self, dem, output, callback=None) -> ToolResult: ...
+    def svm_classification(self, inputs, training, field, scaling="Normalize", output=None, c=200.0, gamma=50.0, tolerance=0.1, test_proportion=0.2, callback=None) -> ToolResult:
+        """Performs an SVM binary classification using training site polygons/points and multiple input images.
+
+        Keyword arguments:
+
+        inputs -- Names of the input predictor rasters. 
+        scaling -- Scaling method for predictors. Options include 'None', 'Normalize', and 'Standardize'. 
+        training -- Name of the input training site polygons/points Shapefile. 
+        field -- Name of the attribute containing class data. 
+        output -- Name of the output raster file. 
+        c -- c-value, the regularization parameter. 
+        gamma -- Gamma parameter used in setting the RBF (Gaussian) kernel function. 
+        tolerance -- The tolerance parameter used in determining the stopping condition. 
+        test_proportion -- The proportion of the dataset to include in the test split; default is 0.2. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def svm_classification_async(self, inputs, training, field, scaling="Normalize", output=None, c=200.0, gamma=50.0, tolerance=0.1, test_proportion=0.2, callback=None) -> ToolResult: ...
+    def svm_regression(self, inputs, training, field, scaling="Normalize", output=None, c=50.0, eps=10.0, gamma=0.5, test_proportion=0.2, callback=None) -> ToolResult:
+        """Performs a supervised SVM regression analysis using training site points and predictor rasters.
+
+        Keyword arguments:
+
+        inputs -- Names of the input predictor rasters. 
+        scaling -- Scaling method for predictors. Options include 'None', 'Normalize', and 'Standardize'. 
+        training -- Name of the input training site points Shapefile. 
+        field -- Name of the attribute containing class data. 
+        output -- Name of the output raster file. 
+        c -- c-value, the regularization parameter. 
+        eps -- Epsilon in the epsilon-SVR model. 
+        gamma -- Gamma parameter used in setting the RBF (Gaussian) kernel function. 
+        test_proportion -- The proportion of the dataset to include in the test split; default is 0.2. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def svm_regression_async(self, inputs, training, field, scaling="Normalize", output=None, c=50.0, eps=10.0, gamma=0.5, test_proportion=0.2, callback=None) -> ToolResult: ...
+    def symmetrical_difference(self, i, overlay, output, snap=0.0, callback=None) -> ToolResult:
+        """Outputs the features that occur in one of the two vector inputs but not both, i.e. no overlapping features.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        overlay -- Input overlay vector file. 
+        output -- Output vector file. 
+        snap -- Snap tolerance. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def symmetrical_difference_async(self, i, overlay, output, snap=0.0, callback=None) -> ToolResult: ...
+    def tan(self, i, output, callback=None) -> ToolResult:
+        """Returns the tangent (tan) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def tan_async(self, i, output, callback=None) -> ToolResult: ...
+    def tangential_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a tangential curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def tangential_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def tanh(self, i, output, callback=None) -> ToolResult:
+        """Returns the hyperbolic tangent (tanh) of each values in a raster.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def tanh_async(self, i, output, callback=None) -> ToolResult: ...
+    def thicken_raster_line(self, i, output, callback=None) -> ToolResult:
+        """Thickens single-cell wide lines within a raster image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def thicken_raster_line_async(self, i, output, callback=None) -> ToolResult: ...
+    def time_in_daylight(self, dem, output, lat, long, az_fraction=10.0, max_dist=100.0, utc_offset="00:00", start_day=1, end_day=365, start_time="00:00:00", end_time="23:59:59", callback=None) -> ToolResult:
+        """Calculates the proportion of time a location is not within an area of shadow.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        az_fraction -- Azimuth fraction in degrees. 
+        max_dist -- Optional maximum search distance. Minimum value is 5 x cell size. 
+        lat -- Centre point latitude. 
+        long -- Centre point longitude. 
+        utc_offset -- UTC time offset, in hours (e.g. -04:00, +06:00). 
+        start_day -- Start day of the year (1-365). 
+        end_day -- End day of the year (1-365). 
+        start_time -- Starting hour to track shadows (e.g. 5, 5:00, 05:00:00). Assumes 24-hour time: HH:MM:SS. 'sunrise' is also a valid time. 
+        end_time -- Ending hour to track shadows (e.g. 21, 21:00, 21:00:00). Assumes 24-hour time: HH:MM:SS. 'sunset' is also a valid time. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def time_in_daylight_async(self, dem, output, lat, long, az_fraction=10.0, max_dist=100.0, utc_offset="00:00", start_day=1, end_day=365, start_time="00:00:00", end_time="23:59:59", callback=None) -> ToolResult: ...
+    def tin_gridding(self, i, output, field=None, use_z=False, resolution=None, base=None, max_triangle_edge_length=None, callback=None) -> ToolResult:
+        """Creates a raster grid based on a triangular irregular network (TIN) fitted to vector points.
+
+        Keyword arguments:
+
+        i -- Input vector points file. 
+        field -- Input field name in attribute table. 
+        use_z -- Use the 'z' dimension of the Shapefile's geometry instead of an attribute field?. 
+        output -- Output raster file. 
+        resolution -- Output raster's grid resolution. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        max_triangle_edge_length -- Optional maximum triangle edge length; triangles larger than this size will not be gridded. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def tin_gridding_async(self, i, output, field=None, use_z=False, resolution=None, base=None, max_triangle_edge_length=None, callback=None) -> ToolResult: ...
+    def to_degrees(self, i, output, callback=None) -> ToolResult:
+        """Converts a raster from radians to degrees.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def to_degrees_async(self, i, output, callback=None) -> ToolResult: ...
+    def to_radians(self, i, output, callback=None) -> ToolResult:
+        """Converts a raster from degrees to radians.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def to_radians_async(self, i, output, callback=None) -> ToolResult: ...
+    def tophat_transform(self, i, output, filterx=11, filtery=11, variant="white", callback=None) -> ToolResult:
+        """Performs either a white or black top-hat transform on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        variant -- Optional variant value. Options include 'white' and 'black'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def tophat_transform_async(self, i, output, filterx=11, filtery=11, variant="white", callback=None) -> ToolResult: ...
+    def topo_render(self, dem, output, palette="soft", rev_palette=False, az=315.0, alt=30.0, background_hgt_offset=10.0, polygon=None, background_clr="[255, 255, 255]", attenuation=0.6, ambient_light=0.2, z_factor=1.0, callback=None) -> ToolResult:
+        """This tool creates a pseudo-3D rendering from an input DEM, for the purpose of effective topographic visualization.
+
+        Keyword arguments:
+
+        dem -- Name of the input digital elevation model (DEM) raster file. 
+        output -- Name of the output raster file. 
+        palette -- Palette name; options are 'atlas', 'high_relief', 'arid', 'soft', 'earthtones', 'muted', 'light_quant', 'purple', 'viridi', 'gn_yl', 'pi_y_g', 'bl_yl_rd', 'deep', 'imhof', and 'white'. 
+        rev_palette -- Reverse the palette?. 
+        az -- Light source azimuth direction (degrees, 0-360). 
+        alt -- Light source altitude (degrees, 0-90). 
+        background_hgt_offset -- Offset height of background, in z-units. 
+        polygon -- Clipping polygon vector file (optional). 
+        background_clr -- Background red-green-blue (RGB) or red-green-blue-alpha (RGBA) colour, e.g. '[255, 255, 245]', '[255, 255, 245, 200]'. 
+        attenuation -- Attenuation parameter. Range is 0-4. Zero means no attenuation. 
+        ambient_light -- Ambient light parameter. Range is 0.0-0.7. Zero means no ambient light. 
+        z_factor -- Elevation multiplier, or a vertical exageration. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def topo_render_async(self, dem, output, palette="soft", rev_palette=False, az=315.0, alt=30.0, background_hgt_offset=10.0, polygon=None, background_clr="[255, 255, 255]", attenuation=0.6, ambient_light=0.2, z_factor=1.0, callback=None) -> ToolResult: ...
+    def topographic_position_animation(self, i, output, palette="bl_yl_rd", min_scale=1, num_steps=100, step_nonlinearity=1.5, height=600, delay=250, label="", dev_max=False, callback=None) -> ToolResult:
+        """This tool creates an animated GIF of multi-scale local topographic position (elevation deviation).
+
+        Keyword arguments:
+
+        i -- Name of the input digital elevation model (DEM) raster file. 
+        palette -- Image palette; options are 'bl_yl_rd', 'bl_w_rd', 'purple', 'gn_yl', 'pi_y_g', and 'viridis'. 
+        output -- Name of the output HTML file (*.html). 
+        min_scale -- Minimum search neighbourhood radius in grid cells. 
+        num_steps -- Number of steps. 
+        step_nonlinearity -- Step nonlinearity factor (1.0-2.0 is typical). 
+        height -- Image height, in pixels. 
+        delay -- GIF time delay in milliseconds. 
+        label -- Label text (leave blank for none). 
+        dev_max -- Do you want to use DEVmax instead of DEV for measuring local topographic position?. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def topographic_position_animation_async(self, i, output, palette="bl_yl_rd", min_scale=1, num_steps=100, step_nonlinearity=1.5, height=600, delay=250, label="", dev_max=False, callback=None) -> ToolResult: ...
+    def topological_stream_order(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Assigns each link in a stream network its topological order.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def topological_stream_order_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def total_curvature(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult:
+        """Calculates a total curvature raster from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Optional multiplier for when the vertical and horizontal units are not the same. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def total_curvature_async(self, dem, output, log=False, zfactor=None, callback=None) -> ToolResult: ...
+    def total_filter(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult:
+        """Performs a total filter on an input image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        filterx -- Size of the filter kernel in the x-direction. 
+        filtery -- Size of the filter kernel in the y-direction. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def total_filter_async(self, i, output, filterx=11, filtery=11, callback=None) -> ToolResult: ...
+    def trace_downslope_flowpaths(self, seed_pts, d8_pntr, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Traces downslope flowpaths from one or more target sites (i.e. seed points).
+
+        Keyword arguments:
+
+        seed_pts -- Input vector seed points file. 
+        d8_pntr -- Input D8 pointer raster file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def trace_downslope_flowpaths_async(self, seed_pts, d8_pntr, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def travelling_salesman_problem(self, i, output, duration=60, callback=None) -> ToolResult:
+        """Finds approximate solutions to travelling salesman problems, the goal of which is to identify the shortest route connecting a set of locations.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        output -- Name of the output lines shapefile. 
+        duration -- Maximum duration, in seconds. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def travelling_salesman_problem_async(self, i, output, duration=60, callback=None) -> ToolResult: ...
+    def trend_surface(self, i, output, order=1, callback=None) -> ToolResult:
+        """Estimates the trend surface of an input raster file.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        order -- Polynomial order (1 to 10). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def trend_surface_async(self, i, output, order=1, callback=None) -> ToolResult: ...
+    def trend_surface_vector_points(self, i, field, output, cell_size, order=1, callback=None) -> ToolResult:
+        """Estimates a trend surface from vector points.
+
+        Keyword arguments:
+
+        i -- Input vector Points file. 
+        field -- Input field name in attribute table. 
+        output -- Output raster file. 
+        order -- Polynomial order (1 to 10). 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def trend_surface_vector_points_async(self, i, field, output, cell_size, order=1, callback=None) -> ToolResult: ...
+    def tributary_identifier(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult:
+        """Assigns a unique identifier to each tributary in a stream network.
+
+        Keyword arguments:
+
+        d8_pntr -- Input raster D8 pointer file. 
+        streams -- Input raster streams file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        zero_background -- Flag indicating whether a background value of zero should be used. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def tributary_identifier_async(self, d8_pntr, streams, output, esri_pntr=False, zero_background=False, callback=None) -> ToolResult: ...
+    def truncate(self, i, output, num_decimals=None, callback=None) -> ToolResult:
+        """Truncates the values in a raster to the desired number of decimal places.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        num_decimals -- Number of decimals left after truncation (default is zero). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def truncate_async(self, i, output, num_decimals=None, callback=None) -> ToolResult: ...
+    def turning_bands_simulation(self, base, output, range, iterations=1000, callback=None) -> ToolResult:
+        """Creates an image containing random values based on a turning-bands simulation.
+
+        Keyword arguments:
+
+        base -- Input base raster file. 
+        output -- Output file. 
+        range -- The field's range, in xy-units, related to the extent of spatial autocorrelation. 
+        iterations -- The number of iterations. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def turning_bands_simulation_async(self, base, output, range, iterations=1000, callback=None) -> ToolResult: ...
+    def two_sample_ks_test(self, input1, input2, output, num_samples=None, callback=None) -> ToolResult:
+        """Performs a 2-sample K-S test for significant differences on two input rasters.
+
+        Keyword arguments:
+
+        input1 -- First input raster file. 
+        input2 -- Second input raster file. 
+        output -- Output HTML file. 
+        num_samples -- Number of samples. Leave blank to use whole image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def two_sample_ks_test_async(self, input1, input2, output, num_samples=None, callback=None) -> ToolResult: ...
+    def union(self, i, overlay, output, snap=0.0, callback=None) -> ToolResult:
+        """Splits vector layers at their overlaps, creating a layer containing all the portions from both input and overlay layers.
+
+        Keyword arguments:
+
+        i -- Input vector file. 
+        overlay -- Input overlay vector file. 
+        output -- Output vector file. 
+        snap -- Snap tolerance. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def union_async(self, i, overlay, output, snap=0.0, callback=None) -> ToolResult: ...
+    def unnest_basins(self, d8_pntr, pour_pts, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Extract whole watersheds for a set of outlet points.
+
+        Keyword arguments:
+
+        d8_pntr -- Input D8 pointer raster file. 
+        pour_pts -- Input vector pour points (outlet) file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def unnest_basins_async(self, d8_pntr, pour_pts, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def unsharp_masking(self, i, output, sigma=0.75, amount=100.0, threshold=0.0, callback=None) -> ToolResult:
+        """An image sharpening technique that enhances edges.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        sigma -- Standard deviation distance in pixels. 
+        amount -- A percentage and controls the magnitude of each overshoot. 
+        threshold -- Controls the minimal brightness change that will be sharpened. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def unsharp_masking_async(self, i, output, sigma=0.75, amount=100.0, threshold=0.0, callback=None) -> ToolResult: ...
+    def unsphericity(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates the unsphericity curvature from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def unsphericity_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def update_nodata_cells(self, input1, input2, output, callback=None) -> ToolResult:
+        """Replaces the NoData values in an input raster with the corresponding values contained in a second update layer.
+
+        Keyword arguments:
+
+        input1 -- Input raster file 1. 
+        input2 -- Input raster file 2; update layer. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def update_nodata_cells_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def upslope_depression_storage(self, dem, output, callback=None) -> ToolResult:
+        """Estimates the average upslope depression storage depth.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def upslope_depression_storage_async(self, dem, output, callback=None) -> ToolResult: ...
+    def user_defined_weights_filter(self, i, weights, output, center="center", normalize=False, callback=None) -> ToolResult:
+        """Performs a user-defined weights filter on an image.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        weights -- Input weights file. 
+        output -- Output raster file. 
+        center -- Kernel center cell; options include 'center', 'upper-left', 'upper-right', 'lower-left', 'lower-right'. 
+        normalize -- Normalize kernel weights? This can reduce edge effects and lessen the impact of data gaps (nodata) but is not suited when the kernel weights sum to zero. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def user_defined_weights_filter_async(self, i, weights, output, center="center", normalize=False, callback=None) -> ToolResult: ...
+    def vector_hex_binning(self, i, output, width, orientation="horizontal", callback=None) -> ToolResult:
+        """Hex-bins a set of vector points.
+
+        Keyword arguments:
+
+        i -- Input base file. 
+        output -- Output vector polygon file. 
+        width -- The grid cell width. 
+        orientation -- Grid Orientation, 'horizontal' or 'vertical'. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def vector_hex_binning_async(self, i, output, width, orientation="horizontal", callback=None) -> ToolResult: ...
+    def vector_lines_to_raster(self, i, output, field="FID", nodata=True, cell_size=None, base=None, callback=None) -> ToolResult:
+        """Converts a vector containing polylines into a raster.
+
+        Keyword arguments:
+
+        i -- Input vector lines file. 
+        field -- Input field name in attribute table. 
+        output -- Output raster file. 
+        nodata -- Background value to set to NoData. Without this flag, it will be set to 0.0. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def vector_lines_to_raster_async(self, i, output, field="FID", nodata=True, cell_size=None, base=None, callback=None) -> ToolResult: ...
+    def vector_points_to_raster(self, i, output, field="FID", assign="last", nodata=True, cell_size=None, base=None, callback=None) -> ToolResult:
+        """Converts a vector containing points into a raster.
+
+        Keyword arguments:
+
+        i -- Input vector Points file. 
+        field -- Input field name in attribute table. 
+        output -- Output raster file. 
+        assign -- Assignment operation, where multiple points are in the same grid cell; options include 'first', 'last' (default), 'min', 'max', 'sum', 'number'. 
+        nodata -- Background value to set to NoData. Without this flag, it will be set to 0.0. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def vector_points_to_raster_async(self, i, output, field="FID", assign="last", nodata=True, cell_size=None, base=None, callback=None) -> ToolResult: ...
+    def vector_polygons_to_raster(self, i, output, field="FID", nodata=True, cell_size=None, base=None, callback=None) -> ToolResult:
+        """Converts a vector containing polygons into a raster.
+
+        Keyword arguments:
+
+        i -- Input vector polygons file. 
+        field -- Input field name in attribute table. 
+        output -- Output raster file. 
+        nodata -- Background value to set to NoData. Without this flag, it will be set to 0.0. 
+        cell_size -- Optionally specified cell size of output raster. Not used when base raster is specified. 
+        base -- Optionally specified input base raster file. Not used when a cell size is specified. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def vector_polygons_to_raster_async(self, i, output, field="FID", nodata=True, cell_size=None, base=None, callback=None) -> ToolResult: ...
+    def vector_stream_network_analysis(self, streams, output, snap=0.1, callback=None) -> ToolResult:
+        """This tool performs common stream network analysis operations on an input vector stream file.
+
+        Keyword arguments:
+
+        streams -- Name of the input streams vector file. 
+        output -- Name of the output lines shapefile. 
+        snap -- Snap distance, in xy units (metres). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def vector_stream_network_analysis_async(self, streams, output, snap=0.1, callback=None) -> ToolResult: ...
+    def vertical_excess_curvature(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult:
+        """This tool calculates vertical excess curvature from an input DEM.
+
+        Keyword arguments:
+
+        dem -- Name of the input raster DEM file. 
+        output -- Name of the output raster image file. 
+        log -- Display output values using a log-scale. 
+        zfactor -- Z conversion factor. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def vertical_excess_curvature_async(self, dem, output, log=False, zfactor=1.0, callback=None) -> ToolResult: ...
+    def viewshed(self, dem, stations, output, height=2.0, callback=None) -> ToolResult:
+        """Identifies the viewshed for a point or set of points.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        stations -- Input viewing station vector file. 
+        output -- Output raster file. 
+        height -- Viewing station height, in z units. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def viewshed_async(self, dem, stations, output, height=2.0, callback=None) -> ToolResult: ...
+    def visibility_index(self, dem, output, height=2.0, res_factor=2, callback=None) -> ToolResult:
+        """Estimates the relative visibility of sites in a DEM.
+
+        Keyword arguments:
+
+        dem -- Input raster DEM file. 
+        output -- Output raster file. 
+        height -- Viewing station height, in z units. 
+        res_factor -- The resolution factor determines the density of measured viewsheds. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def visibility_index_async(self, dem, output, height=2.0, res_factor=2, callback=None) -> ToolResult: ...
+    def voronoi_diagram(self, i, output, callback=None) -> ToolResult:
+        """Creates a vector Voronoi diagram for a set of vector points.
+
+        Keyword arguments:
+
+        i -- Input vector points file. 
+        output -- Output vector polygon file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def voronoi_diagram_async(self, i, output, callback=None) -> ToolResult: ...
+    def watershed(self, d8_pntr, pour_pts, output, esri_pntr=False, callback=None) -> ToolResult:
+        """Identifies the watershed, or drainage basin, draining to a set of target cells.
+
+        Keyword arguments:
+
+        d8_pntr -- Input D8 pointer raster file. 
+        pour_pts -- Input pour points (outlet) file. 
+        output -- Output raster file. 
+        esri_pntr -- D8 pointer uses the ESRI style scheme. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def watershed_async(self, d8_pntr, pour_pts, output, esri_pntr=False, callback=None) -> ToolResult: ...
+    def weighted_overlay(self, factors, weights, output, cost=None, constraints=None, scale_max=1.0, callback=None) -> ToolResult:
+        """Performs a weighted sum on multiple input rasters after converting each image to a common scale. The tool performs a multi-criteria evaluation (MCE).
+
+        Keyword arguments:
+
+        factors -- Input factor raster files. 
+        weights -- Weight values, contained in quotes and separated by commas or semicolons. Must have the same number as factors. 
+        cost -- Boolean array indicating which factors are cost factors, contained in quotes and separated by commas or semicolons. Must have the same number as factors. 
+        constraints -- Input constraints raster files. 
+        output -- Output raster file. 
+        scale_max -- Suitability scale maximum value (common values are 1.0, 100.0, and 255.0). 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def weighted_overlay_async(self, factors, weights, output, cost=None, constraints=None, scale_max=1.0, callback=None) -> ToolResult: ...
+    def weighted_sum(self, inputs, weights, output, callback=None) -> ToolResult:
+        """Performs a weighted-sum overlay on multiple input raster images.
+
+        Keyword arguments:
+
+        inputs -- Input raster files. 
+        weights -- Weight values, contained in quotes and separated by commas or semicolons. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def weighted_sum_async(self, inputs, weights, output, callback=None) -> ToolResult: ...
+    def wetness_index(self, sca, slope, output, callback=None) -> ToolResult:
+        """Calculates the topographic wetness index, Ln(A / tan(slope)).
+
+        Keyword arguments:
+
+        sca -- Input raster specific contributing area (SCA) file. 
+        slope -- Input raster slope file (in degrees). 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def wetness_index_async(self, sca, slope, output, callback=None) -> ToolResult: ...
+    def wilcoxon_signed_rank_test(self, input1, input2, output, num_samples=None, callback=None) -> ToolResult:
+        """Performs a 2-sample K-S test for significant differences on two input rasters.
+
+        Keyword arguments:
+
+        input1 -- First input raster file. 
+        input2 -- Second input raster file. 
+        output -- Output HTML file. 
+        num_samples -- Number of samples. Leave blank to use whole image. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def wilcoxon_signed_rank_test_async(self, input1, input2, output, num_samples=None, callback=None) -> ToolResult: ...
+    def write_function_memory_insertion(self, input1, input2, output, input3=None, callback=None) -> ToolResult:
+        """Performs a write function memory insertion for single-band multi-date change detection.
+
+        Keyword arguments:
+
+        input1 -- Input raster file associated with the first date. 
+        input2 -- Input raster file associated with the second date. 
+        input3 -- Optional input raster file associated with the third date. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def write_function_memory_insertion_async(self, input1, input2, output, input3=None, callback=None) -> ToolResult: ...
+    def xor(self, input1, input2, output, callback=None) -> ToolResult:
+        """Performs a logical XOR operator on two Boolean raster images.
+
+        Keyword arguments:
+
+        input1 -- Input raster file. 
+        input2 -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def xor_async(self, input1, input2, output, callback=None) -> ToolResult: ...
+    def yield_filter(self, i, yield_field, pass_field, output, width=6.096, z_score_threshold=2.5, min_yield=0.0, max_yield=99999.9, callback=None) -> ToolResult:
+        """Filters crop yield values of point data derived from combine harvester yield monitors.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        yield_field -- Name of the attribute containing yield data. 
+        pass_field -- Name of the attribute containing pass line ID. 
+        output -- Name of the output points shapefile. 
+        width -- Pass swath width (m). 
+        z_score_threshold -- Z-score threshold value (default=2.5). 
+        min_yield -- Minimum yield value in output. 
+        max_yield -- Maximum yield value in output. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def yield_filter_async(self, i, yield_field, pass_field, output, width=6.096, z_score_threshold=2.5, min_yield=0.0, max_yield=99999.9, callback=None) -> ToolResult: ...
+    def yield_map(self, i, pass_field_name, output, width=6.096, max_change_in_heading=25.0, callback=None) -> ToolResult:
+        """This tool can be used to create a segmented-vector polygon yield map from a set of harvester points.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        pass_field_name -- Name of the attribute containing pass line ID. 
+        output -- Name of the output polygon shapefile. 
+        width -- Pass swath width (m). 
+        max_change_in_heading -- Max change in heading. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def yield_map_async(self, i, pass_field_name, output, width=6.096, max_change_in_heading=25.0, callback=None) -> ToolResult: ...
+    def yield_normalization(self, i, yield_field, output, standardize=False, radius=None, min_yield=0.0, max_yield=99999.9, callback=None) -> ToolResult:
+        """This tool can be used to normalize the yield points for a field.
+
+        Keyword arguments:
+
+        i -- Name of the input points shapefile. 
+        yield_field -- Name of the attribute containing yield data. 
+        output -- Name of the output points shapefile. 
+        standardize -- Should the yield values be standardized (converted to z-scores) rather than normalized?. 
+        radius -- Optional search radius, in metres. Only specify this value if you want to calculate locally normalized yield. 
+        min_yield -- Minimum yield value in output. 
+        max_yield -- Maximum yield value in output. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def yield_normalization_async(self, i, yield_field, output, standardize=False, radius=None, min_yield=0.0, max_yield=99999.9, callback=None) -> ToolResult: ...
+    def z_scores(self, i, output, callback=None) -> ToolResult:
+        """Standardizes the values in an input raster by converting to z-scores.
+
+        Keyword arguments:
+
+        i -- Input raster file. 
+        output -- Output raster file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def z_scores_async(self, i, output, callback=None) -> ToolResult: ...
+    def zlidar_to_las(self, inputs=None, outdir=None, callback=None) -> ToolResult:
+        """Converts one or more zlidar files into the LAS data format.
+
+        Keyword arguments:
+
+        inputs -- Input ZLidar files. 
+        outdir -- Output directory into which zlidar files are created. If unspecified, it is assumed to be the same as the inputs. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def zlidar_to_las_async(self, inputs=None, outdir=None, callback=None) -> ToolResult: ...
+    def zonal_statistics(self, i, features, output=None, stat="mean", out_table=None, callback=None) -> ToolResult:
+        """Extracts descriptive statistics for a group of patches in a raster.
+
+        Keyword arguments:
+
+        i -- Input data raster file. 
+        features -- Input feature definition raster file. 
+        output -- Output raster file. 
+        stat -- Statistic to extract, including 'mean', 'median', 'minimum', 'maximum', 'range', 'standard deviation', and 'total'. 
+        out_table -- Output HTML Table file. 
+        callback -- Custom function for handling tool text outputs.
+        """
+        ...
+    async def zonal_statistics_async(self, i, features, output=None, stat="mean", out_table=None, callback=None) -> ToolResult: ...
+    def __getattr__(self, name: str) -> Any: ...